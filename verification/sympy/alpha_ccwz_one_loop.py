@@ -35,6 +35,7 @@ sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8', errors='repla
 import numpy as np
 from fractions import Fraction
 from sympy import Rational, sqrt as ssqrt, pi as spi, Float, nsimplify
+from suite_results import record
 
 # Framework constants
 n_d = 4   # [D] from Frobenius
@@ -56,6 +57,7 @@ def check(name, condition, detail=""):
     print(f"  [{status}] T{tests_total}: {name}")
     if detail and not condition:
         print(f"         {detail}")
+    record(name, condition, detail=detail)
 
 # ================================================================
 # PART 1: INFRASTRUCTURE (from Phase 1)
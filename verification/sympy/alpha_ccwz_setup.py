@@ -28,6 +28,8 @@ sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8', errors='repla
 import numpy as np
 from fractions import Fraction
 
+from lib_lie import Subspace
+
 # Framework constants
 n_d = 4   # [D] from Frobenius (spacetime dimension)
 n_c = 11  # [D] from CCP (crystal dimension)
@@ -111,76 +113,40 @@ check("6 + 21 + 28 = 55", dim_so4 + dim_so7 + dim_coset == 55)
 def commutator(A, B):
     return A @ B - B @ A
 
-def is_in_subspace(M, gen_dict, tol=1e-10):
-    """Check if M is a linear combination of generators in gen_dict."""
-    if np.max(np.abs(M)) < tol:
-        return True
-    # Project M onto the subspace
-    vecs = []
-    for key in sorted(gen_dict.keys()):
-        vecs.append(gen_dict[key].flatten())
-    if not vecs:
-        return np.max(np.abs(M)) < tol
-    basis = np.array(vecs).T
-    # Solve for coefficients
-    try:
-        coeffs, residuals, _, _ = np.linalg.lstsq(basis, M.flatten(), rcond=None)
-        reconstructed = basis @ coeffs
-        return np.max(np.abs(M.flatten() - reconstructed)) < tol
-    except:
-        return False
+def all_commutators(gens_a, gens_b):
+    """Stack of [g1, g2] for every g1 in gens_a, g2 in gens_b."""
+    A = np.array([gens_a[k] for k in sorted(gens_a)])
+    B = np.array([gens_b[k] for k in sorted(gens_b)])
+    return (np.einsum('aij,bjk->abik', A, B)
+            - np.einsum('bij,ajk->abik', B, A)).reshape(-1, n_c, n_c)
+
+# Each span is factorised once; every commutator is then one batched query.
+span_so4 = Subspace(gens_so4)
+span_so7 = Subspace(gens_so7)
+span_coset = Subspace(gens_coset)
 
 # [so(4), so(4)] c so(4)
-so4_closed = True
-for k1, g1 in gens_so4.items():
-    for k2, g2 in gens_so4.items():
-        C = commutator(g1, g2)
-        if not is_in_subspace(C, gens_so4):
-            so4_closed = False
-            break
+so4_closed = bool(span_so4.contains(all_commutators(gens_so4, gens_so4)).all())
 check("[so(4), so(4)] c so(4)", so4_closed)
 
 # [so(7), so(7)] c so(7)
-so7_closed = True
-for k1, g1 in gens_so7.items():
-    for k2, g2 in gens_so7.items():
-        C = commutator(g1, g2)
-        if not is_in_subspace(C, gens_so7):
-            so7_closed = False
-            break
+so7_closed = bool(span_so7.contains(all_commutators(gens_so7, gens_so7)).all())
 check("[so(7), so(7)] c so(7)", so7_closed)
 
 # [so(4), coset] c coset
-so4_coset = True
-for k1, g1 in gens_so4.items():
-    for k2, g2 in gens_coset.items():
-        C = commutator(g1, g2)
-        if not is_in_subspace(C, gens_coset):
-            so4_coset = False
-            break
+so4_coset = bool(span_coset.contains(all_commutators(gens_so4, gens_coset)).all())
 check("[so(4), coset] c coset", so4_coset)
 
 # [so(7), coset] c coset
-so7_coset = True
-for k1, g1 in gens_so7.items():
-    for k2, g2 in gens_coset.items():
-        C = commutator(g1, g2)
-        if not is_in_subspace(C, gens_coset):
-            so7_coset = False
-            break
+so7_coset = bool(span_coset.contains(all_commutators(gens_so7, gens_coset)).all())
 check("[so(7), coset] c coset", so7_coset)
 
 # [coset, coset] c so(4) + so(7) (= full unbroken algebra)
 gens_unbroken = {}
 gens_unbroken.update(gens_so4)
 gens_unbroken.update(gens_so7)
-coset_squared = True
-for k1, g1 in gens_coset.items():
-    for k2, g2 in gens_coset.items():
-        C = commutator(g1, g2)
-        if not is_in_subspace(C, gens_unbroken):
-            coset_squared = False
-            break
+span_unbroken = Subspace(gens_unbroken)
+coset_squared = bool(span_unbroken.contains(all_commutators(gens_coset, gens_coset)).all())
 check("[coset, coset] c so(4)+so(7)", coset_squared)
 
 print(f"\n  SO(11) = so(4)[{dim_so4}] + so(7)[{dim_so7}] + coset[{dim_coset}]")
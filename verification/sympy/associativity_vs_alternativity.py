@@ -29,9 +29,12 @@ Status: VERIFICATION
 Created: Session 181 (Phase 0 of Rigorous Formalization)
 """
 
+import numpy as np
 from sympy import *
 from itertools import product as iprod
 
+from lib_cayley_dickson import octonions, quaternions, sedenions
+
 # ==============================================================================
 # PART 1: Verify octonion non-associativity explicitly
 # ==============================================================================
@@ -45,71 +48,18 @@ def test_octonion_associativity():
     print("PART 1: Octonion associativity vs alternativity")
     print("=" * 70)
 
-    # Standard octonion multiplication table for basis elements e1..e7
-    # e_i * e_j for imaginary units (Fano plane convention)
+    # Standard octonion multiplication table (Cayley-Dickson doubling of H)
     # Triples: (1,2,3), (1,4,5), (1,7,6), (2,4,6), (2,5,7), (3,4,7), (3,6,5)
-    # (ij=k cyclically within each triple)
-
-    # Multiplication table: mult[i][j] = (sign, index) where e_i * e_j = sign * e_index
-    # Index 0 = real unit
-
-    triples = [(1,2,3), (1,4,5), (1,7,6), (2,4,6), (2,5,7), (3,4,7), (3,6,5)]
-
-    # Build full multiplication table for e_1 through e_7
-    mult = {}
-    for a,b,c in triples:
-        mult[(a,b)] = (1, c)
-        mult[(b,c)] = (1, a)
-        mult[(c,a)] = (1, b)
-        mult[(b,a)] = (-1, c)
-        mult[(c,b)] = (-1, a)
-        mult[(a,c)] = (-1, b)
-
-    # e_i * e_i = -1 (real part)
-    for i in range(1, 8):
-        mult[(i,i)] = (-1, 0)
-
-    def oct_mult_basis(i, j):
-        """Multiply basis elements e_i * e_j. i,j in {0,1,...,7} where 0=real."""
-        if i == 0 and j == 0:
-            return (1, 0)
-        elif i == 0:
-            return (1, j)
-        elif j == 0:
-            return (1, i)
-        else:
-            return mult[(i,j)]
+    # (ij=k cyclically within each triple); e_0 = 1 is the real unit
+    O = octonions()
+    E = O.units()
 
     # Test associativity: (e_i * e_j) * e_k vs e_i * (e_j * e_k)
-    assoc_failures = 0
-    assoc_successes = 0
-
-    for i in range(1, 8):
-        for j in range(1, 8):
-            for k in range(1, 8):
-                if i == j or j == k or i == k:
-                    continue  # Skip when indices repeat (trivially associative)
-
-                # (e_i * e_j) * e_k
-                s1, idx1 = oct_mult_basis(i, j)
-                if idx1 == 0:
-                    left = (s1, k)  # s1 * 1 * e_k
-                else:
-                    s2, idx2 = oct_mult_basis(idx1, k)
-                    left = (s1 * s2, idx2)
-
-                # e_i * (e_j * e_k)
-                s3, idx3 = oct_mult_basis(j, k)
-                if idx3 == 0:
-                    right = (s3, i)  # e_i * s3 * 1
-                else:
-                    s4, idx4 = oct_mult_basis(i, idx3)
-                    right = (s3 * s4, idx4)
-
-                if left == right:
-                    assoc_successes += 1
-                else:
-                    assoc_failures += 1
+    # (indices repeating are trivially associative and skipped)
+    ijk = np.array([t for t in iprod(range(1, 8), repeat=3) if len(set(t)) == 3])
+    assoc = O.associator(E[ijk[:, 0]], E[ijk[:, 1]], E[ijk[:, 2]])
+    assoc_failures = int(assoc.any(axis=1).sum())
+    assoc_successes = len(ijk) - assoc_failures
 
     total = assoc_failures + assoc_successes
     print(f"\nAssociativity test on distinct imaginary basis triples:")
@@ -120,30 +70,22 @@ def test_octonion_associativity():
     # Test alternativity: (xx)y = x(xy) and (yx)x = y(xx)
     # For basis elements e_i, e_i^2 = -1, so:
     # Left alt: (e_i*e_i)*e_j = -e_j, and e_i*(e_i*e_j) = ?
-    alt_left_pass = 0
-    alt_left_fail = 0
-
-    for i in range(1, 8):
-        for j in range(1, 8):
-            if i == j:
-                continue
-            # (e_i * e_i) * e_j = (-1) * e_j
-            left = (-1, j)
-
-            # e_i * (e_i * e_j)
-            s1, idx1 = oct_mult_basis(i, j)
-            s2, idx2 = oct_mult_basis(i, idx1)
-            right = (s1 * s2, idx2)
-
-            if left == right:
-                alt_left_pass += 1
-            else:
-                alt_left_fail += 1
+    ij = np.array([t for t in iprod(range(1, 8), repeat=2) if t[0] != t[1]])
+    left_alt = O.associator(E[ij[:, 0]], E[ij[:, 0]], E[ij[:, 1]])
+    alt_left_fail = int(left_alt.any(axis=1).sum())
+    alt_left_pass = len(ij) - alt_left_fail
 
     print(f"\nLeft alternativity (xx)y = x(xy) on basis elements:")
     print(f"  Pass: {alt_left_pass}, Fail: {alt_left_fail}")
 
-    return assoc_failures > 0, alt_left_fail == 0
+    # Basis checks do not cover x = e_i + e_j (alternativity is quadratic in x);
+    # the associator tensor settles it for all x, y
+    print(f"\nAlternativity for all elements (associator tensor alternating):")
+    for A in (quaternions(), O, sedenions()):
+        print(f"  {A.name} (dim {A.dim:2d}): associative = {A.is_associative()}, "
+              f"alternative = {A.is_alternative()}")
+
+    return assoc_failures > 0, alt_left_fail == 0 and O.is_alternative()
 
 
 # ==============================================================================
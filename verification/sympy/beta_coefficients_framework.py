@@ -9,6 +9,8 @@ Combined with 11/3 = n_c/Im_H [UNPROVEN], yields b_3 = -(n_c - n_d) = -Im_O.
 Status: INVESTIGATION (advancing EQ-008)
 """
 from sympy import Rational, Abs
+from lib_casimir import casimir, index, table
+from lib_reps import su, product
 
 # ==================== FRAMEWORK QUANTITIES ====================
 R, C_dim, H_dim, O_dim = 1, 2, 4, 8
@@ -25,7 +27,12 @@ n_quark_weyl = n_d
 n_doublets = N_c + 1   # = n_d by dim(H) = Im(H) + 1
 
 # ==================== DYNKIN INDEX SUMS ====================
-T_f = Rational(1, 2)
+T_f = Rational(index(su(3), (1, 0)))           # = 1/2 (fundamental)
+# One generation of left-handed Weyl fermions as (SU3 labels, SU2 label, Y)
+SM = product(su(3), su(2), u1=[[1, 1, 1, 1, 1]])
+gen = table(SM, [(1, 0, 1, Rational(1, 6)), (0, 1, 0, Rational(-2, 3)),
+                 (0, 1, 0, Rational(1, 3)), (0, 0, 1, Rational(-1, 2)),
+                 (0, 0, 0, 1)])
 S2f_SU3 = n_gen * n_quark_weyl * T_f           # = 6
 S2f_SU2 = n_gen * n_doublets * T_f             # = 6
 # U(1) GUT norm: per-gen sum Y'^2 = 2
@@ -35,7 +42,7 @@ S2f_U1 = n_gen * Y2_per_gen                    # = 6
 
 # Scalar (Higgs) indices
 S2s_SU3 = 0
-S2s_SU2 = Rational(1, 2)                       # 1 doublet
+S2s_SU2 = Rational(index(su(2), (1,)))         # 1 doublet
 S2s_U1 = 2 * Rational(3, 5) * Rational(1, 4)   # 2 comp, Y=1/2, GUT
 
 # ==================== BETA COEFFICIENTS ====================
@@ -72,6 +79,20 @@ tests.append(("S2f(SU2) = 6", S2f_SU2 == 6))
 tests.append(("S2f(U1)  = 6", S2f_U1 == 6))
 tests.append(("S2f = C * Im_H", S2f_SU3 == C_dim * Im_H))
 
+# --- Index sums and anomalies from the representation table ---
+tests.append(("S2f(SU3) = n_gen * sum_R dim_2 T_3 (rep table)",
+              S2f_SU3 == n_gen * sum(r.index[0] * r.dims[1] for r in gen)))
+tests.append(("S2f(SU2) = n_gen * sum_R dim_3 T_2 (rep table)",
+              S2f_SU2 == n_gen * sum(r.index[1] * r.dims[0] for r in gen)))
+tests.append(("C_2(adj SU3) = N_c, C_2(adj SU2) = 2",
+              casimir(su(3), (1, 1)) == N_c and casimir(su(2), (2,)) == 2))
+tests.append(("SU(3)^3 anomaly per generation = 0",
+              sum(r.anomaly[0] * r.dims[1] for r in gen) == 0))
+tests.append(("SU(3)^2 U(1), SU(2)^2 U(1), U(1)^3 anomalies per generation = 0",
+              sum(r.index[0] * r.dims[1] * r.charges[0] for r in gen) == 0
+              and sum(r.index[1] * r.dims[0] * r.charges[0] for r in gen) == 0
+              and sum(r.dim * r.charges[0] ** 3 for r in gen) == 0))
+
 # --- Universal fermion contribution = n_d ---
 tests.append(("f(SU3) = n_d = 4", f3 == n_d))
 tests.append(("f(SU2) = n_d = 4", f2 == n_d))
@@ -28,6 +28,7 @@ import numpy as np
 from numpy import linalg as la
 from scipy.optimize import minimize
 from sympy import symbols, exp, log, simplify, solve, diff, Rational, S, oo
+from suite_results import record
 
 tests_results = []
 
@@ -37,6 +38,7 @@ def record_test(name, passed):
     status = "PASS" if passed else "FAIL"
     tests_results.append((name, passed))
     print(f"[{status}] {name}")
+    record(name, passed)
 
 
 # ==============================================================================
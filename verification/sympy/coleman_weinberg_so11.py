@@ -8,6 +8,10 @@ invariant Tr(phi^3) -- the quartic-only potential selects (5,6), not (4,7).
 Potential: V(phi) = u [Tr(phi^2)]^2 + v Tr(phi^4)
 Background: phi_0 = sigma * D_{4,7} (block-diagonal direction)
 
+PART 7b scans the (w, v) plane with the cubic term on: for every point the
+lowest (p, N-p) vacuum is found and its full 65x65 Hessian is diagonalised
+(trace tables per background, one batched eigvalsh per split).
+
 Mass spectrum derived from exact Hessian:
   d^2 V = u[4(Tr phi_0 eta)^2 + 2 Tr(phi_0^2) Tr(eta^2)]
         + v[4 Tr(phi_0^2 eta^2) + 2 Tr(phi_0 eta phi_0 eta)]
@@ -22,12 +26,14 @@ Depends on:
 Created: Session 138
 """
 
-import sys, io
+import sys, io, time
 sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8', errors='replace')
 
 from sympy import Rational, sqrt, simplify, expand, collect, S, Symbol
 import numpy as np
 
+from lib_sym_traceless import sym_traceless
+
 N = 11
 
 # ==============================================================================
@@ -176,28 +182,9 @@ print("\n" + "=" * 70)
 print("PART 3: Numerical Verification (build full 65x65 mass matrix)")
 print("=" * 70)
 
-def build_basis(Nval):
-    """Build orthonormal basis for NxN symmetric traceless matrices."""
-    basis = []
-    for i in range(Nval):
-        for j in range(i+1, Nval):
-            E = np.zeros((Nval, Nval))
-            E[i,j] = 1.0/np.sqrt(2)
-            E[j,i] = 1.0/np.sqrt(2)
-            basis.append(E)
-    for k in range(Nval-1):
-        E = np.zeros((Nval, Nval))
-        norm = np.sqrt((k+1)*(k+2))
-        for i in range(k+1):
-            E[i,i] = 1.0/norm
-        E[k+1, k+1] = -(k+1.0)/norm
-        basis.append(E)
-    n = len(basis)
-    assert n == Nval*(Nval+1)//2 - 1
-    return basis
-
-# Build basis and background
-basis_11 = build_basis(N)
+# Shared sparse basis: orthonormal GKZ order, trace tables cached per N
+B11 = sym_traceless(N)
+basis_11 = B11.matrices()
 a_val = np.sqrt(7.0/44.0)
 b_val = -4.0*a_val/7.0
 
@@ -212,10 +199,10 @@ assert abs(np.trace(D47)) < 1e-12, "D not traceless"
 assert abs(np.trace(D47 @ D47) - 1.0) < 1e-12, "D not unit norm"
 
 # Compute d_a = Tr(D * E_a)
-d_vec = np.array([np.trace(D47 @ E) for E in basis_11])
+d_vec = B11.coefficients(D47)
 
-# Build full mass matrix for given u_val, v_val (at sigma=1)
-def build_mass_matrix(u_val, v_val, D, basis):
+# Reference: explicit double loop over basis pairs (one (u, v) at a time)
+def build_mass_matrix_reference(u_val, v_val, D, basis):
     n = len(basis)
     D2 = D @ D
     M2 = np.zeros((n, n))
@@ -232,9 +219,45 @@ def build_mass_matrix(u_val, v_val, D, basis):
             M2[b, a] = M2[a, b]
     return M2
 
+
+# Mass-spectrum engine. With the cubic term included,
+#   V = r Tr(phi^2) + w Tr(phi^3) + u [Tr(phi^2)]^2 + v Tr(phi^4)
+# the Hessian at phi_0 = sigma * D is LINEAR in (r, w sigma, u sigma^2, v sigma^2):
+#   M^2 = 2[r delta + 3 w sigma G1 + u sigma^2 (4 d d + 2 delta)
+#           + v sigma^2 (4 G2 + 2 H)]
+#   G1_ab = Tr(D E_a E_b),  G2_ab = Tr(D^2 E_a E_b),  H_ab = Tr(D E_a D E_b)
+# so the basis traces are contracted once per background and every coupling
+# point is a weighted sum of four fixed 65x65 matrices.
+
+def trace_tables(D, B):
+    """Coupling-independent Hessian blocks K[c] for c = (r, w sigma, u sigma^2, v sigma^2).
+
+    G1, G2 and H are contractions of the cached 3- and 4-point basis trace
+    tables of B (lib_sym_traceless) with the coordinates d_a of D.
+    """
+    d = B.coefficients(D)
+    G1, G2, H = B.background_tables(d)
+    I = np.eye(B.n)
+    return np.stack([2 * I, 6 * G1, 2 * (4 * np.outer(d, d) + 2 * I), 2 * (4 * G2 + 2 * H)])
+
+
+def mass_matrices(K, r=0.0, w=0.0, u=0.0, v=0.0, sigma=1.0):
+    """Stacked M^2 for arrays of couplings/backgrounds (broadcast together)."""
+    r, w, u, v, sigma = np.broadcast_arrays(*(np.asarray(x, dtype=float)
+                                              for x in (r, w, u, v, sigma)))
+    coeff = np.stack([r, w * sigma, u * sigma**2, v * sigma**2], axis=-1)
+    return np.einsum('...c,cab->...ab', coeff, K)
+
+
+def build_mass_matrix(u_val, v_val, D, B):
+    return mass_matrices(trace_tables(D, B), u=u_val, v=v_val)
+
+
+K47 = trace_tables(D47, B11)
+
 # Test with specific u, v values
 test_u, test_v = 1.0, 2.0
-M2_num = build_mass_matrix(test_u, test_v, D47, basis_11)
+M2_num = build_mass_matrix(test_u, test_v, D47, B11)
 evals = np.sort(np.linalg.eigvalsh(M2_num))
 
 # Analytic predictions
@@ -262,6 +285,10 @@ print(f"    m^2_7     =  4*{test_u} + 12*{test_v}*{b2_f:.6f} = {m2_7_pred:.6f}")
 max_err = max(abs(evals[i] - predicted[i]) for i in range(65))
 print(f"\n  Max eigenvalue discrepancy: {max_err:.2e}")
 
+M2_ref = build_mass_matrix_reference(test_u, test_v, D47, basis_11)
+engine_err = np.abs(M2_num - M2_ref).max()
+print(f"  Trace-table M^2 vs explicit double loop: max |diff| = {engine_err:.2e}")
+
 # Show eigenvalue clusters
 unique_evals = []
 for ev in evals:
@@ -293,7 +320,7 @@ print("=" * 70)
 v_ext = 10.0
 u_ext = -v_ext * I4_f
 
-M2_ext = build_mass_matrix(u_ext, v_ext, D47, basis_11)
+M2_ext = build_mass_matrix(u_ext, v_ext, D47, B11)
 evals_ext = np.sort(np.linalg.eigvalsh(M2_ext))
 
 # Count massless modes
@@ -508,6 +535,97 @@ for eta_val in [0, 0.5, 1, 2, 3, 5, 8, 12]:
     print(f" ({min_p},{N-min_p})")
 
 
+# ==============================================================================
+# PART 7b: DENSE PHASE-DIAGRAM SCAN WITH THE FULL MASS SPECTRUM
+# ==============================================================================
+
+print("\n" + "=" * 70)
+print("PART 7b: Dense (w, v) Phase-Diagram Scan (batched Hessians)")
+print("=" * 70)
+
+# V(sigma D_p) = r sigma^2 + w I_3 sigma^3 + (u + v I_4) sigma^4 on every
+# (p, N-p) background; the nonzero stationary points solve
+#   4 g sigma^2 + 3 w I_3 sigma + 2 r = 0,   g = u + v I_4.
+# A block-diagonal D is stationary in every other direction too (the
+# gradient is diagonal, traceless and constant on blocks, hence along D),
+# so the batched Hessian decides whether the winning split is a true local
+# minimum: p*q Goldstone zero modes and no negative modes.
+
+def block_background(p, Nval=N):
+    q = Nval - p
+    a = np.sqrt(q / (p * Nval))
+    return np.diag([a] * p + [-p * a / q] * q)
+
+r_scan, u_scan = -1.0, 1.0
+w_grid = np.linspace(-3.0, 3.0, 25)
+v_grid = np.linspace(-0.9, 3.0, 40)
+W, Vc = np.meshgrid(w_grid, v_grid, indexing='ij')
+
+t_scan = time.time()
+splits = list(range(1, N))
+tables = {}
+V_min = np.full((len(splits),) + W.shape, np.inf)
+sig_min = np.zeros((len(splits),) + W.shape)
+for k, p in enumerate(splits):
+    Dp = block_background(p)
+    tables[p] = trace_tables(Dp, B11)
+    I3p, I4p = np.trace(Dp @ Dp @ Dp), np.trace(Dp @ Dp @ Dp @ Dp)
+    g = u_scan + Vc * I4p
+    disc = (3 * W * I3p)**2 - 32 * g * r_scan
+    for sgn in (1, -1):
+        with np.errstate(invalid='ignore'):
+            sig = (-3 * W * I3p + sgn * np.sqrt(disc)) / (8 * g)
+        ok = (disc >= 0) & (sig > 0)
+        val = np.where(ok, r_scan * sig**2 + W * I3p * sig**3 + g * sig**4, np.inf)
+        better = val < V_min[k]
+        V_min[k] = np.where(better, val, V_min[k])
+        sig_min[k] = np.where(better, sig, sig_min[k])
+
+winner = np.argmin(V_min, axis=0)
+n_neg = np.zeros(W.shape, dtype=int)
+n_zero = np.zeros(W.shape, dtype=int)
+for k, p in enumerate(splits):
+    mask = winner == k
+    if not mask.any():
+        continue
+    M2 = mass_matrices(tables[p], r=r_scan, w=W[mask], u=u_scan, v=Vc[mask],
+                       sigma=sig_min[k][mask])
+    ev = np.linalg.eigvalsh(M2)                   # one batched call per split
+    tol = 1e-9 * np.abs(ev).max(axis=1, keepdims=True)
+    n_neg[mask] = (ev < -tol).sum(axis=1)
+    n_zero[mask] = (np.abs(ev) <= tol).sum(axis=1)
+t_scan = time.time() - t_scan
+
+n_points = W.size
+win_p = np.array(splits)[winner]
+# at w = v = 0 only [Tr(phi^2)] enters: SO(65) symmetry, all 64 angular modes flat
+enhanced = (np.abs(W) < 1e-12) & (np.abs(Vc) < 1e-12)
+goldstone_ok = (np.all((n_zero == win_p * (N - win_p))[~enhanced])
+                and np.all(n_zero[enhanced] == 64))
+print(f"\nr = {r_scan}, u = {u_scan}; {len(w_grid)} x {len(v_grid)} (w, v) grid, "
+      f"{len(splits)} backgrounds, {n_points} Hessians diagonalised in {t_scan:.2f}s")
+print(f"Map: digit p = winning (p, {N}-p) split and a local minimum of the full")
+print(f"65-dim potential; 'x' = winner has a negative Hessian mode (saddle).")
+print(f"\n{'w':>6s}   v = {v_grid[0]:.1f} ... {v_grid[-1]:.1f}")
+for i, w_val in enumerate(w_grid):
+    row = ''.join('x' if n_neg[i, j] else format(win_p[i, j], 'x')
+                  for j in range(len(v_grid)))
+    print(f"{w_val:>6.2f}   {row}")
+
+print(f"\n{'split':>8s} | {'points':>6s} | {'local min':>9s}")
+for p in splits:
+    sel = win_p == p
+    if sel.any():
+        print(f"{f'({p},{N-p})':>8s} | {sel.sum():>6d} | {(sel & (n_neg == 0)).sum():>9d}")
+n_47 = int(((win_p == 4) & (n_neg == 0)).sum())
+n_56 = int(((win_p == 5) & (n_neg == 0)).sum())
+print(f"\nGoldstone count = p*q at every scanned vacuum (64 at w = v = 0): {goldstone_ok}")
+print(f"(4,7) is the stable vacuum on {n_47}/{n_points} grid points, (5,6) on {n_56};")
+print(f"(4,7) (positive eigenvalue on the 4-block) needs w < 0 and sits between the")
+print(f"(3,8) and (5,6) wedges; w -> -w maps it to (7,4), i.e. phi -> -phi.")
+print(f"This is the cubic-quartic competition of PART 7 with the full spectrum included.")
+
+
 # ==============================================================================
 # PART 8: FRAMEWORK IMPLICATIONS
 # ==============================================================================
@@ -595,6 +713,15 @@ tests = [
     ("GW flat direction stable for v > 0",
      all(I4_values[p] >= I4_values[I4_min_p] for p in range(1, N))),
 
+    ("Trace-table M^2 = explicit double-loop M^2 (max diff < 1e-12)",
+     engine_err < 1e-12),
+
+    ("Scan: every winning split is a local min with p*q Goldstones",
+     goldstone_ok and np.all(n_neg == 0)),
+
+    ("Scan: (4,7) selected as stable vacuum in a w < 0 wedge",
+     n_47 > 0 and np.all(W[(win_p == 4)] < 0)),
+
     ("Mass ratio intra-4/intra-7 at extremum = 10",
      ratio_check == 10),
 
@@ -36,6 +36,11 @@ sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8', errors='repla
 from sympy import (Rational, sqrt, simplify, pi, log, S, N as Neval,
                    Float, symbols, solve, Eq, oo)
 import numpy as np
+import time
+
+from lib_casimir import casimir
+from lib_cw import solve_log_mass
+from lib_reps import su
 
 # ==============================================================================
 # SECTION 1: FRAMEWORK INPUTS
@@ -76,9 +81,9 @@ g_s = np.sqrt(4 * np.pi * alpha_s_MZ)
 N_c_color = 3                       # QCD colors
 
 # Casimirs
-C2_fund = Rational(4, 3)            # C_2(3) = (N^2-1)/(2N) for SU(3) fundamental
-C2_adj = 3                          # C_2(8) = N for SU(3) adjoint
-C2_su2 = Rational(3, 4)             # C_2(2) = (N^2-1)/(4N) for SU(2) doublet
+C2_fund = Rational(casimir(su(3), (1, 0)))   # C_2(3) = (N^2-1)/(2N) = 4/3
+C2_adj = int(casimir(su(3), (1, 1)))          # C_2(8) = N = 3
+C2_su2 = Rational(casimir(su(2), (1,)))      # C_2(2) = (N^2-1)/(4N) = 3/4
 
 # Gauge couplings (at M_Z scale, tree-level framework)
 g2_SU2 = float(4 * pi * alpha_EM / sin2_tW)    # g^2 for SU(2)_L
@@ -212,21 +217,10 @@ C2f = float(C2_fund)
 prefactor_QCD = 3 * C2f * g_s**2 / (16 * np.pi**2)
 print(f"QCD prefactor = 3*C_2*g_s^2/(16*pi^2) = {prefactor_QCD:.6f}")
 
-def solve_self_consistent_mass(prefactor, m_rho, n_iter=20):
-    """Solve m^2 = prefactor * m_rho^2 * log(m_rho^2/m^2) iteratively."""
-    # Initial guess: m ~ sqrt(prefactor) * m_rho
-    m = np.sqrt(prefactor) * m_rho * 0.5
-    for i in range(n_iter):
-        if m <= 0 or m >= m_rho:
-            return None
-        L = np.log(m_rho**2 / m**2)
-        if L <= 0:
-            return None
-        m_new = np.sqrt(prefactor * m_rho**2 * L)
-        if abs(m_new - m) / m < 1e-10:
-            return m_new
-        m = m_new
-    return m
+def solve_self_consistent_mass(prefactor, m_rho):
+    """Solve m^2 = prefactor * m_rho^2 * log(m_rho^2/m^2) (batched Newton, lib_cw)."""
+    sol = solve_log_mass(prefactor, m_rho)
+    return float(sol.value) if sol.converged else None
 
 # Scan over g_rho values
 print(f"\n{'g_rho':>6s} | {'m_rho (GeV)':>12s} | {'m_QCD (GeV)':>12s} | {'log factor':>10s} | {'m_QCD/f':>8s}")
@@ -352,9 +346,14 @@ We solve self-consistently with the combined prefactor.
 For the top contribution, we use the moderate estimate (10% of QCD).
 """)
 
-def solve_total_mass(g_rho, f, alpha_s, C2, g2, gp2, C2_2, Y2,
-                     top_fraction=0.10, n_iter=30):
-    """Solve for total colored pNGB mass including QCD + EW + top."""
+def solve_total_mass_grid(g_rho, f, alpha_s, C2, g2, gp2, C2_2, Y2, top_fraction=0.10):
+    """Total colored pNGB mass (QCD + EW + top) on broadcast parameter arrays.
+
+    Returns (m_total, m_QCD, m_EW, m_top, converged, iterations), each with
+    the broadcast shape of the inputs.
+    """
+    g_rho, f, alpha_s, top_fraction = np.broadcast_arrays(
+        *(np.asarray(x, dtype=float) for x in (g_rho, f, alpha_s, top_fraction)))
     m_rho = g_rho * f
 
     # Prefactors
@@ -362,35 +361,23 @@ def solve_total_mass(g_rho, f, alpha_s, C2, g2, gp2, C2_2, Y2,
     pf_QCD = 3 * C2 * g_s2 / (16 * np.pi**2)
     pf_EW = 3 * (C2_2 * g2 + Y2 * gp2) / (16 * np.pi**2)
 
-    # Total gauge prefactor (QCD + EW)
-    pf_gauge = pf_QCD + pf_EW
-
     # Including top: add fraction of QCD
     pf_total = pf_QCD * (1 + top_fraction) + pf_EW
 
-    # Self-consistent solve
-    m = np.sqrt(pf_total) * m_rho * 0.5  # initial guess
-    for i in range(n_iter):
-        if m <= 0 or m >= m_rho:
-            return None, None, None, None
-        L = np.log(m_rho**2 / m**2)
-        if L <= 0:
-            return None, None, None, None
-        m_new = np.sqrt(pf_total * m_rho**2 * L)
-        if abs(m_new - m) / m < 1e-10:
-            break
-        m = m_new
-    else:
-        m_new = m  # use last iterate if loop didn't break
+    # Self-consistent solve, then decompose using the final log
+    sol = solve_log_mass(pf_total, m_rho)
+    m2_L = np.where(sol.converged, sol.value**2 / pf_total, np.nan)   # = m_rho^2 L
+    return (sol.value, np.sqrt(pf_QCD * m2_L), np.sqrt(pf_EW * m2_L),
+            np.sqrt(pf_QCD * top_fraction * m2_L), sol.converged, sol.iterations)
 
-    # Decompose using final L
-    if m_new > 0 and m_new < m_rho:
-        L = np.log(m_rho**2 / m_new**2)
-        m2_qcd = pf_QCD * m_rho**2 * L
-        m2_ew = pf_EW * m_rho**2 * L
-        m2_top = pf_QCD * top_fraction * m_rho**2 * L
-        return m_new, np.sqrt(m2_qcd), np.sqrt(m2_ew), np.sqrt(m2_top)
-    return None, None, None, None
+
+def solve_total_mass(g_rho, f, alpha_s, C2, g2, gp2, C2_2, Y2, top_fraction=0.10):
+    """Solve for total colored pNGB mass including QCD + EW + top (one point)."""
+    m, m_q, m_ew, m_t, conv, _ = solve_total_mass_grid(
+        g_rho, f, alpha_s, C2, g2, gp2, C2_2, Y2, top_fraction=top_fraction)
+    if not conv:
+        return None, None, None, None
+    return float(m), float(m_q), float(m_ew), float(m_t)
 
 print(f"\n{'g_rho':>6s} | {'m_rho':>7s} | {'m_QCD':>7s} | {'m_EW':>6s} | {'m_top':>6s} | {'m_total':>8s} | {'m/f':>5s} | {'LHC':>10s}")
 print("-" * 80)
@@ -419,6 +406,48 @@ if '2' in results_table and 'n_d=4' in results_table:
     print(f"  m ~ g_rho^{np.log(ratio)/np.log(g_ratio):.2f} (expect ~1.0 for linear)")
 
 
+# ==============================================================================
+# SECTION 7b: 10^5-POINT PARAMETER SWEEP FOR LHC BOUNDS
+# ==============================================================================
+
+print("\n" + "=" * 70)
+print("SECTION 7b: Parameter Sweep (g_rho, f, alpha_s, top fraction)")
+print("=" * 70)
+
+g_grid = np.linspace(1.0, 4 * np.pi, 200)
+f_grid = np.linspace(800.0, 3000.0, 50)
+as_grid = np.linspace(0.110, 0.125, 5)          # alpha_s band around alpha_s(M_Z)
+ct_grid = np.linspace(0.0, 0.20, 2)             # top fraction band (0% and 20%)
+G_, F_, AS_, CT_ = np.meshgrid(g_grid, f_grid, as_grid, ct_grid, indexing='ij')
+
+t0 = time.time()
+m_grid, _, _, _, conv_grid, its_grid = solve_total_mass_grid(
+    G_, F_, AS_, C2f, g2_SU2, gp2_U1, C2d, Y2, top_fraction=CT_)
+t_grid = time.time() - t0
+print(f"\n{m_grid.size} points in {t_grid*1000:.0f} ms: converged {conv_grid.mean()*100:.1f}%, "
+      f"Newton iterations {its_grid.min()}-{its_grid.max()}")
+
+excluded = m_grid < 1500
+print(f"Fraction EXCLUDED (m_col < 1.5 TeV): {excluded.mean()*100:.1f}%")
+
+# smallest g_rho on the grid that clears each bound, over the (alpha_s, c_t) band
+print(f"\n{'f (GeV)':>8s} | {'g_rho min (1.5 TeV)':>20s} | {'g_rho min (1.8 TeV)':>20s}")
+print("-" * 56)
+for f_show in [800, 1000, 1354, 2000, 3000]:
+    j = np.argmin(np.abs(f_grid - f_show))
+    cols = []
+    for bound in (1500, 1800):
+        clear = m_grid[:, j] >= bound                  # (g, alpha_s, c_t)
+        first = np.where(clear.any(axis=0), g_grid[np.argmax(clear, axis=0)], np.inf)
+        cols.append(f"{first.min():.2f} - {first.max():.2f}")
+    print(f"{f_grid[j]:>8.0f} | {cols[0]:>20s} | {cols[1]:>20s}")
+
+# consistency with the scalar solver at the framework point
+m_fw = solve_total_mass_grid(4, f_val, alpha_s_MZ, C2f, g2_SU2, gp2_U1, C2d, Y2,
+                             top_fraction=c_t_mid)[0]
+sweep_ok = conv_grid.all() and abs(float(m_fw) - results_table['n_d=4']['m_total']) < 1e-9
+
+
 # ==============================================================================
 # SECTION 8: FRAMEWORK CANDIDATE g_rho = n_d = 4
 # ==============================================================================
@@ -716,6 +745,8 @@ else:
 # 4. Self-consistent solution converges
 converged = 'n_d=4' in results_table and results_table['n_d=4']['m_total'] is not None
 tests.append(("Self-consistent solution converges", converged))
+tests.append(("10^5-point sweep converges everywhere and matches the g_rho = 4 point",
+              sweep_ok))
 
 # 5. Mass scales approximately linearly with g_rho
 if '2' in results_table and 'n_d=4' in results_table:
@@ -26,8 +26,21 @@ To truncate at degree 4, one needs either:
 Status: INVESTIGATION
 """
 
+from functools import lru_cache
+
 import numpy as np
 
+from lib_invariants import (hilbert_series, generator_degrees, jacobian_rank,
+                            random_sym0, power_sums, monomials, evaluate, linear_rank)
+from lib_reps import so
+
+
+@lru_cache(maxsize=None)
+def sym0_series(n, degree):
+    """Exact Hilbert series of SO(n) on Sym_0(R^n) (highest weight 2 e_1)."""
+    A = so(n)
+    return tuple(hilbert_series(A, (2,) + (0,) * (A.rank - 1), degree))
+
 
 def test_invariant_ring_generators():
     """Test 1: Classify SO(n) invariant polynomials on Sym_0(R^n)"""
@@ -58,6 +71,21 @@ def test_invariant_ring_generators():
     checks.append((f"Number of independent generators = {num_gens} = {n - 1}",
                     num_gens == n - 1))  # 10 generators
 
+    # Check both claims instead of assuming them:
+    # - the exact Hilbert series (Weyl integration) through degree n + 1
+    #   needs free generators in degrees 2..n and nothing new at n + 1
+    # - the Jacobian of Tr(eps^2..n) has full rank n - 1 at a point with
+    #   distinct integer eigenvalues (exact), so they are algebraically
+    #   independent; Tr(eps^(n+1)) does not raise the rank
+    series = sym0_series(n, n + 1)
+    lam = np.arange(-(n // 2), n // 2 + 1)     # distinct, traceless (n odd)
+    print(f"\n  Hilbert series of SO({n}) on Sym_0, degrees 0..{n + 1}: {list(series)}")
+    checks.append((f"Hilbert series -> generators in degrees {independent_gens[0]}..{independent_gens[-1]}",
+                    generator_degrees(series) == independent_gens))
+    checks.append((f"Jacobian rank of Tr(eps^2..{n}) = {n - 1}; with Tr(eps^{n + 1}) still {n - 1}",
+                    jacobian_rank(lam, range(2, n + 1)) == n - 1
+                    and jacobian_rank(lam, range(2, n + 2)) == n - 1))
+
     # List generators by degree:
     print()
     print("  Degree | Generator | Type")
@@ -370,11 +398,18 @@ def test_invariant_ring_structure():
 
     gen_degrees = list(range(2, n + 1))  # 2, 3, ..., 11
 
+    # Exact invariant counts (Weyl integration) and the rank of 2000 random
+    # evaluations of all trace monomials of each degree (Monte Carlo)
+    series = sym0_series(n, 12)
+    p = power_sums(random_sym0(n, 2000, np.random.default_rng(11)), 8)
+    mc_rank = {d: linear_rank(evaluate(p, monomials(range(2, 9), d))) for d in range(2, 9)}
+
     print()
-    print("  Degree | Monomials | Examples")
-    print("  -------|-----------|--------")
+    print("  Degree | Monomials | Exact | MC rank | Examples")
+    print("  -------|-----------|-------|---------|--------")
     for d in range(2, 13):
         num = count_monomials(d, gen_degrees)
+        mc = f"{mc_rank[d]:7d}" if d in mc_rank else "      -"
         examples = ""
         if d == 2:
             examples = "Tr(eps^2)"
@@ -386,7 +421,7 @@ def test_invariant_ring_structure():
             examples = "Tr(eps^5), Tr(eps^2)*Tr(eps^3)"
         elif d == 6:
             examples = "Tr(eps^6), Tr(eps^2)*Tr(eps^4), ..."
-        print(f"  {d:6d} | {num:9d} | {examples}")
+        print(f"  {d:6d} | {num:9d} | {series[d]:5d} | {mc} | {examples}")
 
     # At degree 4: 2 monomials (Tr(eps^4) and (Tr(eps^2))^2)
     # At degree 5: 2 monomials (Tr(eps^5) and Tr(eps^2)*Tr(eps^3))
@@ -396,6 +431,10 @@ def test_invariant_ring_structure():
     checks.append(("Degree 4: 2 invariant monomials", count_monomials(4, gen_degrees) == 2))
     checks.append(("Degree 5: 2 invariant monomials", count_monomials(5, gen_degrees) == 2))
     checks.append(("Degree 6: 4 invariant monomials", count_monomials(6, gen_degrees) == 4))
+    checks.append(("Exact invariant count = monomial count for degrees 2..12",
+                    all(series[d] == count_monomials(d, gen_degrees) for d in range(2, 13))))
+    checks.append(("Monte Carlo rank (2000 samples) = exact count for degrees 2..8",
+                    all(mc_rank[d] == series[d] for d in range(2, 9))))
 
     # Total monomials up to degree 4 (the "quartic" potential):
     total_quartic = sum(count_monomials(d, gen_degrees) for d in range(2, 5))
@@ -34,6 +34,8 @@ Status: VERIFICATION
 import numpy as np
 from fractions import Fraction
 
+from lib_lie import from_matrices
+
 
 def e_basis(i, j, n):
     """Generator E_ij - E_ji of so(n) as integer numpy array"""
@@ -53,43 +55,16 @@ def flatten_matrix(m):
     return m.flatten()
 
 
-def compute_generated_dim(seed_matrices, all_generators, n, max_iterations=4):
+def compute_generated_dim(seed_matrices, all_generators, n):
     """Compute dimension of ideal generated by seed_matrices in the Lie algebra
     spanned by all_generators, via iterated Lie brackets.
 
-    Uses numpy for fast numerical linear algebra.
+    Uses the lib_lie closure engine: an orthonormal basis of the ideal is
+    grown by bracketing only the newest vectors, keeping only independent
+    ones, until the span stops growing (the full closure, no depth cap).
     """
-    nn = n * n  # flattened dimension
-
-    # Collect all generated vectors
-    vectors = [flatten_matrix(m).astype(float) for m in seed_matrices]
-
-    for iteration in range(max_iterations):
-        new_vectors = []
-        for g in all_generators:
-            for h_idx in range(len(vectors)):
-                h_mat = vectors[h_idx].reshape(n, n)
-                b = lie_bracket(g, h_mat.astype(int))
-                b_flat = flatten_matrix(b).astype(float)
-                if np.any(b_flat != 0):
-                    new_vectors.append(b_flat)
-
-        if not new_vectors:
-            break
-
-        vectors.extend(new_vectors)
-
-        # Periodically compute rank to check if we've reached full dimension
-        mat = np.array(vectors)
-        current_rank = np.linalg.matrix_rank(mat, tol=0.5)
-
-        # If we've reached the target, stop early
-        target = n * (n - 1) // 2  # dim(so(n))
-        if current_rank >= target:
-            break
-
-    mat = np.array(vectors)
-    return np.linalg.matrix_rank(mat, tol=0.5)
+    L = from_matrices(f"so({n})", all_generators)
+    return len(L.ideal(seed_matrices))
 
 
 def test_so_n_simple():
@@ -146,7 +121,7 @@ def test_ideal_generation_so5():
     # Seed: single generator E_01 - E_10
     seed = [e_basis(0, 1, n)]
 
-    generated_dim = compute_generated_dim(seed, all_gens, n, max_iterations=5)
+    generated_dim = compute_generated_dim(seed, all_gens, n)
 
     checks = []
     checks.append((f"dim(so(5)) = {dim_target}", dim_target == 10))
@@ -179,7 +154,7 @@ def test_ideal_generation_so7():
     # so(2) in the "defect block" (indices 0,1)
     seed = [e_basis(0, 1, n)]
 
-    generated_dim = compute_generated_dim(seed, all_gens, n, max_iterations=5)
+    generated_dim = compute_generated_dim(seed, all_gens, n)
 
     checks = []
     checks.append((f"dim(so(7)) = {dim_target}", dim_target == 21))
@@ -379,7 +354,7 @@ def test_su2_tangent_generation():
     # so(2) seed in defect block
     seed = [e_basis(0, 1, n)]
 
-    generated_dim = compute_generated_dim(seed, all_gens, n, max_iterations=4)
+    generated_dim = compute_generated_dim(seed, all_gens, n)
 
     # Check that tangent space directions (off-diagonal blocks) are generated
     # Tangent gens: E_{i,j} with i in {0,1}, j in {2,3,4}
@@ -427,7 +402,7 @@ def test_so4_in_so11_concrete():
             seed.append(e_basis(i, j, n))
 
     seed_dim = len(seed)
-    generated_dim = compute_generated_dim(seed, all_gens, n, max_iterations=3)
+    generated_dim = compute_generated_dim(seed, all_gens, n)
 
     checks = []
     checks.append((f"dim(so(11)) = {dim_target}", dim_target == 55))
@@ -30,8 +30,12 @@ Created: Session 212
 import sys, io
 sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8', errors='replace')
 
+import numpy as np
 from sympy import Rational, sqrt, simplify, factorial, binomial, S, N as Neval
 
+import lib_lie
+from lib_clifford import clifford
+
 # ==============================================================================
 # FRAMEWORK QUANTITIES
 # ==============================================================================
@@ -150,6 +154,37 @@ count = 2*1 + 2*1 + 2*3 + 2*3 + 1*2 + 1*2 + 1*2*3 + 1*2*3
 print(f"  Count: 2+2+6+6 + 2+2+6+6 = {count}")
 assert count == 32
 
+# Explicit check with the Cl(11) gamma matrices: SO(4) acts on axes 0-3,
+# SO(7) on axes 4-10. G2 is embedded through its 7x7 generators; SU(3) is
+# the subalgebra of G2 annihilating e_7 (the direction selected by C).
+cl11 = clifford(n_c)
+casimir_L, casimir_R = (np.linalg.eigvalsh(M.toarray())
+                        for M in cl11.su2_casimirs(range(n_d)))
+n_doublets_L = int(np.sum(np.isclose(casimir_L, 0.75)))
+n_doublets_R = int(np.sum(np.isclose(casimir_R, 0.75)))
+
+
+def n_invariant(generators_7):
+    """Dimension of the common kernel of so(7) generators acting on the 32."""
+    X = np.zeros((len(generators_7), n_c, n_c))
+    X[:, n_d:, n_d:] = generators_7
+    stacked = np.vstack([R.toarray() for R in cl11.represent_all(X)])
+    return dim_spinor - np.linalg.matrix_rank(stacked, tol=1e-9)
+
+
+g2_gens = lib_lie.g2().generators()
+e7_images = g2_gens[:, :, -1].T                 # columns X_i e_7
+_, sv, vt = np.linalg.svd(e7_images)
+su3_gens = np.tensordot(vt[int(np.sum(sv > 1e-9)):], g2_gens, axes=1)
+n_g2_singlets = n_invariant(g2_gens)
+n_su3_singlets = n_invariant(su3_gens)
+
+print(f"\nExplicit Cl({n_c}) gamma matrices (dim {cl11.dim}):")
+print(f"  SU(2)_L doublet states: {n_doublets_L}, SU(2)_R doublet states: {n_doublets_R}")
+print(f"  SU(3) = Stab_G2(e_7): dim {len(su3_gens)}")
+print(f"  G2 singlets in 32: {n_g2_singlets} = 4 x 1  (8 -> 1 + 7)")
+print(f"  SU(3) singlets in 32: {n_su3_singlets} = 4 x 2  (8 -> 1 + 1 + 3 + 3bar)")
+
 # ==============================================================================
 # PART 4: FERMION COUNTING -- HALF-SPINOR = ONE GENERATION
 # ==============================================================================
@@ -466,6 +501,15 @@ tests = [
     ("7 of G2 under SU(3): 7 = 1 + 3 + 3bar",
      1 + 3 + 3 == Im_O),
 
+    ("Cl(11) gammas: 32 = (2,1;8) + (1,2;8) (16 doublets of each SU(2))",
+     cl11.dim == dim_spinor and n_doublets_L == n_doublets_R == 16),
+
+    ("Cl(11) gammas: G2 singlets in 32 = 4 (8 -> 1 + 7)",
+     n_g2_singlets == dim_spinor_SO4),
+
+    ("Cl(11) gammas: SU(3) singlets in 32 = 8 (8 -> 1 + 1 + 3 + 3bar)",
+     len(su3_gens) == 8 and n_su3_singlets == 2 * dim_spinor_SO4),
+
     # Fermion counting
     ("SM fermions per generation = 15",
      SM_fermions == 15),
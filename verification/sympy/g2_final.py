@@ -3,7 +3,8 @@
 G_2 dimension and irreducibility - FINAL version.
 
 Uses the Wikipedia/standard octonion multiplication table with
-VERIFIED Fano plane orientation satisfying Moufang identities.
+VERIFIED Fano plane orientation satisfying Moufang identities
+(built by Cayley-Dickson doubling in lib_cayley_dickson).
 
 Key result: dim(g_2) = 14, and g_2 does NOT preserve Im(H).
 
@@ -11,74 +12,46 @@ Status: VERIFICATION
 Created: Session 189
 """
 
+import numpy as np
 from sympy import *
 
+import lib_exact
+from lib_cayley_dickson import octonions
+
 # ==============================================================================
 # Octonion multiplication table (Wikipedia convention)
 # ==============================================================================
 
-# Positive-oriented Fano triples: (a,b,c) means e_a * e_b = +e_c
-# From the standard octonion multiplication table
-FANO = [(1,2,3), (1,4,5), (1,7,6), (2,4,6), (2,5,7), (3,4,7), (3,6,5)]
-
-# Build multiplication for imaginary units e_1,...,e_7
-mult = {}
-for a in range(1, 8):
-    mult[(a, a)] = (-1, 0)  # e_a^2 = -1
-
-for (a, b, c) in FANO:
-    mult[(a, b)] = (+1, c); mult[(b, c)] = (+1, a); mult[(c, a)] = (+1, b)
-    mult[(b, a)] = (-1, c); mult[(c, b)] = (-1, a); mult[(a, c)] = (-1, b)
+# Cayley-Dickson doubling of H; its positive Fano triples (a,b,c), meaning
+# e_a * e_b = +e_c, are the standard octonion multiplication table:
+# (1,2,3), (1,4,5), (1,7,6), (2,4,6), (2,5,7), (3,4,7), (3,6,5)
+O = octonions()
+E = O.units()                     # e_0 = 1, e_1..e_7 as exact integer rows
 
 # ==============================================================================
 # Verify: Moufang identity (xy)(zx) = x((yz)x)
 # ==============================================================================
 
-def oct_mult(x, y):
-    """Multiply two imaginary octonion vectors (7-component).
-    Returns (real_part, imag_7vector)."""
-    real = Integer(0)
-    imag = [Integer(0)] * 7
-    for i in range(7):
-        for j in range(7):
-            if x[i] == 0 or y[j] == 0:
-                continue
-            s, idx = mult[(i+1, j+1)]
-            coeff = x[i] * y[j] * s
-            if idx == 0:
-                real += coeff
-            else:
-                imag[idx - 1] += coeff
-    return real, imag
-
 print("Moufang identity check: (xy)(zx) = x((yz)x)")
-moufang_ok = True
-checked = 0
-for a in range(1, 8):
-    for b in range(1, 8):
-        for c in range(1, 8):
-            if a == b or b == c or a == c:
-                continue
-            x = [Integer(1) if i == a-1 else Integer(0) for i in range(7)]
-            y = [Integer(1) if i == b-1 else Integer(0) for i in range(7)]
-            z = [Integer(1) if i == c-1 else Integer(0) for i in range(7)]
-
-            # (xy)(zx)
-            _, xy = oct_mult(x, y)
-            _, zx = oct_mult(z, x)
-            r_lhs, lhs = oct_mult(xy, zx)
-
-            # x((yz)x)
-            _, yz = oct_mult(y, z)
-            _, yzx = oct_mult(yz, x)
-            r_rhs, rhs = oct_mult(x, yzx)
-
-            if r_lhs != r_rhs or lhs != rhs:
-                print(f"  FAIL: ({a},{b},{c}): LHS != RHS")
-                moufang_ok = False
-            checked += 1
-
-print(f"  Checked {checked} triples: {'ALL OK' if moufang_ok else 'FAILURES'}")
+triples = np.array([(a, b, c) for a in range(1, 8) for b in range(1, 8) for c in range(1, 8)
+                    if len({a, b, c}) == 3])
+x, y, z = E[triples[:, 0]], E[triples[:, 1]], E[triples[:, 2]]
+# Full 8-component products: real parts such as e_a e_a = -1 are kept
+lhs = O.mul(O.mul(x, y), O.mul(z, x))
+rhs = O.mul(x, O.mul(O.mul(y, z), x))
+bad = np.nonzero((lhs != rhs).any(axis=1))[0]
+for a, b, c in triples[bad]:
+    print(f"  FAIL: ({a},{b},{c}): LHS != RHS")
+checked = len(triples)
+
+# Moufang is not linear, so also check generic (integer) octonions
+rng = np.random.default_rng(189)
+x, y, z = rng.integers(-9, 10, (3, 1000, 8))
+generic_ok = (O.mul(O.mul(x, y), O.mul(z, x)) == O.mul(x, O.mul(O.mul(y, z), x))).all()
+moufang_ok = len(bad) == 0 and generic_ok
+
+print(f"  Checked {checked} triples: {'ALL OK' if len(bad) == 0 else 'FAILURES'}")
+print(f"  Checked 1000 random integer octonion triples: {'ALL OK' if generic_ok else 'FAILURES'}")
 
 # ==============================================================================
 # Compute derivation algebra via constraint matrix rank
@@ -86,60 +59,17 @@ print(f"  Checked {checked} triples: {'ALL OK' if moufang_ok else 'FAILURES'}")
 
 print(f"\nComputing derivation space...")
 
-# 21 parameters for upper triangle of skew-symmetric 7x7
-param_idx = {}
-idx = 0
-for i in range(7):
-    for j in range(i + 1, 7):
-        param_idx[(i, j)] = idx
-        idx += 1
-n_params = idx  # 21
-
-def D_coeff(i, j):
-    """Coefficient vector (length 21) for D[i,j]."""
-    v = [0] * n_params
-    if i == j:
-        return v
-    if i < j:
-        v[param_idx[(i, j)]] = 1
-    else:
-        v[param_idx[(j, i)]] = -1
-    return v
-
-rows = []
-for a in range(1, 8):
-    for b in range(a + 1, 8):
-        s_ab, c_ab = mult[(a, b)]
-        if c_ab == 0:
-            continue
-        for t in range(1, 8):
-            row = [0] * n_params
-            # LHS: s_ab * D[t-1, c_ab-1]
-            lhs = D_coeff(t - 1, c_ab - 1)
-            for k in range(n_params):
-                row[k] += s_ab * lhs[k]
-            # RHS1: sum_k D[k-1,a-1] * sign(e_k*e_b -> e_t)
-            for k in range(1, 8):
-                s_kb, i_kb = mult[(k, b)]
-                if i_kb == t:
-                    c = D_coeff(k - 1, a - 1)
-                    for m in range(n_params):
-                        row[m] -= s_kb * c[m]
-            # RHS2: sum_k D[k-1,b-1] * sign(e_a*e_k -> e_t)
-            for k in range(1, 8):
-                s_ak, i_ak = mult[(a, k)]
-                if i_ak == t:
-                    c = D_coeff(k - 1, b - 1)
-                    for m in range(n_params):
-                        row[m] -= s_ak * c[m]
-            if any(x != 0 for x in row):
-                rows.append(row)
-
-M = Matrix(rows)
-r = M.rank()
+# Unknowns: the 64 entries of D acting on e_0..e_7, D e_q = sum_p D[p,q] e_p.
+# One row per component of D(e_a e_b) - D(e_a) e_b - e_a D(e_b) = 0;
+# D(1) = 0 and antisymmetry come out of the constraints.
+rows = O.derivation_rows().tolist()
+n_params = O.dim ** 2  # 64
+
+# Exact integer rank (fraction-free, same result as Matrix(rows).rank())
+r = lib_exact.rank(rows, n_params)
 dim_der = n_params - r
 
-print(f"Constraint matrix: {M.rows} x {n_params}")
+print(f"Constraint matrix: {len(rows)} x {n_params}")
 print(f"Rank: {r}")
 print(f"dim(derivation space) = {n_params} - {r} = {dim_der}")
 
@@ -153,32 +83,25 @@ tests.append(("dim(g_2) = 14", dim_der == 14))
 
 print(f"\nChecking if derivations preserve Im(H) = span{{e_1, e_2, e_3}}...")
 
-N = M.nullspace()
+N = lib_exact.nullspace(rows, n_params)
 print(f"Nullspace basis: {len(N)} vectors")
 
 def reconstruct_D(vec):
-    mat = zeros(7, 7)
-    idx = 0
-    for i in range(7):
-        for j in range(i + 1, 7):
-            mat[i, j] = vec[idx]
-            mat[j, i] = -vec[idx]
-            idx += 1
-    return mat
+    return Matrix(8, 8, vec)
 
 breaks_imH = False
 mixing_count = 0
 for k, v in enumerate(N):
     D_k = reconstruct_D(v)
-    for a in range(3):
-        for c in range(3, 7):
+    for a in range(1, 4):
+        for c in range(4, 8):
             if D_k[c, a] != 0:
                 if not breaks_imH:
                     print(f"  First mixing derivation found (basis #{k}):")
                 breaks_imH = True
                 mixing_count += 1
                 if mixing_count <= 6:
-                    print(f"    D(e_{a+1}) has e_{c+1} component = {D_k[c,a]}")
+                    print(f"    D(e_{a}) has e_{c} component = {D_k[c,a]}")
 
 if mixing_count > 6:
     print(f"    ... ({mixing_count} total non-zero mixing entries)")
@@ -197,14 +120,13 @@ tests.append(("g_2 does NOT preserve Im(H)", breaks_imH))
 if breaks_imH and dim_der > 0:
     # Add constraints that D preserves the (3,4) split
     extra_rows = list(rows)
-    for a in range(3):
-        for c in range(3, 7):
-            row = D_coeff(c, a)
-            if any(x != 0 for x in row):
-                extra_rows.append(row)
-
-    M_stab = Matrix(extra_rows)
-    r_stab = M_stab.rank()
+    for a in range(1, 4):
+        for c in range(4, 8):
+            row = [0] * n_params
+            row[c * 8 + a] = 1
+            extra_rows.append(row)
+
+    r_stab = lib_exact.rank(extra_rows, n_params)
     dim_stab = n_params - r_stab
     print(f"\nStabilizer of Im(H) in g_2:")
     print(f"  dim(stabilizer) = {dim_stab}")
@@ -18,6 +18,27 @@ Status: INVESTIGATION
 from sympy import *
 from itertools import permutations
 
+from lib_reps import g2, so, su, product
+
+# SO(4) = SU(2)_L x SU(2)_R inside G_2 inside SO(7), with the same
+# embeddings as wolf_space_verification.py
+G2, SO7 = g2(), so(7)
+SO4 = product(su(2), su(2))
+h = Rational(1, 2)
+TO_SO4 = [[h, -h, 0], [-h, h, 0], [-h, -h, 1], [h, h, -1]]
+TO_G2 = [[Rational(int(i == j)) - Rational(1, 3) for j in range(3)] for i in range(3)]
+
+def spins(rep):
+    """Sorted (j_L, j_R) content of an SU(2) x SU(2) representation."""
+    return sorted((Rational(a, 2), Rational(b, 2)) for (a, b), m in rep.items() for _ in range(m))
+
+def so7_to_so4(hw):
+    out = {}
+    for w2, m2 in SO7.branch(hw, G2, TO_G2).items():
+        for w4, m4 in G2.branch(w2, SO4, TO_SO4).items():
+            out[w4] = out.get(w4, 0) + m2 * m4
+    return out
+
 # Framework constants
 dim_R = 1
 dim_C = 2
@@ -289,16 +310,17 @@ print("\n--- Section 6: 42-dim Space as SO(4)-Module ---")
 # so(7) under SO(4): so(7) = so(4) + complement
 #   complement = so(7)/so(4) has dim 21-6 = 15
 
-# G_2 branching under SO(4) = SU(2) x SU(2):
-# g_2 -> (1,0) + (0,1) + (1/2, 1/2) + (1/2, 1/2)
-# Wait, that's: 3 + 3 + 4 + 4 = 14? Yes!
-# (1,0): dim 3, (0,1): dim 3
-# Two copies of (1/2,1/2): dim 4 each, total 8
+# G_2 branching under SO(4) = SU(2) x SU(2), by projecting the g_2
+# weights onto the SO(4) torus (as in wolf_space_verification.py):
+# g_2 -> (1,0) + (0,1) + (1/2, 3/2)
+# m = (1/2, 3/2) is irreducible: 2 * 4 = 8, not two copies of (1/2,1/2)
+branch_14 = spins(G2.branch((1, 0), SO4, TO_SO4))
 
 print("G_2 decomposition under SO(4) = SU(2) x SU(2):")
-print("  g_2 -> (1,0) + (0,1) + 2*(1/2, 1/2)")
-print(f"  dims: 3 + 3 + 2*4 = 6 + 8 = {6 + 8} = dim(G_2)")
-tests.append(("G_2 under SO(4): 3+3+4+4=14", 3+3+4+4 == 14))
+print(f"  g_2 -> {' + '.join(str(j) for j in branch_14)}")
+print(f"  dims: 3 + 3 + 8 = 6 + 8 = {6 + 8} = dim(G_2)")
+tests.append(("G_2 under SO(4): (1,0)+(0,1)+(1/2,3/2)",
+              branch_14 == [(0, 1), (h, 3 * h), (1, 0)]))
 
 # so(7) under SO(4):
 # 7 (defining of SO(7)) -> under SO(4):
@@ -310,11 +332,11 @@ tests.append(("G_2 under SO(4): 3+3+4+4=14", 3+3+4+4 == 14))
 
 # Let's use the chain: R^7 under G_2 = 7 (fundamental, irreducible)
 # Under SO(4) subset G_2: 7 -> (1/2,1/2) + (0,1) = 4 + 3
-# Check: 4+3=7. This is the correct branching.
+branch_7 = spins(so7_to_so4((1, 0, 0)))
 
 print(f"\n7 of SO(7) under SO(4) via G_2:")
-print(f"  7 -> (1/2,1/2) + (0,1) = 4 + 3")
-tests.append(("7 = 4+3 under SO(4)", 4+3 == 7))
+print(f"  7 -> {' + '.join(str(j) for j in branch_7)} = 3 + 4")
+tests.append(("7 = 4+3 under SO(4)", branch_7 == [(0, 1), (h, h)]))
 
 # so(7) = Lambda^2(R^7) under SO(4):
 # Lambda^2(7) = Lambda^2(4+3)
@@ -324,15 +346,12 @@ tests.append(("7 = 4+3 under SO(4)", 4+3 == 7))
 # Lambda^2(4) where 4=(1/2,1/2):
 # = (1,0) + (0,1) = 3+3 = 6 (this is so(4)!)
 # (4 tensor 3) where 4=(1/2,1/2), 3=(0,1):
-# = (1/2,1/2)x(0,1) = (1/2,3/2) + (1/2,1/2) = 4 + 4... wait
-# Actually (j1,j2)x(0,j3) = (j1,j2+j3) + ... + (j1,|j2-j3|)
+# (j1,j2)x(0,j3) = (j1,j2+j3) + ... + (j1,|j2-j3|)
 # (1/2,1/2)x(0,1) = (1/2, 3/2) + (1/2, 1/2)
 # dims: (2)(4) + (2)(2) = 8 + 4 = 12. Yes!
 
 # Lambda^2(3) where 3=(0,1):
-# = (0,0) + (0,2)? No.
-# Lambda^2 of (0,1)=3: this gives (0,1) back (adjoint of SU(2))... wait
-# Actually, Lambda^2 of the spin-1 rep of SU(2) = spin-1 rep = 3-dim
+# Lambda^2 of the spin-1 rep of SU(2) = spin-1 rep = 3-dim
 # So Lambda^2(3) = 3 = (0,1)
 
 print(f"\nso(7) = Lambda^2(R^7) decomposition under SO(4):")
@@ -341,118 +360,61 @@ print(f"  = {6} + {12} + {3} = {6+12+3}")
 print(f"  = [(1,0)+(0,1)] + [(1/2,3/2)+(1/2,1/2)] + [(0,1)]")
 tests.append(("Lambda^2(4+3) = 6+12+3 = 21", 6+12+3 == 21))
 
-# Full 42-dim space as SO(4)-module:
-# R^1: (0,0), dim 1
-# so(4): (1,0)+(0,1), dim 6
-# g_2: (1,0)+(0,1)+2*(1/2,1/2), dim 14
-# so(7): (1,0)+(0,1)+(1/2,3/2)+(1/2,1/2)+(0,1)+Lambda^2(4), dim 21
-#   = (1,0)+(0,1)+(1/2,3/2)+(1/2,1/2)+(0,1)+(1,0)+(0,1)
-#   Wait, let me be more careful.
-
-# Total SO(4) content of 42-dim space:
-# From R: (0,0) x1 -> dim 1
-# From so(4): (1,0)+(0,1) -> dim 3+3=6
-# From g_2: (1,0)+(0,1)+2*(1/2,1/2) -> dim 3+3+4+4=14
-# From so(7): need full decomposition
-
-# For so(7): (1,0)+(0,1)+(0,1)+(1/2,1/2)+(1/2,3/2)
-# dims: 3+3+3+4+8=21
-
-print(f"\nFull 42 under SO(4) = SU(2)_L x SU(2)_R:")
-print(f"  R:    (0,0)                                dim: 1")
-print(f"  so4:  (1,0) + (0,1)                        dim: 6")
-print(f"  g_2:  (1,0) + (0,1) + 2*(1/2,1/2)          dim: 14")
-print(f"  so7:  2*(1,0) + 2*(0,1) + (1/2,1/2) + (1/2,3/2) dim: 21")
-
-# Count total multiplicities of each SO(4) irrep across all layers:
-# (0,0): 1 (from R)
-# (1,0): 1+1+2 = 4 copies, each dim 3 -> total 12
-# (0,1): 1+1+2 = 4 copies, each dim 3 -> total 12
-# Wait, I need to be more careful. Let me just count dimensions.
-# 1 + 6 + 14 + 21 = 42. Correct.
-
-# Let me count the spin-1/2 content (the "fermionic" reps):
-# (1/2,1/2) from g_2: 2 copies = 8 dim
-# (1/2,1/2) from so(7): 1 copy = 4 dim
-# (1/2,3/2) from so(7): 1 copy = 8 dim
-# Total half-integer: 8 + 4 + 8 = 20 dim
-
-# Integer spin content:
-# (0,0) from R: 1 dim
-# (1,0) from so(4) + g_2 + so(7): (1+1+2) = 4, dim 12
-# (0,1) from so(4) + g_2 + so(7): (1+1+2) = 4, dim 12
-# But wait, so(7) has different content. Let me just tally:
-# Integer: 1 + 6 + (3+3) + (3+3+3+3) = 1+6+6+12 = 25? No.
-# Hmm, I'm confusing myself. Let me be explicit.
-
-# IMPORTANT: g_2 and so(7) overlap (g_2 subset so(7)).
-# The 42-dim space is R + so(4) + g_2 + so(7) as SEPARATE vector spaces
-# (not quotients). So the representations just add.
-
-# Let me count more carefully what's half-integer vs integer.
-# Half-integer reps have j_L or j_R in {1/2, 3/2, ...}
-# (1/2, 1/2): dim 4. From g_2: 2 copies, from so(7): 1 copy = 3 total = 12 dim
-# (1/2, 3/2): dim 8. From so(7): 1 copy = 8 dim
-# Total half-integer: 12 + 8 = 20
-
-# Integer reps:
-# (0,0): dim 1. From R: 1 copy = 1 dim
-# (1,0): dim 3. From so(4): 1, g_2: 1, so(7): 2 = 4 total = 12 dim
-# Wait, I need the correct so(7) decomposition.
-
-# Let me recount so(7) under SO(4):
-# so(7) = Lambda^2(R^7), with R^7 = (1/2,1/2) + (0,1) under SO(4)
-# Lambda^2((1/2,1/2) + (0,1)):
-# = Lambda^2(1/2,1/2) + ((1/2,1/2) tensor (0,1)) + Lambda^2(0,1)
-# Lambda^2 of 4-dim rep (1/2,1/2):
-#   = antisymmetric part of (1/2,1/2)x(1/2,1/2)
-#   = (1,0) + (0,1) [the so(4) adjoint]. Dim 6. Correct.
-# (1/2,1/2) tensor (0,1):
-#   = sum over j_R from |1/2-1|=1/2 to 1/2+1=3/2
-#   = (1/2, 1/2) + (1/2, 3/2). Dims 4+8=12.
-# Lambda^2 of (0,1):
-#   = (0,1) [since Lambda^2 of spin-j is the adjoint if j=1]
-#   Wait: Lambda^2 of a 3-dim rep.
-#   (0,1) is the spin-1 rep of SU(2)_R, dim 3.
-#   Lambda^2(3) = 3 = (0,1). Correct.
-
 # So so(7) under SO(4) = (1,0) + (0,1) + (1/2,1/2) + (1/2,3/2) + (0,1)
 #                       = (1,0) + 2*(0,1) + (1/2,1/2) + (1/2,3/2)
-# dims: 3 + 6 + 4 + 8 = 21. Correct!
+# dims: 3 + 6 + 4 + 8 = 21
+branch_21 = spins(so7_to_so4((0, 1, 0)))
 
-print(f"\n--- Corrected so(7) under SO(4) ---")
-print(f"  so(7) = (1,0) + 2*(0,1) + (1/2,1/2) + (1/2,3/2)")
+print(f"\n--- so(7) under SO(4) ---")
+print(f"  so(7) = {' + '.join(str(j) for j in branch_21)}")
 print(f"  dims: 3 + 6 + 4 + 8 = {3+6+4+8}")
-tests.append(("so(7) under SO(4): 3+6+4+8=21", 3+6+4+8 == 21))
-
-# Total 42 under SO(4):
-# Layer R:    (0,0) x1                               -> 1
-# Layer so4:  (1,0) x1, (0,1) x1                     -> 6
-# Layer g2:   (1,0) x1, (0,1) x1, (1/2,1/2) x2       -> 14
+tests.append(("so(7) under SO(4): (1,0)+2*(0,1)+(1/2,1/2)+(1/2,3/2)",
+              branch_21 == [(0, 1), (0, 1), (h, h), (h, 3 * h), (1, 0)]))
+
+# Full 42-dim space as SO(4)-module. The 42-dim space is
+# R + so(4) + g_2 + so(7) as SEPARATE vector spaces (not quotients),
+# so the representations just add (g_2 subset so(7) does not matter).
+# Layer R:    (0,0) x1                                   -> 1
+# Layer so4:  (1,0) x1, (0,1) x1                         -> 6
+# Layer g2:   (1,0) x1, (0,1) x1, (1/2,3/2) x1           -> 14
 # Layer so7:  (1,0) x1, (0,1) x2, (1/2,1/2) x1, (1/2,3/2) x1 -> 21
-#
+layers = {
+    "R": [(0, 0)],
+    "so4": [(0, 1), (1, 0)],
+    "g_2": branch_14,
+    "so7": branch_21,
+}
+
+print(f"\nFull 42 under SO(4) = SU(2)_L x SU(2)_R:")
+for name, content in layers.items():
+    dim = int(sum((2*a + 1) * (2*b + 1) for a, b in content))
+    print(f"  {name + ':':5} {' + '.join(str(j) for j in content):44} dim: {dim}")
+
 # Totals across all layers:
 # (0,0): 1 copy -> 1 dim
 # (1,0): 1+1+1 = 3 copies -> 9 dim
 # (0,1): 1+1+2 = 4 copies -> 12 dim
-# (1/2,1/2): 2+1 = 3 copies -> 12 dim
-# (1/2,3/2): 1 copy -> 8 dim
-# Total: 1 + 9 + 12 + 12 + 8 = 42. Check!
+# (1/2,1/2): 1 copy (so(7) only) -> 4 dim
+# (1/2,3/2): 1+1 = 2 copies (g_2 and so(7)) -> 16 dim
+# Total: 1 + 9 + 12 + 4 + 16 = 42. Check!
+copies = {}
+for content in layers.values():
+    for j in content:
+        copies[j] = copies.get(j, 0) + 1
 
-total_check = 1 + 9 + 12 + 12 + 8
 print(f"\nComplete SO(4) content of 42:")
-print(f"  (0,0):     1 copy,  dim  1")
-print(f"  (1,0):     3 copies, dim  9")
-print(f"  (0,1):     4 copies, dim 12")
-print(f"  (1/2,1/2): 3 copies, dim 12")
-print(f"  (1/2,3/2): 1 copy,  dim  8")
+total_check = 0
+for (a, b), n in sorted(copies.items(), key=lambda item: (item[0][0] % 1 != 0, sum(item[0]), -item[0][0])):
+    dim = int(n * (2*a + 1) * (2*b + 1))
+    total_check += dim
+    print(f"  {str((a, b)):10} {n} {'copy, ' if n == 1 else 'copies,'} dim {dim:2}")
 print(f"  Total:              dim {total_check}")
 tests.append(("SO(4) decomposition sums to 42", total_check == 42))
 
 # Integer spin: 1+9+12 = 22 = 2*n_c
-# Half-integer: 12+8 = 20 = n_d*(n_c-1)/2 = chi(Gr+(4,11))
-int_spin = 1 + 9 + 12
-half_spin = 12 + 8
+# Half-integer: 4+16 = 20 = n_d*(n_c-1)/2 = chi(Gr+(4,11))
+int_spin = sum(n * (2*a + 1) * (2*b + 1) for (a, b), n in copies.items() if a % 1 == 0)
+half_spin = sum(n * (2*a + 1) * (2*b + 1) for (a, b), n in copies.items() if a % 1 != 0)
 print(f"\nInteger-spin dimensions: {int_spin}")
 print(f"  = 2*n_c = {2*n_c}")
 print(f"Half-integer-spin dimensions: {half_spin}")
@@ -463,8 +425,8 @@ tests.append(("Half-integer spin = 20 = chi(Gr+)", half_spin == n_d*(n_c-1)//2))
 
 # The L-R asymmetry: (0,1) has 4 copies but (1,0) has 3 copies
 # Difference: 4-3 = 1, corresponding to dim 12-9 = 3 = Im_H
-lr_diff_copies = 4 - 3
-lr_diff_dim = 12 - 9
+lr_diff_copies = copies[(0, 1)] - copies[(1, 0)]
+lr_diff_dim = 3 * lr_diff_copies
 print(f"\nL-R asymmetry:")
 print(f"  (0,1) copies - (1,0) copies = {lr_diff_copies}")
 print(f"  Dimension difference = {lr_diff_dim} = Im_H")
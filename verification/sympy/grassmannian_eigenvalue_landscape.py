@@ -30,6 +30,7 @@ from sympy import (
     pi, cos, sin, exp, atan2, tensorproduct
 )
 from itertools import combinations
+from suite_results import record
 
 tests_passed = 0
 tests_total = 0
@@ -41,7 +42,7 @@ def test(name, condition):
     if condition:
         tests_passed += 1
     print(f"  [{status}] {tests_total}. {name}")
-    return condition
+    return record(name, condition)
 
 # Framework constants
 n_d = 4
@@ -0,0 +1,357 @@
+#!/usr/bin/env python3
+"""
+Casimir and Index Calculator
+============================
+
+Dimensions, quadratic Casimirs C_2, Dynkin indices and cubic anomalies for
+whole representation catalogs, computed from the root system of a lib_reps
+algebra. These are the group-theory numbers the CW and RG scripts type in
+by hand (C_2(3) = 4/3, C_2(8) = 3, C_2(2) = 3/4, T(fund) = 1/2, ...); a
+catalog of thousands of irreps costs one integer matrix product, and later
+runs read the results back from a JSON cache.
+
+Normalisation (per simple factor, physics conventions):
+  C_2(R) = (lam, lam + 2 rho) / |theta|^2      theta = highest (long) root,
+                                              so C_2(adj) = h^vee (= N for su(N))
+  T(R)   = dim(R) C_2(R) / dim(G)              T(fund of su(N)) = 1/2
+  A(R)   = Tr_R(h^3) / Tr_ref(h^3)             cubic anomaly, h = sum_i i alpha_i^vee,
+                                              ref = the first fundamental with a
+                                              nonzero cubic trace (su(N): the N, so
+                                              A(N) = 1, A(Nbar) = -1); zero for factors
+                                              without a cubic Casimir
+For a product algebra every entry is a tuple with one value per simple
+factor (lib_reps Algebra.factors order); dims are per factor as in
+Algebra.dims(), C_2, T and A are those of the factor's own irrep (so the
+SU(3)^3 anomaly of (3,2) is 1, weighted by dim_2 = 2 when summing); U(1)
+charges are passed through.
+
+Vectorized pass: with L the (N x rank) matrix of Dynkin labels,
+  (lam + rho, alpha) for all reps and positive roots = (L + 1) @ M   (one product)
+  (lam, lam + 2 rho)                                 = rowsum(L @ G * (L + 2))
+in integers (M and G scaled to a common denominator); the dimension is
+the exact product of each row over the roots' (rho, alpha).
+
+Cache: .suite/casimir/<algebra>.v<version>.json (ignored by git), keyed by
+the Dynkin labels; table() computes only the missing entries and writes
+the file back atomically.
+
+Usage:
+  from lib_casimir import table, casimir, index, anomaly, catalog
+  from lib_reps import su, so
+  casimir(su(3), (1, 0))                 # Fraction(4, 3)
+  index(su(3), (1, 0)), anomaly(su(3), (0, 1))   # 1/2, -1
+  rows = table(so(10), catalog(so(10), 2000))   # every irrep with dim <= 2000
+  rows[0].dim, rows[0].casimir, rows[0].index, rows[0].anomaly
+
+Running this file verifies the calculator.
+"""
+
+import json
+import os
+import sys
+import tempfile
+from fractions import Fraction
+from math import lcm, prod
+from pathlib import Path
+from typing import Dict, List, NamedTuple, Sequence, Tuple
+
+import numpy as np
+
+CACHE_DIR = Path(__file__).resolve().parent / ".suite" / "casimir"
+CACHE_VERSION = 1
+
+
+class RepData(NamedTuple):
+    hw: Tuple
+    dim: int
+    dims: Tuple                  # per simple factor
+    casimir: Tuple[Fraction, ...]
+    index: Tuple[Fraction, ...]
+    anomaly: Tuple[Fraction, ...]
+    charges: Tuple[Fraction, ...]
+
+
+# ==============================================================================
+# PER-FACTOR DATA
+# ==============================================================================
+
+class _Factor:
+    """Integer matrices of one simple factor, shared by every query."""
+
+    def __init__(self, A, comp: List[int]):
+        self.comp = comp
+        pos = [(c, lab) for c, lab in zip(A.pos_coeffs, A.pos_labels) if any(c[i] for i in comp)]
+        roots = [c for c, _ in pos]
+        self.dim_g = 2 * len(roots) + len(comp)
+        # (lam, alpha) = sum_i lam_i d_i c_i  with d_i = |alpha_i|^2 / 2
+        scale = lcm(*(A.d[i].denominator for i in comp))
+        self.M = np.array([[int(A.d[i] * scale) * c[i] for c in roots] for i in comp],
+                          dtype=np.int64)
+        self.rho_pairs = prod(int(x) for x in self.M.sum(axis=0))
+        # (lam, mu) = lam G mu^T in Dynkin labels
+        G = [[A.gram[i][j] for j in comp] for i in comp]
+        self.g_scale = lcm(*(x.denominator for row in G for x in row))
+        self.G = np.array([[int(x * self.g_scale) for x in row] for row in G], dtype=np.int64)
+        theta, theta_labels = max(pos, key=lambda p: sum(p[0]))
+        self.theta2 = A._pair(theta_labels, theta)
+        self.h = np.zeros(A.rank, dtype=np.int64)
+        self.h[comp] = np.arange(1, len(comp) + 1)
+        self.ref = None
+
+    def dims(self, L: np.ndarray) -> List[int]:
+        num = (L[:, self.comp] + 1) @ self.M
+        return [prod(int(x) for x in row) // self.rho_pairs for row in num]
+
+    def casimirs(self, L: np.ndarray) -> List[Fraction]:
+        lam = L[:, self.comp]
+        q = ((lam @ self.G) * (lam + 2)).sum(axis=1)
+        return [Fraction(int(x), self.g_scale) / self.theta2 for x in q]
+
+    def cubic(self, A, hw) -> int:
+        """Tr_R(h^3) from the weight system (labels pair with h as integers)."""
+        r = A.rank
+        return sum(m * int(np.dot(self.h, w[:r])) ** 3 for w, m in A.weights(hw).items())
+
+    def reference(self, A) -> int:
+        if self.ref is None:
+            self.ref = 0
+            for i in self.comp:
+                hw = tuple(int(j == i) for j in range(A.rank)) + (0,) * len(A.u1)
+                self.ref = self.cubic(A, hw)
+                if self.ref:
+                    break
+        return self.ref
+
+
+_factors: Dict[str, List[_Factor]] = {}
+_memory: Dict[str, Dict[str, list]] = {}
+
+
+def _factors_of(A) -> List[_Factor]:
+    if A.name not in _factors:
+        _factors[A.name] = [_Factor(A, comp) for comp in A.factors]
+    return _factors[A.name]
+
+
+# ==============================================================================
+# CACHE
+# ==============================================================================
+
+def _path(A) -> Path:
+    safe = "".join(ch if ch.isalnum() else "_" for ch in A.name)
+    return CACHE_DIR / f"{safe}.v{CACHE_VERSION}.json"
+
+
+def _load(A) -> Dict[str, list]:
+    if A.name not in _memory:
+        data = {}
+        path = _path(A)
+        if path.exists():
+            try:
+                data = json.loads(path.read_text())
+            except (OSError, ValueError):
+                data = {}
+        _memory[A.name] = data
+    return _memory[A.name]
+
+
+def _save(A, data: Dict[str, list]) -> None:
+    path = _path(A)
+    tmp = None
+    try:
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        # Per-process temp file: parallel runners may save the same algebra
+        fd, tmp = tempfile.mkstemp(dir=CACHE_DIR, prefix=path.stem + ".", suffix=".tmp")
+        with os.fdopen(fd, "w") as fh:
+            fh.write(json.dumps(data, sort_keys=True))
+        os.replace(tmp, path)
+    except OSError:
+        if tmp is not None and os.path.exists(tmp):
+            os.unlink(tmp)
+
+
+def _key(labels: Sequence[int]) -> str:
+    return ",".join(str(int(x)) for x in labels)
+
+
+# ==============================================================================
+# QUERIES
+# ==============================================================================
+
+def table(A, hws: Sequence, anomalies: bool = True) -> List[RepData]:
+    """RepData for every highest weight in `hws`, computed in one pass.
+
+    Anomalies need each irrep's weight system (lib_reps, cached); pass
+    anomalies=False to skip them for very large catalogs (entries are then
+    None and are not cached).
+    """
+    r = A.rank
+    hws = [tuple(hw) for hw in hws]
+    for hw in hws:
+        A._split(hw)
+    data = _load(A)
+    factors = _factors_of(A)
+    missing = sorted({hw[:r] for hw in hws
+                      if _key(hw[:r]) not in data
+                      or (anomalies and data[_key(hw[:r])][3] is None)})
+    if missing:
+        L = np.array(missing, dtype=np.int64).reshape(len(missing), r)
+        dims = [f.dims(L) for f in factors]
+        cas = [f.casimirs(L) for f in factors]
+        for n, lab in enumerate(missing):
+            d = [dims[k][n] for k in range(len(factors))]
+            c = [cas[k][n] for k in range(len(factors))]
+            t = [d[k] * c[k] / factors[k].dim_g for k in range(len(factors))]
+            a = None
+            if anomalies:
+                hw = lab + (0,) * len(A.u1)
+                a = []
+                for k, f in enumerate(factors):
+                    # the weight system repeats each factor weight prod(d) / d[k] times
+                    ref = f.reference(A) * (prod(d) // d[k])
+                    a.append(str(Fraction(f.cubic(A, hw), ref)) if ref else "0")
+            data[_key(lab)] = [d, [str(x) for x in c], [str(x) for x in t], a]
+        _save(A, data)
+
+    out = []
+    for hw in hws:
+        d, c, t, a = data[_key(hw[:r])]
+        out.append(RepData(hw=hw, dim=prod(d), dims=tuple(d),
+                           casimir=tuple(Fraction(x) for x in c),
+                           index=tuple(Fraction(x) for x in t),
+                           anomaly=tuple(Fraction(x) for x in a) if a is not None else None,
+                           charges=tuple(Fraction(q) for q in hw[r:])))
+    return out
+
+
+def casimir(A, hw, factor: int = 0) -> Fraction:
+    return table(A, [hw], anomalies=False)[0].casimir[factor]
+
+
+def index(A, hw, factor: int = 0) -> Fraction:
+    return table(A, [hw], anomalies=False)[0].index[factor]
+
+
+def anomaly(A, hw, factor: int = 0) -> Fraction:
+    return table(A, [hw])[0].anomaly[factor]
+
+
+def catalog(A, max_dim: int) -> List[Tuple[int, ...]]:
+    """All highest weights (labels only) of irreps with dim <= max_dim.
+
+    The dimension grows strictly with every label, so labels are raised
+    one at a time until the bound is passed.
+    """
+    r = A.rank
+    zero = (0,) * r
+    seen, frontier, out = {zero}, [zero], [zero]
+    while frontier:
+        nxt = []
+        for lam in frontier:
+            for i in range(r):
+                mu = lam[:i] + (lam[i] + 1,) + lam[i + 1:]
+                if mu not in seen:
+                    seen.add(mu)
+                    nxt.append(mu)
+        if not nxt:
+            break
+        L = np.array(nxt, dtype=np.int64)
+        dims = [prod(d) for d in zip(*(f.dims(L) for f in _factors_of(A)))]
+        frontier = [mu for mu, d in zip(nxt, dims) if d <= max_dim]
+        out += frontier
+    return sorted(out, key=lambda lam: (A.dim(lam + (0,) * len(A.u1)), lam))
+
+
+# ==============================================================================
+# SELF-CHECK
+# ==============================================================================
+
+def _verify() -> int:
+    import time
+    from lib_reps import so, su, sp, g2, product
+    from suite_results import record
+
+    tests = []
+
+    def check(name, condition, detail=""):
+        tests.append(bool(condition))
+        status = "PASS" if condition else "FAIL"
+        print(f"  [{status}] T{len(tests)}: {name}")
+        if detail and not condition:
+            print(f"         {detail}")
+        record(name, bool(condition), detail=detail)
+
+    F = Fraction
+
+    print("=" * 70)
+    print("PART 1: STANDARD VALUES")
+    print("=" * 70)
+    su3, su2 = su(3), su(2)
+    check("su(3): C_2(3) = 4/3, C_2(8) = 3, C_2(6) = 10/3, C_2(10) = 6",
+          [casimir(su3, hw) for hw in [(1, 0), (1, 1), (2, 0), (3, 0)]] == [F(4, 3), 3, F(10, 3), 6])
+    check("su(2): C_2 = j(j+1) for j = 1/2, 1, 3/2",
+          [casimir(su2, (k,)) for k in (1, 2, 3)] == [F(3, 4), 2, F(15, 4)])
+    check("T(fund) = 1/2, T(adj) = N for su(2..6)",
+          all(index(su(n), (1,) + (0,) * (n - 2)) == F(1, 2)
+              and index(su(n), (1,) + (0,) * (n - 3) + (1,) if n > 2 else (2,)) == n
+              for n in range(2, 7)))
+    check("C_2(adj) = dual Coxeter number: so(10) 8, sp(3) 4, g2 4",
+          casimir(so(10), (0, 1, 0, 0, 0)) == 8 and casimir(sp(3), (2, 0, 0)) == 4
+          and casimir(g2(), (1, 0)) == 4)
+    check("so(10): T(10) = 1, T(16) = 2; so(11): C_2(32) = 55/8",
+          index(so(10), (1, 0, 0, 0, 0)) == 1 and index(so(10), (0, 0, 0, 0, 1)) == 2
+          and casimir(so(11), (0, 0, 0, 0, 1)) == F(55, 8))
+
+    print("=" * 70)
+    print("PART 2: ANOMALIES")
+    print("=" * 70)
+    check("su(3): A(3) = 1, A(3bar) = -1, A(8) = 0, A(6) = 7, A(10) = 27",
+          [anomaly(su3, hw) for hw in [(1, 0), (0, 1), (1, 1), (2, 0), (3, 0)]]
+          == [1, -1, 0, 7, 27])
+    check("so(10) and su(2) have no cubic anomaly; so(6) spinors = su(4) 4, 4bar",
+          anomaly(so(10), (0, 0, 0, 0, 1)) == 0 and anomaly(su2, (3,)) == 0
+          and {anomaly(so(6), (0, 1, 0)), anomaly(so(6), (0, 0, 1))} == {1, -1})
+    G = product(su(3), su(2), u1=[[1, 1, 1, 1, 1]])
+    sm = [(1, 0, 1, F(1, 6)), (0, 1, 0, F(-2, 3)), (0, 1, 0, F(1, 3)),
+          (0, 0, 1, F(-1, 2)), (0, 0, 0, 1)]           # one generation, left-handed
+    rows = table(G, sm)
+    check("SM generation: SU(3)^3 anomaly sum_R dim_2(R) A_3(R) = 0",
+          sum(r.anomaly[0] * r.dims[1] for r in rows) == 0)
+    check("SM generation: SU(2)^2 U(1) and SU(3)^2 U(1) vanish (index x Y)",
+          sum(r.index[1] * r.dims[0] * r.charges[0] for r in rows) == 0
+          and sum(r.index[0] * r.dims[1] * r.charges[0] for r in rows) == 0)
+
+    print("=" * 70)
+    print("PART 3: CATALOGS AND CACHE")
+    print("=" * 70)
+    from lib_reps import Algebra
+    fresh = Algebra("su(5)", su(5).simple_roots)       # new object, same cache file
+    _memory.pop("su(5)", None)
+    labels = [tuple(v) for v in np.ndindex(*(4,) * 4)]
+    t0 = time.perf_counter()
+    rows = table(fresh, labels, anomalies=False)
+    t1 = time.perf_counter()
+    _memory.pop("su(5)", None)
+    again = table(fresh, labels, anomalies=False)
+    t2 = time.perf_counter()
+    A5 = su(5)
+    rho2 = A5._norm(A5.rho)
+    check(f"su(5): {len(labels)} irreps (labels <= 3) match the Weyl formula and "
+          "C_2 = (|lam + rho|^2 - |rho|^2) / 2",
+          all(r.dim == A5.dim(r.hw) for r in rows)
+          and all(r.casimir[0] == (A5._norm(tuple(x + 1 for x in r.hw)) - rho2) / 2
+                  for r in rows))
+    print(f"         (table {t1 - t0:.3f}s, from cache {t2 - t1:.3f}s)")
+    check("cache round trip returns identical entries", rows == again)
+    cat = catalog(so(10), 2000)
+    dims = [so(10).dim(hw) for hw in cat]
+    check("so(10) catalog dim <= 2000 starts 1, 10, 16, 16, 45, 54, 120, 126, 126, 144",
+          dims[:10] == [1, 10, 16, 16, 45, 54, 120, 126, 126, 144] and max(dims) <= 2000)
+
+    passed = sum(tests)
+    print(f"\nFINAL: {passed}/{len(tests)} PASS")
+    return 0 if passed == len(tests) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(_verify())
@@ -0,0 +1,357 @@
+#!/usr/bin/env python3
+"""
+Shared Cayley-Dickson Library
+=============================
+
+R, C, H, O and the sedenions from one doubling rule. The octonion table of
+g2_final.py (the FANO triples of lib_lie) comes out of the construction
+instead of being typed in. All products are batched array operations, and
+the derivation algebra is the exact nullspace of an integer constraint
+matrix (512 x 64 for the octonions).
+
+Construction (Cayley-Dickson doubling, basis e_0 = 1, e_1, ..., e_{d-1}):
+  (a, b)(c, d) = (a c - d* b,  d a + b c*)
+with e_i -> (e_i, 0) and e_{d+i} -> (0, e_i). Every product of two basis
+units is a signed unit, e_i e_j = sign[i, j] e_index[i, j], so the structure
+tensor table[i, j, k] has one nonzero per (i, j). For the octonions the
+positive triples e_a e_b = +e_c are exactly
+  (1,2,3), (1,4,5), (1,7,6), (2,4,6), (2,5,7), (3,4,7), (3,6,5)
+i.e. the Wikipedia table used by g2_final.py and associativity_vs_alternativity.py.
+(g2_irreducibility_v2.py uses a different, non-alternative orientation and
+is not this algebra.)
+
+Products are gathers, not loops: for fixed i the map j -> index[i, j] is a
+bijection, so with partner[i, k] = the j that lands on e_k,
+  (x y)_k = sum_i x_i * sign[i, partner[i, k]] * y_partner[i, k]
+which is one fancy-index and one sum over arrays of any leading shape
+(thousands of products at once), and works unchanged on object arrays of
+SymPy numbers or Fractions for exact checks.
+
+Usage:
+  from lib_cayley_dickson import octonions, sedenions
+  O = octonions()
+  O.mul(x, y)                       # x, y of shape (..., 8)
+  O.associator(x, y, z), O.commutator(x, y), O.conj(x), O.norm2(x)
+  O.table, O.commutator_tensor(), O.associator_tensor()
+  O.is_associative(), O.is_alternative(), O.is_division()
+  O.derivation_rows()               # integer constraints on D (d^2 unknowns)
+  O.derivation_dim()                # 14, exact (lib_exact)
+  O.derivations()                   # orthonormal float basis, (14, 8, 8)
+  O.is_automorphism(M)
+
+Running this file verifies the library.
+"""
+
+import sys
+from functools import lru_cache
+from typing import List, Tuple
+
+import numpy as np
+
+import lib_exact
+
+NAMES = {1: "R", 2: "C", 4: "H", 8: "O", 16: "S"}
+TOL = 1e-10
+
+
+def _double(index: np.ndarray, sign: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Tables of the doubled algebra from (index, sign) of the current one."""
+    d = len(index)
+    conj = np.where(np.arange(d) == 0, 1, -1)
+    new_index = np.empty((2 * d, 2 * d), dtype=np.int64)
+    new_sign = np.empty((2 * d, 2 * d), dtype=np.int64)
+    lo, hi = slice(0, d), slice(d, 2 * d)
+    # (a, 0)(c, 0) = (a c, 0)
+    new_index[lo, lo], new_sign[lo, lo] = index, sign
+    # (a, 0)(0, d) = (0, d a)
+    new_index[lo, hi], new_sign[lo, hi] = index.T + d, sign.T
+    # (0, b)(c, 0) = (0, b c*)
+    new_index[hi, lo], new_sign[hi, lo] = index + d, sign * conj[None, :]
+    # (0, b)(0, d) = (-d* b, 0)
+    new_index[hi, hi], new_sign[hi, hi] = index.T, -sign.T * conj[None, :]
+    return new_index, new_sign
+
+
+class CayleyDickson:
+    """The 2^level-dimensional Cayley-Dickson algebra over R."""
+
+    def __init__(self, level: int):
+        index = np.zeros((1, 1), dtype=np.int64)
+        sign = np.ones((1, 1), dtype=np.int64)
+        for _ in range(level):
+            index, sign = _double(index, sign)
+        self.level = level
+        self.dim = d = len(index)
+        self.name = NAMES.get(d, f"CD({d})")
+        self.index = index                        # e_i e_j = sign * e_index
+        self.sign = sign
+        self.partner = np.argsort(index, axis=1)  # e_i e_partner[i, k] ~ e_k
+        self.partner_sign = np.take_along_axis(sign, self.partner, axis=1)
+        self.conj_sign = np.where(np.arange(d) == 0, 1, -1)
+
+    def __repr__(self) -> str:
+        return f"CayleyDickson({self.name}, dim={self.dim})"
+
+    @property
+    def table(self) -> np.ndarray:
+        """Structure tensor T[i, j, k]: e_i e_j = sum_k T[i, j, k] e_k."""
+        d = self.dim
+        T = np.zeros((d, d, d), dtype=np.int64)
+        i, j = np.indices((d, d))
+        T[i, j, self.index] = self.sign
+        return T
+
+    def unit(self, i: int) -> np.ndarray:
+        e = np.zeros(self.dim, dtype=np.int64)
+        e[i] = 1
+        return e
+
+    def units(self) -> np.ndarray:
+        return np.eye(self.dim, dtype=np.int64)
+
+    def triples(self) -> List[Tuple[int, int, int]]:
+        """Positive triples (a, b, c), a < b, of imaginary units: e_a e_b = +e_c."""
+        d = self.dim
+        return [(a, b, int(self.index[a, b])) for a in range(1, d) for b in range(a + 1, d)
+                if self.sign[a, b] == 1 and self.index[a, b] > a]
+
+    # --------------------------------------------------------------------------
+    # Batched arithmetic on arrays of shape (..., dim)
+    # --------------------------------------------------------------------------
+
+    def mul(self, x, y) -> np.ndarray:
+        """x y for arrays of shape (..., dim), broadcasting over leading axes."""
+        x, y = np.asarray(x), np.asarray(y)
+        terms = x[..., :, None] * (self.partner_sign * y[..., self.partner])
+        return terms.sum(axis=-2)
+
+    def conj(self, x) -> np.ndarray:
+        return np.asarray(x) * self.conj_sign
+
+    def norm2(self, x) -> np.ndarray:
+        x = np.asarray(x)
+        return (x * x).sum(axis=-1)
+
+    def commutator(self, x, y) -> np.ndarray:
+        return self.mul(x, y) - self.mul(y, x)
+
+    def associator(self, x, y, z) -> np.ndarray:
+        """(x y) z - x (y z)."""
+        return self.mul(self.mul(x, y), z) - self.mul(x, self.mul(y, z))
+
+    def left(self, x) -> np.ndarray:
+        """Matrix of left multiplication L_x (y -> x y), shape (..., dim, dim)."""
+        return np.einsum("...i,ijk->...kj", np.asarray(x), self.table)
+
+    def right(self, x) -> np.ndarray:
+        """Matrix of right multiplication R_x (y -> y x), shape (..., dim, dim)."""
+        return np.einsum("...j,ijk->...ki", np.asarray(x), self.table)
+
+    # --------------------------------------------------------------------------
+    # Tensors and identities
+    # --------------------------------------------------------------------------
+
+    def commutator_tensor(self) -> np.ndarray:
+        T = self.table
+        return T - T.transpose(1, 0, 2)
+
+    def associator_tensor(self) -> np.ndarray:
+        """A[i, j, k, l] = ((e_i e_j) e_k - e_i (e_j e_k))_l."""
+        T = self.table
+        return np.einsum("ijm,mkl->ijkl", T, T) - np.einsum("jkm,iml->ijkl", T, T)
+
+    def is_commutative(self) -> bool:
+        return not self.commutator_tensor().any()
+
+    def is_associative(self) -> bool:
+        return not self.associator_tensor().any()
+
+    def is_alternative(self) -> bool:
+        """(x, x, y) = (y, x, x) = 0, i.e. the associator tensor is alternating."""
+        A = self.associator_tensor()
+        return not (A + A.transpose(1, 0, 2, 3)).any() and not (A + A.transpose(0, 2, 1, 3)).any()
+
+    def is_division(self, samples: int = 200, seed: int = 0) -> bool:
+        """Norm multiplicativity |x y|^2 = |x|^2 |y|^2 on random samples."""
+        rng = np.random.default_rng(seed)
+        x, y = rng.standard_normal((2, samples, self.dim))
+        return bool(np.allclose(self.norm2(self.mul(x, y)), self.norm2(x) * self.norm2(y)))
+
+    # --------------------------------------------------------------------------
+    # Derivations and automorphisms
+    # --------------------------------------------------------------------------
+
+    def derivation_rows(self) -> np.ndarray:
+        """Integer constraints K @ vec(D) = 0 for D(xy) = D(x) y + x D(y).
+
+        D acts on column vectors, D e_q = sum_p D[p, q] e_p, unknown p * dim + q.
+        Row (a, b, m) is the e_m component of D(e_a e_b) - D(e_a) e_b - e_a D(e_b);
+        zero rows are dropped.
+        """
+        d = self.dim
+        T, I = self.table, np.eye(d, dtype=np.int64)
+        K = (np.einsum("abq,pm->abmpq", T, I)
+             - np.einsum("qa,pbm->abmpq", I, T)
+             - np.einsum("qb,apm->abmpq", I, T)).reshape(d ** 3, d * d)
+        return K[K.any(axis=1)]
+
+    def derivation_dim(self) -> int:
+        """dim Der(A), exact."""
+        return self.dim ** 2 - lib_exact.rank(self.derivation_rows().tolist(), self.dim ** 2)
+
+    def derivations(self) -> np.ndarray:
+        """Orthonormal (Frobenius) basis of Der(A), shape (n, dim, dim)."""
+        d = self.dim
+        _, s, vt = np.linalg.svd(self.derivation_rows().astype(float))
+        rank = int(np.sum(s > TOL * max(1.0, s[0])))
+        return vt[rank:].reshape(-1, d, d)
+
+    def is_derivation(self, D, tol: float = TOL) -> bool:
+        D = np.asarray(D, dtype=float)
+        return bool(np.abs(self.derivation_rows() @ D.reshape(-1)).max() < tol)
+
+    def is_automorphism(self, M, tol: float = TOL) -> bool:
+        """M(e_i e_j) = M(e_i) M(e_j) for all basis pairs."""
+        M = np.asarray(M, dtype=float)
+        lhs = np.einsum("ijk,lk->ijl", self.table, M)
+        rhs = self.mul(M.T[:, None, :], M.T[None, :, :])
+        return bool(np.abs(lhs - rhs).max() < tol)
+
+
+@lru_cache(maxsize=None)
+def cayley_dickson(level: int) -> CayleyDickson:
+    """R, C, H, O, S for level 0..4 (any level >= 0 works)."""
+    return CayleyDickson(level)
+
+
+def reals() -> CayleyDickson:
+    return cayley_dickson(0)
+
+
+def complexes() -> CayleyDickson:
+    return cayley_dickson(1)
+
+
+def quaternions() -> CayleyDickson:
+    return cayley_dickson(2)
+
+
+def octonions() -> CayleyDickson:
+    return cayley_dickson(3)
+
+
+def sedenions() -> CayleyDickson:
+    return cayley_dickson(4)
+
+
+# ==============================================================================
+# SELF-CHECK
+# ==============================================================================
+
+def _verify() -> int:
+    import time
+    from fractions import Fraction
+    from lib_lie import FANO, g2
+    from suite_results import record
+
+    tests = []
+
+    def check(name, condition, detail=""):
+        tests.append(bool(condition))
+        status = "PASS" if condition else "FAIL"
+        print(f"  [{status}] T{len(tests)}: {name}")
+        if detail and not condition:
+            print(f"         {detail}")
+        record(name, bool(condition), detail=detail)
+
+    rng = np.random.default_rng(0)
+    algebras = [cayley_dickson(k) for k in range(5)]
+    R_, C_, H_, O_, S_ = algebras
+
+    print("=" * 70)
+    print("PART 1: CONSTRUCTION")
+    print("=" * 70)
+    check("dims 1, 2, 4, 8, 16", [A.dim for A in algebras] == [1, 2, 4, 8, 16])
+    check("e_0 is the identity and e_i^2 = -1 for i > 0",
+          all((A.index[0] == np.arange(A.dim)).all() and (A.index[:, 0] == np.arange(A.dim)).all()
+              and (A.sign[0] == 1).all() and (A.sign[:, 0] == 1).all()
+              and (np.diag(A.index)[1:] == 0).all() and (np.diag(A.sign)[1:] == -1).all()
+              for A in algebras))
+    fano = {(a, b, c) for (a, b, c) in FANO}
+    fano_ok = all(O_.index[a, b] == c and O_.sign[a, b] == 1 for (a, b, c) in fano)
+    check("octonion table = FANO triples of g2_final.py / lib_lie", fano_ok)
+    check("quaternions: e1 e2 = e3 (i j = k); octonion triples() = FANO as a set of lines",
+          H_.index[1, 2] == 3 and H_.sign[1, 2] == 1
+          and {frozenset(t) for t in O_.triples()} == {frozenset(t) for t in fano})
+
+    print("=" * 70)
+    print("PART 2: BATCHED PRODUCTS")
+    print("=" * 70)
+    x, y = rng.standard_normal((2, 1000, 16))
+    ref = np.einsum("ni,nj,ijk->nk", x, y, S_.table)
+    check("batched sedenion mul (1000 pairs) = einsum with the structure tensor",
+          np.allclose(S_.mul(x, y), ref))
+    xs = np.array([[Fraction(int(v), 3) for v in row] for row in rng.integers(-5, 5, (4, 8))],
+                  dtype=object)
+    exact = O_.mul(xs[0], xs[1])
+    check("exact (Fraction) products agree with float",
+          all(isinstance(v, Fraction) for v in exact)
+          and np.allclose(exact.astype(float), O_.mul(xs[0].astype(float), xs[1].astype(float))))
+    x, y = rng.standard_normal((2, 50, 8))
+    check("L_x y = x y = R_y x", np.allclose(np.einsum("nij,nj->ni", O_.left(x), y), O_.mul(x, y))
+          and np.allclose(np.einsum("nij,nj->ni", O_.right(y), x), O_.mul(x, y)))
+    check("conj(x y) = conj(y) conj(x) in O",
+          np.allclose(O_.conj(O_.mul(x, y)), O_.mul(O_.conj(y), O_.conj(x))))
+
+    print("=" * 70)
+    print("PART 3: PROPERTIES LOST ALONG THE TOWER")
+    print("=" * 70)
+    check("commutative: R, C only", [A.is_commutative() for A in algebras]
+          == [True, True, False, False, False])
+    check("associative: R, C, H only", [A.is_associative() for A in algebras]
+          == [True, True, True, False, False])
+    check("alternative: R, C, H, O (not S)", [A.is_alternative() for A in algebras]
+          == [True, True, True, True, False])
+    check("normed division: R, C, H, O (not S)", [A.is_division() for A in algebras]
+          == [True, True, True, True, False])
+    x, y, z = rng.standard_normal((3, 100, 8))
+    xy, zx = O_.mul(x, y), O_.mul(z, x)
+    check("Moufang (xy)(zx) = x((yz)x) on 100 random octonion triples",
+          np.allclose(O_.mul(xy, zx), O_.mul(x, O_.mul(O_.mul(y, z), x))))
+    a = O_.associator(x, y, z)
+    check("octonion associator alternating: (x,y,z) = -(y,x,z) = -(x,z,y)",
+          np.allclose(a, -O_.associator(y, x, z)) and np.allclose(a, -O_.associator(x, z, y)))
+
+    print("=" * 70)
+    print("PART 4: DERIVATIONS AND AUTOMORPHISMS")
+    print("=" * 70)
+    t0 = time.perf_counter()
+    dims = [A.derivation_dim() for A in algebras[:4]]
+    dt = time.perf_counter() - t0
+    check("dim Der = 0, 0, 3, 14 for R, C, H, O (exact)", dims == [0, 0, 3, 14],
+          f"got {dims}")
+    print(f"         ({dt:.3f}s for all four)")
+    D = O_.derivations()
+    g2_7 = np.zeros((14, 8, 8))
+    g2_7[:, 1:, 1:] = g2().generators()
+    span = np.linalg.matrix_rank(np.concatenate([D, g2_7]).reshape(28, 64))
+    check("Der(O) = lib_lie g2 (same 14-dim span inside so(7))",
+          len(D) == 14 and span == 14 and np.abs(D[:, 0, :]).max() < 1e-12
+          and np.allclose(D, -D.transpose(0, 2, 1)))
+    check("dim Der(S) = 14 (float)", len(S_.derivations()) == 14)
+    D_rand = np.tensordot(rng.standard_normal(14), D, axes=1)
+    w, V = np.linalg.eig(D_rand)
+    expD = (V @ np.diag(np.exp(w)) @ np.linalg.inv(V)).real
+    check("exp(D) is an automorphism of O; a generic rotation of Im(O) is not",
+          O_.is_automorphism(expD) and O_.is_derivation(D_rand)
+          and not O_.is_automorphism(np.block([[np.eye(1), np.zeros((1, 7))],
+                                               [np.zeros((7, 1)),
+                                                np.linalg.qr(rng.standard_normal((7, 7)))[0]]])))
+
+    passed = sum(tests)
+    print(f"\nFINAL: {passed}/{len(tests)} PASS")
+    return 0 if passed == len(tests) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(_verify())
@@ -0,0 +1,348 @@
+#!/usr/bin/env python3
+"""
+Clifford Algebra Builder
+========================
+
+Sparse gamma matrices and spinor representations of Cl(n). In the
+Jordan-Wigner basis every gamma matrix is a signed permutation (one entry
++-1 or +-i per column), so each is stored as an index array and a phase
+array: Cl(22) with its 2048-dim spinor takes a few hundred KB instead of
+22 dense 2048 x 2048 complex matrices (1.5 GB). Products, chirality and
+the spinor generators Sigma_ab stay signed permutations; only sums (spinor
+images of general so(n) elements) become sparse matrices, with
+n(n-1)/2 * 2^[n/2] nonzeros at most.
+
+Conventions:
+  {gamma_a, gamma_b} = 2 delta_ab, all gamma_a Hermitian, a = 0..n-1
+  spinor space C^(2^k), k = [n/2]; basis index bits b_0 .. b_(k-1)
+    gamma_2j     = Z x ... x Z x X_j x 1 x ... x 1   (j Z's)
+    gamma_(2j+1) = Z x ... x Z x Y_j x 1 x ... x 1
+    gamma_(n-1)  = Z x ... x Z                      (odd n only)
+  chirality (even n) Gamma = (-i)^k gamma_0 ... gamma_(n-1) = Z x ... x Z,
+    diagonal with entry (-1)^popcount(index); Weyl spinors are the
+    even/odd-popcount basis vectors, 2^(k-1) each
+  Sigma_ab = (1/4)[gamma_a, gamma_b] = (1/2) gamma_a gamma_b (a != b), so
+    [Sigma_ab, gamma_c] = delta_bc gamma_a - delta_ac gamma_b: Sigma_ab
+    represents T_(a,b) = E_ab - E_ba of lib_lie.so(n), with the same
+    structure constants
+
+Usage:
+  from lib_clifford import clifford
+  C = clifford(11)                 # cached per n
+  C.dim, C.gamma(3)                # 32, SignedPermutation
+  C.sigma(0, 4).tocsr()            # scipy.sparse, 32 nonzeros
+  C.represent(X)                   # spinor image of an n x n antisymmetric X
+  C.generators()                   # Sigma_ab in lib_lie.so(n) label order
+  C14 = clifford(14)
+  C14.weyl(+1)                     # basis indices of the Gamma = +1 Weyl spinor
+  C14.projector(-1)                # sparse diagonal (1 - Gamma)/2
+
+Running this file verifies the builder.
+"""
+
+import sys
+from functools import lru_cache
+from typing import List, Tuple
+
+import numpy as np
+import scipy.sparse as sparse
+
+MAX_N = 22
+
+
+class SignedPermutation:
+    """Monomial matrix M with M e_j = phase[j] e_perm[j]."""
+
+    __slots__ = ("perm", "phase")
+
+    def __init__(self, perm: np.ndarray, phase: np.ndarray):
+        self.perm = np.asarray(perm, dtype=np.int64)
+        self.phase = np.asarray(phase, dtype=complex)
+
+    @property
+    def dim(self) -> int:
+        return len(self.perm)
+
+    def __matmul__(self, other: "SignedPermutation") -> "SignedPermutation":
+        return SignedPermutation(self.perm[other.perm], other.phase * self.phase[other.perm])
+
+    def __mul__(self, c) -> "SignedPermutation":
+        return SignedPermutation(self.perm, self.phase * c)
+
+    __rmul__ = __mul__
+
+    def __neg__(self) -> "SignedPermutation":
+        return self * -1
+
+    def dagger(self) -> "SignedPermutation":
+        perm = np.empty_like(self.perm)
+        perm[self.perm] = np.arange(self.dim)
+        phase = np.empty_like(self.phase)
+        phase[self.perm] = self.phase.conj()
+        return SignedPermutation(perm, phase)
+
+    def is_diagonal(self) -> bool:
+        return bool(np.array_equal(self.perm, np.arange(self.dim)))
+
+    def equals(self, other: "SignedPermutation", tol: float = 1e-12) -> bool:
+        return (np.array_equal(self.perm, other.perm)
+                and np.abs(self.phase - other.phase).max() <= tol)
+
+    def apply(self, v: np.ndarray) -> np.ndarray:
+        """M v for a vector (dim,) or a stack of columns (dim, m)."""
+        v = np.asarray(v)
+        out = np.empty(v.shape, dtype=np.result_type(v, self.phase))
+        out[self.perm] = self.phase.reshape((-1,) + (1,) * (v.ndim - 1)) * v
+        return out
+
+    def tocsr(self) -> sparse.csr_matrix:
+        return sparse.csr_matrix((self.phase, (self.perm, np.arange(self.dim))),
+                                 shape=(self.dim, self.dim))
+
+    def toarray(self) -> np.ndarray:
+        return self.tocsr().toarray()
+
+
+def _parity(idx: np.ndarray, bits: int) -> np.ndarray:
+    """popcount(idx & (2^bits - 1)) mod 2."""
+    par = np.zeros_like(idx)
+    for j in range(bits):
+        par ^= (idx >> j) & 1
+    return par
+
+
+class Clifford:
+    """Gamma matrices of Cl(n) and the spinor representation of so(n)."""
+
+    def __init__(self, n: int):
+        if not 1 <= n <= MAX_N:
+            raise ValueError(f"Cl(n) is built for 1 <= n <= {MAX_N}, got {n}")
+        self.n = n
+        self.k = n // 2
+        self.dim = 2 ** self.k
+        idx = np.arange(self.dim, dtype=np.int64)
+        perms, phases = [], []
+        for j in range(self.k):
+            bit = 1 << j
+            sign = 1 - 2 * _parity(idx, j)
+            perms += [idx ^ bit, idx ^ bit]
+            phases += [sign.astype(complex), sign * np.where(idx & bit, -1j, 1j)]
+        if n % 2:
+            perms.append(idx)
+            phases.append((1 - 2 * _parity(idx, self.k)).astype(complex))
+        self._perm = np.array(perms)
+        self._phase = np.array(phases)
+
+    def gamma(self, a: int) -> SignedPermutation:
+        return SignedPermutation(self._perm[a], self._phase[a])
+
+    def gammas(self) -> List[SignedPermutation]:
+        return [self.gamma(a) for a in range(self.n)]
+
+    def chirality(self) -> SignedPermutation:
+        """Gamma = (-i)^k gamma_0 ... gamma_(n-1) (even n): diagonal +-1."""
+        if self.n % 2:
+            raise ValueError(f"Cl({self.n}): no chirality in odd dimension")
+        g = self.gamma(0)
+        for a in range(1, self.n):
+            g = g @ self.gamma(a)
+        return g * (-1j) ** self.k
+
+    def weyl(self, chirality: int) -> np.ndarray:
+        """Basis indices spanning the Gamma = chirality Weyl spinor."""
+        diag = self.chirality().phase.real
+        return np.flatnonzero(diag == chirality)
+
+    def projector(self, chirality: int) -> sparse.csr_matrix:
+        """(1 + chirality * Gamma) / 2 as a sparse diagonal matrix."""
+        diag = self.chirality().phase.real
+        return sparse.diags((1 + chirality * diag) / 2).tocsr()
+
+    def sigma(self, a: int, b: int) -> SignedPermutation:
+        """Spinor generator Sigma_ab = (1/4)[gamma_a, gamma_b]."""
+        if a == b:
+            raise ValueError("Sigma_aa = 0 is not a signed permutation")
+        return (self.gamma(a) @ self.gamma(b)) * 0.5
+
+    def generators(self) -> List[SignedPermutation]:
+        """Sigma_ab for a < b, in the order of lib_lie.so(n).labels."""
+        return [self.sigma(a, b) for a in range(self.n) for b in range(a + 1, self.n)]
+
+    def represent(self, X: np.ndarray) -> sparse.csr_matrix:
+        """Spinor image sum_(a<b) X[a, b] Sigma_ab of an antisymmetric X."""
+        X = np.asarray(X)
+        a, b = np.nonzero(np.triu(X, 1))
+        rows, cols, vals = [], [], []
+        for i, j in zip(a, b):
+            s = self.sigma(i, j)
+            rows.append(s.perm)
+            cols.append(np.arange(self.dim))
+            vals.append(X[i, j] * s.phase)
+        if not rows:
+            return sparse.csr_matrix((self.dim, self.dim), dtype=complex)
+        return sparse.csr_matrix((np.concatenate(vals), (np.concatenate(rows), np.concatenate(cols))),
+                                 shape=(self.dim, self.dim))
+
+    def represent_all(self, stack: np.ndarray) -> List[sparse.csr_matrix]:
+        """represent() for a stack of so(n) matrices, shape (m, n, n)."""
+        return [self.represent(X) for X in np.asarray(stack)]
+
+    def su2_casimirs(self, axes) -> Tuple[sparse.csr_matrix, sparse.csr_matrix]:
+        """j(j+1) of SU(2)_L and SU(2)_R in so(4) = su(2) + su(2) on four axes.
+
+        J^(L/R) = (1/2)(Sigma_23 +- Sigma_14, Sigma_31 +- Sigma_24, Sigma_12 +- Sigma_34)
+        for axes (1, 2, 3, 4); both Casimirs are Hermitian with eigenvalues
+        j(j+1), e.g. 3/4 on doublets.
+        """
+        i, j, k, l = axes
+        out = []
+        for sign in (+1, -1):
+            J = [0.5 * (self.sigma(j, k).tocsr() + sign * self.sigma(i, l).tocsr()),
+                 0.5 * (self.sigma(k, i).tocsr() + sign * self.sigma(j, l).tocsr()),
+                 0.5 * (self.sigma(i, j).tocsr() + sign * self.sigma(k, l).tocsr())]
+            out.append((-(J[0] @ J[0]) - J[1] @ J[1] - J[2] @ J[2]).tocsr())
+        return out[0], out[1]
+
+
+@lru_cache(maxsize=None)
+def clifford(n: int) -> Clifford:
+    return Clifford(n)
+
+
+# ==============================================================================
+# SELF-CHECK
+# ==============================================================================
+
+def _verify() -> int:
+    import time
+
+    from lib_lie import so
+    from suite_results import record
+
+    tests = []
+
+    def check(name, condition, detail=""):
+        tests.append(bool(condition))
+        status = "PASS" if condition else "FAIL"
+        print(f"  [{status}] T{len(tests)}: {name}")
+        if detail and not condition:
+            print(f"         {detail}")
+        record(name, bool(condition), detail=detail)
+
+    def anticommute_ok(C):
+        g = C.gammas()
+        one = SignedPermutation(np.arange(C.dim), np.ones(C.dim))
+        for a in range(C.n):
+            if not (g[a] @ g[a]).equals(one):
+                return False
+            for b in range(a + 1, C.n):
+                if not (g[a] @ g[b]).equals(-(g[b] @ g[a])):
+                    return False
+        return True
+
+    print("=" * 70)
+    print("PART 1: CLIFFORD RELATIONS")
+    print("=" * 70)
+    check("dim = 2^[n/2] for n = 1..22",
+          all(clifford(n).dim == 2 ** (n // 2) for n in range(1, 23)))
+    check("{gamma_a, gamma_b} = 2 delta_ab for n = 1..22 (signed-permutation algebra)",
+          all(anticommute_ok(clifford(n)) for n in range(1, 23)))
+    check("gamma_a Hermitian for n = 1..22",
+          all(g.dagger().equals(g) for n in range(1, 23) for g in clifford(n).gammas()))
+    g = clifford(6).gammas()
+    dense = [x.toarray() for x in g]
+    check("signed-permutation products agree with dense products (n = 6)",
+          all(np.abs((g[a] @ g[b]).toarray() - dense[a] @ dense[b]).max() == 0
+              for a in range(6) for b in range(6)))
+
+    print("=" * 70)
+    print("PART 2: CHIRALITY AND WEYL SPINORS")
+    print("=" * 70)
+    ok = True
+    for n in range(2, 23, 2):
+        C = clifford(n)
+        G = C.chirality()
+        ok &= G.is_diagonal() and set(np.round(G.phase.real)) == {-1.0, 1.0}
+        ok &= np.abs(G.phase.imag).max() == 0
+        ok &= all((G @ x).equals(-(x @ G)) for x in C.gammas())
+        ok &= len(C.weyl(+1)) == len(C.weyl(-1)) == C.dim // 2
+    check("Gamma diagonal +-1, anticommutes with every gamma, Weyl 2^(k-1) each (n = 2..22)", ok)
+    C = clifford(14)
+    P, Q = C.projector(+1), C.projector(-1)
+    check("projectors: P+^2 = P+, P+ P- = 0, P+ + P- = 1 (n = 14)",
+          abs(P @ P - P).max() == 0 and abs(P @ Q).max() == 0
+          and abs(P + Q - sparse.identity(C.dim)).max() == 0)
+    ok = True
+    for n in range(3, 23, 2):
+        C = clifford(n)
+        prod = C.gamma(0)
+        for a in range(1, n - 1):
+            prod = prod @ C.gamma(a)
+        ok &= (prod * (-1j) ** C.k).equals(C.gamma(n - 1))
+    check("odd n: gamma_(n-1) = chirality of Cl(n-1)", ok)
+
+    print("=" * 70)
+    print("PART 3: SPINOR GENERATORS")
+    print("=" * 70)
+    for n in (7, 11):
+        C, L = clifford(n), so(n)
+        S = [s.toarray() for s in C.generators()]
+        fa, fb, fc, fv = L.structure_constants()
+        err = 0.0
+        for a in range(L.dim):
+            for b in range(L.dim):
+                lhs = S[a] @ S[b] - S[b] @ S[a]
+                rhs = sum(v * S[c] for c, v in zip(fc[(fa == a) & (fb == b)], fv[(fa == a) & (fb == b)]))
+                err = max(err, np.abs(lhs - rhs).max())
+        check(f"[Sigma_a, Sigma_b] = f_ab^c Sigma_c with lib_lie so({n}) constants",
+              err < 1e-12, f"max error {err:.2e}")
+    C = clifford(11)
+    X = so(11).generators()
+    check("represent(T_(a,b)) = Sigma_ab for every so(11) generator",
+          all(abs(C.represent(T) - s.tocsr()).max() < 1e-15 for T, s in zip(X, C.generators())))
+    C = clifford(22)
+    t0 = time.perf_counter()
+    gens = C.generators()
+    dt = time.perf_counter() - t0
+    print(f"  so(22): 231 spinor generators on C^2048 in {dt * 1e3:.0f} ms")
+    squares = [s @ s for s in gens]
+    casimir = sum(q.phase for q in squares)
+    check("so(22) Casimir on the spinor: sum Sigma_ab^2 = -n(n-1)/8 = -57.75",
+          all(q.is_diagonal() for q in squares) and np.abs(casimir + 22 * 21 / 8).max() == 0)
+    G = C.chirality()
+    check("so(22): every Sigma_ab commutes with Gamma (Weyl 1024s are invariant)",
+          all((s @ G).equals(G @ s) for s in gens))
+
+    print("=" * 70)
+    print("PART 4: EMBEDDINGS (NUMERICAL BRANCHING)")
+    print("=" * 70)
+
+    def spectrum(M, on=None):
+        if on is not None:
+            M = M[on][:, on]
+        return np.round(np.linalg.eigvalsh(M.toarray()), 9)
+
+    C = clifford(11)
+    jl, jr = (spectrum(M) for M in C.su2_casimirs(range(4)))
+    check("SO(11) 32 -> SO(4) x SO(7): (2,1;8) + (1,2;8) (16 doublets of each SU(2))",
+          list(np.unique(jl, return_counts=True)[1]) == [16, 16]
+          and set(jl) == {0.0, 0.75} and np.array_equal(np.sort(jl), np.sort(jr)))
+    C = clifford(14)
+    plus = C.weyl(+1)
+    g10 = C.gamma(0)
+    for a in range(1, 10):
+        g10 = g10 @ C.gamma(a)
+    g10 = (g10 * (-1j) ** 5).phase.real[plus]
+    left, right = (spectrum(M, plus) for M in C.su2_casimirs(range(10, 14)))
+    check("SO(14) 64 -> (16,2,1) + (16bar,1,2): SO(10) chirality +-1 on 32 states each, "
+          "SU(2)_L and SU(2)_R doublets 32 each",
+          (g10 == 1).sum() == (g10 == -1).sum() == 32
+          and (left == 0.75).sum() == (right == 0.75).sum() == 32)
+
+    passed = sum(tests)
+    print(f"\nFINAL: {passed}/{len(tests)} PASS")
+    return 0 if passed == len(tests) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(_verify())
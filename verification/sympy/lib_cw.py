@@ -0,0 +1,232 @@
+#!/usr/bin/env python3
+"""
+Batched Self-Consistent Coleman-Weinberg Masses
+===============================================
+
+Newton and Anderson solvers over whole parameter grids for the one-loop
+gauge mass of a pNGB,
+  m^2 = P m_rho^2 log(m_rho^2 / m^2),
+whose solution is x = m^2/m_rho^2 = P W_0(1/P) (Lambert W). The plain
+fixed-point loop x -> -P log x contracts only by 1/W_0(1/P) per step (0.42
+for the QCD prefactor); Newton on t = log x reaches 1e-13 in 3-5 steps for
+every P > 0 and runs on 10^5 grid points at once.
+
+Method:
+  - newton(g, dg, t0): elementwise Newton over arrays; converged entries
+    are frozen, so every entry gets its own iteration count. Callbacks
+    take (values, indices) of the active entries, g(t[idx], idx)
+  - anderson(G, x0): elementwise fixed-point iteration with Anderson(1)
+    mixing (the secant step on the residual G(x) - x; for a scalar
+    unknown a deeper history adds nothing), for maps without a derivative
+  - solve_log_mass(): g(t) = e^t + P t is increasing and convex in
+    t = log x, so Newton from any start converges (monotonically after
+    at most one step) to the unique root; the start t0 = log(P log(1 + 1/P))
+    is within a few percent of the answer for all P
+
+Every solver returns Solution(value, converged, iterations); inputs that
+have no solution (P <= 0, m_rho <= 0, NaN) come back as NaN with
+converged = False.
+
+Usage:
+  from lib_cw import solve_log_mass
+  sol = solve_log_mass(prefactor, m_rho)          # arrays broadcast together
+  sol.value, sol.converged, sol.iterations
+  solve_log_mass(P, m_rho, method="anderson")
+
+Running this file verifies the solvers.
+"""
+
+import sys
+from typing import Callable, NamedTuple
+
+import numpy as np
+
+TOL = 1e-13
+
+
+class Solution(NamedTuple):
+    value: np.ndarray
+    converged: np.ndarray
+    iterations: np.ndarray
+
+
+# ==============================================================================
+# GENERIC BATCHED SOLVERS
+# ==============================================================================
+
+def newton(g: Callable, dg: Callable, t0, tol: float = TOL, max_iter: int = 50) -> Solution:
+    """Solve g(t) = 0 elementwise.
+
+    g and dg are called as g(t_active, idx): the still-active values as a
+    1-D array and their flat indices into t0, so per-point parameters can be
+    looked up as P[idx]. An entry stops once its step is below
+    tol * max(1, |t|).
+    """
+    t = np.array(t0, dtype=float)
+    shape = t.shape
+    t = t.ravel().copy()
+    its = np.zeros(t.size, dtype=int)
+    conv = np.zeros(t.size, dtype=bool)
+    active = np.flatnonzero(np.isfinite(t))
+    for _ in range(max_iter):
+        if active.size == 0:
+            break
+        ta = t[active]
+        step = g(ta, active) / dg(ta, active)
+        t[active] = ta - step
+        its[active] += 1
+        done = np.abs(step) <= tol * np.maximum(1.0, np.abs(ta))
+        bad = ~np.isfinite(t[active])
+        conv[active[done & ~bad]] = True
+        active = active[~done & ~bad]
+    return Solution(t.reshape(shape), conv.reshape(shape), its.reshape(shape))
+
+
+def anderson(G: Callable, x0, tol: float = TOL, max_iter: int = 200) -> Solution:
+    """Fixed point x = G(x) elementwise with Anderson(1) mixing.
+
+    G is called as G(x_active, idx), as g in newton().
+    With residuals f_k = G(x_k) - x_k the update is
+      x_{k+1} = G(x_k) - gamma (G(x_k) - G(x_{k-1})),
+      gamma = f_k / (f_k - f_{k-1}),
+    falling back to the plain step when f_k = f_{k-1}.
+    """
+    x = np.array(x0, dtype=float)
+    shape = x.shape
+    x = x.ravel().copy()
+    its = np.zeros(x.size, dtype=int)
+    conv = np.zeros(x.size, dtype=bool)
+    active = np.flatnonzero(np.isfinite(x))
+    g_prev = np.full(x.size, np.nan)
+    f_prev = np.full(x.size, np.nan)
+    for _ in range(max_iter):
+        if active.size == 0:
+            break
+        xa = x[active]
+        ga = G(xa, active)
+        fa = ga - xa
+        df = fa - f_prev[active]
+        with np.errstate(invalid="ignore", divide="ignore"):
+            gamma = np.where(np.isfinite(df) & (df != 0), fa / df, 0.0)
+        x_new = ga - gamma * (ga - np.where(np.isfinite(g_prev[active]), g_prev[active], ga))
+        g_prev[active], f_prev[active] = ga, fa
+        x[active] = x_new
+        its[active] += 1
+        done = np.abs(x_new - xa) <= tol * np.maximum(1.0, np.abs(xa))
+        bad = ~np.isfinite(x_new)
+        conv[active[done & ~bad]] = True
+        active = active[~done & ~bad]
+    return Solution(x.reshape(shape), conv.reshape(shape), its.reshape(shape))
+
+
+# ==============================================================================
+# SELF-CONSISTENT LOG MASS
+# ==============================================================================
+
+def solve_log_mass(prefactor, m_rho, method: str = "newton", tol: float = TOL,
+                   max_iter: int = 200) -> Solution:
+    """m with m^2 = prefactor * m_rho^2 * log(m_rho^2 / m^2), elementwise.
+
+    prefactor and m_rho broadcast together; the returned value has their
+    broadcast shape (m in the units of m_rho).
+    """
+    P, m_rho = np.broadcast_arrays(np.asarray(prefactor, dtype=float),
+                                   np.asarray(m_rho, dtype=float))
+    shape = P.shape
+    P, m_rho = P.ravel(), m_rho.ravel()
+    ok = (P > 0) & (m_rho > 0) & np.isfinite(P) & np.isfinite(m_rho)
+    t0 = np.full(P.size, np.nan)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        t0[ok] = np.log(P[ok] * np.log1p(1.0 / P[ok]))
+
+    if method == "newton":
+        sol = newton(lambda t, i: np.exp(t) + P[i] * t,
+                     lambda t, i: np.exp(t) + P[i], t0, tol=tol, max_iter=max_iter)
+        x = np.exp(sol.value)
+    elif method == "anderson":
+        sol = anderson(lambda x, i: -P[i] * np.log(x), np.exp(t0), tol=tol, max_iter=max_iter)
+        x = sol.value
+    else:
+        raise ValueError(f"unknown method {method!r}")
+    conv = sol.converged & ok & (x > 0) & (x < 1)
+    m = np.where(conv, m_rho * np.sqrt(np.where(conv, x, 1.0)), np.nan)
+    return Solution(m.reshape(shape), conv.reshape(shape), sol.iterations.reshape(shape))
+
+
+# ==============================================================================
+# SELF-CHECK
+# ==============================================================================
+
+def _verify() -> int:
+    import time
+
+    from scipy.special import lambertw
+
+    from suite_results import record
+
+    tests = []
+
+    def check(name, condition, detail=""):
+        tests.append(bool(condition))
+        status = "PASS" if condition else "FAIL"
+        print(f"  [{status}] T{len(tests)}: {name}")
+        if detail and not condition:
+            print(f"         {detail}")
+        record(name, bool(condition), detail=detail)
+
+    print("=" * 70)
+    print("PART 1: ACCURACY")
+    print("=" * 70)
+    P = np.logspace(-6, 2, 2001)
+    exact = np.sqrt(P * lambertw(1.0 / P).real)
+    for method in ("newton", "anderson"):
+        sol = solve_log_mass(P, 1.0, method=method)
+        err = np.abs(sol.value / exact - 1).max()
+        print(f"  {method:>8s}: max rel err {err:.1e}, iterations "
+              f"{sol.iterations.min()}-{sol.iterations.max()}")
+        check(f"{method}: m/m_rho = sqrt(P W(1/P)) to 1e-12 for P in [1e-6, 100]",
+              sol.converged.all() and err < 1e-12)
+    sol = solve_log_mass(P, 1.0)
+    x = (sol.value)**2
+    check("solution satisfies m^2 = P m_rho^2 log(m_rho^2/m^2) (residual < 1e-12)",
+          np.abs(x + P * np.log(x)).max() < 1e-12)
+    check("Newton needs at most 8 iterations anywhere", sol.iterations.max() <= 8)
+
+    print("=" * 70)
+    print("PART 2: SCALAR FIXED POINT AND FLAGS")
+    print("=" * 70)
+    P_qcd = 3 * (4 / 3) * 4 * np.pi * 0.1179 / (16 * np.pi**2)
+    x = np.sqrt(P_qcd) * 0.5
+    for _ in range(20):
+        x = np.sqrt(P_qcd * np.log(1 / x**2))
+    ref = solve_log_mass(P_qcd, 1.0).value
+    print(f"  QCD prefactor {P_qcd:.5f}: 20 fixed-point steps off by {abs(x / ref - 1):.1e}")
+    check("20-step fixed point agrees to 1e-6 but not to 1e-10 (slow contraction)",
+          1e-10 < abs(x / ref - 1) < 1e-6)
+    bad = solve_log_mass([0.0, -1.0, np.nan, 0.05], [1.0, 1.0, 1.0, -2.0])
+    check("P <= 0, NaN and m_rho <= 0 give NaN with converged = False",
+          np.isnan(bad.value).all() and not bad.converged.any())
+    sol = solve_log_mass(np.full((3, 4), 0.04), np.arange(1, 5) * 1000.0)
+    check("broadcasting: shape (3, 4), m proportional to m_rho",
+          sol.value.shape == (3, 4) and np.allclose(sol.value / sol.value[:, :1], np.arange(1, 5)))
+
+    print("=" * 70)
+    print("PART 3: SPEED")
+    print("=" * 70)
+    rng = np.random.default_rng(0)
+    P = rng.uniform(1e-3, 0.2, 10**5)
+    m_rho = rng.uniform(1e3, 2e4, 10**5)
+    t0 = time.perf_counter()
+    sol = solve_log_mass(P, m_rho)
+    dt = time.perf_counter() - t0
+    print(f"  10^5 points: {dt * 1e3:.0f} ms, mean iterations {sol.iterations.mean():.2f}")
+    check("10^5-point grid converges everywhere within 8 Newton iterations",
+          sol.converged.all() and sol.iterations.max() <= 8)
+
+    passed = sum(tests)
+    print(f"\nFINAL: {passed}/{len(tests)} PASS")
+    return 0 if passed == len(tests) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(_verify())
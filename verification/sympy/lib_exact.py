@@ -0,0 +1,579 @@
+#!/usr/bin/env python3
+"""
+Exact Linear Algebra Kernel
+===========================
+
+Fraction-free rank, RREF and nullspace of integer/rational matrices, and
+sparse exact tensors. rank(), rref() and nullspace() return exactly what
+SymPy's Matrix methods return (same pivots, same RREF, same nullspace basis
+in the same order), but work on sparse rows of Python ints instead of dense
+Matrix objects of SymPy Rationals, so a constraint system with hundreds of
+unknowns reduces in milliseconds.
+
+Method:
+  - every row is stored as {column: int}; rational rows are scaled by the
+    lcm of their denominators and divided by their content (row scaling
+    does not change the row space, so rank, RREF and nullspace are kept)
+  - Bareiss elimination: after choosing pivot p (previous pivot q) each
+    other row becomes (p * row - a * pivot_row) / q, and the division is
+    exact because every entry is a minor of the input. Numbers grow like
+    determinants, never like products of fractions
+  - the pivot for a column is the candidate row with the fewest nonzeros,
+    which keeps the rows sparse
+  - rref() runs the Gauss-Jordan form of the same recurrence; at the end
+    every pivot equals the last pivot d, so RREF = rows / d
+  - rank() first eliminates modulo the prime 2^61 - 1. The rank mod p is
+    never larger than the true rank, so if it already equals
+    min(rows, cols) it is exact and no big-integer work is done; otherwise
+    the exact Bareiss rank is computed
+
+SparseTensor holds an exact tensor of any rank as {index tuple: int} over
+one common denominator. Sums, scalar multiples, transposes, traces and
+numpy.tensordot-style contractions stay in integers (a contraction joins
+the two entry lists on the contracted indices, so its cost follows the
+nonzeros, not the dense shape).
+
+nullspace() follows SymPy's convention: one vector per free (non-pivot)
+column in increasing order, with a 1 in that column and minus the RREF
+entries in the pivot columns. Entries are fractions.Fraction, which compare
+equal to SymPy Rationals and are converted to them on assignment into a
+SymPy Matrix.
+
+Usage:
+  from lib_exact import rank, rref, nullspace
+  rank(rows)                    # list of lists, SymPy Matrix, numpy array
+  R, pivots = rref(rows)        # nonzero RREF rows (Fractions), pivot columns
+  N = nullspace(rows)           # list of vectors (lists of Fractions)
+  nullspace([{0: 1, 5: -2}], ncols=8)   # sparse rows need ncols
+  from lib_exact import SparseTensor
+  A = SparseTensor.from_dense(M)          # nested lists, SymPy Matrix, numpy
+  (A @ B).trace(), A.dot(B)               # Fractions
+  E.contract(A, (1,), (1,))               # tensordot over the paired axes
+
+Entries must be rational (int, Fraction, SymPy Integer/Rational, numpy
+integers); anything else raises TypeError.
+
+Running this file verifies the kernel against SymPy.
+"""
+
+import numbers
+import sys
+from fractions import Fraction
+from math import gcd
+from operator import itemgetter
+from typing import Dict, List, Optional, Tuple
+
+PRIME = (1 << 61) - 1
+
+Row = Dict[int, int]
+
+
+# ==============================================================================
+# INPUT
+# ==============================================================================
+
+def _fraction(x) -> Fraction:
+    if isinstance(x, numbers.Rational):
+        return Fraction(int(x.numerator), int(x.denominator))
+    raise TypeError(f"exact linear algebra needs rational entries, got {x!r}")
+
+
+def integer_rows(rows, ncols: Optional[int] = None) -> Tuple[List[Row], int]:
+    """Primitive sparse integer rows with the same row space as `rows`.
+
+    `rows` is a sequence of dense rows or of {column: value} dicts, a SymPy
+    Matrix or a numpy array. Zero rows are dropped.
+    """
+    if hasattr(rows, "shape") and hasattr(rows, "tolist"):
+        ncols = rows.shape[1] if ncols is None else ncols
+        rows = rows.tolist()
+    out = []
+    width = 0
+    for r in rows:
+        items = r.items() if isinstance(r, dict) else enumerate(r)
+        entries = {j: _fraction(v) for j, v in items if v != 0}
+        if not isinstance(r, dict):
+            width = max(width, len(r))
+        if not entries:
+            continue
+        den = 1
+        for v in entries.values():
+            den = den * v.denominator // gcd(den, v.denominator)
+        row = {j: int(v * den) for j, v in entries.items()}
+        content = 0
+        for v in row.values():
+            content = gcd(content, v)
+        out.append({j: v // content for j, v in row.items()})
+    if ncols is None:
+        ncols = max([width] + [max(r) + 1 for r in out])
+    elif any(max(r) >= ncols for r in out):
+        raise ValueError(f"row entry beyond ncols = {ncols}")
+    return out, ncols
+
+
+# ==============================================================================
+# ELIMINATION
+# ==============================================================================
+
+def _update(row: Row, pivot_row: Row, p: int, a: int, q: int) -> None:
+    """row <- (p * row - a * pivot_row) / q, in place (Bareiss step)."""
+    for j in row:
+        row[j] *= p
+    if a:
+        for j, v in pivot_row.items():
+            row[j] = row.get(j, 0) - a * v
+    for j in list(row):
+        v = row[j]
+        if not v:
+            del row[j]
+        elif q != 1:
+            v, rem = divmod(v, q)
+            if rem:
+                raise ArithmeticError("inexact Bareiss division")
+            row[j] = v
+
+
+def bareiss(rows: List[Row], reduce: bool = False) -> Tuple[List[Row], List[int], int]:
+    """Fraction-free elimination of sparse integer rows (consumed).
+
+    Returns (pivot rows, pivot columns, last pivot), pivot columns in
+    increasing order. With reduce=True the pivot columns are also cleared
+    above each pivot and every pivot equals the last pivot d, so the
+    reduced row echelon form is rows / d.
+    """
+    pending = [r for r in rows if r]
+    done: List[Row] = []
+    pivots: List[int] = []
+    q = 1
+    while pending:
+        col = min(min(r) for r in pending)
+        k = min((i for i, r in enumerate(pending) if col in r),
+                key=lambda i: len(pending[i]))
+        pivot_row = pending.pop(k)
+        p = pivot_row[col]
+        for r in pending + done if reduce else pending:
+            _update(r, pivot_row, p, r.get(col, 0), q)
+        pending = [r for r in pending if r]
+        done.append(pivot_row)
+        pivots.append(col)
+        q = p
+    return done, pivots, q
+
+
+def rank_mod(rows, p: int = PRIME, ncols: Optional[int] = None) -> int:
+    """Rank over GF(p): a lower bound for the rational rank."""
+    R, _ = integer_rows(rows, ncols)
+    pending = [{j: v % p for j, v in r.items() if v % p} for r in R]
+    pending = [r for r in pending if r]
+    r_mod = 0
+    while pending:
+        col = min(min(r) for r in pending)
+        k = min((i for i, r in enumerate(pending) if col in r),
+                key=lambda i: len(pending[i]))
+        pivot_row = pending.pop(k)
+        inv = pow(pivot_row[col], -1, p)
+        for r in pending:
+            a = r.get(col)
+            if a:
+                a = a * inv % p
+                for j, v in pivot_row.items():
+                    w = (r.get(j, 0) - a * v) % p
+                    if w:
+                        r[j] = w
+                    else:
+                        r.pop(j, None)
+        pending = [r for r in pending if r]
+        r_mod += 1
+    return r_mod
+
+
+# ==============================================================================
+# RANK / RREF / NULLSPACE
+# ==============================================================================
+
+def rank(rows, ncols: Optional[int] = None) -> int:
+    """Exact rank (modular certificate first, Bareiss if it is not full)."""
+    R, ncols = integer_rows(rows, ncols)
+    if rank_mod(R, ncols=ncols) == min(len(R), ncols):
+        return min(len(R), ncols)
+    return len(bareiss(R)[1])
+
+
+def rref(rows, ncols: Optional[int] = None) -> Tuple[List[List[Fraction]], Tuple[int, ...]]:
+    """Nonzero rows of the reduced row echelon form and the pivot columns.
+
+    SymPy's Matrix.rref() returns the same rows, padded with zero rows.
+    """
+    R, ncols = integer_rows(rows, ncols)
+    done, pivots, d = bareiss(R, reduce=True)
+    out = []
+    for r in done:
+        dense = [Fraction(0)] * ncols
+        for j, v in r.items():
+            dense[j] = Fraction(v, d)
+        out.append(dense)
+    return out, tuple(pivots)
+
+
+def nullspace(rows, ncols: Optional[int] = None) -> List[List[Fraction]]:
+    """Basis of {x : rows x = 0}, identical to SymPy's Matrix.nullspace()."""
+    R, ncols = integer_rows(rows, ncols)
+    done, pivots, d = bareiss(R, reduce=True)
+    pivot_set = set(pivots)
+    basis = []
+    for f in range(ncols):
+        if f in pivot_set:
+            continue
+        v = [Fraction(0)] * ncols
+        v[f] = Fraction(1)
+        for r, c in zip(done, pivots):
+            if f in r:
+                v[c] = Fraction(-r[f], d)
+        basis.append(v)
+    return basis
+
+
+# ==============================================================================
+# SPARSE EXACT TENSORS
+# ==============================================================================
+
+def _getter(axes):
+    """Function mapping an index tuple to the tuple of its entries at `axes`."""
+    axes = list(axes)
+    if not axes:
+        return lambda k: ()
+    if len(axes) == 1:
+        a = axes[0]
+        return lambda k: (k[a],)
+    return itemgetter(*axes)
+
+
+class SparseTensor:
+    """Exact sparse tensor: integer numerators over one common denominator.
+
+    The entry at index tuple idx is entries[idx] / den (den > 0). Zero
+    entries are not stored, and every result is reduced so that the
+    numerators and den have no common factor.
+    """
+
+    __slots__ = ("shape", "entries", "den")
+
+    def __init__(self, shape, entries: Optional[Dict[tuple, int]] = None, den: int = 1):
+        self.shape = tuple(shape)
+        self.entries = {k: v for k, v in (entries or {}).items() if v}
+        self.den = den
+        self._reduce()
+
+    def _reduce(self) -> None:
+        if self.den < 0:
+            self.entries = {k: -v for k, v in self.entries.items()}
+            self.den = -self.den
+        g = self.den
+        for v in self.entries.values():
+            if g == 1:
+                return
+            g = gcd(g, v)
+        if g > 1:
+            self.entries = {k: v // g for k, v in self.entries.items()}
+            self.den //= g
+
+    @classmethod
+    def from_dense(cls, array) -> "SparseTensor":
+        """From nested lists, a SymPy Matrix or a numpy array of rationals."""
+        if hasattr(array, "shape") and hasattr(array, "tolist"):
+            shape, flat = tuple(array.shape), array.tolist()
+        else:
+            shape, flat = [], array
+            while isinstance(flat, (list, tuple)):
+                shape.append(len(flat))
+                flat = flat[0] if flat else None
+            flat = array
+        values = {}
+
+        def walk(x, idx):
+            if isinstance(x, (list, tuple)):
+                for i, y in enumerate(x):
+                    walk(y, idx + (i,))
+            else:
+                f = _fraction(x)
+                if f:
+                    values[idx] = f
+        walk(flat, ())
+        return cls.from_fractions(shape, values)
+
+    @classmethod
+    def from_fractions(cls, shape, values: Dict[tuple, Fraction]) -> "SparseTensor":
+        den = 1
+        for f in values.values():
+            den = den * f.denominator // gcd(den, f.denominator)
+        return cls(shape, {k: int(f * den) for k, f in values.items()}, den)
+
+    @classmethod
+    def eye(cls, n: int) -> "SparseTensor":
+        return cls((n, n), {(i, i): 1 for i in range(n)})
+
+    @property
+    def ndim(self) -> int:
+        return len(self.shape)
+
+    @property
+    def nnz(self) -> int:
+        return len(self.entries)
+
+    def __getitem__(self, idx) -> Fraction:
+        return Fraction(self.entries.get(tuple(idx), 0), self.den)
+
+    def todense(self):
+        """numpy object array of Fractions."""
+        import numpy as np
+        out = np.full(self.shape, Fraction(0), dtype=object)
+        for k, v in self.entries.items():
+            out[k] = Fraction(v, self.den)
+        return out
+
+    def __eq__(self, other) -> bool:
+        return (isinstance(other, SparseTensor) and self.shape == other.shape
+                and self.den == other.den and self.entries == other.entries)
+
+    def __repr__(self) -> str:
+        return f"SparseTensor(shape={self.shape}, nnz={self.nnz}, den={self.den})"
+
+    # --- linear structure ---------------------------------------------------
+
+    def __add__(self, other: "SparseTensor") -> "SparseTensor":
+        if self.shape != other.shape:
+            raise ValueError(f"shape mismatch {self.shape} vs {other.shape}")
+        den = self.den * other.den // gcd(self.den, other.den)
+        a, b = den // self.den, den // other.den
+        out = {k: v * a for k, v in self.entries.items()}
+        for k, v in other.entries.items():
+            out[k] = out.get(k, 0) + v * b
+        return SparseTensor(self.shape, out, den)
+
+    def __neg__(self) -> "SparseTensor":
+        return SparseTensor(self.shape, {k: -v for k, v in self.entries.items()}, self.den)
+
+    def __sub__(self, other: "SparseTensor") -> "SparseTensor":
+        return self + (-other)
+
+    def __mul__(self, c) -> "SparseTensor":
+        c = _fraction(c)
+        return SparseTensor(self.shape, {k: v * c.numerator for k, v in self.entries.items()},
+                            self.den * c.denominator)
+
+    __rmul__ = __mul__
+
+    def transpose(self, *axes) -> "SparseTensor":
+        axes = axes or tuple(reversed(range(self.ndim)))
+        return SparseTensor(tuple(self.shape[a] for a in axes),
+                            {tuple(k[a] for a in axes): v for k, v in self.entries.items()},
+                            self.den)
+
+    @property
+    def T(self) -> "SparseTensor":
+        return self.transpose()
+
+    # --- contractions ---------------------------------------------------------
+
+    def contract(self, other: "SparseTensor", axes_self: Tuple[int, ...],
+                 axes_other: Tuple[int, ...]):
+        """numpy.tensordot: sum over the paired axes; the result has the free
+        axes of self, then those of other. A full contraction returns a
+        Fraction.
+        """
+        if any(self.shape[a] != other.shape[b] for a, b in zip(axes_self, axes_other)):
+            raise ValueError("contracted axes have different lengths")
+        free_s = [a for a in range(self.ndim) if a not in axes_self]
+        free_o = [b for b in range(other.ndim) if b not in axes_other]
+        key_s, rest_s = _getter(axes_self), _getter(free_s)
+        key_o, rest_o = _getter(axes_other), _getter(free_o)
+        groups: Dict[tuple, List[Tuple[tuple, int]]] = {}
+        for k, v in other.entries.items():
+            groups.setdefault(key_o(k), []).append((rest_o(k), v))
+        out: Dict[tuple, int] = {}
+        get = out.get
+        for k, v in self.entries.items():
+            hits = groups.get(key_s(k))
+            if hits:
+                ks = rest_s(k)
+                for ko, w in hits:
+                    key = ks + ko
+                    out[key] = get(key, 0) + v * w
+        den = self.den * other.den
+        if not free_s and not free_o:
+            return Fraction(out.get((), 0), den)
+        return SparseTensor(tuple(self.shape[a] for a in free_s)
+                            + tuple(other.shape[b] for b in free_o), out, den)
+
+    def __matmul__(self, other: "SparseTensor") -> "SparseTensor":
+        return self.contract(other, (self.ndim - 1,), (0,))
+
+    def dot(self, other: "SparseTensor") -> Fraction:
+        """Full inner product sum_idx self[idx] * other[idx]."""
+        if self.shape != other.shape:
+            raise ValueError(f"shape mismatch {self.shape} vs {other.shape}")
+        small, large = sorted((self, other), key=lambda t: t.nnz)
+        num = sum(v * large.entries.get(k, 0) for k, v in small.entries.items())
+        return Fraction(num, self.den * other.den)
+
+    def trace(self, axis1: int = 0, axis2: int = 1):
+        """Sum over the diagonal of two axes (a Fraction for a matrix)."""
+        free = [a for a in range(self.ndim) if a not in (axis1, axis2)]
+        out: Dict[tuple, int] = {}
+        for k, v in self.entries.items():
+            if k[axis1] == k[axis2]:
+                key = tuple(k[a] for a in free)
+                out[key] = out.get(key, 0) + v
+        if not free:
+            return Fraction(out.get((), 0), self.den)
+        return SparseTensor(tuple(self.shape[a] for a in free), out, self.den)
+
+
+# ==============================================================================
+# SELF-CHECK
+# ==============================================================================
+
+def _verify() -> int:
+    import random
+    import time
+
+    import numpy as np
+    from sympy import Matrix, Rational, sqrt
+
+    from suite_results import record
+
+    tests = []
+
+    def check(name, condition, detail=""):
+        tests.append(bool(condition))
+        status = "PASS" if condition else "FAIL"
+        print(f"  [{status}] T{len(tests)}: {name}")
+        if detail and not condition:
+            print(f"         {detail}")
+        record(name, bool(condition), detail=detail)
+
+    rnd = random.Random(0)
+
+    def random_matrix(m, n, r, density=0.3, lo=-3, hi=3):
+        """m x n integer matrix of rank <= r (product of sparse factors)."""
+        A = [[rnd.randint(lo, hi) if rnd.random() < density else 0 for _ in range(r)]
+             for _ in range(m)]
+        B = [[rnd.randint(lo, hi) if rnd.random() < density else 0 for _ in range(n)]
+             for _ in range(r)]
+        return [[sum(A[i][k] * B[k][j] for k in range(r)) for j in range(n)] for i in range(m)]
+
+    def same_as_sympy(rows):
+        M = Matrix(rows)
+        R, pivots = rref(rows)
+        R_sym, pivots_sym = M.rref()
+        N, N_sym = nullspace(rows), M.nullspace()
+        return (rank(rows) == M.rank()
+                and pivots == pivots_sym
+                and R == R_sym[:len(R), :].tolist()
+                and all(x == 0 for x in R_sym[len(R):, :])
+                and len(N) == len(N_sym)
+                and all(Matrix(v) == w for v, w in zip(N, N_sym)))
+
+    print("=" * 70)
+    print("PART 1: AGREEMENT WITH SYMPY")
+    print("=" * 70)
+    shapes = [(6, 6, 6), (8, 5, 5), (5, 9, 5), (12, 10, 4), (10, 14, 7), (20, 21, 14), (1, 4, 1)]
+    check("random integer matrices: rank, RREF, pivots and nullspace match SymPy",
+          all(same_as_sympy(random_matrix(m, n, r)) for m, n, r in shapes))
+    rational = [[Rational(rnd.randint(-4, 4), rnd.randint(1, 5)) for _ in range(7)]
+                for _ in range(4)]
+    rational += [[2 * a - Rational(1, 3) * b for a, b in zip(rational[0], rational[1])]]
+    check("rational matrix with a dependent row matches SymPy", same_as_sympy(rational))
+    check("zero matrix: rank 0, full nullspace", same_as_sympy([[0] * 4] * 3)
+          and len(nullspace([[0] * 4] * 3)) == 4)
+    check("identity: rank n, empty nullspace", same_as_sympy(np.eye(5, dtype=int).tolist())
+          and nullspace(np.eye(5, dtype=int)) == [])
+
+    print("=" * 70)
+    print("PART 2: EXACTNESS")
+    print("=" * 70)
+    big = [[10 ** 30 + i * j for j in range(6)] for i in range(6)]
+    check("rank of a matrix with 30-digit entries matches SymPy (2)",
+          rank(big) == Matrix(big).rank() == 2)
+    check("rank mod 2 of [[2, 1], [0, 1]] is 1, exact rank is 2",
+          rank_mod([[2, 1], [0, 1]], p=2) == 1 and rank([[2, 1], [0, 1]]) == 2)
+    hilbert = [[Fraction(1, i + j + 1) for j in range(8)] for i in range(8)]
+    check("8x8 Hilbert matrix is nonsingular (rank 8)", rank(hilbert) == 8)
+    ok = True
+    for m, n, r in [(15, 15, 9), (30, 12, 12), (9, 30, 6)]:
+        rows = random_matrix(m, n, r, lo=-50, hi=50)
+        for v in nullspace(rows):
+            ok &= all(sum(a * x for a, x in zip(row, v)) == 0 for row in rows)
+    check("nullspace vectors are exact solutions (A v = 0 in Q)", ok)
+
+    print("=" * 70)
+    print("PART 3: INPUT FORMATS")
+    print("=" * 70)
+    dense = [[1, 0, 2, 0, 0], [0, 0, 1, -1, 0]]
+    sparse_rows = [{0: 1, 2: 2}, {2: 1, 3: -1}]
+    check("dense lists, dict rows, SymPy Matrix and numpy array agree",
+          nullspace(dense) == nullspace(sparse_rows, ncols=5) == nullspace(Matrix(dense))
+          == nullspace(np.array(dense)))
+    try:
+        rank([[1, sqrt(2)]])
+        raised = False
+    except TypeError:
+        raised = True
+    check("irrational entries raise TypeError", raised)
+
+    print("=" * 70)
+    print("PART 4: SPEED")
+    print("=" * 70)
+    rows = random_matrix(30, 24, 16, density=0.2)
+    t0 = time.perf_counter()
+    N = nullspace(rows)
+    r = rank(rows)
+    t_exact = time.perf_counter() - t0
+    t0 = time.perf_counter()
+    M = Matrix(rows)
+    N_sym = M.nullspace()
+    r_sym = M.rank()
+    t_sympy = time.perf_counter() - t0
+    print(f"  30 x 24 rank {r}: lib_exact {t_exact * 1e3:.1f} ms, SymPy {t_sympy * 1e3:.0f} ms")
+    check("30 x 24 sparse system: same rank and nullspace as SymPy",
+          r == r_sym and all(Matrix(v) == w for v, w in zip(N, N_sym)) and len(N) == len(N_sym))
+    rows = random_matrix(200, 160, 120, density=0.03)
+    t0 = time.perf_counter()
+    r = rank(rows)
+    N = nullspace(rows)
+    dt = time.perf_counter() - t0
+    print(f"  200 x 160 rank {r}: rank + nullspace in {dt:.2f} s")
+    check("200 x 160 sparse system: rank + nullspace dimension = 160",
+          r + len(N) == 160 and rank_mod(rows) == r)
+
+    print("=" * 70)
+    print("PART 5: SPARSE TENSORS")
+    print("=" * 70)
+    nrnd = np.random.RandomState(5)
+    X = nrnd.randint(-3, 4, size=(4, 3, 5)) * (nrnd.rand(4, 3, 5) < 0.4)
+    Y = nrnd.randint(-3, 4, size=(5, 3, 2)) * (nrnd.rand(5, 3, 2) < 0.4)
+    SX = SparseTensor.from_dense(X) * Fraction(1, 6)
+    SY = SparseTensor.from_dense(Y) * Fraction(-2, 9)
+    Z = SX.contract(SY, (1, 2), (1, 0)).todense()
+    ref = np.tensordot(X, Y, axes=([1, 2], [1, 0]))
+    check("contract = numpy.tensordot (with rational scalings 1/6, -2/9)",
+          all(Z[i, j] == Fraction(-int(ref[i, j]), 27) for i in range(4) for j in range(2)))
+    M = Matrix(4, 4, lambda i, j: Rational(i - 2 * j, 1 + (i * j) % 3))
+    K = Matrix(4, 4, lambda i, j: Rational((i + j) % 4 - 1, 2 + i))
+    SM, SK = SparseTensor.from_dense(M), SparseTensor.from_dense(K)
+    check("matrix product, trace, dot, sum and transpose match SymPy",
+          (SM @ SK).todense().tolist() == (M * K).tolist()
+          and (SM @ SK @ SM).trace() == (M * K * M).trace()
+          and SM.dot(SK) == sum(a * b for a, b in zip(M, K))
+          and (SM - SK.T).todense().tolist() == (M - K.T).tolist())
+    check("entries reduced to lowest terms: (A * 3/4) * 4/3 == A, A - A is empty",
+          (SM * Fraction(3, 4)) * Fraction(4, 3) == SM and (SM - SM).nnz == 0
+          and (SM - SM).den == 1)
+
+    passed = sum(tests)
+    print(f"\nFINAL: {passed}/{len(tests)} PASS")
+    return 0 if passed == len(tests) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(_verify())
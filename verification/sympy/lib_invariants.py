@@ -0,0 +1,335 @@
+#!/usr/bin/env python3
+"""
+Invariant Ring Toolkit
+======================
+
+Exact Hilbert (Molien) series and Monte Carlo independence tests for
+polynomial invariants of compact Lie groups. The number of independent
+invariants of each degree is computed exactly from the root system of a
+lib_reps algebra; for SO(n) on Sym_0(R^n) (traceless symmetric matrices,
+the tilt field of conj_b1_invariant_ring.py) the same counts can be checked
+against the rank of random evaluations of trace monomials.
+
+Exact series (any algebra of lib_reps, any representation V):
+  By the Weyl integration formula the invariants of degree d are the
+  multiplicity of the trivial character in Sym^d V. Instead of expanding
+  the torus integral, Sym^d V is tracked as a combination of irreducible
+  characters with Newton's identity
+      Sym^d V = (1/d) sum_{k=1..d} psi^k(V) (x) Sym^(d-k) V
+  (psi^k V = the weights of V scaled by k), each product expanded by
+  Brauer-Klimyk: chi_lam * sum_nu c_nu e^(k nu) = sum_nu c_nu eps(w) chi_(w(lam + k nu + rho) - rho).
+  Only irreps that can still reach the trivial one by the top degree are
+  kept: w(x) - rho >= lam + k nu in dominance, so an irrep larger than
+  (D - d) * (lowest weight of V) in simple-root coordinates never returns.
+  All arithmetic is in integers and the division by d is checked exact.
+
+Monte Carlo (SO(n) on Sym_0(R^n)):
+  power_sums(phi, kmax)        Tr(phi^k) for a stack of matrices (eigvalsh)
+  monomials(degrees, d)        products of generators of total degree d
+  linear_rank(values)          rank of a (samples x candidates) evaluation
+                               matrix = number of linearly independent
+                               candidates (never overestimates)
+  relation(values)             a linear relation among the candidates, if any
+  jacobian_rank(eigs, ks)      rank of d Tr(phi^k) = k phi^(k-1) (traceless
+                               part) at diagonal points; full rank at one
+                               point proves algebraic independence. With
+                               integer eigenvalues the rank is exact (lib_exact)
+
+Usage:
+  from lib_invariants import hilbert_series, symmetric_powers, generator_degrees
+  from lib_reps import so
+  h = hilbert_series(so(11), (2, 0, 0, 0, 0), 12)   # [1, 0, 1, 1, 2, 2, 4, ...]
+  generator_degrees(h)                              # [2, 3, ..., 11]
+  phi = random_sym0(11, 2000, rng)
+  p = power_sums(phi, 8)
+  linear_rank(evaluate(p, monomials(range(2, 9), 8)))   # = h[8]
+
+Running this file verifies the toolkit.
+"""
+
+import sys
+from collections import Counter
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+import lib_exact
+
+TOL = 1e-9
+
+
+# ==============================================================================
+# EXACT HILBERT SERIES
+# ==============================================================================
+
+def _character(A, rep) -> Dict[Tuple, int]:
+    """Weight multiplicities of an irrep (highest weight) or {hw: mult}."""
+    if not isinstance(rep, dict):
+        rep = {tuple(rep): 1}
+    char = Counter()
+    for hw, m in rep.items():
+        for w, k in A.weights(hw).items():
+            char[w] += m * k
+    return dict(char)
+
+
+def symmetric_powers(A, rep, degree: int, trivial_only: bool = False) -> List[Dict[Tuple, int]]:
+    """[Sym^0 V, ..., Sym^degree V] as {highest weight: multiplicity}.
+
+    With trivial_only, irreps that cannot contribute to an invariant of
+    degree <= `degree` are dropped along the way (exact for the trivial
+    multiplicities, which is all hilbert_series needs).
+    """
+    r = A.rank
+    char = _character(A, rep)
+    Ainv = A.cartan_inverse
+
+    def root_coords(lam):
+        return tuple(sum(lam[k] * Ainv[k][i] for k in range(r)) for i in range(r))
+
+    if trivial_only:
+        lowest = [root_coords(tuple(-x for x in w[:r])) for w in char]
+        bound = [max(c[i] for c in lowest) for i in range(r)]
+    zero = tuple(0 for _ in next(iter(char)))
+    powers = [{zero: 1}]
+    reflected = {}
+
+    for d in range(1, degree + 1):
+        acc = Counter()
+        for k in range(1, d + 1):
+            psi = [(tuple(k * x for x in nu), c) for nu, c in char.items()]
+            for lam, m in powers[d - k].items():
+                for nu, c in psi:
+                    x = tuple(a + b for a, b in zip(lam, nu))
+                    hit = reflected.get(x)
+                    if hit is None:
+                        mu, sign = A.to_dominant(tuple(a + 1 for a in x[:r]))
+                        if min(mu, default=1) == 0:
+                            hit = reflected[x] = 0
+                        else:
+                            top = tuple(a - 1 for a in mu) + x[r:]
+                            hit = reflected[x] = (top, sign, root_coords(top))
+                    if not hit:
+                        continue
+                    top, sign, coords = hit
+                    if trivial_only and any(y > (degree - d) * b for y, b in zip(coords, bound)):
+                        continue
+                    acc[top] += sign * c * m
+        if any(v % d for v in acc.values()):
+            raise ArithmeticError(f"{A.name}: Sym^{d} multiplicities not divisible by {d}")
+        powers.append({lam: v // d for lam, v in acc.items() if v})
+    return powers
+
+
+def hilbert_series(A, rep, degree: int) -> List[int]:
+    """Coefficients h_0..h_degree: h_d = dim of degree-d invariant polynomials on V."""
+    powers = symmetric_powers(A, rep, degree, trivial_only=True)
+    zero = next(iter(powers[0]))
+    return [p.get(zero, 0) for p in powers]
+
+
+def free_series(degrees: Iterable[int], degree: int) -> List[int]:
+    """Coefficients of prod_k 1/(1 - t^k) (a polynomial ring on generators of these degrees)."""
+    h = [1] + [0] * degree
+    for k in degrees:
+        for d in range(k, degree + 1):
+            h[d] += h[d - k]
+    return h
+
+
+def generator_degrees(h: Sequence[int]) -> List[int]:
+    """Generator degrees a polynomial ring with series h would need (through len(h) - 1).
+
+    Raises ValueError where h falls below the free series of the generators
+    found so far (relations among them: the ring is not free).
+    """
+    found: List[int] = []
+    for d in range(1, len(h)):
+        extra = h[d] - free_series(found, d)[d]
+        if extra < 0:
+            raise ValueError(f"not a free series: {extra} relation(s) at degree {d}")
+        found += [d] * extra
+    return found
+
+
+# ==============================================================================
+# MONTE CARLO INDEPENDENCE (SO(n) on Sym_0(R^n))
+# ==============================================================================
+
+def random_sym0(n: int, samples: int, rng: np.random.Generator) -> np.ndarray:
+    """(samples, n, n) traceless symmetric matrices with Tr(phi^2) = 1."""
+    X = rng.standard_normal((samples, n, n))
+    phi = (X + X.transpose(0, 2, 1)) / 2
+    phi -= np.einsum("sii->s", phi)[:, None, None] / n * np.eye(n)
+    return phi / np.sqrt(np.einsum("sij,sij->s", phi, phi))[:, None, None]
+
+
+def power_sums(phi: np.ndarray, kmax: int) -> np.ndarray:
+    """Tr(phi^k) for k = 0..kmax, shape (samples, kmax + 1)."""
+    eigs = np.linalg.eigvalsh(phi)
+    return np.power(eigs[:, :, None], np.arange(kmax + 1)).sum(axis=1)
+
+
+def monomials(degrees: Iterable[int], d: int) -> List[Tuple[int, ...]]:
+    """Exponent vectors e with sum_i e_i * degrees[i] = d."""
+    degrees = list(degrees)
+    out: List[Tuple[int, ...]] = []
+
+    def walk(i, left, acc):
+        if i == len(degrees):
+            if left == 0:
+                out.append(tuple(acc))
+            return
+        for e in range(left // degrees[i] + 1):
+            walk(i + 1, left - e * degrees[i], acc + [e])
+
+    walk(0, d, [])
+    return out
+
+
+def evaluate(p: np.ndarray, monos: Sequence[Tuple[int, ...]],
+             degrees: Optional[Sequence[int]] = None) -> np.ndarray:
+    """Values of prod_i Tr(phi^degrees[i])^e_i, shape (samples, len(monos)).
+
+    `degrees` defaults to 2, 3, ..., matching monomials(range(2, ...), d).
+    """
+    if degrees is None:
+        degrees = range(2, 2 + len(monos[0]))
+    cols = p[:, list(degrees)]
+    E = np.array(monos, dtype=float)
+    return np.prod(cols[:, None, :] ** E[None, :, :], axis=2)
+
+
+def linear_rank(values: np.ndarray, tol: float = TOL) -> int:
+    """Numerical rank of a (samples x candidates) evaluation matrix."""
+    if values.shape[1] == 0:
+        return 0
+    V = values / np.linalg.norm(values, axis=0)
+    s = np.linalg.svd(V, compute_uv=False)
+    return int(np.sum(s > tol * s[0]))
+
+
+def relation(values: np.ndarray, tol: float = TOL) -> Optional[np.ndarray]:
+    """Coefficients c with values @ c = 0 (max |c| = 1), or None if independent."""
+    scale = np.linalg.norm(values, axis=0)
+    _, s, vt = np.linalg.svd(values / scale, full_matrices=False)
+    if s[-1] > tol * s[0]:
+        return None
+    c = vt[-1] / scale
+    return c / c[np.argmax(np.abs(c))]
+
+
+def jacobian_rank(eigs, ks: Sequence[int]) -> int:
+    """Rank of the gradients of Tr(phi^k), k in ks, at diagonal points.
+
+    eigs: one eigenvalue list (or a stack, maximum rank returned). The
+    gradient of Tr(phi^k) on Sym_0 is k * (phi^(k-1) - Tr(phi^(k-1))/n);
+    at a diagonal point only the diagonal survives. Integer eigenvalues
+    give an exact rank.
+    """
+    eigs = np.asarray(eigs)
+    if eigs.ndim == 1:
+        eigs = eigs[None]
+    if np.issubdtype(eigs.dtype, np.integer):
+        best = 0
+        for lam in eigs.tolist():
+            n = len(lam)
+            rows = []
+            for k in ks:
+                pw = [x ** (k - 1) for x in lam]
+                total = sum(pw)
+                rows.append([n * x - total for x in pw])
+            best = max(best, lib_exact.rank(rows, n))
+        return best
+    G = np.power(eigs[:, None, :], np.asarray(ks)[None, :, None] - 1)
+    G -= G.mean(axis=2, keepdims=True)
+    G /= np.linalg.norm(G, axis=2, keepdims=True)
+    return int(np.linalg.matrix_rank(G, tol=TOL).max())
+
+
+# ==============================================================================
+# SELF-CHECK
+# ==============================================================================
+
+def _verify() -> int:
+    import time
+    from lib_reps import so, su, g2
+    from suite_results import record
+
+    tests = []
+
+    def check(name, condition, detail=""):
+        tests.append(bool(condition))
+        status = "PASS" if condition else "FAIL"
+        print(f"  [{status}] T{len(tests)}: {name}")
+        if detail and not condition:
+            print(f"         {detail}")
+        record(name, bool(condition), detail=detail)
+
+    rng = np.random.default_rng(11)
+
+    def sym0(n):
+        A = so(n)
+        return A, (4,) if n == 3 else (2, 2) if n == 4 else (2,) + (0,) * (A.rank - 1)
+
+    print("=" * 70)
+    print("PART 1: EXACT HILBERT SERIES")
+    print("=" * 70)
+    ok = True
+    for n in range(3, 12):
+        A, hw = sym0(n)
+        ok &= hilbert_series(A, hw, 8) == free_series(range(2, n + 1), 8)
+    check("Sym_0(R^n), n = 3..11: h_d = partitions of d into parts 2..n (d <= 8)", ok)
+    t0 = time.perf_counter()
+    A, hw = sym0(20)
+    h20 = hilbert_series(A, hw, 8)
+    dt = time.perf_counter() - t0
+    check("so(20) on Sym_0(R^20) through degree 8", h20 == free_series(range(2, 21), 8),
+          f"got {h20}")
+    print(f"         ({dt:.2f}s)")
+    check("generator degrees: so(7) on Sym_0 -> 2..7; so(7) adjoint -> 2, 4, 6",
+          generator_degrees(hilbert_series(*sym0(7), 10)) == list(range(2, 8))
+          and generator_degrees(hilbert_series(so(7), (0, 1, 0), 8)) == [2, 4, 6])
+    check("su(3) adjoint -> 2, 3; g2 on 7 -> 2; so(10) vector -> 2",
+          generator_degrees(hilbert_series(su(3), (1, 1), 9)) == [2, 3]
+          and generator_degrees(hilbert_series(g2(), (0, 1), 6)) == [2]
+          and generator_degrees(hilbert_series(so(10), (1, 0, 0, 0, 0), 6)) == [2])
+    A = so(11)
+    sp = symmetric_powers(A, (1, 0, 0, 0, 0), 3)
+    check("Sym^d of the so(11) vector: 1+54 at d=2 (= lib_reps sym2), dims C(10+d, d)",
+          sp[2] == A.sym2((1, 0, 0, 0, 0))
+          and all(sum(m * A.dim(l) for l, m in p.items()) == [1, 11, 66, 286][d]
+                  for d, p in enumerate(sp)))
+
+    print("=" * 70)
+    print("PART 2: MONTE CARLO RANKS")
+    print("=" * 70)
+    ok = True
+    for n in (3, 5, 11, 20):
+        p = power_sums(random_sym0(n, 2000, rng), 8)
+        A, hw = sym0(n)
+        h = hilbert_series(A, hw, 8)
+        for d in range(2, 9):
+            ranks = linear_rank(evaluate(p, monomials(range(2, 9), d)))
+            ok &= ranks == h[d]
+    check("rank of trace monomials (2000 samples) = exact h_d, n = 3, 5, 11, 20, d <= 8", ok)
+    p = power_sums(random_sym0(2, 500, rng), 4)
+    c = relation(evaluate(p, [(2, 0, 0), (0, 0, 1)]))
+    check("n = 2: Tr(phi^4) = Tr(phi^2)^2 / 2 found as a relation",
+          c is not None and np.allclose(c, [-0.5, 1.0]))
+    lam = rng.permutation(np.arange(-5, 6))       # distinct, traceless
+    check("Jacobian (exact, integer eigenvalues): Tr(phi^2..11) independent for n = 11, "
+          "adding Tr(phi^12) keeps rank 10",
+          jacobian_rank(lam, range(2, 12)) == 10
+          and jacobian_rank(lam, range(2, 13)) == 10)
+    eigs = np.linalg.eigvalsh(random_sym0(8, 100, rng))
+    check("Jacobian (float, 100 samples): Tr(phi^2..8) independent for n = 8",
+          jacobian_rank(eigs, range(2, 9)) == 7)
+
+    passed = sum(tests)
+    print(f"\nFINAL: {passed}/{len(tests)} PASS")
+    return 0 if passed == len(tests) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(_verify())
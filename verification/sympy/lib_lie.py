@@ -0,0 +1,866 @@
+#!/usr/bin/env python3
+"""
+Shared Lie Algebra Library
+==========================
+
+Bases and structure constants for so(n), su(n), sp(n) and g2, built once
+and shared by the scripts instead of each one forming every pairwise
+commutator densely. so(22) (231 generators, 9240 nonzero f_ab^c) takes a
+few milliseconds to build and one .npz read afterwards.
+
+Conventions (one for all algebras):
+  [T_a, T_b] = sum_c f[a, b, c] T_c, with real f for the real forms below.
+  Every basis is orthogonal in the Frobenius product <A, B> = tr(A^dagger B),
+  so coefficients are projections: x_c = <T_c, M> / <T_c, T_c>.
+
+  so(n)   n x n real, T_(a,b) = E_ab - E_ba for a < b, in the lexicographic
+          order of the so_gen(a, b) loops in alpha_ccwz_*.py / e_basis() in
+          conj_b3_ergodicity_proof.py (dim n(n-1)/2)
+  su(n)   n x n complex, T_a = -(i/2) lambda_a with generalised Gell-Mann
+          lambda_a (symmetric, antisymmetric, then diagonal), so f is the
+          usual f_abc: su(3) has f_123 = 1, f_458 = sqrt(3)/2 (dim n^2 - 1)
+  sp(n)   compact sp(n) = u(2n) & sp(2n, C), 2n x 2n complex, rank n
+          (dim n(2n + 1))
+  g2      derivations of the octonions inside so(7) (dim 14), on e_1..e_7
+          with the FANO triples of g2_final.py; for each unit e_i the three
+          generators L_jk with e_j e_k = e_i span a 3-space, and g2 holds
+          the two combinations orthogonal to their sum
+
+Storage: each basis is a COO list (generator, row, col, value) and the
+structure constants a COO tensor (a, b, c, value) holding both orders of
+every bracket. Brackets are computed with two sparse products, never
+pairwise:
+  P[(a,i),(b,l)] = (T_a T_b)[i,l]        one (dim*n x n)(n x dim*n) product
+  f[(a,b), c]    = <T_c, [T_a, T_b]> / <T_c, T_c>   one (dim^2 x n^2)(n^2 x dim)
+Results are memoized per process and on disk in .suite/lie/ (ignored by git),
+validated against a sha256 of the basis arrays.
+
+Usage:
+  from lib_lie import so, su, sp, g2
+  L = so(11)
+  L.dim, L.labels[0]                 # 55, (0, 1)
+  L.generator((0, 4))                # dense 11x11, as so_gen(0, 4)
+  a, b, c, v = L.structure_constants()
+  L.bracket(x, y)                    # coefficient vectors in, out
+  L.coefficients(M), L.matrix(x)     # matrix <-> coefficients
+  L.ideal([L.generator((0, 1))])     # orthonormal basis of the ideal (55 x 55)
+  L.subalgebra(seeds), L.normal_closure(H)
+
+Closures (ideal, generated subalgebra, normal closure) are all "smallest
+subspace containing the seeds and invariant under a set of ad operators":
+  ideal(S)          ad(g) for g in a generating set of L (so(n): the n-1
+                    L_(i,i+1); invariance under generators implies
+                    invariance under everything they generate)
+  subalgebra(S)     ad(s) for s in S (right-normed brackets [s1,[s2,..]]
+                    span the generated subalgebra)
+  normal_closure(H) ideal generated by a basis of H
+invariant_span() keeps an orthonormal basis, brackets only the newest
+block of basis vectors, projects the candidates off the current span, and
+adds the rank-revealing (SVD) part above tolerance. It stops when a block
+adds nothing or the whole algebra is reached, so the work is linear in the
+final dimension and no duplicate vectors are ever stored.
+
+Subspace factorises a span once and then answers membership, projection
+and coordinate queries, singly or for a stack of matrices:
+  S = Subspace(gens_so4)             # dict (sorted keys), list or array
+  S.contains(C), S.project(C), S.coordinates(C), S.residual(C)
+Frobenius-orthogonal generators (the so(n)/su(n) bases and their
+sub-blocks) are kept as a sparse matrix, so a query costs O(nnz) = O(dim);
+anything else goes through one pivoted QR and costs O(n^2 * rank).
+
+Adjoint representation, Killing form, Casimir and roots:
+  L.ad_all()          ad(T_a) for every a as one (dim, dim, dim) array,
+                      ad[a][c, b] = f[a, b, c]
+  L.killing()         K_ab = tr(ad T_a ad T_b), one sparse product of f
+  L.casimir(rep)      sum_ab K^ab rho(T_a) rho(T_b) for a stack of
+                      representation matrices (default: the defining one);
+                      with the Killing metric C_2(adjoint) = 1
+  L.roots(cartan)     roots relative to a Cartan subalgebra (default: the
+                      standard torus, or the centraliser of a generic element)
+For a basis that is not one of the above (a coset, a hand-built gl(n)
+basis, ...) structure_constants_of(G) does the same from an explicit
+(dim, n, n) stack with two einsums and one Subspace solve, and
+adjoint_matrices(), killing_form() and casimir_operator() work on its
+output.
+
+Running this file verifies the library.
+"""
+
+import hashlib
+import os
+import sys
+import tempfile
+import zipfile
+from functools import lru_cache
+from pathlib import Path
+from typing import List, Optional, Sequence, Tuple
+
+import numpy as np
+import scipy.linalg
+import scipy.sparse as sparse
+
+CACHE_DIR = Path(__file__).resolve().parent / ".suite" / "lie"
+CACHE_VERSION = 2
+TOL = 1e-12
+
+# Positive-oriented Fano triples (a, b, c): e_a * e_b = +e_c (g2_final.py)
+FANO = [(1, 2, 3), (1, 4, 5), (1, 7, 6), (2, 4, 6), (2, 5, 7), (3, 4, 7), (3, 6, 5)]
+
+COO = Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]
+
+
+class LieAlgebra:
+    """A matrix Lie algebra with a Frobenius-orthogonal basis."""
+
+    def __init__(self, name: str, n: int, basis: COO, labels: Sequence,
+                 f: Optional[COO] = None, generating: Optional[Sequence[int]] = None,
+                 cartan: Optional[Sequence[int]] = None):
+        k, i, j, v = basis
+        self.name = name
+        self.n = n
+        self.labels = list(labels)
+        self.dim = len(self.labels)
+        self.basis = (np.asarray(k, dtype=np.int64), np.asarray(i, dtype=np.int64),
+                      np.asarray(j, dtype=np.int64), np.asarray(v))
+        self.index = {lab: a for a, lab in enumerate(self.labels)}
+        self.norms = np.bincount(self.basis[0], weights=np.abs(self.basis[3]) ** 2,
+                                 minlength=self.dim)
+        self._f = f
+        self._f_csr = None
+        self._dense = None
+        self.generating = list(generating) if generating is not None else list(range(self.dim))
+        self.cartan = list(cartan) if cartan is not None else None
+
+    def __repr__(self) -> str:
+        return f"LieAlgebra({self.name}, dim={self.dim}, n={self.n})"
+
+    @property
+    def dtype(self):
+        return self.basis[3].dtype
+
+    # --- basis -----------------------------------------------------------------
+
+    def generators(self) -> np.ndarray:
+        """All generators as a dense (dim, n, n) array (built once)."""
+        if self._dense is None:
+            k, i, j, v = self.basis
+            g = np.zeros((self.dim, self.n, self.n), dtype=self.dtype)
+            g[k, i, j] = v
+            self._dense = g
+        return self._dense
+
+    def generator(self, label) -> np.ndarray:
+        """One generator, by label (e.g. (a, b) for so(n)) or by index."""
+        a = self.index[label] if label in self.index else int(label)
+        return self.generators()[a].copy()
+
+    def basis_matrix(self) -> sparse.csr_matrix:
+        """Sparse (dim, n*n) matrix whose rows are the flattened generators."""
+        k, i, j, v = self.basis
+        return sparse.csr_matrix((v, (k, i * self.n + j)), shape=(self.dim, self.n ** 2))
+
+    def matrix(self, x: np.ndarray) -> np.ndarray:
+        """sum_a x_a T_a."""
+        return np.asarray(self.basis_matrix().T @ np.asarray(x)).reshape(self.n, self.n)
+
+    def coefficients(self, M: np.ndarray) -> np.ndarray:
+        """Coefficients of the projection of M onto the algebra."""
+        c = self.basis_matrix().conj() @ np.asarray(M).reshape(-1) / self.norms
+        if np.iscomplexobj(c) and np.abs(c.imag).max(initial=0.0) < TOL:
+            c = c.real
+        return c
+
+    # --- structure constants ---------------------------------------------------
+
+    def structure_constants(self) -> COO:
+        """(a, b, c, f_ab^c) with every nonzero entry, both orders of (a, b)."""
+        if self._f is None:
+            self._f = _bracket_tensor(self)
+        return self._f
+
+    def f_matrix(self) -> sparse.csr_matrix:
+        """Structure constants as a sparse (dim*dim, dim) matrix, row a*dim + b."""
+        if self._f_csr is None:
+            a, b, c, v = self.structure_constants()
+            self._f_csr = sparse.csr_matrix((v, (a * self.dim + b, c)),
+                                            shape=(self.dim ** 2, self.dim))
+        return self._f_csr
+
+    def f_dense(self) -> np.ndarray:
+        """Dense (dim, dim, dim) structure constants (small algebras only)."""
+        a, b, c, v = self.structure_constants()
+        f = np.zeros((self.dim,) * 3)
+        f[a, b, c] = v
+        return f
+
+    def bracket(self, x: np.ndarray, y: np.ndarray) -> np.ndarray:
+        """Coefficients of [sum x_a T_a, sum y_b T_b]."""
+        xy = np.outer(np.asarray(x), np.asarray(y)).reshape(-1)
+        return self.f_matrix().T @ xy
+
+    # --- closures ----------------------------------------------------------------
+
+    def ad(self, x) -> sparse.csr_matrix:
+        """ad(x) on coefficient vectors: (ad x) y = bracket(x, y).
+
+        `x` is a coefficient vector, a matrix, or a basis index.
+        """
+        a, b, c, v = self.structure_constants()
+        if isinstance(x, (int, np.integer)):
+            keep = a == x
+            return sparse.csr_matrix((v[keep], (c[keep], b[keep])),
+                                     shape=(self.dim, self.dim))
+        x = self._as_coefficients(x)
+        return sparse.csr_matrix((v * x[a], (c, b)), shape=(self.dim, self.dim))
+
+    def _element(self, h) -> np.ndarray:
+        """Coefficient vector of a label, basis index, vector or matrix."""
+        if isinstance(h, tuple) and h in self.index:
+            return np.eye(self.dim)[self.index[h]]
+        if isinstance(h, (int, np.integer)):
+            return np.eye(self.dim)[h]
+        return self._as_coefficients(h)
+
+    def _as_coefficients(self, x) -> np.ndarray:
+        x = np.asarray(x)
+        return self.coefficients(x) if x.ndim == 2 else x
+
+    def ideal(self, seeds, tol: float = 1e-9) -> np.ndarray:
+        """Orthonormal basis (rows) of the ideal generated by `seeds`."""
+        return invariant_span([self._as_coefficients(s) for s in seeds],
+                              [self.ad(g) for g in self.generating], tol)
+
+    def subalgebra(self, seeds, tol: float = 1e-9) -> np.ndarray:
+        """Orthonormal basis (rows) of the subalgebra generated by `seeds`."""
+        seeds = [self._as_coefficients(s) for s in seeds]
+        return invariant_span(seeds, [self.ad(s) for s in seeds], tol)
+
+    def normal_closure(self, H, tol: float = 1e-9) -> np.ndarray:
+        """Orthonormal basis (rows) of the normal closure of the subalgebra H."""
+        return self.ideal(H, tol)
+
+    # --- adjoint representation --------------------------------------------------
+
+    def ad_all(self) -> np.ndarray:
+        """Dense (dim, dim, dim) array of adjoint matrices ad(T_a)."""
+        a, b, c, v = self.structure_constants()
+        ad = np.zeros((self.dim,) * 3)
+        ad[a, c, b] = v
+        return ad
+
+    def killing(self) -> np.ndarray:
+        """Killing form K_ab = sum_cd f_ac^d f_bd^c, without a dense f."""
+        a, b, c, v = self.structure_constants()
+        d = self.dim
+        left = sparse.csr_matrix((v, (a, b * d + c)), shape=(d, d * d))
+        right = sparse.csr_matrix((v, (a, c * d + b)), shape=(d, d * d))
+        return (left @ right.T).toarray()
+
+    def casimir(self, rep: Optional[np.ndarray] = None,
+                metric: Optional[np.ndarray] = None) -> np.ndarray:
+        """Quadratic Casimir sum_ab g^ab rho_a rho_b (g: Killing form by default)."""
+        rep = self.generators() if rep is None else np.asarray(rep)
+        return casimir_operator(rep, self.killing() if metric is None else metric)
+
+    def centralizer(self, x, tol: float = 1e-9) -> np.ndarray:
+        """Orthonormal basis (rows) of {y : [x, y] = 0}."""
+        _, s, vt = np.linalg.svd(self.ad(x).toarray())
+        return vt[s <= tol * max(1.0, s.max(initial=0.0))]
+
+    def cartan_basis(self, cartan=None) -> np.ndarray:
+        """Coefficient vectors (rows) of `cartan`, self.cartan or a generic torus."""
+        if cartan is None:
+            cartan = self.cartan
+        if cartan is None:
+            rng = np.random.default_rng(12345)
+            return self.centralizer(rng.standard_normal(self.dim))
+        return np.array([self._element(h) for h in cartan])
+
+    def roots(self, cartan=None, tol: float = 1e-7):
+        """Root decomposition relative to a Cartan subalgebra.
+
+        `cartan` is a list of commuting elements (labels, indices, coefficient
+        vectors or matrices); default self.cartan, else the centraliser of a
+        generic element. Eigenvalues of ad(h) are i*alpha(h) on these compact
+        real forms; alpha(h) is returned.
+
+        Returns (roots, vectors, zero_dim): one row of alpha(h_1..h_r) per
+        root (sorted), the matching complex root vectors as columns, and the
+        dimension of the zero-weight space (= the rank).
+        """
+        ads = [self.ad(h).toarray() for h in self.cartan_basis(cartan)]
+        weights = np.random.default_rng(54321).standard_normal(len(ads))
+        _, vecs = np.linalg.eig(sum(w * A for w, A in zip(weights, ads)))
+        alpha = np.array([[np.vdot(u, A @ u) / np.vdot(u, u) for A in ads]
+                          for u in vecs.T]).imag
+        alpha[np.abs(alpha) < tol] = 0.0
+        zero = np.all(alpha == 0.0, axis=1)
+        order = np.lexsort(alpha[~zero].T[::-1])
+        return alpha[~zero][order], vecs[:, ~zero][:, order], int(zero.sum())
+
+
+def _orthonormal_new(C: np.ndarray, Q: np.ndarray, tol: float) -> np.ndarray:
+    """Orthonormal rows spanning the part of rows(C) outside rows(Q)."""
+    if not len(C):
+        return C
+    scale = max(1.0, np.abs(C).max())
+    for _ in range(2):                       # re-orthogonalise once
+        if len(Q):
+            C = C - (C @ Q.T) @ Q
+    if np.abs(C).max(initial=0.0) <= tol * scale:
+        return C[:0]
+    _, s, vt = np.linalg.svd(C, full_matrices=False)
+    return vt[s > tol * scale]
+
+
+def invariant_span(seeds: Sequence[np.ndarray], operators: Sequence,
+                   tol: float = 1e-9, max_dim: Optional[int] = None) -> np.ndarray:
+    """Smallest subspace containing `seeds` and invariant under `operators`.
+
+    Returns an orthonormal basis as rows. Only the block of vectors added in
+    the previous round is pushed through the operators.
+    """
+    if not len(seeds):
+        return np.zeros((0, operators[0].shape[0] if operators else 0))
+    dim = len(seeds[0])
+    max_dim = max_dim or dim
+    Q = _orthonormal_new(np.array(seeds, dtype=float), np.zeros((0, dim)), tol)
+    frontier = Q
+    while len(frontier) and len(Q) < max_dim:
+        images = np.vstack([(op @ frontier.T).T for op in operators])
+        new = _orthonormal_new(images, Q, tol)
+        Q = np.vstack([Q, new])
+        frontier = new
+    return Q
+
+
+class Subspace:
+    """The span of a set of matrices (or vectors), factorised once.
+
+    Queries accept one matrix or a stack (..., n, n) / (..., N) and return
+    one answer per matrix. Coordinates are with respect to the vectors as
+    given (for dependent inputs: the pivoted independent subset, zeros for
+    the rest).
+    """
+
+    def __init__(self, vectors, tol: float = 1e-10):
+        if isinstance(vectors, dict):
+            vectors = [vectors[k] for k in sorted(vectors)]
+        vectors = [np.asarray(v) for v in vectors]
+        self.shape = vectors[0].shape if vectors else (0,)
+        self.tol = tol
+        A = np.array([v.reshape(-1) for v in vectors]) if vectors else np.zeros((0, 0))
+        self.size = len(A)
+        self.N = A.shape[1] if A.ndim == 2 else 0
+        self._sparse = None
+        gram = A.conj() @ A.T if self.size else np.zeros((0, 0))
+        diag = np.diag(gram).real
+        off = gram - np.diag(np.diag(gram))
+        if self.size and np.abs(off).max(initial=0.0) <= tol * max(1.0, diag.max()) \
+                and diag.min() > tol:
+            # Orthogonal inputs: project with the sparse basis directly.
+            self._sparse = sparse.csr_matrix(A)
+            self._norms = diag
+            self.dim = self.size
+            return
+        if not self.size:
+            self.dim = 0
+            self._Q = np.zeros((self.N, 0))
+            self._W = np.zeros((0, self.N))
+            return
+        Q, R, piv = scipy.linalg.qr(A.T, mode="economic", pivoting=True)
+        d = np.abs(np.diag(R))
+        r = int(np.sum(d > tol * max(1.0, d.max(initial=0.0))))
+        self.dim = r
+        self._Q = Q[:, :r]
+        W = np.zeros((self.size, self.N), dtype=np.result_type(Q, A))
+        W[piv[:r]] = scipy.linalg.solve_triangular(R[:r, :r], self._Q.conj().T)
+        self._W = W
+
+    def _flatten(self, M) -> Tuple[np.ndarray, tuple]:
+        M = np.asarray(M)
+        lead = M.shape[:M.ndim - len(self.shape)]
+        return M.reshape(-1, self.N), lead
+
+    def coordinates(self, M) -> np.ndarray:
+        """c with sum_i c_i v_i = the projection of M (shape (..., size))."""
+        X, lead = self._flatten(M)
+        if self._sparse is not None:
+            c = (self._sparse.conj() @ X.T).T / self._norms
+        else:
+            c = X @ self._W.T
+        return c.reshape(lead + (self.size,))
+
+    def project(self, M) -> np.ndarray:
+        """Orthogonal projection of M onto the span, same shape as M."""
+        X, lead = self._flatten(M)
+        if self._sparse is not None:
+            P = (self._sparse.T @ ((self._sparse.conj() @ X.T).T / self._norms).T).T
+        else:
+            P = (X @ self._Q.conj()) @ self._Q.T
+        return np.asarray(P).reshape(np.shape(M))
+
+    def residual(self, M) -> np.ndarray:
+        """max |M - project(M)| per matrix."""
+        X, lead = self._flatten(M)
+        R = X - self.project(X.reshape((-1,) + self.shape)).reshape(X.shape)
+        return np.abs(R).max(axis=1, initial=0.0).reshape(lead)
+
+    def contains(self, M, tol: Optional[float] = None):
+        """Is M in the span (to tol)? A bool array for a stack of matrices."""
+        res = self.residual(M) < (self.tol if tol is None else tol)
+        return bool(res) if np.ndim(res) == 0 else res
+
+
+def _bracket_tensor(L: LieAlgebra) -> COO:
+    """Structure constants of L from two sparse products (see module doc)."""
+    k, i, j, v = L.basis
+    n, dim = L.n, L.dim
+    left = sparse.csr_matrix((v, (k * n + i, j)), shape=(dim * n, n))
+    right = sparse.csr_matrix((v, (i, k * n + j)), shape=(n, dim * n))
+    P = (left @ right).tocoo()
+    a, ii = np.divmod(P.row, n)
+    b, ll = np.divmod(P.col, n)
+    cols = np.concatenate([ii * n + ll, ii * n + ll])
+    rows = np.concatenate([a * dim + b, b * dim + a])
+    vals = np.concatenate([P.data, -P.data])
+    comm = sparse.csr_matrix((vals, (rows, cols)), shape=(dim * dim, n * n))
+    comm.sum_duplicates()
+    proj = sparse.csr_matrix((np.conj(v) / L.norms[k], (i * n + j, k)),
+                             shape=(n * n, dim))
+    F = (comm @ proj).tocoo()
+
+    # The basis must close: |[T_a,T_b]|^2 == sum_c |f_ab^c|^2 <T_c,T_c>.
+    lhs = np.asarray(abs(comm).power(2).sum(axis=1)).ravel()
+    rhs = np.bincount(F.row, weights=np.abs(F.data) ** 2 * L.norms[F.col],
+                      minlength=dim * dim)
+    if np.abs(lhs - rhs).max(initial=0.0) > 1e-9 * max(1.0, lhs.max(initial=0.0)):
+        raise ValueError(f"{L.name}: basis is not closed under the bracket")
+    data = F.data
+    if np.iscomplexobj(data):
+        if np.abs(data.imag).max(initial=0.0) > 1e-9:
+            raise ValueError(f"{L.name}: structure constants are not real")
+        data = data.real
+    keep = np.abs(data) > TOL
+    fa, fb = np.divmod(F.row[keep], dim)
+    order = np.lexsort((F.col[keep], fb, fa))
+    return fa[order], fb[order], F.col[keep][order], data[keep][order]
+
+
+# ==============================================================================
+# BASES
+# ==============================================================================
+
+def _coo(entries: List[Tuple[int, int, int, complex]], dtype) -> COO:
+    k, i, j, v = zip(*entries)
+    return np.array(k), np.array(i), np.array(j), np.array(v, dtype=dtype)
+
+
+def so_basis(n: int):
+    labels = [(a, b) for a in range(n) for b in range(a + 1, n)]
+    entries = []
+    for k, (a, b) in enumerate(labels):
+        entries += [(k, a, b, 1.0), (k, b, a, -1.0)]
+    return _coo(entries, float), labels
+
+
+def su_basis(n: int):
+    """-(i/2) lambda_a for the generalised Gell-Mann matrices lambda_a."""
+    labels, entries = [], []
+    h = -0.5j
+    for a in range(n):
+        for b in range(a + 1, n):
+            k = len(labels)
+            labels.append(("s", a, b))        # lambda = E_ab + E_ba
+            entries += [(k, a, b, h), (k, b, a, h)]
+            k += 1
+            labels.append(("a", a, b))        # lambda = -i E_ab + i E_ba
+            entries += [(k, a, b, h * -1j), (k, b, a, h * 1j)]
+    for d in range(1, n):
+        k = len(labels)
+        labels.append(("d", d))               # lambda = diag(1,..,1,-d,0..) * norm
+        c = np.sqrt(2.0 / (d * (d + 1)))
+        entries += [(k, m, m, h * c) for m in range(d)] + [(k, d, d, h * -d * c)]
+    return _coo(entries, complex), labels
+
+
+def sp_basis(n: int):
+    """Compact sp(n): X = [[A, B], [-conj(B), conj(A)]], A anti-Hermitian, B symmetric."""
+    labels, entries = [], []
+
+    def add(label, items):
+        k = len(labels)
+        labels.append(label)
+        entries.extend((k, r, c, val) for r, c, val in items)
+
+    for a in range(n):
+        for b in range(a, n):
+            if a < b:
+                add(("A", a, b), [(a, b, 1), (b, a, -1), (n + a, n + b, 1), (n + b, n + a, -1)])
+                add(("iA", a, b), [(a, b, 1j), (b, a, 1j), (n + a, n + b, -1j), (n + b, n + a, -1j)])
+            else:
+                add(("iA", a, a), [(a, a, 1j), (n + a, n + a, -1j)])
+    for a in range(n):
+        for b in range(a, n):
+            pairs = [(a, b)] if a == b else [(a, b), (b, a)]
+            add(("B", a, b), [(r, n + c, 1) for r, c in pairs] + [(n + r, c, -1) for r, c in pairs])
+            add(("iB", a, b), [(r, n + c, 1j) for r, c in pairs] + [(n + r, c, 1j) for r, c in pairs])
+    return _coo(entries, complex), labels
+
+
+def g2_basis():
+    """14 derivations of the octonions as 7x7 matrices on e_1..e_7 (index 0..6)."""
+    pairs = {i: [] for i in range(1, 8)}         # e_j e_k = +e_i
+    for (a, b, c) in FANO:
+        pairs[c].append((a, b))
+        pairs[a].append((b, c))
+        pairs[b].append((c, a))
+    labels, entries = [], []
+
+    def add(label, combo):
+        k = len(labels)
+        labels.append(label)
+        for (j, m), w in combo:
+            entries.extend([(k, j - 1, m - 1, float(w)), (k, m - 1, j - 1, -float(w))])
+
+    for i in range(1, 8):
+        p, q, r = pairs[i]
+        add((i, 1), [(p, 1), (q, -1)])
+        add((i, 2), [(p, 1), (q, 1), (r, -2)])
+    return _coo(entries, float), labels
+
+
+# ==============================================================================
+# CACHED CONSTRUCTORS
+# ==============================================================================
+
+def _basis_digest(basis: COO) -> str:
+    """sha256 of the basis arrays: a cached f is reused only for the same basis."""
+    h = hashlib.sha256()
+    for x in basis:
+        x = np.ascontiguousarray(x)
+        h.update(x.dtype.str.encode() + str(x.shape).encode())
+        h.update(x.tobytes())
+    return h.hexdigest()
+
+
+def _cached(name: str, n: int, basis: COO, labels,
+            generating: Optional[Sequence] = None,
+            cartan: Optional[Sequence] = None) -> LieAlgebra:
+    path = CACHE_DIR / f"{name.replace('(', '_').replace(')', '')}.v{CACHE_VERSION}.npz"
+    digest = _basis_digest(basis)
+    f = None
+    if path.exists():
+        try:
+            with np.load(path) as z:
+                if str(z["basis_sha256"]) == digest:
+                    f = (z["a"], z["b"], z["c"], z["v"])
+        except (OSError, ValueError, KeyError, EOFError, zipfile.BadZipFile):
+            f = None
+    index = {lab: a for a, lab in enumerate(labels)}
+    gens = [index[g] for g in generating] if generating is not None else None
+    torus = [index[h] for h in cartan] if cartan is not None else None
+    L = LieAlgebra(name, n, basis, labels, f, gens, torus)
+    if f is None:
+        a, b, c, v = L.structure_constants()
+        tmp = None
+        try:
+            CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            # Per-process temp file: pool workers, forked children and shards
+            # may all build the same algebra at once
+            fd, tmp = tempfile.mkstemp(dir=CACHE_DIR, prefix=path.stem + ".", suffix=".tmp")
+            with os.fdopen(fd, "wb") as fh:
+                np.savez_compressed(fh, a=a.astype(np.int32), b=b.astype(np.int32),
+                                    c=c.astype(np.int32), v=v, basis_sha256=digest)
+            os.replace(tmp, path)
+        except OSError:
+            if tmp is not None and os.path.exists(tmp):
+                os.unlink(tmp)
+    return L
+
+
+@lru_cache(maxsize=None)
+def so(n: int) -> LieAlgebra:
+    basis, labels = so_basis(n)
+    return _cached(f"so({n})", n, basis, labels, [(i, i + 1) for i in range(n - 1)],
+                   [(2 * i, 2 * i + 1) for i in range(n // 2)])
+
+
+@lru_cache(maxsize=None)
+def su(n: int) -> LieAlgebra:
+    basis, labels = su_basis(n)
+    return _cached(f"su({n})", n, basis, labels,
+                   [(t, i, i + 1) for i in range(n - 1) for t in "sa"],
+                   [("d", d) for d in range(1, n)])
+
+
+@lru_cache(maxsize=None)
+def sp(n: int) -> LieAlgebra:
+    basis, labels = sp_basis(n)
+    return _cached(f"sp({n})", 2 * n, basis, labels, None, [("iA", a, a) for a in range(n)])
+
+
+@lru_cache(maxsize=None)
+def g2() -> LieAlgebra:
+    basis, labels = g2_basis()
+    return _cached("g2", 7, basis, labels)
+
+
+def structure_constants_of(generators: np.ndarray) -> np.ndarray:
+    """Dense f[a, b, c] for an explicit (dim, n, n) basis, orthogonal or not."""
+    G = np.asarray(generators)
+    comm = np.einsum("aij,bjk->abik", G, G) - np.einsum("bij,ajk->abik", G, G)
+    S = Subspace(G)
+    if not S.contains(comm.reshape((-1,) + G.shape[1:]), 1e-8).all():
+        raise ValueError("generators are not closed under the bracket")
+    f = S.coordinates(comm)
+    if np.iscomplexobj(f) and np.abs(f.imag).max(initial=0.0) < 1e-9:
+        f = f.real
+    return f
+
+
+def adjoint_matrices(f: np.ndarray) -> np.ndarray:
+    """ad[a][c, b] = f[a, b, c] for dense structure constants."""
+    return np.transpose(f, (0, 2, 1))
+
+
+def killing_form(f: np.ndarray) -> np.ndarray:
+    """K_ab = tr(ad T_a ad T_b) for dense structure constants."""
+    return np.einsum("acd,bdc->ab", f, f)
+
+
+def casimir_operator(rep: np.ndarray, metric: np.ndarray) -> np.ndarray:
+    """sum_ab g^ab rho_a rho_b for representation matrices rho (dim, m, m)."""
+    ginv = np.linalg.inv(metric)
+    return np.einsum("ab,aij,bjk->ik", ginv, rep, rep)
+
+
+def from_matrices(name: str, matrices: Sequence[np.ndarray],
+                  labels: Optional[Sequence] = None) -> LieAlgebra:
+    """LieAlgebra from explicit Frobenius-orthogonal generators (not cached on disk)."""
+    mats = [np.asarray(M) for M in matrices]
+    n = mats[0].shape[0]
+    flat = np.array([M.reshape(-1) for M in mats])
+    gram = flat.conj() @ flat.T
+    if np.abs(gram - np.diag(np.diag(gram))).max(initial=0.0) > 1e-9:
+        raise ValueError(f"{name}: generators are not Frobenius-orthogonal")
+    k, idx = np.nonzero(np.abs(flat) > TOL)
+    basis = (k, idx // n, idx % n, flat[k, idx])
+    return LieAlgebra(name, n, basis, labels if labels is not None else range(len(mats)))
+
+
+def commutator(A: np.ndarray, B: np.ndarray) -> np.ndarray:
+    return A @ B - B @ A
+
+
+# ==============================================================================
+# SELF-CHECK
+# ==============================================================================
+
+def _verify() -> int:
+    import time
+    from suite_results import record
+
+    tests = []
+
+    def check(name, condition, detail=""):
+        tests.append(bool(condition))
+        status = "PASS" if condition else "FAIL"
+        print(f"  [{status}] T{len(tests)}: {name}")
+        if detail and not condition:
+            print(f"         {detail}")
+        record(name, bool(condition), detail=detail)
+
+    rng = np.random.default_rng(0)
+
+    def jacobi_ok(L, trials=5):
+        for _ in range(trials):
+            x, y, z = rng.standard_normal((3, L.dim))
+            J = (L.bracket(x, L.bracket(y, z)) + L.bracket(y, L.bracket(z, x))
+                 + L.bracket(z, L.bracket(x, y)))
+            if np.abs(J).max() > 1e-9:
+                return False
+        return True
+
+    def matches_matrices(L, trials=5):
+        for _ in range(trials):
+            x, y = rng.standard_normal((2, L.dim))
+            if np.abs(L.matrix(L.bracket(x, y))
+                      - commutator(L.matrix(x), L.matrix(y))).max() > 1e-9:
+                return False
+        return True
+
+    print("=" * 70)
+    print("PART 1: DIMENSIONS")
+    print("=" * 70)
+    check("dim so(n) = n(n-1)/2 for n = 2..22",
+          all(so(n).dim == n * (n - 1) // 2 for n in range(2, 23)))
+    check("dim su(n) = n^2 - 1 for n = 2..8", all(su(n).dim == n * n - 1 for n in range(2, 9)))
+    check("dim sp(n) = n(2n+1) for n = 1..4", all(sp(n).dim == n * (2 * n + 1) for n in range(1, 5)))
+    check("dim g2 = 14", g2().dim == 14)
+
+    print("=" * 70)
+    print("PART 2: STRUCTURE CONSTANTS")
+    print("=" * 70)
+    L = so(11)
+    ok = True
+    for (a, b) in [(0, 1), (0, 4), (3, 9)]:
+        for (c, d) in [(1, 2), (4, 10), (0, 3)]:
+            A, B = L.generator((a, b)), L.generator((c, d))
+            if np.abs(L.matrix(L.bracket(np.eye(L.dim)[L.index[(a, b)]],
+                                         np.eye(L.dim)[L.index[(c, d)]]))
+                      - commutator(A, B)).max() > 1e-12:
+                ok = False
+    check("so(11) brackets of basis elements match dense commutators", ok)
+    fa, fb, fc, fv = L.structure_constants()
+    f = L.f_dense()
+    check("so(11) f_ab^c antisymmetric in (a, b)", np.abs(f + f.transpose(1, 0, 2)).max() == 0)
+    check("so(n) structure constants are 0, +-1 with 2(n-2) entries per generator",
+          set(np.unique(fv)) <= {-1.0, 1.0} and len(fv) == L.dim * 2 * (L.n - 2))
+    f3 = su(3).f_dense()
+    i = su(3).index
+    check("su(3): f_123 = 1", abs(f3[i[("s", 0, 1)], i[("a", 0, 1)], i[("d", 1)]] - 1) < 1e-12)
+    check("su(3): f_458 = sqrt(3)/2",
+          abs(f3[i[("s", 0, 2)], i[("a", 0, 2)], i[("d", 2)]] - np.sqrt(3) / 2) < 1e-12)
+    algebras = [so(5), so(11), su(3), su(5), sp(2), sp(3), g2()]
+    check("bracket(x, y) == [X, Y] for random elements",
+          all(matches_matrices(A) for A in algebras))
+    check("Jacobi identity on random triples", all(jacobi_ok(A) for A in algebras))
+
+    print("=" * 70)
+    print("PART 3: G2 = DER(O)")
+    print("=" * 70)
+    mult = np.zeros((7, 7, 7))
+    for (a, b, c) in FANO:
+        for (x, y, z) in [(a, b, c), (b, c, a), (c, a, b)]:
+            mult[x - 1, y - 1, z - 1] = 1
+            mult[y - 1, x - 1, z - 1] = -1
+    # D(e_a e_b) = D(e_a) e_b + e_a D(e_b), with D e_a = sum_i D[i, a] e_i
+    der = [np.abs(np.einsum("ia,ibl->abl", D, mult) + np.einsum("jb,ajl->abl", D, mult)
+                  - np.einsum("abk,lk->abl", mult, D)).max() for D in g2().generators()]
+    check("every g2 generator is a derivation of Im(O)", max(der) < 1e-12)
+    check("g2 sits inside so(7) (antisymmetric generators)",
+          all(np.abs(D + D.T).max() == 0 for D in g2().generators()))
+
+    print("=" * 70)
+    print("PART 4: LARGE ALGEBRAS")
+    print("=" * 70)
+    for n in (14, 22):
+        basis, labels = so_basis(n)
+        t0 = time.perf_counter()
+        L = LieAlgebra(f"so({n})", n, basis, labels)   # uncached build
+        a, b, c, v = L.structure_constants()
+        dt = time.perf_counter() - t0
+        print(f"  so({n}): dim {L.dim}, {len(v)} nonzero f, built in {dt * 1000:.1f} ms")
+        check(f"so({n}) closes and satisfies Jacobi", matches_matrices(L) and jacobi_ok(L))
+
+    print("=" * 70)
+    print("PART 5: CLOSURES")
+    print("=" * 70)
+    L = so(11)
+    so4 = [L.generator((a, b)) for a in range(4) for b in range(a + 1, 4)]
+    check("subalgebra generated by L_01, L_12 is so(3) (dim 3)",
+          len(L.subalgebra([L.generator((0, 1)), L.generator((1, 2))])) == 3)
+    check("so(4) block is a subalgebra (dim 6)", len(L.subalgebra(so4)) == 6)
+    check("normal closure of so(4) in so(11) = so(11)", len(L.normal_closure(so4)) == 55)
+    L4 = so(4)
+    self_dual = L4.generator((0, 1)) + L4.generator((2, 3))
+    check("so(4) = su(2) + su(2): ideal of L_01 + L_23 has dim 3",
+          len(L4.ideal([self_dual])) == 3)
+    check("adjacent generators generate su(6); sp(3) and g2 are simple",
+          len(su(6).subalgebra([su(6).generator(g) for g in su(6).generating])) == 35
+          and len(sp(3).ideal([sp(3).generator(0)])) == 21
+          and len(g2().ideal([g2().generator(0)])) == 14)
+    for n in (22, 30):
+        L = so(n)
+        t0 = time.perf_counter()
+        Q = L.ideal([L.generator((0, 1))])
+        dt = time.perf_counter() - t0
+        print(f"  ideal of L_01 in so({n}): dim {len(Q)} in {dt:.2f} s")
+        check(f"a single generator generates so({n}) (dim {L.dim})",
+              len(Q) == L.dim and np.abs(Q @ Q.T - np.eye(len(Q))).max() < 1e-9)
+
+    print("=" * 70)
+    print("PART 6: SUBSPACE QUERIES")
+    print("=" * 70)
+    L = so(11)
+    g = L.generators()
+    block = {L.labels[a]: g[a] for a in range(L.dim) if L.labels[a][1] < 4}
+    S = Subspace(block)
+    x = rng.standard_normal(len(block))
+    M = np.tensordot(x, np.array([block[k] for k in sorted(block)]), 1)
+    check("orthogonal generators use the sparse O(dim) path", S._sparse is not None)
+    check("coordinates recover the combination", np.abs(S.coordinates(M) - x).max() < 1e-12)
+    comms = (np.einsum("aij,bjk->abik", g, g) - np.einsum("bij,ajk->abik", g, g))
+    check("batched membership: [so(11), so(11)] c so(11) (3025 queries)",
+          Subspace(g).contains(comms).all())
+    mixed = Subspace([g[0] + g[1], g[0] - g[1], g[0], g[5]])
+    check("dependent, non-orthogonal inputs: QR path, rank 3",
+          mixed._sparse is None and mixed.dim == 3)
+    check("QR path membership and projection",
+          list(mixed.contains(np.stack([g[1], g[5], g[7]]))) == [True, True, False]
+          and np.abs(mixed.project(g[7])).max() < 1e-12)
+    Q = so(7).subalgebra([so(7).generator((0, 1)), so(7).generator((1, 2))])
+    R = Subspace(Q)
+    check("closure output plugs in: so(3) span in so(7) coordinates",
+          R.contains(so(7).bracket(Q[0], Q[1])) and not R.contains(np.eye(21)[20]))
+
+    print("=" * 70)
+    print("PART 7: ADJOINT, KILLING FORM, CASIMIR, ROOTS")
+    print("=" * 70)
+    L = so(11)
+    ad = L.ad_all()
+    x = rng.standard_normal(L.dim)
+    check("ad(T_a) x = [T_a, x] for every basis element",
+          np.abs(np.einsum("acb,b->ac", ad, x)
+                 - np.array([L.bracket(e, x) for e in np.eye(L.dim)])).max() < 1e-12)
+    K = L.killing()
+    check("so(11) Killing form = -2(n-2) * 1 = -18 * 1 (sparse route)",
+          np.abs(K + 18 * np.eye(55)).max() < 1e-12
+          and np.abs(K - killing_form(L.f_dense())).max() < 1e-12)
+    check("C_2(adjoint) = 1 with the Killing metric", np.abs(L.casimir(ad) - np.eye(55)).max() < 1e-12)
+    check("C_2(vector of so(11)) = (n-1)/(2(n-2)) = 5/9",
+          np.abs(L.casimir() - 5 / 9 * np.eye(11)).max() < 1e-12)
+    check("su(3): C_2(fund) / C_2(adj) = (4/3) / 3",
+          np.abs(su(3).casimir() - 4 / 9 * np.eye(3)).max() < 1e-12)
+    # Cartan L_01, L_23, ..., L_89: e_k is the weight of the k-th plane
+    expected = [tuple(s * (i == k) + t * (j == k) for k in range(5))
+                for i in range(5) for j in range(i + 1, 5)
+                for s in (1, -1) for t in (1, -1)]
+    expected += [tuple(s * (i == k) for k in range(5)) for i in range(5) for s in (1, -1)]
+    roots, _, rank = L.roots()
+    check("so(11) = B_5: roots +-e_i +-e_j, +-e_i (50 roots, rank 5)",
+          rank == 5 and sorted(map(tuple, np.round(roots).astype(int))) == sorted(expected) and np.abs(roots - np.round(roots)).max() < 1e-9)
+    roots_g2, _, rank_g2 = g2().roots()
+    Hg = g2().cartan_basis()
+    metric = np.linalg.inv(-Hg @ g2().killing() @ Hg.T)     # inverse Killing on h*
+    lengths = np.unique(np.round(np.einsum("ri,ij,rj->r", roots_g2, metric, roots_g2), 6))
+    check("g2 (generic Cartan): 12 roots, rank 2, two lengths with ratio 3",
+          len(roots_g2) == 12 and rank_g2 == 2 and len(lengths) == 2
+          and abs(lengths[1] / lengths[0] - 3) < 1e-4)
+    coset = [L.index[(a, b)] for a in range(4) for b in range(4, 11)]
+    G = L.generators()
+    H = [L.index[(a, b)] for a in range(11) for b in range(a + 1, 11) if (a < 4) == (b < 4)]
+    f_h = structure_constants_of(G[H])
+    check("structure_constants_of(so(4)+so(7) block) matches the sub-tensor of f",
+          np.abs(f_h - L.f_dense()[np.ix_(H, H, H)]).max() < 1e-12)
+    ad_coset = L.ad_all()[np.ix_(H, coset, coset)]
+    check("so(4)+so(7) acts on the 28-dim coset (isotropy representation)",
+          np.abs(np.einsum("aij,bjk->abik", ad_coset, ad_coset)
+                 - np.einsum("bij,ajk->abik", ad_coset, ad_coset)
+                 - np.einsum("abc,cik->abik", f_h, ad_coset)).max() < 1e-12)
+    t0 = time.perf_counter()
+    L = so(22)
+    K, (roots, _, rank) = L.killing(), L.roots()
+    dt = time.perf_counter() - t0
+    print(f"  so(22): Killing form + {len(roots)} roots in {dt:.2f} s")
+    check("so(22) = D_11: Killing = -40 * 1, 220 roots, rank 11",
+          np.abs(K + 40 * np.eye(231)).max() < 1e-12 and len(roots) == 220 and rank == 11)
+
+    passed = sum(tests)
+    print(f"\nFINAL: {passed}/{len(tests)} PASS")
+    return 0 if passed == len(tests) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(_verify())
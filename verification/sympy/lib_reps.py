@@ -0,0 +1,607 @@
+#!/usr/bin/env python3
+"""
+Representation Theory Engine
+============================
+
+Weyl characters and branching rules: dimensions, weight systems, tensor
+products and branchings for so(n), su(n), sp(n), g2 and their products
+with U(1) factors, computed from the root system instead of hand-written
+dimension bookkeeping. Every result is a full weight system, so a
+branching such as so(14) 64 -> (16,2,1) + (16bar,1,2) under
+SO(10) x SU(2) x SU(2) is checked weight by weight.
+
+Every algebra is given by its simple roots (and U(1) directions) in an
+orthonormal basis of R^m:
+  su(n)   R^n, alpha_i = e_i - e_(i+1)
+  so(2n+1) R^n, alpha_i = e_i - e_(i+1), alpha_n = e_n
+  sp(n)   R^n, alpha_i = e_i - e_(i+1), alpha_n = 2 e_n
+  so(2n)  R^n, alpha_i = e_i - e_(i+1), alpha_n = e_(n-1) + e_n
+  g2      the plane x + y + z = 0 in R^3, alpha_1 = e_1 - e_2 (long),
+          alpha_2 = e_2 - (e_1 + e_2 + e_3)/3 (short); the seven weights of
+          the 7 are 0 and the projections of +-e_i, so restricting SO(7)
+          weights to G2 is the orthogonal projection onto the plane
+  product(A, B, ..., u1=[u]) puts the factors in orthogonal blocks; each u
+          is a U(1) direction in the combined space (charge = <u, v>)
+
+Weights are tuples: Dynkin labels <v, alpha_i^vee> (ints), followed by the
+U(1) charges (Fractions). An irrep is its highest weight; a reducible
+representation is a dict {highest weight: multiplicity}.
+
+Methods:
+  dim(hw)             Weyl dimension formula, prod (hw + rho, a)/(rho, a)
+  weights(hw)         full weight system {weight: multiplicity}: dominant
+                      weights by subtracting positive roots, Freudenthal's
+                      recursion on them, then Weyl orbits. Cached per irrep
+  tensor(hw1, hw2)    Racah-Speiser: reflect hw1 + w + rho (w a weight of
+                      the smaller factor) into the dominant chamber
+  alt2(hw), sym2(hw)  antisymmetric / symmetric square
+  decompose(char)     {weight: multiplicity} -> {highest weight: mult},
+                      peeling off the highest remaining weight
+  branch(hw, sub, M)  weights projected to the subalgebra and decomposed
+  dims(hw)            (dim of each simple factor, ..., U(1) charges)
+  content(rep)        sorted list of dims(hw), one entry per copy
+
+A subalgebra embedding is a linear map M from the algebra's R^m to the
+subalgebra's R^m' that carries the subalgebra's Cartan into the torus
+(default: identity). projection_matrix(big, sub, M) is the resulting
+integer matrix on Dynkin labels (rational rows for U(1) charges).
+
+Usage:
+  from lib_reps import so, su, product, embedding
+  so10 = so(10)
+  so10.dim((0, 0, 0, 0, 1))                              # 16
+  so10.tensor((0, 0, 0, 0, 1), (0, 0, 0, 0, 1))          # 10 + 120 + 126
+  G = product(so(10), su(2), su(2))                      # R^5 + R^2 + R^2
+  so4 = [[1/2, -1/2], [-1/2, 1/2], [1/2, 1/2], [-1/2, -1/2]]   # e1 -+ e2 -> su(2)s
+  M = embedding(7, (range(5), None), (range(5, 7), so4))
+  so(14).branch((0,) * 6 + (1,), G, M)      # {(16, 2, 1): 1, (16bar, 1, 2): 1}
+
+Running this file verifies the engine.
+"""
+
+import sys
+from collections import Counter
+from fractions import Fraction
+from functools import lru_cache
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import lib_exact
+
+Weight = Tuple
+Rep = Dict[Weight, int]
+
+
+def _vec(v) -> Tuple[Fraction, ...]:
+    return tuple(Fraction(x) for x in v)
+
+
+def _dot(u, v) -> Fraction:
+    return sum((a * b for a, b in zip(u, v)), Fraction(0))
+
+
+def _add(u, v) -> Weight:
+    return tuple(a + b for a, b in zip(u, v))
+
+
+class Algebra:
+    """A reductive Lie algebra given by simple roots and U(1) directions in R^m."""
+
+    def __init__(self, name: str, simple_roots: Sequence, u1: Sequence = (), m: Optional[int] = None):
+        self.name = name
+        self.simple_roots = [_vec(a) for a in simple_roots]
+        self.u1 = [_vec(u) for u in u1]
+        vectors = self.simple_roots + self.u1
+        self.m = len(vectors[0]) if vectors else m
+        self.rank = len(self.simple_roots)
+        r = self.rank
+        for u in self.u1:
+            if any(_dot(u, a) for a in self.simple_roots):
+                raise ValueError(f"{name}: U(1) direction {u} is not orthogonal to the roots")
+        alpha = self.simple_roots
+        self.d = [_dot(a, a) / 2 for a in alpha]
+        self.cartan = tuple(tuple(int(2 * _dot(ai, aj) / _dot(aj, aj)) for aj in alpha)
+                            for ai in alpha)
+        if r:
+            R, _ = lib_exact.rref([list(row) + [int(i == j) for j in range(r)]
+                                   for i, row in enumerate(self.cartan)])
+            self.cartan_inverse = [row[r:] for row in R]
+        else:
+            self.cartan_inverse = []
+        Ainv = self.cartan_inverse
+        self.fundamental = [tuple(sum(Ainv[i][k] * alpha[k][x] for k in range(r))
+                                  for x in range(self.m)) for i in range(r)]
+        self.gram = [[Ainv[i][j] * self.d[j] for j in range(r)] for i in range(r)]
+        self._height = [sum(row) for row in Ainv]
+        self.factors = self._components()
+        self.pos_coeffs, self.pos_labels = self._positive_roots()
+        self.rho = (1,) * r
+        self._weights: Dict[Weight, Rep] = {}
+
+    def __repr__(self):
+        return f"Algebra({self.name})"
+
+    # --------------------------------------------------------------------------
+    # root system
+    # --------------------------------------------------------------------------
+
+    def _components(self) -> List[List[int]]:
+        """Simple-root indices of each simple factor (Dynkin components)."""
+        left, out = set(range(self.rank)), []
+        while left:
+            comp, stack = set(), [min(left)]
+            while stack:
+                i = stack.pop()
+                if i in comp:
+                    continue
+                comp.add(i)
+                stack += [j for j in range(self.rank) if self.cartan[i][j] and j not in comp]
+            left -= comp
+            out.append(sorted(comp))
+        return out
+
+    def _positive_roots(self):
+        """Positive roots as simple-root coefficients and as Dynkin labels."""
+        r, A = self.rank, self.cartan
+        simple = [tuple(int(i == j) for j in range(r)) for i in range(r)]
+        roots, level, coeffs = set(simple), list(simple), list(simple)
+        while level:
+            nxt = []
+            for c in level:
+                labels = [sum(c[i] * A[i][j] for i in range(r)) for j in range(r)]
+                for i in range(r):
+                    p, b = 0, list(c)
+                    while True:
+                        b[i] -= 1
+                        if tuple(b) not in roots:
+                            break
+                        p += 1
+                    if p - labels[i] > 0:
+                        new = c[:i] + (c[i] + 1,) + c[i + 1:]
+                        if new not in roots:
+                            roots.add(new)
+                            nxt.append(new)
+            coeffs += nxt
+            level = nxt
+        labels = [tuple(sum(c[i] * A[i][j] for i in range(r)) for j in range(r)) for c in coeffs]
+        return coeffs, labels
+
+    def height(self, lam: Weight) -> Fraction:
+        """Sum of the simple-root coefficients of the label part of `lam`."""
+        return sum((l * h for l, h in zip(lam, self._height)), Fraction(0))
+
+    def _norm(self, lam) -> Fraction:
+        G = self.gram
+        return sum((lam[i] * G[i][j] * lam[j] for i in range(self.rank) for j in range(self.rank)),
+                   Fraction(0))
+
+    def _pair(self, lam, c) -> Fraction:
+        """(lam, alpha) for alpha with simple-root coefficients c."""
+        return sum((ci * li * di for ci, li, di in zip(c, lam, self.d)), Fraction(0))
+
+    def _reflect(self, mu, i) -> Weight:
+        row = self.cartan[i]
+        return tuple(m - mu[i] * a for m, a in zip(mu, row))
+
+    def to_dominant(self, mu) -> Tuple[Weight, int]:
+        """Dominant Weyl image of the label part of `mu` and the parity of the word."""
+        mu, sign = tuple(mu), 1
+        while True:
+            i = next((i for i, x in enumerate(mu) if x < 0), None)
+            if i is None:
+                return mu, sign
+            mu, sign = self._reflect(mu, i), -sign
+
+    def orbit(self, mu) -> List[Weight]:
+        """Weyl orbit of a dominant label vector."""
+        mu = tuple(mu)
+        seen, stack = {mu}, [mu]
+        while stack:
+            w = stack.pop()
+            for i in range(self.rank):
+                if w[i] > 0:
+                    nu = self._reflect(w, i)
+                    if nu not in seen:
+                        seen.add(nu)
+                        stack.append(nu)
+        return list(seen)
+
+    # --------------------------------------------------------------------------
+    # irreps
+    # --------------------------------------------------------------------------
+
+    def _split(self, hw) -> Tuple[Weight, Weight]:
+        hw = tuple(hw)
+        if len(hw) != self.rank + len(self.u1):
+            raise ValueError(f"{self.name}: weight {hw} needs {self.rank} labels "
+                             f"and {len(self.u1)} charges")
+        lam = hw[:self.rank]
+        if any(int(l) != l or l < 0 for l in lam):
+            raise ValueError(f"{self.name}: {lam} is not a dominant integral weight")
+        return tuple(int(l) for l in lam), tuple(Fraction(q) for q in hw[self.rank:])
+
+    def _dim(self, lam, roots) -> int:
+        num = den = Fraction(1)
+        for c in roots:
+            num *= self._pair(_add(lam, self.rho), c)
+            den *= self._pair(self.rho, c)
+        return int(num / den)
+
+    def dim(self, hw) -> int:
+        lam, _ = self._split(hw)
+        return self._dim(lam, self.pos_coeffs)
+
+    def dims(self, hw) -> Tuple:
+        """(dimension of each simple factor, ..., U(1) charges)."""
+        lam, charges = self._split(hw)
+        out = []
+        for comp in self.factors:
+            roots = [c for c in self.pos_coeffs if any(c[i] for i in comp)]
+            out.append(self._dim(lam, roots))
+        return tuple(out) + charges
+
+    def dominant_weights(self, hw) -> Dict[Weight, int]:
+        """Dominant weights of the irrep and their multiplicities (Freudenthal)."""
+        lam, _ = self._split(hw)
+        seen, stack = {lam}, [lam]
+        while stack:
+            mu = stack.pop()
+            for a in self.pos_labels:
+                nu = tuple(x - y for x, y in zip(mu, a))
+                if min(nu, default=0) >= 0 and nu not in seen:
+                    seen.add(nu)
+                    stack.append(nu)
+        order = sorted(seen, key=self.height, reverse=True)
+        top = self._norm(_add(lam, self.rho))
+        mult = {lam: 1}
+        for mu in order[1:]:
+            s = Fraction(0)
+            for c, a in zip(self.pos_coeffs, self.pos_labels):
+                nu = _add(mu, a)
+                while True:
+                    m = mult.get(self.to_dominant(nu)[0])
+                    if not m:
+                        break
+                    s += m * self._pair(nu, c)
+                    nu = _add(nu, a)
+            value = 2 * s / (top - self._norm(_add(mu, self.rho)))
+            if value.denominator != 1:
+                raise ArithmeticError(f"{self.name}: non-integer multiplicity at {mu}")
+            mult[mu] = int(value)
+        return mult
+
+    def weights(self, hw) -> Rep:
+        """Full weight system {weight: multiplicity} (cached)."""
+        hw = tuple(hw)
+        if hw not in self._weights:
+            _, charges = self._split(hw)
+            out = {}
+            for mu, m in self.dominant_weights(hw).items():
+                for w in self.orbit(mu):
+                    out[w + charges] = m
+            self._weights[hw] = out
+        return self._weights[hw]
+
+    def decompose(self, character: Dict[Weight, int]) -> Rep:
+        """Irreducible content of a character given as {weight: multiplicity}."""
+        left = Counter({tuple(w): m for w, m in character.items() if m})
+        out: Rep = {}
+        while left:
+            hw = max(left, key=lambda w: self.height(w[:self.rank]))
+            m = left[hw]
+            if m < 0 or min(hw[:self.rank], default=0) < 0:
+                raise ValueError(f"{self.name}: not a character (at {hw})")
+            out[hw] = out.get(hw, 0) + m
+            for w, k in self.weights(hw).items():
+                left[w] -= m * k
+                if not left[w]:
+                    del left[w]
+        return out
+
+    def tensor(self, hw1, hw2) -> Rep:
+        """Irreducible content of hw1 (x) hw2 (Racah-Speiser)."""
+        if self.dim(hw1) < self.dim(hw2):
+            hw1, hw2 = hw2, hw1
+        lam, q1 = self._split(hw1)
+        r = self.rank
+        out: Dict[Weight, int] = {}
+        for w, m in self.weights(hw2).items():
+            dom, sign = self.to_dominant(tuple(l + x + 1 for l, x in zip(lam, w[:r])))
+            if 0 in dom:
+                continue
+            key = tuple(x - 1 for x in dom) + _add(q1, w[r:])
+            out[key] = out.get(key, 0) + sign * m
+        return {k: v for k, v in out.items() if v}
+
+    def _square(self, hw, sign) -> Rep:
+        items = list(self.weights(hw).items())
+        char = Counter()
+        for w1, m1 in items:
+            for w2, m2 in items:
+                char[_add(w1, w2)] += m1 * m2
+        for w, m in items:
+            char[_add(w, w)] += sign * m
+        return self.decompose({w: m // 2 for w, m in char.items()})
+
+    def alt2(self, hw) -> Rep:
+        """Antisymmetric square Lambda^2 of the irrep."""
+        return self._square(hw, -1)
+
+    def sym2(self, hw) -> Rep:
+        """Symmetric square S^2 of the irrep."""
+        return self._square(hw, +1)
+
+    def content(self, rep: Rep) -> List[Tuple]:
+        """Sorted dims() of every irrep in `rep`, repeated by multiplicity."""
+        return sorted(self.dims(hw) for hw, m in rep.items() for _ in range(m))
+
+    # --------------------------------------------------------------------------
+    # branching
+    # --------------------------------------------------------------------------
+
+    def vector(self, w) -> Tuple[Fraction, ...]:
+        """Orthonormal-basis coordinates of a weight (labels, charges)."""
+        v = [Fraction(0)] * self.m
+        for l, omega in zip(w[:self.rank], self.fundamental):
+            v = [x + l * y for x, y in zip(v, omega)]
+        for q, u in zip(w[self.rank:], self.u1):
+            v = [x + Fraction(q) * y / _dot(u, u) for x, y in zip(v, u)]
+        return tuple(v)
+
+    def labels(self, v) -> Weight:
+        """Dynkin labels and U(1) charges of a vector in R^m."""
+        lab = []
+        for a in self.simple_roots:
+            x = 2 * _dot(v, a) / _dot(a, a)
+            if x.denominator != 1:
+                raise ValueError(f"{self.name}: {tuple(v)} is not an integral weight")
+            lab.append(int(x))
+        return tuple(lab) + tuple(_dot(v, u) for u in self.u1)
+
+    def branch(self, hw, sub: "Algebra", M=None) -> Rep:
+        """Irreducible content of the irrep `hw` restricted to `sub`."""
+        P = projection_matrix(self, sub, M)
+        char = Counter()
+        for w, m in self.weights(hw).items():
+            image = tuple(_dot(row, w) for row in P)
+            char[tuple(int(x) for x in image[:sub.rank]) + image[sub.rank:]] += m
+        return sub.decompose(char)
+
+
+def projection_matrix(big: Algebra, sub: Algebra, M=None) -> List[Tuple[Fraction, ...]]:
+    """Matrix taking (labels, charges) of `big` to (labels, charges) of `sub`.
+
+    M maps big.m coordinates to sub.m coordinates (rows: sub coordinates);
+    None means the identity.
+    """
+    if M is None:
+        if big.m != sub.m:
+            raise ValueError(f"{big.name} -> {sub.name}: need an embedding map")
+        M = [[int(i == j) for j in range(big.m)] for i in range(big.m)]
+    M = [_vec(row) for row in M]
+    n = big.rank + len(big.u1)
+    columns = []
+    for k in range(n):
+        e = tuple(int(i == k) for i in range(n))
+        v = big.vector(e)
+        image = tuple(_dot(row, v) for row in M)
+        columns.append(tuple(2 * _dot(image, a) / _dot(a, a) for a in sub.simple_roots)
+                       + tuple(_dot(image, u) for u in sub.u1))
+    P = [tuple(col[i] for col in columns) for i in range(sub.rank + len(sub.u1))]
+    if any(x.denominator != 1 for row in P[:sub.rank] for x in row):
+        raise ValueError(f"{big.name} -> {sub.name}: map does not send weights to weights")
+    return P
+
+
+def embedding(m: int, *blocks) -> List[List[Fraction]]:
+    """Block map R^m -> R^m': each block is (source indices, matrix or None).
+
+    A block with matrix None copies the source coordinates; otherwise the
+    matrix (rows: new coordinates) acts on them. Blocks are stacked in order.
+    """
+    rows = []
+    for source, matrix in blocks:
+        source = list(source)
+        if matrix is None:
+            matrix = [[int(i == j) for j in range(len(source))] for i in range(len(source))]
+        for mrow in matrix:
+            row = [Fraction(0)] * m
+            for j, x in zip(source, mrow):
+                row[j] = Fraction(x)
+            rows.append(row)
+    return rows
+
+
+# ==============================================================================
+# CONSTRUCTORS
+# ==============================================================================
+
+def _e(n, i, j=None, sign=-1, scale=1):
+    v = [0] * n
+    v[i] = scale
+    if j is not None:
+        v[j] = sign
+    return v
+
+
+@lru_cache(maxsize=None)
+def su(n: int) -> Algebra:
+    return Algebra(f"su({n})", [_e(n, i, i + 1) for i in range(n - 1)])
+
+
+@lru_cache(maxsize=None)
+def so(n: int) -> Algebra:
+    if n < 3:
+        raise ValueError("so(n) needs n >= 3")
+    k = n // 2
+    roots = [_e(k, i, i + 1) for i in range(k - 1)]
+    roots.append(_e(k, k - 1) if n % 2 else _e(k, k - 2, k - 1, sign=1))
+    return Algebra(f"so({n})", roots)
+
+
+@lru_cache(maxsize=None)
+def sp(n: int) -> Algebra:
+    roots = [_e(n, i, i + 1) for i in range(n - 1)] + [_e(n, n - 1, scale=2)]
+    return Algebra(f"sp({n})", roots)
+
+
+@lru_cache(maxsize=None)
+def g2() -> Algebra:
+    third = Fraction(1, 3)
+    return Algebra("g2", [(1, -1, 0), (-third, 1 - third, -third)])
+
+
+def product(*factors: Algebra, u1: Sequence = ()) -> Algebra:
+    """Direct sum of `factors` in orthogonal blocks, plus U(1) directions `u1`."""
+    m = sum(f.m for f in factors)
+    roots, dirs, offset = [], [], 0
+    for f in factors:
+        pad = lambda v: [0] * offset + list(v) + [0] * (m - offset - f.m)
+        roots += [pad(a) for a in f.simple_roots]
+        dirs += [pad(u) for u in f.u1]
+        offset += f.m
+    name = " x ".join([f.name for f in factors] + ["u(1)"] * len(u1))
+    return Algebra(name, roots, dirs + [list(u) for u in u1], m=m)
+
+
+# ==============================================================================
+# SELF-CHECK
+# ==============================================================================
+
+def _verify() -> int:
+    import time
+
+    from suite_results import record
+
+    tests = []
+
+    def check(name, condition, detail=""):
+        tests.append(bool(condition))
+        status = "PASS" if condition else "FAIL"
+        print(f"  [{status}] T{len(tests)}: {name}")
+        if detail and not condition:
+            print(f"         {detail}")
+        record(name, bool(condition), detail=detail)
+
+    def unit(r, i):
+        return tuple(int(j == i) for j in range(r))
+
+    half = Fraction(1, 2)
+
+    print("=" * 70)
+    print("PART 1: WEYL DIMENSION FORMULA")
+    print("=" * 70)
+    ok = all(so(n).dim(unit(so(n).rank, 0)) == n and
+             so(n).dim(unit(so(n).rank, 1)) == n * (n - 1) // 2
+             for n in range(7, 23))
+    check("so(n): vector n, adjoint n(n-1)/2 for n = 7..22", ok)
+    ok = all(so(n).dim(unit(so(n).rank, so(n).rank - 1)) == 2 ** ((n - 1) // 2)
+             for n in range(5, 23))
+    check("so(n): (half-)spinor dimension 2^[(n-1)/2] for n = 5..22", ok)
+    check("su(n): defining n, adjoint n^2 - 1 for n = 2..9",
+          all(su(n).dim(unit(n - 1, 0)) == n
+              and su(n).dim(tuple(int(i in (0, n - 2)) for i in range(n - 1))) == n * n - 1
+              for n in range(3, 10)) and su(2).dim((2,)) == 3)
+    check("sp(n): defining 2n, adjoint n(2n+1) for n = 1..6",
+          all(sp(n).dim(unit(n, 0)) == 2 * n and sp(n).dim(tuple(2 * int(i == 0) for i in range(n)))
+              == n * (2 * n + 1) for n in range(1, 7)))
+    check("g2: (1,0) = 14, (0,1) = 7, (0,2) = 27, (2,0) = 77",
+          [g2().dim(w) for w in [(1, 0), (0, 1), (0, 2), (2, 0)]] == [14, 7, 27, 77])
+    check("numbers of positive roots: so(22) 110, su(9) 36, sp(6) 36, g2 6",
+          [len(L.pos_coeffs) for L in (so(22), su(9), sp(6), g2())] == [110, 36, 36, 6])
+
+    print("=" * 70)
+    print("PART 2: FREUDENTHAL MULTIPLICITIES")
+    print("=" * 70)
+    cases = [(su(3), (1, 1)), (su(3), (2, 2)), (su(4), (1, 0, 1)), (so(7), (0, 0, 1)),
+             (so(8), (0, 1, 0, 0)), (so(10), (0, 0, 0, 1, 1)), (sp(3), (0, 1, 0)),
+             (g2(), (1, 0)), (g2(), (1, 1)), (so(9), (1, 0, 0, 1)), (su(5), (0, 1, 0, 0))]
+    check("sum of multiplicities = Weyl dimension for 11 irreps",
+          all(sum(L.weights(hw).values()) == L.dim(hw) for L, hw in cases))
+    check("zero weight multiplicity = rank in the adjoint (su(3) 2, so(10) 5, g2 2)",
+          su(3).weights((1, 1))[(0, 0)] == 2 and so(10).weights((0, 1, 0, 0, 0))[(0,) * 5] == 5
+          and g2().weights((1, 0))[(0, 0)] == 2)
+    check("su(3) 27 = (2,2): zero weight multiplicity 3", su(3).weights((2, 2))[(0, 0)] == 3)
+    check("g2 7: zero weight multiplicity 1, six nonzero weights",
+          g2().weights((0, 1)) == {w: 1 for w in g2().weights((0, 1))} and len(g2().weights((0, 1))) == 7)
+
+    print("=" * 70)
+    print("PART 3: TENSOR PRODUCTS")
+    print("=" * 70)
+    check("su(3): 3 x 3bar = 8 + 1", su(3).tensor((1, 0), (0, 1)) == {(1, 1): 1, (0, 0): 1})
+    check("su(3): 8 x 8 = 27 + 10 + 10bar + 2*8 + 1",
+          su(3).tensor((1, 1), (1, 1)) == {(2, 2): 1, (3, 0): 1, (0, 3): 1, (1, 1): 2, (0, 0): 1})
+    check("su(2): spin 1 x spin 1 = 2 + 1 + 0",
+          su(2).tensor((2,), (2,)) == {(4,): 1, (2,): 1, (0,): 1})
+    check("g2: 7 x 7 = 27 + 14 + 7 + 1",
+          g2().tensor((0, 1), (0, 1)) == {(0, 2): 1, (1, 0): 1, (0, 1): 1, (0, 0): 1})
+    s = so(10)
+    check("so(10): 16 x 16 = 10 + 120 + 126",
+          sorted(s.dim(hw) for hw in s.tensor((0, 0, 0, 0, 1), (0, 0, 0, 0, 1))) == [10, 120, 126])
+    check("Lambda^2(vector) = adjoint for so(7..12); S^2 = traceless + singlet",
+          all(so(n).alt2(unit(so(n).rank, 0)) == {unit(so(n).rank, 1): 1}
+              and so(n).sym2(unit(so(n).rank, 0)) == {tuple(2 * int(i == 0) for i in range(so(n).rank)): 1,
+                                                      (0,) * so(n).rank: 1}
+              for n in range(7, 13)))
+
+    print("=" * 70)
+    print("PART 4: BRANCHING RULES")
+    print("=" * 70)
+    # so(7) -> g2: project onto the plane x + y + z = 0
+    P = [[Fraction(int(i == j)) - Fraction(1, 3) for j in range(3)] for i in range(3)]
+    b = [g2().content(so(7).branch(hw, g2(), P)) for hw in [(1, 0, 0), (0, 0, 1), (0, 1, 0)]]
+    check("so(7) -> g2: 7 -> 7, 8 -> 7 + 1, 21 -> 14 + 7",
+          b == [[(7,)], [(1,), (7,)], [(7,), (14,)]])
+    check("so(8) -> so(7): 8v -> 7 + 1, 8s -> 8, 28 -> 21 + 7",
+          [sorted(so(7).dim(hw) for hw in so(8).branch(w, so(7), embedding(4, (range(3), None))))
+           for w in [(1, 0, 0, 0), (0, 0, 0, 1), (0, 1, 0, 0)]] == [[1, 7], [8], [7, 21]])
+    # so(4) = su(2) x su(2): e1 - e2 -> first root, e1 + e2 -> second root
+    so4 = [[half, -half], [-half, half], [half, half], [-half, -half]]
+    G = product(so(10), su(2), su(2))
+    M = embedding(7, (range(5), None), (range(5, 7), so4))
+    check("so(14) -> so(10) x su(2) x su(2): 64 -> (16,2,1) + (16bar,1,2)",
+          so(14).branch((0,) * 6 + (1,), G, M)
+          == {(0, 0, 0, 1, 0, 1, 0): 1, (0, 0, 0, 0, 1, 0, 1): 1})
+    check("so(14) -> so(10) x su(2) x su(2): 91 -> (45,1,1) + (1,3,1) + (1,1,3) + (10,2,2)",
+          G.content(so(14).branch((0, 1, 0, 0, 0, 0, 0), G, M))
+          == [(1, 1, 3), (1, 3, 1), (10, 2, 2), (45, 1, 1)])
+    su5 = product(su(5), u1=[(2, 2, 2, 2, 2)])
+    check("so(10) -> su(5) x u(1)_X: 16 -> 10_-1 + 5bar_3 + 1_-5",
+          so(10).branch((0, 0, 0, 1, 0), su5)
+          == {(0, 1, 0, 0, -1): 1, (0, 0, 0, 1, 3): 1, (0, 0, 0, 0, -5): 1})
+    Y = (-Fraction(1, 3),) * 3 + (half, half)
+    sm = product(su(3), su(2), u1=[Y])
+    check("su(5) -> su(3) x su(2) x u(1)_Y: 5bar -> (3bar,1)_1/3 + (1,2)_-1/2",
+          su(5).branch((0, 0, 0, 1), sm)
+          == {(0, 1, 0, Fraction(1, 3)): 1, (0, 0, 1, -half): 1})
+    check("so(10) -> SM: 16 = Q(3,2)_1/6 + u(3bar,1)_-2/3 + d(3bar,1)_1/3 + L(1,2)_-1/2 + e_1 + nu_0",
+          so(10).branch((0, 0, 0, 1, 0), sm)
+          == {(1, 0, 1, Fraction(1, 6)): 1, (0, 1, 0, Fraction(-2, 3)): 1,
+              (0, 1, 0, Fraction(1, 3)): 1, (0, 0, 1, -half): 1, (0, 0, 0, Fraction(1)): 1,
+              (0, 0, 0, Fraction(0)): 1})
+
+    print("=" * 70)
+    print("PART 5: LARGE REPRESENTATIONS AND CACHING")
+    print("=" * 70)
+    t0 = time.perf_counter()
+    adj = so(22).branch(unit(11, 1), product(so(11), so(11)), embedding(11, (range(10), None)))
+    dt = time.perf_counter() - t0
+    print(f"  so(22) adjoint -> so(11) x so(11): {dt * 1e3:.0f} ms")
+    check("so(22): 231 -> (55,1) + (1,55) + (11,11)",
+          product(so(11), so(11)).content(adj) == [(1, 55), (11, 11), (55, 1)])
+    t0 = time.perf_counter()
+    w1 = so(16).weights((0,) * 7 + (1,))
+    dt1 = time.perf_counter() - t0
+    t0 = time.perf_counter()
+    w2 = so(16).weights((0,) * 7 + (1,))
+    dt2 = time.perf_counter() - t0
+    print(f"  so(16) 128 weight system: {dt1 * 1e3:.1f} ms, cached {dt2 * 1e6:.0f} us")
+    check("so(16) 128: 128 weights of multiplicity 1, second call from cache",
+          len(w1) == 128 and set(w1.values()) == {1} and w1 is w2)
+
+    passed = sum(tests)
+    print(f"\nFINAL: {passed}/{len(tests)} PASS")
+    return 0 if passed == len(tests) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(_verify())
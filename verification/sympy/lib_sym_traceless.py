@@ -0,0 +1,323 @@
+#!/usr/bin/env python3
+"""
+Shared Symmetric Traceless Basis
+================================
+
+Sparse basis, index maps and cached 2-, 3- and 4-point trace tables for
+N x N symmetric traceless matrix models. The GKZ basis has only
+N(N-1) + (N-1)(N+2)/2 nonzero entries (175 for N = 11, against
+65 * 121 = 7865 dense), and its trace tables are sparse too: for N = 11 the
+4-point table Tr(E_a E_b E_c E_d) has 54,731 nonzeros out of 65^4 = 17.9M.
+Every invariant and every Hessian block of a background D is a contraction
+over basis coordinates; no dense N x N matrix is formed.
+
+Basis (the order of the former build_basis() copies in so11_beta_functions.py
+and coleman_weinberg_so11.py, and of build_exact_basis() in
+so11_beta_exact_arithmetic.py):
+  ("o", i, j)  (e_ij + e_ji)/sqrt(2) for i < j, lexicographic    N(N-1)/2
+  ("d", k)     diag(1, ..., 1, -(k+1), 0, ..., 0)/sqrt((k+1)(k+2))  N-1
+               (k+1 ones), k = 0 .. N-2
+The basis is orthonormal, so Tr(E_a E_b) = delta_ab and coordinates are
+projections x_a = Tr(E_a M). The integer matrices F_a (entries 1 and
+-(k+1)) and their squared norms |F_a|^2 are kept alongside for exact work:
+E_a = F_a / sqrt(|F_a|^2).
+
+Storage: the basis is a COO list (a, i, j, value) as in lib_lie. The pair
+products come from one sparse product,
+  P[(a, i), (b, l)] = (E_a E_b)[i, l],
+re-indexed as a (n^2, N^2) matrix Q with row a*n + b. Then, using E = E^T,
+  t3[(a, b), c]      = Tr(E_a E_b E_c)       = Q B^T
+  t4[(a, b), (c, d)] = Tr(E_a E_b E_c E_d)   = Q Q_swap^T
+where B is the (n, N^2) basis matrix and Q_swap holds E_d E_c in row c*n + d
+(so Q_swap[c*n + d, i*N + l] = (E_c E_d)[l, i]; the same entries as Q).
+Tables are built on first use and memoized per basis; bases per N.
+
+Usage:
+  from lib_sym_traceless import sym_traceless
+  B = sym_traceless(11)
+  B.n, B.labels[0], B.index[("d", 3)]      # 65, ("o", 0, 1), 58
+  B.matrices()                             # dense (n, N, N), built once
+  x = B.coefficients(M); B.matrix(x)       # matrix <-> coordinates (stacks ok)
+  B.trace2(), B.trace3(), B.trace4()       # sparse tables (rows a*n + b)
+  B.trace_power(x, 3)                      # Tr(phi^k), k = 2, 3, 4, batched
+  G1, G2, H = B.background_tables(B.coefficients(D))
+      # Tr(D E_a E_b), Tr(D^2 E_a E_b), Tr(D E_a D E_b)
+
+Running this file verifies the library.
+"""
+
+import sys
+from functools import lru_cache
+from typing import Tuple
+
+import numpy as np
+import scipy.sparse as sparse
+
+COO = Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]
+
+
+class SymTracelessBasis:
+    """Orthonormal GKZ basis of N x N real symmetric traceless matrices."""
+
+    def __init__(self, N: int):
+        if N < 2:
+            raise ValueError(f"need N >= 2, got {N}")
+        self.N = N
+        labels, k, i, j, f = [], [], [], [], []
+        for p in range(N):
+            for q in range(p + 1, N):
+                a = len(labels)
+                labels.append(("o", p, q))
+                k += [a, a]
+                i += [p, q]
+                j += [q, p]
+                f += [1, 1]
+        for d in range(N - 1):
+            a = len(labels)
+            labels.append(("d", d))
+            k += [a] * (d + 2)
+            i += list(range(d + 2))
+            j += list(range(d + 2))
+            f += [1] * (d + 1) + [-(d + 1)]
+        self.labels = labels
+        self.n = len(labels)
+        self.index = {lab: a for a, lab in enumerate(labels)}
+        k, i, j = (np.array(x, dtype=np.int64) for x in (k, i, j))
+        f = np.array(f, dtype=np.int64)
+        self.norm_sq = np.bincount(k, weights=f**2, minlength=self.n).astype(np.int64)
+        self.integer_basis = (k, i, j, f)
+        self.basis = (k, i, j, f / np.sqrt(self.norm_sq[k]))
+        self._dense = None
+        self._bm = None
+        self._tables = {}
+
+    def __repr__(self) -> str:
+        return f"SymTracelessBasis(N={self.N}, n={self.n})"
+
+    # --- basis -----------------------------------------------------------------
+
+    def matrices(self) -> np.ndarray:
+        """All basis matrices as a dense (n, N, N) array (built once)."""
+        if self._dense is None:
+            k, i, j, v = self.basis
+            E = np.zeros((self.n, self.N, self.N))
+            E[k, i, j] = v
+            self._dense = E
+        return self._dense
+
+    def basis_matrix(self) -> sparse.csr_matrix:
+        """Sparse (n, N*N) matrix whose rows are the flattened basis matrices."""
+        if self._bm is None:
+            k, i, j, v = self.basis
+            self._bm = sparse.csr_matrix((v, (k, i * self.N + j)),
+                                         shape=(self.n, self.N ** 2))
+        return self._bm
+
+    def coefficients(self, M: np.ndarray) -> np.ndarray:
+        """x_a = Tr(E_a M) for M of shape (..., N, N)."""
+        M = np.asarray(M)
+        flat = M.reshape(-1, self.N ** 2)
+        return (self.basis_matrix() @ flat.T).T.reshape(M.shape[:-2] + (self.n,))
+
+    def matrix(self, x: np.ndarray) -> np.ndarray:
+        """sum_a x_a E_a for x of shape (..., n)."""
+        x = np.asarray(x)
+        flat = (self.basis_matrix().T @ x.reshape(-1, self.n).T).T
+        return flat.reshape(x.shape[:-1] + (self.N, self.N))
+
+    # --- trace tables --------------------------------------------------------------
+
+    def _pair_products(self) -> Tuple[sparse.csr_matrix, sparse.csr_matrix]:
+        """Q[a*n + b, i*N + l] = (E_a E_b)[i, l] and Q_swap[a*n + b, i*N + l] = (E_b E_a)[i, l]."""
+        if "Q" not in self._tables:
+            k, i, j, v = self.basis
+            n, N = self.n, self.N
+            left = sparse.csr_matrix((v, (k * N + i, j)), shape=(n * N, N))
+            right = sparse.csr_matrix((v, (i, k * N + j)), shape=(N, n * N))
+            P = (left @ right).tocoo()
+            a, ii = np.divmod(P.row, N)
+            b, ll = np.divmod(P.col, N)
+            shape = (n * n, N * N)
+            self._tables["Q"] = sparse.csr_matrix((P.data, (a * n + b, ii * N + ll)), shape=shape)
+            # (E_c E_d)[l, i] = (E_d E_c)[i, l]: same entries, rows (b, a)
+            self._tables["Q_swap"] = sparse.csr_matrix((P.data, (b * n + a, ii * N + ll)),
+                                                       shape=shape)
+        return self._tables["Q"], self._tables["Q_swap"]
+
+    def trace2(self) -> sparse.csr_matrix:
+        """Tr(E_a E_b) as a sparse (n, n) matrix (the identity)."""
+        if "t2" not in self._tables:
+            bm = self.basis_matrix()
+            self._tables["t2"] = _prune(bm @ bm.T)
+        return self._tables["t2"]
+
+    def trace3(self) -> sparse.csr_matrix:
+        """Tr(E_a E_b E_c) as a sparse (n*n, n) matrix, row a*n + b."""
+        if "t3" not in self._tables:
+            Q, _ = self._pair_products()
+            self._tables["t3"] = _prune(Q @ self.basis_matrix().T)
+        return self._tables["t3"]
+
+    def trace4(self) -> sparse.csr_matrix:
+        """Tr(E_a E_b E_c E_d) as a sparse (n*n, n*n) matrix, rows a*n + b, cols c*n + d."""
+        if "t4" not in self._tables:
+            Q, Q_swap = self._pair_products()
+            self._tables["t4"] = _prune(Q @ Q_swap.T)
+        return self._tables["t4"]
+
+    def trace_coo(self, order: int) -> COO:
+        """Trace table of the given order (2, 3, 4) as flat index arrays + values.
+
+        Returns (indices, values) with indices of shape (order, nnz).
+        """
+        key = f"coo{order}"
+        if key not in self._tables:
+            T = {2: self.trace2, 3: self.trace3, 4: self.trace4}[order]().tocoo()
+            n = self.n
+            if order == 2:
+                idx = np.array([T.row, T.col])
+            elif order == 3:
+                idx = np.array([T.row // n, T.row % n, T.col])
+            else:
+                idx = np.array([T.row // n, T.row % n, T.col // n, T.col % n])
+            self._tables[key] = (idx, T.data)
+        return self._tables[key]
+
+    # --- invariants on coordinates --------------------------------------------------
+
+    def trace_power(self, x: np.ndarray, k: int) -> np.ndarray:
+        """Tr(phi^k) for phi = sum_a x_a E_a, k = 2, 3, 4; x of shape (..., n)."""
+        x = np.asarray(x, dtype=float)
+        X = x.reshape(-1, self.n)
+        if k == 2:
+            out = np.einsum("ma,ma->m", X, X)
+        elif k == 3:
+            XX = np.einsum("ma,mb->mab", X, X).reshape(len(X), -1)
+            out = np.einsum("mc,mc->m", np.asarray((self.trace3().T @ XX.T).T), X)
+        elif k == 4:
+            XX = np.einsum("ma,mb->mab", X, X).reshape(len(X), -1)
+            out = np.einsum("mp,mp->m", np.asarray((self.trace4().T @ XX.T).T), XX)
+        else:
+            raise ValueError(f"trace tables go up to order 4, got {k}")
+        return out.reshape(x.shape[:-1])
+
+    def background_tables(self, d: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """(G1, G2, H) for D = sum_c d_c E_c:
+          G1_ab = Tr(D E_a E_b), G2_ab = Tr(D^2 E_a E_b), H_ab = Tr(D E_a D E_b)
+        """
+        d = np.asarray(d, dtype=float)
+        n = self.n
+        (c, a, b), v = self.trace_coo(3)
+        G1 = np.bincount(a * n + b, weights=v * d[c], minlength=n * n).reshape(n, n)
+        (p, q, r, s), v = self.trace_coo(4)
+        G2 = np.bincount(r * n + s, weights=v * d[p] * d[q], minlength=n * n).reshape(n, n)
+        H = np.bincount(q * n + s, weights=v * d[p] * d[r], minlength=n * n).reshape(n, n)
+        return G1, G2, H
+
+
+def _prune(M, tol: float = 1e-13) -> sparse.csr_matrix:
+    """Drop round-off zeros (cancellations between diagonal basis elements)."""
+    M = sparse.csr_matrix(M)
+    M.data[np.abs(M.data) < tol] = 0.0
+    M.eliminate_zeros()
+    return M
+
+
+@lru_cache(maxsize=None)
+def sym_traceless(N: int) -> SymTracelessBasis:
+    return SymTracelessBasis(N)
+
+
+# ==============================================================================
+# SELF-CHECK
+# ==============================================================================
+
+def _verify() -> int:
+    import time
+
+    from suite_results import record
+
+    tests = []
+
+    def check(name, condition, detail=""):
+        tests.append(bool(condition))
+        status = "PASS" if condition else "FAIL"
+        print(f"  [{status}] T{len(tests)}: {name}")
+        if detail and not condition:
+            print(f"         {detail}")
+        record(name, bool(condition), detail=detail)
+
+    rng = np.random.default_rng(7)
+
+    print("=" * 70)
+    print("PART 1: BASIS")
+    print("=" * 70)
+    B = sym_traceless(11)
+    E = B.matrices()
+    flat = E.reshape(B.n, -1)
+    check("N = 11: n = 65, orthonormal, symmetric, traceless",
+          B.n == 65 and np.abs(flat @ flat.T - np.eye(65)).max() < 1e-12
+          and np.abs(E - E.transpose(0, 2, 1)).max() == 0
+          and np.abs(np.trace(E, axis1=1, axis2=2)).max() < 1e-12)
+    check("labels/index: ('o', 0, 1) first, ('d', 0) = diag(1, -1)/sqrt(2) after the 55 off-diagonals",
+          B.labels[0] == ("o", 0, 1) and B.index[("d", 0)] == 55
+          and np.allclose(np.diag(E[55])[:2], [1 / np.sqrt(2), -1 / np.sqrt(2)]))
+    k, i, j, f = B.integer_basis
+    check("integer basis: E_a = F_a / sqrt(|F_a|^2), |F|^2 = 2 and (k+1)(k+2)",
+          np.allclose(B.basis[3], f / np.sqrt(B.norm_sq[k]))
+          and set(B.norm_sq[:55]) == {2}
+          and list(B.norm_sq[55:]) == [(d + 1) * (d + 2) for d in range(10)])
+    M = rng.standard_normal((4, 11, 11))
+    M = M + M.transpose(0, 2, 1)
+    M -= np.trace(M, axis1=1, axis2=2)[:, None, None] * np.eye(11) / 11
+    check("matrix(coefficients(M)) = M for a stack of symmetric traceless M",
+          np.abs(B.matrix(B.coefficients(M)) - M).max() < 1e-12)
+    check("sym_traceless(N) is memoized", sym_traceless(11) is B)
+
+    print("=" * 70)
+    print("PART 2: TRACE TABLES")
+    print("=" * 70)
+    for Nval in (3, 5, 8):
+        Bs = sym_traceless(Nval)
+        Es = Bs.matrices()
+        n = Bs.n
+        t3 = np.einsum("aij,bjk,cki->abc", Es, Es, Es)
+        t4 = np.einsum("aij,bjk,ckl,dli->abcd", Es, Es, Es, Es)
+        ok = (np.abs(Bs.trace2().toarray() - np.eye(n)).max() < 1e-12
+              and np.abs(Bs.trace3().toarray().reshape(n, n, n) - t3).max() < 1e-12
+              and np.abs(Bs.trace4().toarray().reshape(n, n, n, n) - t4).max() < 1e-12)
+        check(f"N = {Nval}: sparse t2, t3, t4 = dense einsum", ok)
+    t0 = time.perf_counter()
+    B.trace4()
+    dt = time.perf_counter() - t0
+    nnz = B.trace4().nnz
+    print(f"  N = 11: t3 nnz {B.trace3().nnz} / {65**3}, t4 nnz {nnz} / {65**4}, "
+          f"t4 built in {dt * 1000:.0f} ms")
+    check("N = 11: t4 is sparse (< 2% filled)", nnz < 0.02 * 65**4)
+
+    print("=" * 70)
+    print("PART 3: INVARIANTS AND BACKGROUND TABLES ON COORDINATES")
+    print("=" * 70)
+    x = B.coefficients(M)
+    ok = all(np.allclose(B.trace_power(x, p),
+                         [np.trace(np.linalg.matrix_power(m, p)) for m in M], rtol=1e-12)
+             for p in (2, 3, 4))
+    check("Tr(phi^k), k = 2, 3, 4, from coordinates = dense traces", ok)
+    D = M[0] / np.sqrt(np.trace(M[0] @ M[0]))
+    G1, G2, H = B.background_tables(B.coefficients(D))
+    ok = (np.allclose(G1, np.einsum("ij,ajk,bki->ab", D, E, E), atol=1e-12)
+          and np.allclose(G2, np.einsum("ij,ajk,bki->ab", D @ D, E, E), atol=1e-12)
+          and np.allclose(H, np.einsum("ij,ajk,kl,bli->ab", D, E, D, E), atol=1e-12))
+    check("background tables G1, G2, H = dense Tr(D E E), Tr(D^2 E E), Tr(D E D E)", ok)
+    B3 = sym_traceless(3)
+    x3 = rng.standard_normal((100, B3.n))
+    check("N = 3 Cayley-Hamilton on coordinates: Tr(phi^4) = [Tr(phi^2)]^2 / 2",
+          np.allclose(B3.trace_power(x3, 4), B3.trace_power(x3, 2)**2 / 2))
+
+    passed = sum(tests)
+    print(f"\nFINAL: {passed}/{len(tests)} PASS")
+    return 0 if passed == len(tests) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(_verify())
@@ -17,6 +17,7 @@ Depends on: All existing verification scripts
 from sympy import *
 from sympy import Rational as R
 import math
+from suite_results import record, record_all
 
 # ==============================================================================
 # FRAMEWORK CONSTANTS [D] -- derived from axioms
@@ -51,6 +52,7 @@ def test(name, predicted, measured, unc, unit, tag, category):
         # Structural prediction (no numerical comparison)
         results.append((name, pred_f, None, None, unit, tag, category, "INFO"))
         info_count += 1
+        record(name, None, predicted=pred_f, detail=f"{category} {tag}")
         return
 
     meas_f = float(measured)
@@ -69,8 +71,10 @@ def test(name, predicted, measured, unc, unit, tag, category):
     # PASS if within 2 sigma (when sigma available) or within 5%
     if sigma is not None:
         passed = sigma < 2.0
+        tolerance = 2.0 * unc
     else:
         passed = error_pct < 5.0
+        tolerance = 0.05 * abs(meas_f)
 
     status = "PASS" if passed else "FAIL"
     if passed:
@@ -79,6 +83,8 @@ def test(name, predicted, measured, unc, unit, tag, category):
         fail_count += 1
 
     results.append((name, pred_f, meas_f, error_ppm, unit, tag, category, status))
+    record(name, passed, predicted=pred_f, measured=meas_f, tolerance=tolerance,
+           detail=f"{category} {tag}")
 
 # ==============================================================================
 # CATEGORY 1: FUNDAMENTAL CONSTANTS
@@ -439,6 +445,7 @@ tests = [
     ("Omega_Lambda = 137/200 matches Planck", abs(float(R(137, 200)) - 0.6847) < 0.01),
 ]
 
+record_all(tests)
 all_pass = True
 for name, passed in tests:
     status = "PASS" if passed else "FAIL"
@@ -2,22 +2,29 @@
 """
 Exact Arithmetic Verification: A13 and A23 Beta Function Coefficients
 
-KEY FINDING: Using SymPy exact (rational) arithmetic, the conjectured formulas
+KEY FINDING: Using exact (rational) arithmetic, the conjectured formulas
   A13 = (N^2 + 6) / (6N^2)
   A23 = (2N^2 + 9N - 36) / (6N)
-are verified EXACTLY for N = 4, 5, 6, 7.
+are verified EXACTLY for every N = 4, 5, ..., 25.
 
 Since A13 = p(N)/q(N) with deg(p) = deg(q) = 2 is determined by 3 points,
 and A23 = p(N)/q(N) with deg(p) = 2, deg(q) = 1 is determined by 4 points,
-exact agreement at 4 points PROVES the formulas uniquely (given degree bounds).
+exact agreement at 4 points PROVES the formulas uniquely (given degree bounds);
+the remaining 18 points are independent confirmations.
 
 Method:
-  - Build exact orthonormal basis for symmetric traceless matrices using SymPy Rational
-  - Compute T.T bubble contraction exactly (no floating point)
+  - Build an orthogonal basis F_mu of symmetric traceless matrices with
+    INTEGER entries, and its dual F_mu / |F_mu|^2. The sum over an
+    orthonormal basis equals sum_mu F_mu (x) F_mu / |F_mu|^2, so no square
+    roots appear anywhere
+  - Hold every matrix and vertex as a lib_exact SparseTensor (integer
+    numerators over one common denominator) and compute the T.T bubble as
+    sparse exact contractions: K_AB[mu,nu] = T(A,B,F_mu,F_nu) per channel,
+    then T.T = sum_channels <K_AB, K_CD> (no floating point)
   - Extract A13, A23 by solving linear system with 2 test configurations
   - Verify against analytic formulas
 
-Status: THEOREM (exact arithmetic proof for N = 4, 5, 6, 7)
+Status: THEOREM (exact arithmetic proof for N = 4, ..., 25)
 Depends on:
 - [D: Orthonormal basis for sym traceless N x N matrices]
 - [I-MATH: One-loop RG structure, T vertex definition]
@@ -30,11 +37,17 @@ import sys
 import io
 sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8', errors='replace')
 
+import time
+from fractions import Fraction
+
 from sympy import (
     Matrix, Rational, sqrt, eye, zeros, trace,
     simplify, S, Integer
 )
 
+from lib_exact import SparseTensor
+from lib_sym_traceless import sym_traceless
+
 R = Rational
 
 # ==============================================================================
@@ -44,34 +57,15 @@ R = Rational
 def build_exact_basis(N):
     """Build exact orthonormal basis for N x N symmetric traceless matrices.
 
-    Returns list of SymPy Matrix objects with exact Rational entries.
+    Returns list of SymPy Matrix objects with exact entries: the integer
+    matrices F_mu of the shared GKZ basis (lib_sym_traceless) divided by
+    sqrt(|F_mu|^2), |F_mu|^2 = 2 off the diagonal and (k+1)(k+2) on it.
     """
-    basis = []
-
-    # Off-diagonal: (e_ij + e_ji) / sqrt(2)
-    for i in range(N):
-        for j in range(i + 1, N):
-            E = zeros(N)
-            E[i, j] = R(1, 1)
-            E[j, i] = R(1, 1)
-            # Normalize: Tr(E^2) = 2, so divide by sqrt(2)
-            # But we want exact, so keep as 1/sqrt(2) * ...
-            # Actually, store as matrix with entries 1/sqrt(2)
-            E_norm = E * sqrt(R(1, 2))
-            basis.append(E_norm)
-
-    # Diagonal traceless basis (GKZ type)
-    for k in range(N - 1):
-        E = zeros(N)
-        # Entries: first k+1 diagonal = 1/sqrt((k+1)(k+2))
-        #          (k+1)-th diagonal = -(k+1)/sqrt((k+1)(k+2))
-        norm_sq = (k + 1) * (k + 2)
-        for i in range(k + 1):
-            E[i, i] = R(1, 1) / sqrt(R(norm_sq))
-        E[k + 1, k + 1] = R(-(k + 1), 1) / sqrt(R(norm_sq))
-        basis.append(E)
-
-    return basis
+    B = sym_traceless(N)
+    basis = [zeros(N) for _ in range(B.n)]
+    for mu, i, j, f in zip(*(x.tolist() for x in B.integer_basis)):
+        basis[mu][i, j] = Integer(f)
+    return [E / sqrt(Integer(B.norm_sq[mu])) for mu, E in enumerate(basis)]
 
 
 def verify_basis(basis, N):
@@ -105,6 +99,55 @@ for N_test in [3, 4, 5]:
     print(f"  N={N_test}: {len(basis)} basis elements, orthonormal = {ok}")
 
 
+def build_rational_basis(N):
+    """Integer orthogonal basis of symmetric traceless matrices and its dual.
+
+    F_mu = e_ij + e_ji (i < j), |F_mu|^2 = 2, and the unnormalized GKZ
+    diagonals diag(1, ..., 1, -(k+1), 0, ...), |F_mu|^2 = (k+1)(k+2): the
+    same directions as build_exact_basis. Returns (F, F_dual) as (n, N, N)
+    SparseTensors with F_dual[mu] = F[mu] / |F_mu|^2, so that
+      sum_mu F_mu (x) F_dual_mu = sum_mu E_mu (x) E_mu   (E orthonormal)
+    """
+    B = sym_traceless(N)
+    F, F_dual = {}, {}
+    for mu, i, j, f in zip(*(x.tolist() for x in B.integer_basis)):
+        F[(mu, i, j)] = Fraction(f)
+        F_dual[(mu, i, j)] = Fraction(f, int(B.norm_sq[mu]))
+    shape = (B.n, N, N)
+    return SparseTensor.from_fractions(shape, F), SparseTensor.from_fractions(shape, F_dual)
+
+
+def verify_rational_basis(basis, N):
+    """Exact checks: <F_mu, F_dual_nu> = delta, traceless, and the
+    resolution of the identity equals the symmetric traceless projector
+      Pi_{ij,kl} = (d_ik d_jl + d_il d_jk)/2 - d_ij d_kl / N
+    """
+    F, F_dual = basis
+    n = F.shape[0]
+    assert n == N * (N + 1) // 2 - 1, f"Wrong count: {n}"
+    assert F.contract(F_dual, (1, 2), (1, 2)) == SparseTensor.eye(n), "not dual"
+    assert F.trace(1, 2).nnz == 0, "not traceless"
+    Pi = {}
+    for i in range(N):
+        for j in range(N):
+            for k, l in [(i, j), (j, i)]:
+                Pi[(i, j, k, l)] = Pi.get((i, j, k, l), 0) + Fraction(1, 2)
+            for k in range(N):
+                if i == j:
+                    Pi[(i, i, k, k)] = Pi.get((i, i, k, k), 0) - Fraction(1, N)
+    Pi = SparseTensor.from_fractions((N,) * 4, Pi)
+    assert F.contract(F_dual, (0,), (0,)) == Pi, "resolution of identity != projector"
+    return True
+
+
+print("\nInteger orthogonal basis + dual (resolution of the identity = projector):")
+for N_test in [3, 4, 5, 8]:
+    basis = build_rational_basis(N_test)
+    ok = verify_rational_basis(basis, N_test)
+    print(f"  N={N_test}: {basis[0].shape[0]} basis elements, {basis[0].nnz} nonzeros, "
+          f"sum F (x) F_dual = Pi: {ok}")
+
+
 # ==============================================================================
 # PART 2: EXACT T.T CONTRACTION
 # ==============================================================================
@@ -114,26 +157,48 @@ print("PART 2: Exact T.T Bubble Contraction")
 print("=" * 70)
 
 
+def _trace_product(*mats):
+    P = mats[0]
+    for M in mats[1:]:
+        P = P @ M
+    return P.trace()
+
+
 def eval_T4_exact(A, B, C, D):
-    """Exact fully-symmetrized Tr(phi^4) vertex.
+    """Exact fully-symmetrized Tr(phi^4) vertex (SparseTensor matrices).
 
     T(A,B,C,D) = (1/3)[Tr(ABCD) + Tr(ABDC) + Tr(ACBD)]
     3 distinct necklace classes for symmetric matrices.
     """
-    s1 = trace(A * B * C * D)
-    s2 = trace(A * B * D * C)
-    s3 = trace(A * C * B * D)
-    return (s1 + s2 + s3) * R(1, 3)
+    s1 = _trace_product(A, B, C, D)
+    s2 = _trace_product(A, B, D, C)
+    s3 = _trace_product(A, C, B, D)
+    return (s1 + s2 + s3) * Fraction(1, 3)
 
 
 def eval_U4_exact(A, B, C, D):
-    """Exact [Tr(phi^2)]^2 vertex.
+    """Exact [Tr(phi^2)]^2 vertex (SparseTensor matrices).
 
     U(A,B,C,D) = Tr(AB)Tr(CD) + Tr(AC)Tr(BD) + Tr(AD)Tr(BC)
     """
-    return (trace(A * B) * trace(C * D)
-            + trace(A * C) * trace(B * D)
-            + trace(A * D) * trace(B * C))
+    return (_trace_product(A, B) * _trace_product(C, D)
+            + _trace_product(A, C) * _trace_product(B, D)
+            + _trace_product(A, D) * _trace_product(B, C))
+
+
+def vertex_exact(X1, X2, E):
+    """K[mu,nu] = T(X1, X2, E_mu, E_nu) for a stack E of basis matrices.
+
+    Tr(X1 X2 E_mu E_nu) = sum P_li E_mu,ij E_nu,jl   (P = X1 X2)
+    Tr(X1 X2 E_nu E_mu) = the transpose (E is symmetric)
+    Tr(X1 E_mu X2 E_nu) = sum X1_li E_mu,ij X2_jk E_nu,kl
+    """
+    PE = E.contract(X1 @ X2, (1,), (1,))            # [mu, j, l]
+    K1 = PE.contract(E, (1, 2), (1, 2))
+    AE = E.contract(X1, (1,), (1,))                 # [mu, j, l]
+    AEB = AE.contract(X2, (1,), (0,))               # [mu, l, k]
+    K3 = AEB.contract(E, (1, 2), (2, 1))
+    return (K1 + K1.T + K3) * Fraction(1, 3)
 
 
 def bubble_TT_exact(A, B, C, D, basis):
@@ -142,24 +207,19 @@ def bubble_TT_exact(A, B, C, D, basis):
     s-channel: sum_{mu,nu} T(A,B,E_mu,E_nu) T(E_mu,E_nu,C,D)
     t-channel: sum_{mu,nu} T(A,C,E_mu,E_nu) T(E_mu,E_nu,B,D)
     u-channel: sum_{mu,nu} T(A,D,E_mu,E_nu) T(E_mu,E_nu,B,C)
-    """
-    n = len(basis)
-    total = S(0)
 
-    for channel, (X1, X2, Y1, Y2) in enumerate([
+    With basis = (F, F_dual) each channel is <K_X(F), K_Y(F_dual)>, which
+    equals the orthonormal-basis sum exactly.
+    """
+    F, F_dual = basis
+    total = Fraction(0)
+    for X1, X2, Y1, Y2 in [
         (A, B, C, D),  # s
         (A, C, B, D),  # t
         (A, D, B, C),  # u
-    ]):
-        ch_sum = S(0)
-        for mu in range(n):
-            for nu in range(n):
-                t1 = eval_T4_exact(X1, X2, basis[mu], basis[nu])
-                t2 = eval_T4_exact(basis[mu], basis[nu], Y1, Y2)
-                ch_sum += t1 * t2
-        total += ch_sum
-
-    return simplify(total)
+    ]:
+        total += vertex_exact(X1, X2, F).dot(vertex_exact(Y1, Y2, F_dual))
+    return total
 
 
 def make_test_matrices(N, seed_offset=0):
@@ -192,8 +252,8 @@ def compute_A13_A23_exact(N, verbose=True):
     if verbose:
         print(f"\n  Computing N = {N} (n = {N*(N+1)//2 - 1})...")
 
-    basis = build_exact_basis(N)
-    verify_basis(basis, N)
+    basis = build_rational_basis(N)
+    verify_rational_basis(basis, N)
 
     # Generate 2 test configurations with different seeds
     configs = []
@@ -207,7 +267,7 @@ def compute_A13_A23_exact(N, verbose=True):
         else:
             C_t, D_t = make_test_matrices(N, seed_offset=30)[0], \
                         make_test_matrices(N, seed_offset=40)[0]
-        configs.append((A_t, B_t, C_t, D_t))
+        configs.append(tuple(SparseTensor.from_dense(M) for M in (A_t, B_t, C_t, D_t)))
 
     # Compute T.T, U, T for each configuration
     equations = []  # (U_val, T_val, TT_val)
@@ -216,10 +276,9 @@ def compute_A13_A23_exact(N, verbose=True):
         if verbose:
             print(f"    Config {idx+1}/2...")
 
-        U_val = simplify(eval_U4_exact(A_t, B_t, C_t, D_t))
-        T_val = simplify(eval_T4_exact(A_t, B_t, C_t, D_t))
-        TT_val = bubble_TT_exact(A_t, B_t, C_t, D_t, basis)
-        TT_val = simplify(TT_val)
+        U_val = R(eval_U4_exact(A_t, B_t, C_t, D_t))
+        T_val = R(eval_T4_exact(A_t, B_t, C_t, D_t))
+        TT_val = R(bubble_TT_exact(A_t, B_t, C_t, D_t, basis))
 
         if verbose:
             print(f"      U = {U_val}")
@@ -259,17 +318,20 @@ def compute_A13_A23_exact(N, verbose=True):
 
 
 # ==============================================================================
-# PART 3: RUN FOR N = 4, 5, 6, 7
+# PART 3: RUN FOR N = 4, ..., 25
 # ==============================================================================
 
 print("\n" + "=" * 70)
-print("PART 3: Exact Computation for N = 4, 5, 6, 7")
+print("PART 3: Exact Computation for N = 4, ..., 25")
 print("=" * 70)
 
+N_VALUES = list(range(4, 26))
 results = {}
-# N=4 should be fast (n=9), N=5 (n=14) moderate, N=6 (n=20) slower, N=7 (n=27) slow
-for N_val in [4, 5, 6, 7]:
-    A13, A23 = compute_A13_A23_exact(N_val)
+timings = {}
+for N_val in N_VALUES:
+    t0 = time.time()
+    A13, A23 = compute_A13_A23_exact(N_val, verbose=N_val <= 7)
+    timings[N_val] = time.time() - t0
     A13_expected = R(N_val**2 + 6, 6 * N_val**2)
     A23_expected = R(2 * N_val**2 + 9 * N_val - 36, 6 * N_val)
 
@@ -282,6 +344,14 @@ for N_val in [4, 5, 6, 7]:
         'A23_match': simplify(A23 - A23_expected) == 0 if A23 is not None else False,
     }
 
+print(f"\n{'N':>3s} | {'n':>4s} | {'A13':>10s} {'A23':>10s} | {'match':>5s} | {'time':>6s}")
+print("-" * 50)
+for N_val in N_VALUES:
+    r = results[N_val]
+    match = r['A13_match'] and r['A23_match']
+    print(f"{N_val:>3d} | {N_val*(N_val+1)//2 - 1:>4d} | {str(r['A13']):>10s} "
+          f"{str(r['A23']):>10s} | {'yes' if match else 'NO':>5s} | {timings[N_val]:>5.2f}s")
+
 
 # ==============================================================================
 # PART 4: UNIQUENESS ARGUMENT
@@ -300,10 +370,11 @@ PROOF OUTLINE:
 
 1. A13 = (N^2+6)/(6N^2) = (aN^2+b)/(cN^2) has 3 parameters (a,b,c).
    Exact agreement at N = 4, 5, 6 (3 points) determines it uniquely.
-   Agreement at N = 7 provides an independent verification.
+   Agreement at N = 7, ..., 25 provides 19 independent verifications.
 
 2. A23 = (2N^2+9N-36)/(6N) = (aN^2+bN+c)/(dN) has 4 parameters.
    Exact agreement at N = 4, 5, 6, 7 (4 points) determines it uniquely.
+   Agreement at N = 8, ..., 25 provides 18 independent verifications.
 
 Combined with the assumption that A13 and A23 are rational functions
 of N (justified by the projector algebra being polynomial in N),
@@ -379,9 +450,11 @@ A23 = (2N^2 + 9N - 36) / (6N)
   N=6: 90/36 = 5/2       [EXACT]
   N=7: 125/42             [EXACT]
 
+  N=8..25: see the PART 3 table [EXACT]
+
 STATUS: Upgraded from [CONJECTURE] to [DERIVATION]
   - Exact rational arithmetic (no floating point)
-  - 4 independent N values verified
+  - 22 independent N values verified (4 needed)
   - Uniqueness of rational function form guaranteed by degree counting
   - Combined with discriminant proof (so11_discriminant_proof.py):
     THEOREM: No mixed Wilson-Fisher FP for SO(N>=4) symmetric traceless at 1-loop.
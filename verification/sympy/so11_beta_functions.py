@@ -13,7 +13,7 @@ Beta functions (d = 4 - eps):
   beta_u = -eps u + [A11 u^2 + A12 u v + A13 v^2] / (8 pi^2)
   beta_v = -eps v + [A21 u^2 + A22 u v + A23 v^2] / (8 pi^2)
 
-ALL SIX ANALYTIC (verified for N = 3, 4, 5, 6, 7, 8, 11):
+ALL SIX ANALYTIC (verified for N = 3, 4, 5, 6, 7, 8, 11, 16, 24, 40):
   A11 = n + 8                    (n = N(N+1)/2 - 1)
   A12 = (N^2 + 3N - 6) / (3N)
   A13 = (N^2 + 6) / (6N^2)      = 1/6 + 1/N^2
@@ -34,8 +34,12 @@ import sys
 import io
 sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8', errors='replace')
 
+import time
+
 import numpy as np
 
+from lib_sym_traceless import sym_traceless
+
 # ==============================================================================
 # PART 1: BUILD ORTHONORMAL BASIS FOR SYMMETRIC TRACELESS MATRICES
 # ==============================================================================
@@ -46,47 +50,21 @@ print("=" * 70)
 
 
 def build_basis(N):
-    """Build orthonormal basis for N x N real symmetric traceless matrices.
+    """Orthonormal basis for N x N real symmetric traceless matrices.
 
-    Basis elements:
+    The shared GKZ basis of lib_sym_traceless, as a list of dense matrices:
     - Off-diagonal: (e_ij + e_ji)/sqrt(2) for i < j  [N(N-1)/2 elements]
     - Diagonal: orthonormal traceless diagonal matrices  [N-1 elements]
     Total: N(N-1)/2 + N-1 = N(N+1)/2 - 1 = n
     """
-    basis = []
-
-    # Off-diagonal basis elements (normalized)
-    for i in range(N):
-        for j in range(i + 1, N):
-            E = np.zeros((N, N))
-            E[i, j] = 1.0 / np.sqrt(2)
-            E[j, i] = 1.0 / np.sqrt(2)
-            basis.append(E)
-
-    # Diagonal traceless basis (Gram-Schmidt on traceless diagonal matrices)
-    # Use: e_k = diag(0,...,0,1,0,...,0,-1,0,...,0)/sqrt(2) won't work directly
-    # Better: standard traceless diagonal basis
-    for k in range(N - 1):
-        E = np.zeros((N, N))
-        # First k+1 entries = 1/sqrt((k+1)(k+2))
-        # Entry k+1 = -(k+1)/sqrt((k+1)(k+2))
-        norm = np.sqrt((k + 1) * (k + 2))
-        for i in range(k + 1):
-            E[i, i] = 1.0 / norm
-        E[k + 1, k + 1] = -(k + 1.0) / norm
-        basis.append(E)
-
-    # Verify orthonormality
-    n = len(basis)
-    assert n == N * (N + 1) // 2 - 1, f"Wrong basis size: {n}"
-    for a in range(n):
-        for b in range(n):
-            ip = np.trace(basis[a] @ basis[b])
-            expected = 1.0 if a == b else 0.0
-            assert abs(ip - expected) < 1e-12, \
-                f"Basis not orthonormal: <E_{a}, E_{b}> = {ip}"
+    B = sym_traceless(N)
+    assert B.n == N * (N + 1) // 2 - 1, f"Wrong basis size: {B.n}"
 
-    return basis
+    # Verify orthonormality: Gram matrix <E_a, E_b> = Tr(E_a E_b) from the 2-point table
+    err = np.abs(B.trace2().toarray() - np.eye(B.n)).max()
+    assert err < 1e-12, f"Basis not orthonormal: max |<E_a, E_b> - delta| = {err}"
+
+    return list(B.matrices())
 
 
 def dim_sym_traceless(N):
@@ -175,21 +153,133 @@ def bubble_TT_s_channel_basis(A, B, C, D, basis):
 
 
 def bubble_TT_3ch_basis(A, B, C, D, basis):
-    """Sum T.T over s, t, u channels."""
+    """Sum T.T over s, t, u channels (explicit basis reference)."""
     s = bubble_TT_s_channel_basis(A, B, C, D, basis)
     t = bubble_TT_s_channel_basis(A, C, B, D, basis)
     u = bubble_TT_s_channel_basis(A, D, B, C, basis)
     return s + t + u
 
 
-def compute_all_coefficients(N, n_configs=30, verbose=False):
+# Linear maps on N x N matrices are kept as lists of terms, each acting on Y:
+#   ('n', P, Q): Y -> P Y Q      ('t', P, Q): Y -> P Y^T Q
+#   ('r', G, R): Y -> Tr(G Y) R
+# P, Q, G, R may carry a leading batch axis (one entry per configuration), so
+# every composition below is a batched matmul over all configurations.
+
+def _tp(X):
+    return np.swapaxes(X, -1, -2)
+
+
+def _tr(X):
+    return np.trace(X, axis1=-2, axis2=-1)
+
+
+def _compose(F, G):
+    """Terms of the map F o G (apply G first)."""
+    out = []
+    for kf, P, Q in F:
+        for kg, P2, Q2 in G:
+            if kf == 'n':
+                if kg == 'r':
+                    out.append(('r', P2, P @ Q2 @ Q))
+                else:
+                    out.append((kg, P @ P2, Q2 @ Q))
+            elif kf == 't':
+                if kg == 'r':
+                    out.append(('r', P2, P @ _tp(Q2) @ Q))
+                else:
+                    out.append(('t' if kg == 'n' else 'n',
+                                P @ _tp(Q2), _tp(P2) @ Q))
+            else:
+                if kg == 'n':
+                    out.append(('r', Q2 @ P @ P2, Q))
+                elif kg == 't':
+                    out.append(('r', _tp(Q2 @ P @ P2), Q))
+                else:
+                    out.append(('r', P2, _tr(P @ Q2)[..., None, None] * Q))
+    return out
+
+
+def _trace(F):
+    """Trace of the map F over all N x N matrices."""
+    total = 0.0
+    for k, P, Q in F:
+        if k == 'n':
+            total = total + _tr(P) * _tr(Q)
+        elif k == 't':
+            total = total + np.sum(P * Q, axis=(-2, -1))
+        else:
+            total = total + _tr(P @ Q)
+    return total
+
+
+def projector_map(N):
+    """Orthogonal projector onto symmetric traceless matrices.
+
+    Pi(Y) = (Y + Y^T)/2 - Tr(Y) I/N = sum_mu <E_mu, Y> E_mu for any
+    orthonormal basis, so basis sums become compositions with Pi.
+    """
+    I = np.eye(N)
+    return [('n', I / 2, I), ('t', I / 2, I), ('r', I, -I / N)]
+
+
+def vertex_map(A, B):
+    """Quartic vertex with two legs fixed: T(A, B, X, Y) = <X, L_AB(Y)>.
+
+    From T = (S1 + S2 + S3)/3 with Tr(ABXY) = <X, YAB>, Tr(ABYX) = <X, ABY>,
+    Tr(AXBY) = <X, BYA>:  L_AB(Y) = (Y AB + AB Y + B Y A)/3.
+    """
+    I = np.eye(A.shape[-1])
+    AB = A @ B
+    return [('n', I, AB / 3.0), ('n', AB / 3.0, I), ('n', B / 3.0, A)]
+
+
+def bubble_TT_s_channel(A, B, C, D):
+    """s-channel of T.T as one operator trace.
+
+    sum_{mu,nu} T(A,B,E_mu,E_nu) T(E_mu,E_nu,C,D) = Tr(L_AB Pi L_CD Pi)
+    Arguments may be stacks (n_configs, N, N); the result is then a vector.
+    """
+    Pi = projector_map(A.shape[-1])
+    return _trace(_compose(_compose(vertex_map(A, B), Pi),
+                           _compose(vertex_map(C, D), Pi)))
+
+
+def bubble_TT_3ch(A, B, C, D):
+    """Sum T.T over s, t, u channels."""
+    return (bubble_TT_s_channel(A, B, C, D)
+            + bubble_TT_s_channel(A, C, B, D)
+            + bubble_TT_s_channel(A, D, B, C))
+
+
+def check_contraction(N_check, seed=7):
+    """Cross-check the operator-trace contraction against the basis sum."""
+    rng_c = np.random.RandomState(seed)
+    mats = []
+    for _ in range(4):
+        M = rng_c.randn(N_check, N_check)
+        M = 0.5 * (M + M.T)
+        M -= np.trace(M) / N_check * np.eye(N_check)
+        mats.append(M)
+    ref = bubble_TT_3ch_basis(*mats, build_basis(N_check))
+    val = bubble_TT_3ch(*mats)
+    rel = abs(val - ref) / abs(ref)
+    ok = rel < 1e-12
+    print(f"  Operator trace vs basis sum (N={N_check}): rel diff = {rel:.2e} "
+          f"[{'OK' if ok else 'FAIL'}]")
+    return ok
+
+print("\nContraction verification:")
+contraction_ok = all(check_contraction(N_c) for N_c in [3, 4, 5, 7])
+
+
+def compute_all_coefficients(N, n_configs=200, verbose=False):
     """Compute the 6 one-loop beta function coefficients for SO(N).
 
     Uses least-squares regression with many test configurations for robust
     extraction of A13 and A23 from the T.T bubble contraction.
     """
     n = dim_sym_traceless(N)
-    basis = build_basis(N)
 
     # --- Analytic results (all 6 coefficients) ---
     A11 = n + 8
@@ -203,30 +293,24 @@ def compute_all_coefficients(N, n_configs=30, verbose=False):
     # --- Numerical T.T contraction via least-squares ---
     rng = np.random.RandomState(137)
 
-    def rsym(rng_obj):
-        M = rng_obj.randn(N, N)
-        M = 0.5 * (M + M.T)
-        M -= np.trace(M) / N * np.eye(N)
-        return M
-
-    # Generate many test configurations
-    U_vals = []
-    T_vals = []
-    TT_vals = []
-    for i in range(n_configs):
-        A_t, B_t, C_t, D_t = rsym(rng), rsym(rng), rsym(rng), rsym(rng)
-        u_val = eval_U4(A_t, B_t, C_t, D_t)
-        t_val = eval_T4(A_t, B_t, C_t, D_t)
-        tt_val = bubble_TT_3ch_basis(A_t, B_t, C_t, D_t, basis)
-        U_vals.append(u_val)
-        T_vals.append(t_val)
-        TT_vals.append(tt_val)
-        if verbose and (i + 1) % 10 == 0:
-            print(f"    Config {i+1}/{n_configs} done")
-
-    U_arr = np.array(U_vals)
-    T_arr = np.array(T_vals)
-    TT_arr = np.array(TT_vals)
+    # All configurations at once: (n_configs, 4, N, N) symmetric traceless
+    M = rng.randn(n_configs, 4, N, N)
+    M = 0.5 * (M + M.swapaxes(-1, -2))
+    M -= np.trace(M, axis1=-2, axis2=-1)[..., None, None] / N * np.eye(N)
+    A_s, B_s, C_s, D_s = M[:, 0], M[:, 1], M[:, 2], M[:, 3]
+
+    # U and T for every configuration in one einsum each
+    tr2 = lambda X, Y: np.einsum('cij,cji->c', X, Y)
+    tr4 = lambda W, X, Y, Z: np.einsum('cij,cjk,ckl,cli->c', W, X, Y, Z,
+                                       optimize=True)
+    U_arr = (tr2(A_s, B_s) * tr2(C_s, D_s) + tr2(A_s, C_s) * tr2(B_s, D_s)
+             + tr2(A_s, D_s) * tr2(B_s, C_s))
+    T_arr = (tr4(A_s, B_s, C_s, D_s) + tr4(A_s, B_s, D_s, C_s)
+             + tr4(A_s, C_s, B_s, D_s)) / 3.0
+    TT_arr = bubble_TT_3ch(A_s, B_s, C_s, D_s)
+    if verbose:
+        print(f"    T.T contracted for {n_configs} configs in one batch")
+
 
     # Least-squares: TT = A13 * U + A23 * T
     design = np.column_stack([U_arr, T_arr])
@@ -259,8 +343,8 @@ def compute_all_coefficients(N, n_configs=30, verbose=False):
 
 # Compute for multiple N values including verification cases N=6, 8
 results = {}
-for N_val in [3, 4, 5, 6]:
-    n_cfg = 10
+for N_val in [3, 4, 5, 6, 7, 8]:
+    n_cfg = 200
     print(f"\n  Computing N = {N_val} (n = {dim_sym_traceless(N_val)}, "
           f"{n_cfg} configs)...")
     r = compute_all_coefficients(N_val, n_configs=n_cfg)
@@ -269,25 +353,23 @@ for N_val in [3, 4, 5, 6]:
     print(f"    A23 = {r['A23']:.6f} (analytic: {r['A23_analytic']:.6f})")
     print(f"    R^2 = {r['R2']:.8f}")
 
-for N_val in [7, 8]:
-    n_cfg = 10
-    n = dim_sym_traceless(N_val)
-    print(f"\n  Computing N = {N_val} (n = {n}, "
-          f"n^2 = {n**2} terms, {n_cfg} configs)...")
-    r = compute_all_coefficients(N_val, n_configs=n_cfg)
-    results[N_val] = r
-    print(f"    A13 = {r['A13']:.6f} (analytic: {r['A13_analytic']:.6f})")
-    print(f"    A23 = {r['A23']:.6f} (analytic: {r['A23_analytic']:.6f})")
-    print(f"    R^2 = {r['R2']:.8f}")
-
 # N=11: the main target
 N_val = 11
-n_cfg = 8
-print(f"\n  Computing N = {N_val} (n = 65, n^2 = 4225 terms per channel, "
-      f"{n_cfg} configs)...")
+n_cfg = 400
+print(f"\n  Computing N = {N_val} (n = 65, {n_cfg} configs)...")
 r11 = compute_all_coefficients(N_val, n_configs=n_cfg, verbose=True)
 results[N_val] = r11
 
+# Large N: the explicit basis sum would need n^2 = 670,761 terms per channel at N=40
+for N_val in [16, 24, 40]:
+    n_cfg = 200
+    t0 = time.time()
+    r = compute_all_coefficients(N_val, n_configs=n_cfg)
+    results[N_val] = r
+    print(f"\n  N = {N_val} (n = {r['n']}, {n_cfg} configs, {time.time() - t0:.2f}s): "
+          f"A13 = {r['A13']:.6f} ({r['A13_analytic']:.6f}), "
+          f"A23 = {r['A23']:.6f} ({r['A23_analytic']:.6f})")
+
 
 # ==============================================================================
 # PART 3: RESULTS TABLE
@@ -420,12 +502,14 @@ print(f"  Effective A_eff = A11/4 + A12/2 + A13 + A22/2 + A23/2 = {effective_coe
 # is on the same orbit.
 
 print(f"\nN=3 Cayley-Hamilton verification:")
-basis3 = build_basis(3)
+# Invariants evaluated on basis coordinates with the cached trace tables
+basis3 = sym_traceless(3)
 A_test = np.random.RandomState(42).randn(3, 3)
 A_test = 0.5 * (A_test + A_test.T)
 A_test -= np.trace(A_test) / 3 * np.eye(3)
-tr2 = np.trace(A_test @ A_test)
-tr4 = np.trace(A_test @ A_test @ A_test @ A_test)
+x_test = basis3.coefficients(A_test)
+tr2 = basis3.trace_power(x_test, 2)
+tr4 = basis3.trace_power(x_test, 4)
 ratio = tr4 / tr2**2
 print(f"  Random traceless 3x3: Tr(A^4)/[Tr(A^2)]^2 = {ratio:.6f}")
 print(f"  Expected (Cayley-Hamilton): 0.500000")
@@ -435,8 +519,9 @@ print(f"  Match: {abs(ratio - 0.5) < 1e-10}")
 A_test11 = np.random.RandomState(42).randn(11, 11)
 A_test11 = 0.5 * (A_test11 + A_test11.T)
 A_test11 -= np.trace(A_test11) / 11 * np.eye(11)
-tr2_11 = np.trace(A_test11 @ A_test11)
-tr4_11 = np.trace(A_test11 @ A_test11 @ A_test11 @ A_test11)
+x_test11 = sym_traceless(11).coefficients(A_test11)
+tr2_11 = sym_traceless(11).trace_power(x_test11, 2)
+tr4_11 = sym_traceless(11).trace_power(x_test11, 4)
 ratio_11 = tr4_11 / tr2_11**2
 print(f"\n  Random traceless 11x11: Tr(A^4)/[Tr(A^2)]^2 = {ratio_11:.6f}")
 print(f"  NOT 0.5: confirms two independent invariants for N=11")
@@ -527,6 +612,9 @@ tests = [
     ("Orthonormal basis constructed for all N",
      True),
 
+    ("Operator-trace T.T = explicit basis sum (N = 3, 4, 5, 7)",
+     contraction_ok),
+
     ("A11 = n + 8 = 73 for N=11",
      abs(results[11]['A11'] - 73) < 1e-10),
 
@@ -557,7 +645,7 @@ tests = [
     ("N=11 discriminant is negative (no mixed FP)",
      disc_11 < 0),
 
-    ("No stable mixed FP for any N in {4,5,6,7,8,11}",
+    (f"No stable mixed FP for any N in {{{','.join(str(N_val) for N_val in results if N_val >= 4)}}}",
      all(  # Check discriminant < 0 for all N >= 4
          (results[N_val]['A12'] - results[N_val]['A23'])**2
          - 4 * results[N_val]['A13'] * (results[N_val]['A11'] - results[N_val]['A22']) < 0
@@ -601,7 +689,7 @@ RESULTS:
    A22 = 12
    A23 = (2N^2 + 9N - 36) / (6N)          [{r11['A23_analytic']:.6f} for N=11]
 
-   Numerically verified for N = 4, 5, 6, 7, 8, 11 (R^2 = 1.0 to machine precision).
+   Numerically verified for N = 4, 5, 6, 7, 8, 11, 16, 24, 40 (R^2 = 1.0 to machine precision).
 
    Simplified forms:
      A13 = 1/6 + 1/N^2
@@ -613,7 +701,7 @@ RESULTS:
      A13 lam^2 + (A12 - A23) lam + (A11 - A22) = 0
    has discriminant = {disc_11:.4f} < 0 for N = 11.
 
-   In fact, the discriminant is NEGATIVE for ALL N >= 4 tested (N=4..8, 11).
+   In fact, the discriminant is NEGATIVE for ALL N >= 4 tested (N=4..8, 11, 16, 24, 40).
    Only trivial fixed points exist (Gaussian, isotropic, anisotropic).
    All are unstable saddle points in the physical region.
 
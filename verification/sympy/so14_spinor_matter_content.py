@@ -19,6 +19,9 @@ Created: Session 119
 
 from sympy import *
 from sympy import isprime
+import numpy as np
+
+from lib_clifford import clifford
 
 print("="*70)
 print("SO(14) SPINOR AND MATTER CONTENT")
@@ -43,13 +46,14 @@ print("PART 1: SPINOR DIMENSIONS")
 print("="*70)
 
 # SO(2n) spinor dimensions
+# Read off from the explicit Cl(2n) gamma matrices rather than the formulas
 def dirac_spinor_dim(n):
     """Dirac spinor of SO(2n) has dimension 2^n"""
-    return 2**n
+    return clifford(2*n).dim
 
 def weyl_spinor_dim(n):
     """Weyl spinor of SO(2n) has dimension 2^(n-1)"""
-    return 2**(n-1)
+    return len(clifford(2*n).weyl(+1))
 
 spinors = [
     ("SO(4)", 2, H),
@@ -77,8 +81,9 @@ print("\n" + "="*70)
 print("PART 2: SO(14) SPINOR STRUCTURE")
 print("="*70)
 
-spinor_14 = 128  # Dirac
-weyl_14 = 64     # Each Weyl
+cl14 = clifford(14)
+spinor_14 = cl14.dim               # Dirac
+weyl_14 = len(cl14.weyl(+1))       # Each Weyl
 
 print(f"""
 SO(14) spinor dimensions:
@@ -132,6 +137,35 @@ Physical interpretation:
     64 = 4 * 16 = H * spinor_SO10 = spacetime * generation
 """)
 
+# Explicit check on the Weyl 64: SO(10) acts on axes 0-9, SO(4) on 10-13.
+# The SO(10) chirality (-i)^5 g_0...g_9 separates 16 from 16bar; the SU(2)
+# Casimirs of so(4) = su(2)_L + su(2)_R then fix the doublet structure.
+plus = cl14.weyl(+1)
+gamma_10 = cl14.gamma(0)
+for a in range(1, 10):
+    gamma_10 = gamma_10 @ cl14.gamma(a)
+chi_10 = (gamma_10 * (-1j)**5).phase.real
+casimir_L, casimir_R = cl14.su2_casimirs(range(10, 14))
+
+
+def su2_spins(states):
+    """(j_L(j_L+1), j_R(j_R+1)) eigenvalues on a chirality-10 block of the 64."""
+    return tuple(np.unique(np.round(np.linalg.eigvalsh(M[states][:, states].toarray()), 9))
+                 for M in (casimir_L, casimir_R))
+
+
+sixteen = plus[chi_10[plus] == 1]
+sixteen_bar = plus[chi_10[plus] == -1]
+spins_16 = su2_spins(sixteen)
+spins_16bar = su2_spins(sixteen_bar)
+
+print(f"Explicit Cl(14) gamma matrices (Dirac {spinor_14}, Weyl {weyl_14}):")
+print(f"  SO(10) chirality +1: {len(sixteen)} states, SU(2)_L x SU(2)_R Casimirs "
+      f"{spins_16[0].tolist()} x {spins_16[1].tolist()} -> (16, 2, 1)")
+print(f"  SO(10) chirality -1: {len(sixteen_bar)} states, SU(2)_L x SU(2)_R Casimirs "
+      f"{spins_16bar[0].tolist()} x {spins_16bar[1].tolist()} -> (16bar, 1, 2)")
+print()
+
 # ==============================================================================
 # PART 4: MATTER COUNTING
 # ==============================================================================
@@ -319,9 +353,9 @@ print("="*70)
 
 tests = [
     # Spinor dimensions
-    ("SO(14) Dirac = 2^7 = 128", 2**7 == 128),
-    ("SO(14) Weyl = 2^6 = 64", 2**6 == 64),
-    ("SO(10) Weyl = 2^4 = 16", 2**4 == 16),
+    ("SO(14) Dirac = 2^7 = 128", spinor_14 == 2**7 == 128),
+    ("SO(14) Weyl = 2^6 = 64", weyl_14 == 2**6 == 64),
+    ("SO(10) Weyl = 2^4 = 16", weyl_spinor_dim(5) == 2**4 == 16),
 
     # Framework expressions
     ("128 = 2^Im_O", 128 == 2**Im_O),
@@ -340,6 +374,10 @@ tests = [
     # Decomposition
     ("128 = 2 * 64 (chirality)", 128 == 2 * 64),
     ("64 = 4 * 16 (H * gen)", 64 == 4 * 16),
+    ("Cl(14): 64 -> (16,2,1) + (16bar,1,2)",
+     len(sixteen) == len(sixteen_bar) == 32
+     and [c.tolist() for c in spins_16] == [[0.75], [0.0]]
+     and [c.tolist() for c in spins_16bar] == [[0.0], [0.75]]),
     ("128 = 8 * 16 (O * gen)", 128 == 8 * 16),
 
     # Powers
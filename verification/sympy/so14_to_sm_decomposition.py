@@ -19,6 +19,8 @@ Created: Session 119
 from sympy import *
 from sympy import Rational as R
 
+from lib_reps import so, su, product, embedding
+
 print("="*70)
 print("SO(14) -> STANDARD MODEL DECOMPOSITION")
 print("="*70)
@@ -304,6 +306,39 @@ MASS SCALES:
   m_DM ~ 5 GeV [dark generation scale]
 """)
 
+# ==============================================================================
+# PART 8: BRANCHING FROM THE WEIGHT SYSTEMS
+# ==============================================================================
+
+print("="*70)
+print("PART 8: BRANCHING RULES FROM WEIGHT SYSTEMS (lib_reps)")
+print("="*70)
+
+# SO(14) -> SO(10) x SO(4): split R^7 (Cartan of SO(14)) into R^5 + R^2;
+# SO(4) = SU(2)_L x SU(2)_R with roots e_1 - e_2 (L) and e_1 + e_2 (R)
+SO14, SO10 = so(14), so(10)
+G_PS = product(so(10), su(2), su(2))
+so4 = [[R(1, 2), R(-1, 2)], [R(-1, 2), R(1, 2)], [R(1, 2), R(1, 2)], [R(-1, 2), R(-1, 2)]]
+TO_PS = embedding(7, (range(5), None), (range(5, 7), so4))
+# SU(3) x SU(2) x U(1)_Y inside SU(5) inside SO(10), Y = diag(-1/3,-1/3,-1/3,1/2,1/2)
+G_SM = product(su(3), su(2), u1=[(R(-1, 3),) * 3 + (R(1, 2),) * 2])
+
+vec_14 = SO14.branch((1, 0, 0, 0, 0, 0, 0), G_PS, TO_PS)
+weyl_64 = SO14.branch((0, 0, 0, 0, 0, 0, 1), G_PS, TO_PS)
+weyl_64c = SO14.branch((0, 0, 0, 0, 0, 1, 0), G_PS, TO_PS)
+adj_91 = SO14.branch((0, 1, 0, 0, 0, 0, 0), G_PS, TO_PS)
+gen_16 = SO10.branch((0, 0, 0, 1, 0), G_SM)
+
+def show(G, rep):
+    return " + ".join("(" + ", ".join(str(x) for x in d) + ")" for d in G.content(rep))
+
+print(f"  14  -> {show(G_PS, vec_14)}")
+print(f"  64  -> {show(G_PS, weyl_64)}  (16 with SU(2)_L, 16bar with SU(2)_R)")
+print(f"  64' -> {show(G_PS, weyl_64c)}")
+print(f"  91  -> {show(G_PS, adj_91)}")
+print(f"  16 of SO(10) -> (SU(3), SU(2), Y): {show(G_SM, gen_16)}")
+print()
+
 # ==============================================================================
 # VERIFICATION TESTS
 # ==============================================================================
@@ -333,6 +368,16 @@ tests = [
     ("4 = H = spacetime", 4 == H),
     ("16 = 2^H = one generation", 16 == 2**H),
     ("45 = 5 x Im_H^2", 45 == 5 * Im_H**2),
+
+    # Branching rules from weight systems (lib_reps)
+    ("14 -> (10,1,1) + (1,2,2)", G_PS.content(vec_14) == [(1, 2, 2), (10, 1, 1)]),
+    ("64 -> (16,2,1) + (16bar,1,2)",
+     weyl_64 == {(0, 0, 0, 1, 0, 1, 0): 1, (0, 0, 0, 0, 1, 0, 1): 1}),
+    ("91 -> (45,1,1) + (1,3,1) + (1,1,3) + (10,2,2)",
+     G_PS.content(adj_91) == [(1, 1, 3), (1, 3, 1), (10, 2, 2), (45, 1, 1)]),
+    ("16 = Q + u^c + d^c + L + e^c + nu^c (hypercharges 1/6,-2/3,1/3,-1/2,1,0)",
+     G_SM.content(gen_16) == sorted([(3, 2, R(1, 6)), (3, 1, R(-2, 3)), (3, 1, R(1, 3)),
+                                     (1, 2, R(-1, 2)), (1, 1, 1), (1, 1, 0)])),
 ]
 
 all_pass = True
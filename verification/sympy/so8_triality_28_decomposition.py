@@ -17,6 +17,8 @@ Dependencies: S322 (28=7+21 structural identity), S321 (Hom decomposition)
 
 from sympy import *
 
+from lib_reps import so, su, g2, embedding
+
 tests_passed = 0
 tests_total = 0
 
@@ -56,9 +58,29 @@ print()
 # Spinor- (8_c): dim = 8
 # Triality: Z_3 outer automorphism permuting 8_v, 8_s, 8_c
 
+# Highest weights (Dynkin labels, outer nodes 1, 3, 4 of D_4)
+SO8, SO7, G2, SU3 = so(8), so(7), g2(), su(3)
+V8, S8, C8, ADJ8 = (1, 0, 0, 0), (0, 0, 1, 0), (0, 0, 0, 1), (0, 1, 0, 0)
+ADJ7 = (0, 1, 0)
+TO_SO7 = embedding(4, (range(3), None))   # SO(7)_v: drop the e_4 plane
+TO_G2 = [[Rational(int(i == j)) - Rational(1, 3) for j in range(3)] for i in range(3)]
+
+def triality(hw):
+    """Z_3 outer automorphism: permute the outer nodes 1 -> 3 -> 4 -> 1."""
+    a1, a2, a3, a4 = hw
+    return (a4, a2, a1, a3)
+
+def to_g2(hw):
+    """G_2 content of an SO(8) irrep via SO(8) -> SO(7)_v -> G_2."""
+    out = {}
+    for w7, m7 in SO8.branch(hw, SO7, TO_SO7).items():
+        for w2, m2 in SO7.branch(w7, G2, TO_G2).items():
+            out[w2] = out.get(w2, 0) + m7 * m2
+    return out
+
 dim_adj_SO8 = dim_O * (dim_O - 1) // 2
-test("dim(adj SO(8)) = 28", dim_adj_SO8 == 28)
-test("dim(8_v) = dim(8_s) = dim(8_c) = 8", True)
+test("dim(adj SO(8)) = 28", dim_adj_SO8 == 28 == SO8.dim(ADJ8))
+test("dim(8_v) = dim(8_s) = dim(8_c) = 8", [SO8.dim(w) for w in (V8, S8, C8)] == [8, 8, 8])
 
 # Triality is unique to SO(8). Out(SO(n)) = Z_2 for n != 8,4.
 # Out(SO(8)) = S_3 (symmetric group on 3 elements), which contains Z_3.
@@ -85,7 +107,10 @@ print()
 
 dim_adj_SO7 = Im_O * (Im_O - 1) // 2
 test("dim(adj SO(7)) = 21 = Im_H * Im_O", dim_adj_SO7 == 21)
-test("28 = 7 + 21", dim_adj_SO8 == Im_O + dim_adj_SO7)
+test("28 = 7 + 21", SO7.content(SO8.branch(ADJ8, SO7, TO_SO7)) == [(Im_O,), (dim_adj_SO7,)])
+test("SO(8) -> SO(7)_v: 8_v -> 1 + 7, 8_s -> 8, 8_c -> 8",
+     [SO7.content(SO8.branch(w, SO7, TO_SO7)) for w in (V8, S8, C8)]
+     == [[(1,), (7,)], [(8,)], [(8,)]])
 
 print(f"SO(8) -> SO(7): 28 -> 7 + 21")
 print(f"  7 = fundamental of SO(7) = coset directions")
@@ -209,6 +234,20 @@ print()
 # - The residual Z_2 (swapping 8_s <-> 8_c) is the charge conjugation
 #   symmetry (particle <-> antiparticle)
 
+# SO(7)_s and SO(7)_c: branch the triality images under SO(7)_v
+test("Triality cycles 8_v -> 8_s -> 8_c -> 8_v", [triality(w) for w in (V8, S8, C8)] == [S8, C8, V8])
+def under_so7(hw, x):
+    """SO(7)_x content of hw: SO(7)_x = triality^k(SO(7)_v) with triality^k(8_v) = 8_x."""
+    k = [V8, S8, C8].index(x)
+    for _ in range((3 - k) % 3):
+        hw = triality(hw)
+    return SO7.content(SO8.branch(hw, SO7, TO_SO7))
+
+test("SO(7)_x fixes a vector of 8_x only: 8_x -> 1 + 7, other 8's -> 8",
+     all(under_so7(w, x) == ([(1,), (7,)] if w == x else [(8,)])
+         for x in (V8, S8, C8) for w in (V8, S8, C8)))
+test("28 -> 7 + 21 under all three SO(7)'s",
+     all(under_so7(ADJ8, x) == [(7,), (21,)] for x in (V8, S8, C8)))
 test("Choosing identity in O breaks triality Z_3 -> Z_2", True)
 test("Residual Z_2 = charge conjugation (8_s <-> 8_c)", True)
 
@@ -236,7 +275,9 @@ print()
 
 dim_G2 = 14
 test("dim(G_2) = 14", dim_G2 == 14)
-test("G_2 c SO(7) c SO(8)", True)
+test("G_2 c SO(7) c SO(8)", G2.content(SO7.branch((1, 0, 0), G2, TO_G2)) == [(7,)])
+test("Under G_2 all three 8's -> 1 + 7 (7_v = 7_s = 7_c)",
+     all(G2.content(to_g2(w)) == [(1,), (7,)] for w in (V8, S8, C8)))
 
 # Under G_2: the three 7's (from the three SO(7) embeddings) become
 # the SAME 7-dimensional representation of G_2.
@@ -263,8 +304,8 @@ print()
 # So: 28 = 7 + 21 -> 7 + (14 + 7) = 14 + 7 + 7
 # Two copies of the fundamental 7 of G_2.
 
-test("SO(8) adj -> G_2: 28 -> 14 + 7 + 7", 14 + 7 + 7 == 28)
-test("SO(7) adj -> G_2: 21 -> 14 + 7", 14 + 7 == 21)
+test("SO(8) adj -> G_2: 28 -> 14 + 7 + 7", G2.content(to_g2(ADJ8)) == [(7,), (7,), (14,)])
+test("SO(7) adj -> G_2: 21 -> 14 + 7", G2.content(SO7.branch(ADJ7, G2, TO_G2)) == [(7,), (14,)])
 
 print(f"Branching chain:")
 print(f"  SO(8) -> SO(7):  28 -> 7 + 21")
@@ -293,8 +334,11 @@ print()
 # Two 7's: 2*(3 + 3bar + 1) = 6 + 6 + 2 = 14.
 # Total: 14 + 14 = 28. OK.
 
-test("G_2 -> SU(3): 14 -> 8 + 3 + 3bar", 8 + 3 + 3 == 14)
-test("G_2 -> SU(3): 7 -> 3 + 3bar + 1", 3 + 3 + 1 == 7)
+# SU(3) c G_2: the long roots e_i - e_j of G_2 are the roots of SU(3)
+test("G_2 -> SU(3): 14 -> 8 + 3 + 3bar",
+     G2.branch((1, 0), SU3) == {(1, 1): 1, (1, 0): 1, (0, 1): 1})
+test("G_2 -> SU(3): 7 -> 3 + 3bar + 1",
+     G2.branch((0, 1), SU3) == {(1, 0): 1, (0, 1): 1, (0, 0): 1})
 test("Total: 28 = (8+3+3bar) + 2*(3+3bar+1) = 14 + 14", (8+3+3) + 2*(3+3+1) == 28)
 
 print()
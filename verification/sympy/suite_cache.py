@@ -0,0 +1,191 @@
+#!/usr/bin/env python3
+"""
+Verification Suite Result Cache
+===============================
+
+Content-hash cache for suite_runner.py. A script's cache key covers:
+  - its own source,
+  - the source of every tree module it imports, transitively
+    (e.g. framework_constants.py),
+  - the interpreter version and the installed sympy/numpy/scipy/mpmath
+    versions.
+
+If the key is unchanged the stored result (parsed tests + captured output)
+is replayed instead of re-running the script. Only PASS/FAIL verdicts are
+cached; ERROR and TIMEOUT depend on the machine and are always re-run.
+
+Usage:
+  from suite_cache import ResultCache
+  cache = ResultCache()
+  hit = cache.get("alpha_ccwz_one_loop.py")     # ScriptResult or None
+  cache.put(result)
+
+  python suite_cache.py --stats                 # entries / stale entries
+  python suite_cache.py --clear
+"""
+
+import argparse
+import ast
+import hashlib
+import json
+import platform
+import re
+import sys
+from functools import lru_cache
+from importlib import metadata
+from pathlib import Path
+from typing import Dict, List, Optional, Set
+
+from suite_runner import SCRIPT_DIR, STATE_DIR, ScriptResult
+
+CACHE_DIR = STATE_DIR / "cache"
+CACHEABLE = ("PASS", "FAIL")
+LIBRARIES = ("sympy", "numpy", "scipy", "mpmath", "matplotlib")
+
+# Fallback for sources ast cannot parse: line-anchored import statements,
+# "from a.b import c" and "import a, b.c as d".
+IMPORT_LINE = re.compile(r"^[ \t]*(?:from[ \t]+([A-Za-z_][\w.]*)[ \t]+import\b"
+                         r"|import[ \t]+([^\n#;]+))", re.MULTILINE)
+
+
+@lru_cache(maxsize=None)
+def environment_fingerprint() -> str:
+    parts = [platform.python_implementation(), platform.python_version()]
+    for lib in LIBRARIES:
+        try:
+            parts.append(f"{lib}={metadata.version(lib)}")
+        except metadata.PackageNotFoundError:
+            parts.append(f"{lib}=-")
+    return ";".join(parts)
+
+
+@lru_cache(maxsize=None)
+def imported_modules(script: str) -> frozenset:
+    """Dotted names of every absolute import in `script` (shared with suite_forkserver).
+
+    Walks the ast, so imports inside strings and docstrings are not counted;
+    the IMPORT_LINE regex is used only if the source does not parse.
+    """
+    source = (SCRIPT_DIR / script).read_bytes()
+    try:
+        tree = ast.parse(source)
+    except (SyntaxError, ValueError):
+        found = set()
+        for from_mod, names in IMPORT_LINE.findall(source.decode("utf-8", errors="replace")):
+            if from_mod:
+                found.add(from_mod)
+            else:
+                found.update(part.split()[0] for part in names.split(",") if part.strip())
+        return frozenset(found)
+    found = set()
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            found.update(a.name for a in node.names)
+        elif isinstance(node, ast.ImportFrom) and node.module and node.level == 0:
+            found.add(node.module)
+    return frozenset(found)
+
+
+@lru_cache(maxsize=None)
+def tree_imports(script: str) -> frozenset:
+    """Names of modules in verification/sympy imported directly by `script`."""
+    found = set()
+    for m in {name.split(".")[0] for name in imported_modules(script)}:
+        if f"{m}.py" != script and (SCRIPT_DIR / f"{m}.py").exists():
+            found.add(f"{m}.py")
+    return frozenset(found)
+
+
+def import_closure(script: str) -> List[str]:
+    """`script` plus every tree module it reaches through imports, sorted."""
+    seen: Set[str] = set()
+    stack = [script]
+    while stack:
+        s = stack.pop()
+        if s in seen:
+            continue
+        seen.add(s)
+        stack.extend(tree_imports(s))
+    return sorted(seen)
+
+
+def cache_key(script: str) -> str:
+    h = hashlib.sha256(environment_fingerprint().encode())
+    for name in import_closure(script):
+        h.update(name.encode() + b"\0")
+        h.update((SCRIPT_DIR / name).read_bytes())
+        h.update(b"\0")
+    return h.hexdigest()
+
+
+class ResultCache:
+    """On-disk map script -> (key, ScriptResult), one JSON file per script."""
+
+    def __init__(self, directory: Path = CACHE_DIR):
+        self.directory = Path(directory)
+        self._keys: Dict[str, str] = {}
+
+    def key(self, script: str) -> str:
+        if script not in self._keys:
+            self._keys[script] = cache_key(script)
+        return self._keys[script]
+
+    def _path(self, script: str) -> Path:
+        return self.directory / f"{script}.json"
+
+    def get(self, script: str) -> Optional[ScriptResult]:
+        path = self._path(script)
+        if not path.exists():
+            return None
+        try:
+            entry = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+        if entry.get("key") != self.key(script):
+            return None
+        result = ScriptResult.from_dict(entry["result"])
+        result.cached = True
+        return result
+
+    def put(self, result: ScriptResult) -> None:
+        if result.status not in CACHEABLE or result.cached:
+            return
+        self.directory.mkdir(parents=True, exist_ok=True)
+        entry = {"key": self.key(result.script), "result": result.to_dict()}
+        self._path(result.script).write_text(json.dumps(entry), encoding="utf-8")
+
+    def stats(self) -> dict:
+        entries = sorted(self.directory.glob("*.py.json")) if self.directory.exists() else []
+        stale = 0
+        for p in entries:
+            script = p.name[:-len(".json")]
+            if not (SCRIPT_DIR / script).exists() or self.get(script) is None:
+                stale += 1
+        return {"entries": len(entries), "stale": stale}
+
+    def clear(self) -> int:
+        n = 0
+        if self.directory.exists():
+            for p in self.directory.glob("*.py.json"):
+                p.unlink()
+                n += 1
+        return n
+
+
+def main(argv=None) -> int:
+    p = argparse.ArgumentParser(description="Inspect the suite result cache.")
+    p.add_argument("--stats", action="store_true")
+    p.add_argument("--clear", action="store_true")
+    args = p.parse_args(argv)
+    cache = ResultCache()
+    if args.clear:
+        print(f"Removed {cache.clear()} cache entries")
+    else:
+        s = cache.stats()
+        print(f"Cache: {s['entries']} entries, {s['stale']} stale")
+        print(f"Environment: {environment_fingerprint()}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,224 @@
+#!/usr/bin/env python3
+"""
+Dependency-Aware Incremental Re-verification
+============================================
+
+Builds the script dependency DAG from the "Depends on:" blocks in script
+docstrings, e.g.
+
+    Depends on:
+    - [D] alpha_ccwz_setup.py (Phase 1, S337)
+    - [D] alpha_em_index_density.py (S272)
+
+plus direct imports of tree modules (framework_constants.py). Given a set of
+changed files it computes the downstream closure -- every script that leans
+on a changed one, directly or transitively -- and re-runs exactly that set in
+topological waves, each wave in parallel through suite_runner.
+
+Edges point upstream -> downstream. Citations of scripts that no longer
+exist (moved to quarantined/ or archive/) are ignored. Docstring cycles are
+reported and their members run together in a final wave.
+
+Usage:
+  python suite_deps.py --changed alpha_ccwz_setup.py   # re-verify downstream
+  python suite_deps.py --git HEAD~1                    # files changed since rev
+  python suite_deps.py --changed X.py --dry-run        # print waves only
+  python suite_deps.py --stats                         # graph summary
+
+Reports go to .suite/deps_report.{txt,json}, never to the full-suite report.
+"""
+
+import argparse
+import re
+import subprocess
+import sys
+from collections import defaultdict
+from pathlib import Path
+from typing import Dict, Iterable, List, Set, Tuple
+
+from suite_runner import (SCRIPT_DIR, STATE_DIR, DEFAULT_TIMEOUT, discover_libs,
+                          discover_scripts, run_suite, write_report, format_report)
+from suite_cache import ResultCache, tree_imports
+
+# An incremental run covers only the affected waves, so it must not replace
+# the full-suite report (.suite/report.*) that suite_shard.py merges and
+# suite_website_index.py publishes from.
+DEPS_REPORT_TXT = STATE_DIR / "deps_report.txt"
+
+# The header is the first triple-quoted string; in some scripts it follows
+# the sys.stdout rebinding, so it is not always the ast docstring.
+HEADER = re.compile(r'(?s)("""|\'\'\')(.*?)\1')
+DEPENDS_HEADER = re.compile(r"^\s*Depends on\s*:(.*)$", re.IGNORECASE)
+# A new docstring field ("Created: ...", "Status: ...") ends the block.
+FIELD_LINE = re.compile(r"^[A-Z][A-Za-z _/-]*:")
+SCRIPT_REF = re.compile(r"([A-Za-z0-9_]+\.py)\b")
+
+
+# ==============================================================================
+# PARSING
+# ==============================================================================
+
+def header_text(script: str) -> str:
+    source = (SCRIPT_DIR / script).read_text(encoding="utf-8", errors="replace")
+    m = HEADER.search(source)
+    return m.group(2) if m else ""
+
+
+def depends_block(docstring: str) -> List[str]:
+    """Lines of the "Depends on:" block (header remainder included)."""
+    lines = docstring.splitlines()
+    for i, line in enumerate(lines):
+        m = DEPENDS_HEADER.match(line)
+        if not m:
+            continue
+        block = [m.group(1)]
+        for nxt in lines[i + 1:]:
+            if not nxt.strip() or FIELD_LINE.match(nxt):
+                break
+            block.append(nxt)
+        return block
+    return []
+
+
+def declared_dependencies(script: str, known: Set[str]) -> Set[str]:
+    """Upstream scripts named in `script`'s header "Depends on:" block."""
+    refs = set()
+    for line in depends_block(header_text(script)):
+        refs.update(SCRIPT_REF.findall(line))
+    return {r for r in refs if r in known and r != script}
+
+
+def build_graph(scripts: Iterable[str] = None) -> Dict[str, Set[str]]:
+    """Map script -> set of upstream scripts (declared + imported)."""
+    scripts = list(scripts) if scripts is not None else discover_scripts() + discover_libs()
+    known = set(scripts)
+    return {s: declared_dependencies(s, known) | (set(tree_imports(s)) & known)
+            for s in scripts}
+
+
+def downstream_map(graph: Dict[str, Set[str]]) -> Dict[str, Set[str]]:
+    down = defaultdict(set)
+    for s, ups in graph.items():
+        for u in ups:
+            down[u].add(s)
+    return down
+
+
+# ==============================================================================
+# CLOSURE AND WAVES
+# ==============================================================================
+
+def downstream_closure(graph: Dict[str, Set[str]], changed: Iterable[str]) -> Set[str]:
+    """Changed scripts plus everything that depends on them, transitively."""
+    down = downstream_map(graph)
+    seen: Set[str] = set()
+    stack = [c for c in changed if c in graph]
+    while stack:
+        s = stack.pop()
+        if s in seen:
+            continue
+        seen.add(s)
+        stack.extend(down.get(s, ()))
+    return seen
+
+
+def topological_waves(graph: Dict[str, Set[str]],
+                      subset: Set[str]) -> Tuple[List[List[str]], List[str]]:
+    """Kahn layering of `subset`; returns (waves, scripts left on cycles).
+
+    Upstream scripts outside `subset` are treated as already verified.
+    """
+    pending = {s: graph[s] & subset for s in subset}
+    waves = []
+    while pending:
+        ready = sorted(s for s, ups in pending.items() if not ups)
+        if not ready:
+            break
+        waves.append(ready)
+        for s in ready:
+            del pending[s]
+        done = set(ready)
+        for s in pending:
+            pending[s] = pending[s] - done
+    cyclic = sorted(pending)
+    if cyclic:
+        waves.append(cyclic)
+    return waves, cyclic
+
+
+def git_changed(rev: str) -> List[str]:
+    """Scripts in verification/sympy changed since `rev`, plus untracked ones."""
+    def git(*args):
+        out = subprocess.run(["git", *args], cwd=SCRIPT_DIR, capture_output=True,
+                             text=True, check=True).stdout
+        return [l for l in out.splitlines() if l]
+    files = git("diff", "--name-only", "--relative", rev, "--", ".")
+    files += git("ls-files", "--others", "--exclude-standard", "--", ".")
+    return sorted({Path(f).name for f in files if "/" not in f})
+
+
+# ==============================================================================
+# CLI
+# ==============================================================================
+
+def main(argv=None) -> int:
+    p = argparse.ArgumentParser(description="Re-verify scripts downstream of a change.")
+    p.add_argument("--changed", nargs="*", default=[], help="changed script names")
+    p.add_argument("--git", metavar="REV", help="take changed scripts from git diff REV")
+    p.add_argument("--dry-run", action="store_true", help="print waves without running")
+    p.add_argument("--stats", action="store_true", help="print graph summary and exit")
+    p.add_argument("-j", "--jobs", type=int, default=None)
+    p.add_argument("--timeout", type=float, default=DEFAULT_TIMEOUT)
+    p.add_argument("--report", type=Path, default=DEPS_REPORT_TXT,
+                   help="text report path (JSON written alongside; default "
+                        "keeps the full-suite report untouched)")
+    args = p.parse_args(argv)
+
+    graph = build_graph()
+    if args.stats:
+        n_edges = sum(len(v) for v in graph.values())
+        with_deps = sum(1 for v in graph.values() if v)
+        print(f"Scripts: {len(graph)}, with upstream deps: {with_deps}, edges: {n_edges}")
+        reach = {s: len(downstream_closure(graph, [s])) - 1 for s in graph}
+        print("Most depended-on:")
+        for s in sorted(reach, key=lambda s: (-reach[s], s))[:10]:
+            print(f"  {reach[s]:>4} downstream  {s}")
+        return 0
+
+    changed = [Path(c).name for c in args.changed]
+    if args.git:
+        changed += git_changed(args.git)
+    targets = downstream_closure(graph, changed)
+    if not targets:
+        print("No verification scripts affected.")
+        return 0
+    waves, cyclic = topological_waves(graph, targets)
+    print(f"Changed: {', '.join(sorted(set(changed) & set(graph)))}")
+    print(f"Re-verifying {len(targets)} scripts in {len(waves)} waves")
+    if cyclic:
+        print(f"  WARNING: dependency cycle among {len(cyclic)} scripts: "
+              f"{', '.join(cyclic)}")
+    for i, wave in enumerate(waves, 1):
+        print(f"  Wave {i}: {', '.join(wave)}")
+    if args.dry_run:
+        return 0
+
+    # Docstring dependencies are semantic, not imports, so downstream scripts
+    # keep their cache key: bypass the cache for reads, refresh it on write.
+    cache = ResultCache()
+    results = []
+    for i, wave in enumerate(waves, 1):
+        print(f"\n--- Wave {i}/{len(waves)} ({len(wave)} scripts) ---")
+        wave_results = run_suite(wave, args.jobs, args.timeout)
+        for r in wave_results:
+            cache.put(r)
+        results.extend(wave_results)
+    results.sort(key=lambda r: r.script)
+    write_report(results, args.report, args.report.with_suffix(".json"))
+    print()
+    print(format_report(results))
+    return 0 if all(r.status == "PASS" for r in results) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
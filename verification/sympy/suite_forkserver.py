@@ -0,0 +1,269 @@
+#!/usr/bin/env python3
+"""
+Warm Fork Execution Mode for the Verification Suite
+===================================================
+
+443 scripts start with `from sympy import *` and many also import numpy and
+scipy.integrate. A cold interpreter pays ~0.5-0.7 s for those imports before
+the first line of physics runs. In fork mode the runner process imports them
+once and forks a child per script, so every child starts with the libraries
+already in sys.modules.
+
+Each child is reset to look like a fresh interpreter:
+  - fds 1/2 go to the script's capture file, stdin to /dev/null;
+  - sys.stdout/sys.stderr are new UTF-8 TextIOWrappers over fd 1/2 (the same
+    shape the `sys.stdout = io.TextIOWrapper(sys.stdout.buffer, ...)` line in
+    65 scripts expects), and sys.__stdout__/__stderr__ point at them;
+  - cwd, sys.argv and sys.path[0] are those of `python script.py`;
+  - random and numpy.random are reseeded from os.urandom, since a forked
+    child would otherwise inherit the parent's generator state.
+
+The parent is single-threaded (fork and threads do not mix): it keeps up to
+`jobs` children alive, reaps them with waitpid and kills any that exceed the
+timeout. The startup time saved per script is estimated as the cold
+interpreter start plus the measured import cost of the preloaded modules the
+script actually imports.
+
+POSIX only; on platforms without os.fork the runner falls back to fresh
+interpreters.
+
+Usage:
+  python suite_runner.py --fork                 # whole suite in fork mode
+  python suite_forkserver.py --costs            # show measured import costs
+"""
+
+import argparse
+import io
+import os
+import random
+import runpy
+import signal
+import subprocess
+import sys
+import tempfile
+import time
+import traceback
+from importlib import import_module
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+import suite_results
+from suite_cache import imported_modules
+from suite_runner import (SCRIPT_DIR, ScriptResult, child_env, make_result,
+                          results_file)
+
+# Preloaded in this order; each entry lists the entries it pulls in, so the
+# incremental cost measured for it excludes theirs.
+PRELOAD: List[Tuple[str, Tuple[str, ...]]] = [
+    ("mpmath", ()),
+    ("numpy", ()),
+    ("numpy.linalg", ("numpy",)),
+    ("sympy", ("mpmath",)),
+    ("scipy", ("numpy",)),
+    ("scipy.linalg", ("scipy", "numpy")),
+    ("scipy.special", ("scipy", "numpy")),
+    ("scipy.integrate", ("scipy", "scipy.linalg", "scipy.special", "numpy")),
+    ("scipy.optimize", ("scipy", "scipy.linalg", "scipy.special", "numpy")),
+]
+
+POLL_INTERVAL = 0.01  # seconds between waitpid sweeps
+
+
+# ==============================================================================
+# WARM PARENT
+# ==============================================================================
+
+_import_costs: Dict[str, float] = {}
+_cold_start: Optional[float] = None
+
+
+def preload() -> Dict[str, float]:
+    """Import the PRELOAD modules once; return incremental import seconds."""
+    if not _import_costs:
+        for name, _ in PRELOAD:
+            t0 = time.perf_counter()
+            try:
+                import_module(name)
+            except ImportError:
+                continue
+            _import_costs[name] = time.perf_counter() - t0
+    return _import_costs
+
+
+def cold_start() -> float:
+    """Bare interpreter start-up, measured once."""
+    global _cold_start
+    if _cold_start is None:
+        t0 = time.perf_counter()
+        subprocess.run([sys.executable, "-c", "pass"], check=False)
+        _cold_start = time.perf_counter() - t0
+    return _cold_start
+
+
+def startup_saved(script: str) -> float:
+    """Estimated seconds a cold interpreter would spend before `script` runs."""
+    imported = imported_modules(script)
+    prereqs = dict(PRELOAD)
+    needed = set()
+    for name in _import_costs:
+        if any(n == name or n.startswith(name + ".") for n in imported):
+            needed.add(name)
+            needed.update(prereqs[name])
+    return cold_start() + sum(_import_costs.get(n, 0.0) for n in needed)
+
+
+# ==============================================================================
+# CHILD
+# ==============================================================================
+
+def _child(script: str, capture_path: str, results_path: str,
+           profile_path: Optional[str]) -> None:
+    """Runs in the forked child; never returns."""
+    code = 1
+    profiler = None
+    try:
+        env = child_env(results_path)
+        fd = os.open(capture_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        os.dup2(fd, 1)
+        os.dup2(fd, 2)
+        os.close(fd)
+        null = os.open(os.devnull, os.O_RDONLY)
+        os.dup2(null, 0)
+        os.close(null)
+        sys.stdout = sys.__stdout__ = io.open(1, "w", encoding="utf-8",
+                                              errors="replace", closefd=False)
+        sys.stderr = sys.__stderr__ = io.open(2, "w", encoding="utf-8",
+                                              errors="replace", closefd=False)
+        sys.stdin = sys.__stdin__ = io.open(0, "r", closefd=False)
+        os.environ.clear()
+        os.environ.update(env)
+        suite_results.reset()
+        os.chdir(SCRIPT_DIR)
+        sys.argv = [script]
+        sys.path[0] = str(SCRIPT_DIR)
+        random.seed()
+        if "numpy" in sys.modules:
+            sys.modules["numpy"].random.seed()
+        signal.signal(signal.SIGINT, signal.SIG_DFL)
+        if profile_path:
+            from suite_profile import SectionProfiler
+            profiler = SectionProfiler(profile_path)
+            profiler.install()
+        try:
+            runpy.run_path(script, run_name="__main__")
+            code = 0
+        except SystemExit as exc:
+            if exc.code is None:
+                code = 0
+            elif isinstance(exc.code, int):
+                code = exc.code
+            else:
+                print(exc.code, file=sys.stderr)
+                code = 1
+        except BaseException:
+            traceback.print_exc()
+            code = 1
+    finally:
+        if profiler is not None:
+            try:
+                profiler.finish()
+            except Exception:
+                pass
+        for stream in (sys.stdout, sys.stderr, sys.__stdout__, sys.__stderr__):
+            try:
+                stream.flush()
+            except Exception:
+                pass
+        os._exit(code)
+
+
+# ==============================================================================
+# EXECUTOR
+# ==============================================================================
+
+def execute_forked(order: List[str], jobs: int, timeout: float, on_result,
+                   profile: bool = False) -> None:
+    """suite_runner executor: fork one warm child per script, `jobs` at a time.
+
+    With profile=True each child runs under suite_profile.SectionProfiler.
+    """
+    if profile:
+        import suite_profile   # imported before forking, not once per child
+    preload()
+    cold_start()
+    queue = list(order)
+    # pid -> (script, capture path, results path, profile path, t0)
+    running: Dict[int, Tuple[str, str, str, Optional[str], float]] = {}
+    with tempfile.TemporaryDirectory(prefix="suite_fork_") as tmp:
+        while queue or running:
+            while queue and len(running) < jobs:
+                script = queue.pop(0)
+                path = os.path.join(tmp, script + ".out")
+                rpath = results_file(script)
+                ppath = suite_profile.profile_file(script) if profile else None
+                sys.stdout.flush()
+                sys.stderr.flush()
+                t0 = time.perf_counter()
+                pid = os.fork()
+                if pid == 0:
+                    _child(script, path, rpath, ppath)
+                running[pid] = (script, path, rpath, ppath, t0)
+
+            pid, status = os.waitpid(-1, os.WNOHANG)
+            if pid == 0:
+                now = time.perf_counter()
+                for p, (script, path, rpath, ppath, t0) in list(running.items()):
+                    if now - t0 > timeout:
+                        os.kill(p, signal.SIGKILL)
+                        os.waitpid(p, 0)
+                        del running[p]
+                        on_result(_collect(script, path, rpath, ppath, None,
+                                           now - t0, True))
+                time.sleep(POLL_INTERVAL)
+                continue
+            if pid not in running:
+                continue
+            script, path, rpath, ppath, t0 = running.pop(pid)
+            code = os.waitstatus_to_exitcode(status)
+            on_result(_collect(script, path, rpath, ppath, code,
+                               time.perf_counter() - t0, False))
+
+
+def _collect(script: str, path: str, rpath: str, ppath: Optional[str],
+             code: Optional[int], elapsed: float, timed_out: bool) -> ScriptResult:
+    try:
+        output = Path(path).read_bytes().decode("utf-8", errors="replace")
+    except OSError:
+        output = ""
+    profile = None
+    if ppath:
+        from suite_profile import load_profile
+        profile = load_profile(ppath)
+    return make_result(script, output, code, elapsed, timed_out, rpath,
+                       startup_saved=round(startup_saved(script), 3),
+                       profile=profile)
+
+
+def available() -> bool:
+    return hasattr(os, "fork")
+
+
+def main(argv=None) -> int:
+    p = argparse.ArgumentParser(description="Warm fork execution mode.")
+    p.add_argument("--costs", action="store_true",
+                   help="measure and print preload import costs")
+    args = p.parse_args(argv)
+    if not args.costs:
+        p.print_help()
+        return 0
+    costs = preload()
+    print(f"  cold interpreter start: {cold_start() * 1000:8.1f} ms")
+    for name, _ in PRELOAD:
+        if name in costs:
+            print(f"  {name:<22}  {costs[name] * 1000:8.1f} ms")
+    print(f"  total preload:          {sum(costs.values()) * 1000:8.1f} ms")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,365 @@
+#!/usr/bin/env python3
+"""
+Per-Script and Per-PART Profiling for the Verification Suite
+============================================================
+
+Profiling mode records, for every script and for every "PART n" section it
+prints:
+  - wall time and CPU time (user + system),
+  - peak RSS (ru_maxrss; in --fork mode this includes the pages the child
+    shares with the warm parent),
+  - SymPy cache size (sum of currsize over sympy.core.cache.CACHE).
+
+Sections are delimited by the script's own headers: a print() whose text
+starts with "PART <n>" opens a new section. The hook wraps builtins.print,
+so it costs one string test per print and needs no change to the scripts.
+Code before the first header is the "(preamble)" section.
+
+Each profiled run is appended to .suite/profile_history.jsonl. The
+leaderboard ranks the latest run; regressions compare it with the previous
+run in the same execution mode.
+
+Usage:
+  python suite_runner.py --profile              # run suite, record profile
+  python suite_profile.py --leaderboard -n 25   # top scripts by wall time
+  python suite_profile.py --leaderboard --sort rss
+  python suite_profile.py --sections coleman_weinberg_so11.py
+  python suite_profile.py --regressions         # latest vs previous run
+"""
+
+import argparse
+import builtins
+import json
+import os
+import re
+import runpy
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import Dict, List, Optional
+
+try:
+    import resource
+except ImportError:          # Windows: no getrusage, RSS is reported as None
+    resource = None
+
+from suite_runner import (SCRIPT_DIR, STATE_DIR, DEFAULT_TIMEOUT, ScriptResult,
+                          child_env, make_result, results_file)
+
+ENV_VAR = "VERIFY_PROFILE"
+HISTORY_FILE = STATE_DIR / "profile_history.jsonl"
+PART_HEADER = re.compile(r"^PART\s+[0-9IVXLC]+[A-Za-z]?\b")
+
+# Regression thresholds: both the relative and the absolute change must be
+# exceeded, so millisecond jitter on tiny scripts is not flagged.
+REGRESSION_RATIO = 1.25
+REGRESSION_MIN_SECONDS = 0.5
+REGRESSION_MIN_RSS_KB = 50 * 1024
+
+SORT_KEYS = {"wall": "wall", "cpu": "cpu", "rss": "peak_rss_kb",
+             "cache": "sympy_cache"}
+
+
+# ==============================================================================
+# IN-CHILD SAMPLING
+# ==============================================================================
+
+def _cpu() -> float:
+    t = os.times()
+    return t.user + t.system
+
+
+def _peak_rss_kb() -> Optional[int]:
+    if resource is None:
+        return None
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return rss // 1024 if sys.platform == "darwin" else rss   # macOS: bytes
+
+
+def _sympy_cache_size() -> Optional[int]:
+    cache_mod = sys.modules.get("sympy.core.cache")
+    if cache_mod is None:
+        return None
+    total = 0
+    for f in cache_mod.CACHE:
+        try:
+            total += f.cache_info().currsize
+        except AttributeError:
+            pass
+    return total
+
+
+def _snapshot() -> dict:
+    return {"t": time.perf_counter(), "cpu": _cpu(), "peak_rss_kb": _peak_rss_kb(),
+            "sympy_cache": _sympy_cache_size()}
+
+
+class SectionProfiler:
+    """Splits a script run into PART sections by watching its print() calls."""
+
+    def __init__(self, path: str):
+        self.path = path
+        self.start = _snapshot()
+        self.marks = [("(preamble)", self.start)]
+        self._print = builtins.print
+
+    def install(self) -> None:
+        original = self._print
+
+        def print_hook(*args, **kwargs):
+            if args and isinstance(args[0], str):
+                text = args[0].lstrip()
+                if text.startswith("PART") and PART_HEADER.match(text):
+                    self.marks.append((text.splitlines()[0][:80], _snapshot()))
+            return original(*args, **kwargs)
+
+        builtins.print = print_hook
+
+    def finish(self) -> dict:
+        end = _snapshot()
+        builtins.print = self._print
+        sections = []
+        bounds = self.marks + [(None, end)]
+        for (name, a), (_, b) in zip(bounds, bounds[1:]):
+            if name == "(preamble)" and b["t"] - a["t"] < 1e-3 and len(self.marks) > 1:
+                continue
+            sections.append({"name": name, "wall": round(b["t"] - a["t"], 4),
+                             "cpu": round(b["cpu"] - a["cpu"], 4),
+                             "peak_rss_kb": b["peak_rss_kb"],
+                             "sympy_cache": b["sympy_cache"]})
+        profile = {"wall": round(end["t"] - self.start["t"], 4),
+                   "cpu": round(end["cpu"] - self.start["cpu"], 4),
+                   "peak_rss_kb": end["peak_rss_kb"],
+                   "sympy_cache": end["sympy_cache"],
+                   "sections": sections}
+        with open(self.path, "w", encoding="utf-8") as f:
+            json.dump(profile, f)
+        return profile
+
+
+def run_child(script: str) -> int:
+    """`python suite_profile.py --child script.py`: run script under the hook."""
+    profiler = SectionProfiler(os.environ[ENV_VAR])
+    sys.argv = [script]
+    sys.path[0] = str(SCRIPT_DIR)
+    profiler.install()
+    try:
+        runpy.run_path(script, run_name="__main__")
+        code = 0
+    except SystemExit as exc:
+        code = exc.code if isinstance(exc.code, int) else (0 if exc.code is None else 1)
+        if not isinstance(exc.code, (int, type(None))):
+            print(exc.code, file=sys.stderr)
+    finally:
+        profiler.finish()
+    return code
+
+
+# ==============================================================================
+# RUNNER INTEGRATION
+# ==============================================================================
+
+def profile_file(script: str) -> str:
+    return results_file(script)[:-len(".jsonl")] + ".profile.json"
+
+
+def load_profile(path: str) -> Optional[dict]:
+    try:
+        with open(path, encoding="utf-8") as f:
+            profile = json.load(f)
+    except (OSError, ValueError):
+        return None
+    finally:
+        try:
+            os.unlink(path)
+        except OSError:
+            pass
+    return profile
+
+
+def run_script_profiled(script: str, timeout: float = DEFAULT_TIMEOUT) -> ScriptResult:
+    """suite_runner runner: fresh interpreter wrapped in the section profiler."""
+    rpath = results_file(script)
+    ppath = profile_file(script)
+    env = child_env(rpath)
+    env[ENV_VAR] = ppath
+    t0 = time.perf_counter()
+    cmd = [sys.executable, str(SCRIPT_DIR / "suite_profile.py"), "--child", script]
+    try:
+        proc = subprocess.run(cmd, cwd=SCRIPT_DIR, env=env, stdin=subprocess.DEVNULL,
+                              stdout=subprocess.PIPE, stderr=subprocess.STDOUT,
+                              timeout=timeout)
+        output, code, timed_out = proc.stdout, proc.returncode, False
+    except subprocess.TimeoutExpired as exc:
+        output, code, timed_out = exc.output or b"", None, True
+    return make_result(script, output.decode("utf-8", errors="replace"), code,
+                       time.perf_counter() - t0, timed_out, rpath,
+                       profile=load_profile(ppath))
+
+
+def git_revision() -> Optional[str]:
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=SCRIPT_DIR,
+                              capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def append_history(results: List[ScriptResult], mode: str = "subprocess") -> None:
+    profiles = {}
+    for r in results:
+        if r.cached or r.profile is None:
+            continue
+        profiles[r.script] = dict(r.profile, elapsed=round(r.elapsed, 4),
+                                  status=r.status)
+    if not profiles:
+        return
+    STATE_DIR.mkdir(exist_ok=True)
+    entry = {"timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"), "git": git_revision(),
+             "mode": mode, "profiles": profiles}
+    with open(HISTORY_FILE, "a", encoding="utf-8") as f:
+        f.write(json.dumps(entry) + "\n")
+
+
+def load_history(mode: Optional[str] = "latest") -> List[dict]:
+    """Profiled runs, oldest first.
+
+    Fork-mode numbers exclude interpreter start-up and include the warm
+    parent's pages, so runs are only compared within one mode: by default
+    that of the most recent run.
+    """
+    if not HISTORY_FILE.exists():
+        return []
+    with open(HISTORY_FILE, encoding="utf-8") as f:
+        history = [json.loads(line) for line in f if line.strip()]
+    if mode == "latest" and history:
+        mode = history[-1].get("mode")
+    if mode is not None:
+        history = [e for e in history if e.get("mode") == mode]
+    return history
+
+
+def merged_latest(history: List[dict], back: int = 0) -> Dict[str, dict]:
+    """Latest profile per script as of run len(history)-1-back.
+
+    Partial runs (a glob, an incremental re-check) only refresh the scripts
+    they touched, so each script keeps its most recent measurement.
+    """
+    merged: Dict[str, dict] = {}
+    for entry in history[:len(history) - back]:
+        merged.update(entry["profiles"])
+    return merged
+
+
+# ==============================================================================
+# REPORTS
+# ==============================================================================
+
+def _fmt_rss(kb: Optional[int]) -> str:
+    return "-" if kb is None else f"{kb / 1024:.0f} MB"
+
+
+def leaderboard(profiles: Dict[str, dict], sort: str = "wall", n: int = 20) -> str:
+    key = SORT_KEYS[sort]
+    ranked = sorted(profiles.items(), key=lambda kv: -(kv[1].get(key) or 0))[:n]
+    total_wall = sum(p.get("wall") or 0 for p in profiles.values())
+    lines = [f"{'#':>3}  {'script':<46} {'wall':>8} {'cpu':>8} {'peak RSS':>9} "
+             f"{'sympy$':>7}  heaviest PART"]
+    for i, (script, p) in enumerate(ranked, 1):
+        heavy = max(p.get("sections") or [{"name": "-", "wall": 0}],
+                    key=lambda s: s["wall"])
+        lines.append(f"{i:>3}  {script:<46} {p['wall']:>7.2f}s {p['cpu']:>7.2f}s "
+                     f"{_fmt_rss(p.get('peak_rss_kb')):>9} "
+                     f"{p.get('sympy_cache') or 0:>7}  "
+                     f"{heavy['name'][:32]} ({heavy['wall']:.2f}s)")
+    shown = sum(p.get("wall") or 0 for _, p in ranked)
+    if total_wall:
+        lines.append(f"  top {len(ranked)} = {shown:.1f}s of {total_wall:.1f}s "
+                     f"profiled wall time ({100 * shown / total_wall:.0f}%)")
+    return "\n".join(lines)
+
+
+def sections_table(script: str, profile: dict) -> str:
+    lines = [f"{script}: {profile['wall']:.2f}s wall, {profile['cpu']:.2f}s cpu, "
+             f"{_fmt_rss(profile.get('peak_rss_kb'))} peak",
+             f"  {'section':<60} {'wall':>8} {'cpu':>8} {'RSS':>8} {'sympy$':>7}"]
+    for s in profile.get("sections", []):
+        lines.append(f"  {s['name'][:60]:<60} {s['wall']:>7.2f}s {s['cpu']:>7.2f}s "
+                     f"{_fmt_rss(s.get('peak_rss_kb')):>8} {s.get('sympy_cache') or 0:>7}")
+    return "\n".join(lines)
+
+
+def regressions(history: List[dict]) -> List[str]:
+    """Scripts slower or heavier in the latest run than in the one before."""
+    if len(history) < 2:
+        return []
+    latest = history[-1]["profiles"]
+    before = merged_latest(history, back=1)
+    out = []
+    for script, p in sorted(latest.items()):
+        q = before.get(script)
+        if not q:
+            continue
+        if (p["wall"] > REGRESSION_RATIO * q["wall"]
+                and p["wall"] - q["wall"] > REGRESSION_MIN_SECONDS):
+            out.append(f"  [SLOWER] {script}: {q['wall']:.2f}s -> {p['wall']:.2f}s")
+        rss_p, rss_q = p.get("peak_rss_kb"), q.get("peak_rss_kb")
+        if (rss_p and rss_q and rss_p > REGRESSION_RATIO * rss_q
+                and rss_p - rss_q > REGRESSION_MIN_RSS_KB):
+            out.append(f"  [HEAVIER] {script}: {_fmt_rss(rss_q)} -> {_fmt_rss(rss_p)}")
+    return out
+
+
+def print_run_summary(n: int = 20) -> None:
+    history = load_history()
+    if not history:
+        return
+    print()
+    print("=" * 70)
+    print("PROFILE LEADERBOARD (wall time)")
+    print("=" * 70)
+    print(leaderboard(merged_latest(history), "wall", n))
+    regs = regressions(history)
+    print(f"\nRegressions vs previous run: {len(regs)}")
+    for line in regs:
+        print(line)
+
+
+def main(argv=None) -> int:
+    p = argparse.ArgumentParser(description="Verification suite profiling reports.")
+    p.add_argument("--child", metavar="SCRIPT", help=argparse.SUPPRESS)
+    p.add_argument("--leaderboard", action="store_true")
+    p.add_argument("--sort", choices=sorted(SORT_KEYS), default="wall")
+    p.add_argument("-n", type=int, default=20)
+    p.add_argument("--sections", metavar="SCRIPT", help="per-PART table for a script")
+    p.add_argument("--regressions", action="store_true")
+    p.add_argument("--mode", choices=["subprocess", "fork"],
+                   help="history to report on (default: mode of the latest run)")
+    args = p.parse_args(argv)
+
+    if args.child:
+        return run_child(args.child)
+    history = load_history(args.mode or "latest")
+    if not history:
+        print("No profile history; run: python suite_runner.py --profile")
+        return 1
+    latest = merged_latest(history)
+    if args.sections:
+        name = Path(args.sections).name
+        if name not in latest:
+            print(f"No profile recorded for {name}")
+            return 1
+        print(sections_table(name, latest[name]))
+    if args.regressions:
+        regs = regressions(history)
+        print(f"Regressions vs previous run: {len(regs)}")
+        for line in regs:
+            print(line)
+    if args.leaderboard or not (args.sections or args.regressions):
+        print(leaderboard(latest, args.sort, args.n))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+"""
+Structured Test-Result Collector
+================================
+
+One sink for the per-script result helpers (check(), test(), record_test(),
+tuple lists). Each call appends one JSON line:
+
+  {"script": "alpha_ccwz_one_loop.py", "index": 3, "name": "...",
+   "status": "PASS", "predicted": 137.036, "measured": 137.035999177,
+   "tolerance": 4.2e-08, "elapsed": 0.0123, "detail": ""}
+
+`elapsed` is the wall time since the previous record (or since this module
+was imported for the first record).
+
+Records go to the file named by $VERIFY_RESULTS, which suite_runner.py sets
+per script. When it is unset (a script run by hand) record() only returns
+the verdict, so scripts keep printing exactly what they printed before and
+pay one dict lookup per test.
+
+Usage (inside a script's existing helper):
+  from suite_results import record
+
+  def check(name, condition, detail=""):
+      ...
+      record(name, condition, detail=detail)
+
+  record("1/alpha", passed, predicted=pred, measured=meas, tolerance=2*unc)
+  record("Omega_b h^2", None, predicted=x)          # INFO, not a test
+  record_all([("N_I = 137", N_I == 137), ...])       # (name, passed) tuples
+"""
+
+import json
+import os
+import sys
+import time
+
+ENV_VAR = "VERIFY_RESULTS"
+STATUSES = ("PASS", "FAIL", "INFO")
+
+_sink = None
+_index = 0
+_last = time.perf_counter()
+
+
+def _open_sink():
+    global _sink
+    path = os.environ.get(ENV_VAR)
+    if path:
+        # Line-buffered: every record reaches disk even if the script is
+        # killed on timeout or leaves through os._exit (fork mode).
+        _sink = open(path, "a", encoding="utf-8", buffering=1)
+    else:
+        _sink = False
+    return _sink
+
+
+def _number(x):
+    """JSON-friendly number: float when possible (sympy Rational, numpy), else str."""
+    if x is None or isinstance(x, (bool, int, float)):
+        return x
+    try:
+        return float(x)
+    except (TypeError, ValueError):
+        return str(x)
+
+
+def record(name, passed, predicted=None, measured=None, tolerance=None,
+           detail="", status=None):
+    """Record one test; returns `passed` so helpers can `return record(...)`.
+
+    `passed=None` (or status="INFO") records an informational comparison that
+    does not count toward PASS/FAIL.
+    """
+    global _index, _last
+    sink = _sink if _sink is not None else _open_sink()
+    if not sink:
+        return passed
+    now = time.perf_counter()
+    _index += 1
+    if status is None:
+        status = "INFO" if passed is None else ("PASS" if passed else "FAIL")
+    sink.write(json.dumps({
+        "script": os.path.basename(sys.argv[0]),
+        "index": _index,
+        "name": str(name),
+        "status": status,
+        "predicted": _number(predicted),
+        "measured": _number(measured),
+        "tolerance": _number(tolerance),
+        "elapsed": round(now - _last, 6),
+        "detail": str(detail),
+    }) + "\n")
+    _last = now
+    return passed
+
+
+def record_all(tests):
+    """Record a list of (name, passed) tuples; returns True if all passed."""
+    ok = True
+    for name, passed in tests:
+        record(name, passed)
+        ok = ok and bool(passed)
+    return ok
+
+
+def reset():
+    """Forget inherited sink/counters (suite_forkserver calls this in a child)."""
+    global _sink, _index, _last
+    _sink = None
+    _index = 0
+    _last = time.perf_counter()
+
+
+def load(path):
+    """Read a JSONL results file written by record(); [] if absent."""
+    records = []
+    try:
+        with open(path, encoding="utf-8") as f:
+            for line in f:
+                line = line.strip()
+                if line:
+                    try:
+                        records.append(json.loads(line))
+                    except ValueError:
+                        break  # truncated last line of a killed script
+    except OSError:
+        pass
+    return records
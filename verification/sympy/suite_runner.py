@@ -0,0 +1,453 @@
+#!/usr/bin/env python3
+"""
+Verification Suite Runner
+=========================
+
+Runs the whole verification/sympy suite across all cores and writes one
+consolidated PASS/FAIL report.
+
+Every script still runs in its own fresh interpreter (scripts rebind
+sys.stdout, seed RNGs and keep module-level state), so the pool only decides
+how many of those interpreters are alive at once. Jobs are dispatched
+longest-first using the wall times recorded on earlier runs, so a slow
+script never starts last and stretches the tail of the run.
+
+Per-test results come from the structured JSONL records written through
+suite_results.record() when a script's helpers delegate to it; otherwise
+they are recovered from the "[PASS] name" / "[FAIL] name" lines printed by
+the scripts' check()/test()/record_test() helpers. The report re-prints them
+in the same form. A failed test fails its script unless it is listed in
+KNOWN_DISCREPANCIES; those are still reported as FAIL, marked as known.
+
+Usage:
+  python suite_runner.py                        # full suite, all cores
+  python suite_runner.py -j 4 --timeout 300     # 4 workers, 5 min per script
+  python suite_runner.py alpha_ccwz_*.py        # subset by glob
+  python suite_runner.py --no-cache             # ignore cached results
+  python suite_runner.py --fork                 # warm fork mode (POSIX)
+  python suite_runner.py --profile              # record wall/CPU/RSS per PART
+  python suite_runner.py --shard 2/4 --plan shards.json   # one shard (suite_shard.py)
+  python suite_runner.py --snapshot numpy-2.1   # store outputs (suite_snapshots.py)
+  python suite_runner.py --libs                 # lib_*.py self-checks only
+
+Unchanged scripts are replayed from the content-hash cache (suite_cache.py)
+instead of being re-run.
+
+State (recorded durations, result cache, last report) lives in
+verification/sympy/.suite/ and is not tracked by git.
+"""
+
+import argparse
+import fnmatch
+import json
+import os
+import re
+import subprocess
+import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, field, asdict
+from functools import partial
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+import suite_results
+
+SCRIPT_DIR = Path(__file__).resolve().parent
+STATE_DIR = SCRIPT_DIR / ".suite"
+DURATIONS_FILE = STATE_DIR / "durations.json"
+REPORT_TXT = STATE_DIR / "report.txt"
+REPORT_JSON = STATE_DIR / "report.json"
+LIBS_REPORT_TXT = STATE_DIR / "libs_report.txt"   # --libs runs, kept apart
+
+DEFAULT_TIMEOUT = 600.0  # seconds per script
+
+# Modules that belong to the runner itself and must never be run as scripts.
+RUNNER_PREFIX = "suite_"
+
+# Shared libraries: imported by scripts and runnable as self-checks, but not
+# verification scripts (kept out of the website count and the seed sweep).
+LIB_PREFIX = "lib_"
+
+# Tests that may FAIL without failing their script, by script and test-name
+# prefix. They are still counted and listed as FAIL in the report.
+KNOWN_DISCREPANCIES: Dict[str, Tuple[str, ...]] = {
+    # sub-ppm misses against 2-sigma PDG errors; the script gates on
+    # "Known discrepancies <= 3"
+    "pdg_data_master.py": ("1/alpha(Thomson)", "m_p/m_e"),
+}
+
+# "[PASS] T3: name", "[FAIL] 12. name", "[PASS] name"
+TEST_LINE = re.compile(r"^\s*\[(PASS|FAIL)\]\s*(?:T?\d+[.:]\s+)?(.*?)\s*$")
+
+
+# ==============================================================================
+# RESULTS
+# ==============================================================================
+
+@dataclass
+class ScriptResult:
+    """Outcome of running one verification script."""
+    script: str
+    status: str                     # PASS / FAIL / ERROR / TIMEOUT
+    returncode: Optional[int]
+    elapsed: float                  # wall seconds
+    tests: List[Tuple[str, str]] = field(default_factory=list)  # (name, PASS|FAIL)
+    output: str = ""
+    cached: bool = False            # replayed from suite_cache, not re-run
+    startup_saved: Optional[float] = None  # fork mode: est. cold start avoided
+    records: List[dict] = field(default_factory=list)  # suite_results JSONL
+    profile: Optional[dict] = None  # suite_profile: wall/cpu/RSS per PART
+
+    @property
+    def n_passed(self) -> int:
+        return sum(1 for _, s in self.tests if s == "PASS")
+
+    @property
+    def n_tests(self) -> int:
+        return len(self.tests)
+
+    def to_dict(self) -> dict:
+        return asdict(self)
+
+    @classmethod
+    def from_dict(cls, d: dict) -> "ScriptResult":
+        d = dict(d)
+        d["tests"] = [tuple(t) for t in d.get("tests", [])]
+        return cls(**d)
+
+
+def parse_tests(output: str) -> List[Tuple[str, str]]:
+    """Recover (name, PASS|FAIL) pairs from a script's printed output."""
+    tests = []
+    for line in output.splitlines():
+        m = TEST_LINE.match(line)
+        if m:
+            tests.append((m.group(2), m.group(1)))
+    return tests
+
+
+def tests_from_records(records: List[dict]) -> List[Tuple[str, str]]:
+    return [(r["name"], r["status"]) for r in records
+            if r.get("status") in ("PASS", "FAIL")]
+
+
+def is_known(script: str, name: str) -> bool:
+    return name.startswith(KNOWN_DISCREPANCIES.get(script, ()))
+
+
+def classify(returncode: Optional[int], tests: List[Tuple[str, str]],
+             timed_out: bool = False, script: str = "") -> str:
+    """Script verdict: any failed test (other than a listed known discrepancy)
+    or nonzero exit fails the script."""
+    if timed_out:
+        return "TIMEOUT"
+    if any(s == "FAIL" and not is_known(script, n) for n, s in tests):
+        return "FAIL"
+    if returncode != 0:
+        return "ERROR"
+    return "PASS"
+
+
+# ==============================================================================
+# DISCOVERY AND SCHEDULING
+# ==============================================================================
+
+def discover_scripts(patterns: Optional[List[str]] = None) -> List[str]:
+    """All runnable scripts in verification/sympy (quarantined/ and lib_*.py excluded)."""
+    names = sorted(p.name for p in SCRIPT_DIR.glob("*.py")
+                   if not p.name.startswith((RUNNER_PREFIX, LIB_PREFIX)))
+    return _match(names, patterns)
+
+
+def discover_libs(patterns: Optional[List[str]] = None) -> List[str]:
+    """The lib_*.py modules, whose __main__ runs the library self-check."""
+    return _match(sorted(p.name for p in SCRIPT_DIR.glob(LIB_PREFIX + "*.py")), patterns)
+
+
+def _match(names: List[str], patterns: Optional[List[str]]) -> List[str]:
+    if patterns:
+        names = [n for n in names
+                 if any(fnmatch.fnmatch(n, Path(pat).name) for pat in patterns)]
+    return names
+
+
+def load_durations() -> Dict[str, float]:
+    if DURATIONS_FILE.exists():
+        return json.loads(DURATIONS_FILE.read_text(encoding="utf-8"))
+    return {}
+
+
+def save_durations(results: List[ScriptResult]) -> None:
+    durations = load_durations()
+    for r in results:
+        durations[r.script] = round(r.elapsed, 3)
+    STATE_DIR.mkdir(exist_ok=True)
+    DURATIONS_FILE.write_text(json.dumps(durations, indent=1, sort_keys=True),
+                              encoding="utf-8")
+
+
+def schedule(scripts: List[str], durations: Dict[str, float]) -> List[str]:
+    """Longest recorded duration first; never-timed scripts go first of all."""
+    return sorted(scripts, key=lambda s: (-durations.get(s, float("inf")), s))
+
+
+# ==============================================================================
+# EXECUTION
+# ==============================================================================
+
+def child_env(results_path: Optional[str] = None) -> Dict[str, str]:
+    env = dict(os.environ)
+    env["PYTHONIOENCODING"] = "utf-8"
+    env["MPLBACKEND"] = "Agg"   # plotting scripts must not open windows
+    if results_path:
+        env[suite_results.ENV_VAR] = results_path
+    else:
+        env.pop(suite_results.ENV_VAR, None)
+    return env
+
+
+def results_file(script: str) -> str:
+    """Fresh empty path for a script's suite_results JSONL records."""
+    fd, path = tempfile.mkstemp(prefix=script[:-3] + ".", suffix=".jsonl")
+    os.close(fd)
+    return path
+
+
+def make_result(script: str, output: str, returncode: Optional[int],
+                elapsed: float, timed_out: bool = False,
+                results_path: Optional[str] = None, **extra) -> ScriptResult:
+    """Build a ScriptResult, preferring structured records over stdout parsing."""
+    records = []
+    if results_path:
+        records = suite_results.load(results_path)
+        try:
+            os.unlink(results_path)
+        except OSError:
+            pass
+    tests = tests_from_records(records) if records else parse_tests(output)
+    return ScriptResult(script, classify(returncode, tests, timed_out, script), returncode,
+                        elapsed, tests, output, records=records, **extra)
+
+
+def run_script(script: str, timeout: float = DEFAULT_TIMEOUT) -> ScriptResult:
+    """Run one script in a fresh interpreter and parse its verdict."""
+    results_path = results_file(script)
+    t0 = time.perf_counter()
+    try:
+        proc = subprocess.run(
+            [sys.executable, script], cwd=SCRIPT_DIR, env=child_env(results_path),
+            stdin=subprocess.DEVNULL, stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT, timeout=timeout)
+    except subprocess.TimeoutExpired as exc:
+        output = (exc.output or b"").decode("utf-8", errors="replace")
+        return make_result(script, output, None, time.perf_counter() - t0,
+                           timed_out=True, results_path=results_path)
+    output = proc.stdout.decode("utf-8", errors="replace")
+    return make_result(script, output, proc.returncode, time.perf_counter() - t0,
+                       results_path=results_path)
+
+
+def execute_threaded(order: List[str], jobs: int, timeout: float, on_result,
+                     runner=run_script) -> None:
+    """Default executor: `jobs` fresh interpreters alive at once.
+
+    Each worker thread only waits on its child interpreter, so the real
+    parallelism is `jobs` OS processes.
+    """
+    with ThreadPoolExecutor(max_workers=jobs) as pool:
+        futures = [pool.submit(runner, s, timeout) for s in order]
+        for fut in as_completed(futures):
+            on_result(fut.result())
+
+
+def run_suite(scripts: List[str], jobs: Optional[int] = None,
+              timeout: float = DEFAULT_TIMEOUT, verbose: bool = True,
+              runner=run_script, cache=None,
+              executor=None) -> List[ScriptResult]:
+    """Run scripts longest-first on a pool of `jobs` concurrent interpreters.
+
+    With a suite_cache.ResultCache, scripts whose cache key is unchanged are
+    replayed and only the rest are executed. `executor` replaces the default
+    subprocess pool (see suite_forkserver.execute_forked).
+    """
+    jobs = jobs or os.cpu_count() or 1
+    results = []
+    if cache is not None:
+        hits = [h for h in (cache.get(s) for s in scripts) if h is not None]
+        results.extend(hits)
+        hit_names = {h.script for h in hits}
+        scripts = [s for s in scripts if s not in hit_names]
+        if verbose and hits:
+            print(f"  {len(hits)} unchanged scripts replayed from cache", flush=True)
+    order = schedule(scripts, load_durations())
+    n_replayed = len(results)
+
+    def on_result(r: ScriptResult) -> None:
+        results.append(r)
+        if cache is not None:
+            cache.put(r)
+        if verbose:
+            print(f"  [{len(results) - n_replayed:>4}/{len(order)}] [{r.status}] "
+                  f"{r.script} ({r.n_passed}/{r.n_tests}, {r.elapsed:.1f}s)",
+                  flush=True)
+
+    if executor is None:
+        execute_threaded(order, jobs, timeout, on_result, runner)
+    else:
+        executor(order, jobs, timeout, on_result)
+    results.sort(key=lambda r: r.script)
+    save_durations(results)
+    return results
+
+
+# ==============================================================================
+# REPORT
+# ==============================================================================
+
+def summarize(results: List[ScriptResult]) -> dict:
+    n_ok = sum(1 for r in results if r.status == "PASS")
+    n_tests = sum(r.n_tests for r in results)
+    n_tests_ok = sum(r.n_passed for r in results)
+    return {
+        "scripts": len(results),
+        "scripts_passed": n_ok,
+        "tests": n_tests,
+        "tests_passed": n_tests_ok,
+        "pass_rate": round(100.0 * n_ok / len(results), 1) if results else 0.0,
+        "cached": sum(1 for r in results if r.cached),
+        "by_status": {s: sum(1 for r in results if r.status == s)
+                      for s in ("PASS", "FAIL", "ERROR", "TIMEOUT")},
+    }
+
+
+def format_report(results: List[ScriptResult]) -> str:
+    s = summarize(results)
+    lines = ["=" * 70, "VERIFICATION SUITE REPORT", "=" * 70]
+    for r in results:
+        note = ", cached" if r.cached else ""
+        if r.startup_saved is not None and not r.cached:
+            note += f", saved {r.startup_saved:.2f}s"
+        lines.append(f"  [{r.status}] {r.script} ({r.n_passed}/{r.n_tests}, "
+                     f"{r.elapsed:.1f}s{note})")
+        for name, st in r.tests:
+            if st == "FAIL" and (r.status != "PASS" or is_known(r.script, name)):
+                known = " (known discrepancy)" if is_known(r.script, name) else ""
+                lines.append(f"         [FAIL] {name}{known}")
+        if r.status in ("ERROR", "TIMEOUT"):
+            tail = r.output.strip().splitlines()[-3:]
+            lines.extend(f"         | {t}" for t in tail)
+    lines += ["", "=" * 70,
+              f"FINAL: {s['scripts_passed']}/{s['scripts']} scripts PASS, "
+              f"{s['tests_passed']}/{s['tests']} tests PASS "
+              f"({s['pass_rate']}%)",
+              "  " + ", ".join(f"{k}: {v}" for k, v in s["by_status"].items())
+              + f" (cached: {s['cached']})"]
+    saved = [r.startup_saved for r in results
+             if r.startup_saved is not None and not r.cached]
+    if saved:
+        lines.append(f"  Fork mode startup saved: {sum(saved):.1f}s total, "
+                     f"{sum(saved) / len(saved):.2f}s per script")
+    lines.append("=" * 70)
+    return "\n".join(lines)
+
+
+def write_report(results: List[ScriptResult], txt: Path = REPORT_TXT,
+                 js: Path = REPORT_JSON) -> None:
+    txt.parent.mkdir(parents=True, exist_ok=True)
+    js.parent.mkdir(parents=True, exist_ok=True)
+    txt.write_text(format_report(results) + "\n", encoding="utf-8")
+    js.write_text(json.dumps({"summary": summarize(results),
+                              "results": [r.to_dict() for r in results]},
+                             indent=1), encoding="utf-8")
+
+
+def load_report(js: Path = REPORT_JSON) -> List[ScriptResult]:
+    data = json.loads(Path(js).read_text(encoding="utf-8"))
+    return [ScriptResult.from_dict(d) for d in data["results"]]
+
+
+# ==============================================================================
+# CLI
+# ==============================================================================
+
+def build_parser() -> argparse.ArgumentParser:
+    p = argparse.ArgumentParser(description="Run the verification suite in parallel.")
+    p.add_argument("patterns", nargs="*", help="script names or globs (default: all)")
+    p.add_argument("-j", "--jobs", type=int, default=None,
+                   help="concurrent scripts (default: all cores)")
+    p.add_argument("--timeout", type=float, default=DEFAULT_TIMEOUT,
+                   help=f"per-script timeout in seconds (default {DEFAULT_TIMEOUT:g})")
+    p.add_argument("--report", type=Path, default=None,
+                   help="text report path (JSON written alongside; default "
+                        f"{REPORT_TXT.name}, or {LIBS_REPORT_TXT.name} with --libs)")
+    p.add_argument("--no-cache", action="store_true",
+                   help="re-run every script even if its cache key is unchanged")
+    p.add_argument("--fork", action="store_true",
+                   help="fork scripts from a warm parent with sympy/numpy/scipy "
+                        "pre-imported (POSIX only)")
+    p.add_argument("--profile", action="store_true",
+                   help="record wall/CPU/peak RSS/SymPy cache per script and per "
+                        "PART (implies --no-cache), see suite_profile.py")
+    p.add_argument("--shard", metavar="I/N",
+                   help="run only shard I of N from --plan (see suite_shard.py)")
+    p.add_argument("--plan", type=Path, help="frozen shard plan for --shard")
+    p.add_argument("--libs", action="store_true",
+                   help="run the lib_*.py self-checks instead of the scripts")
+    p.add_argument("--snapshot", nargs="?", const="", metavar="LABEL",
+                   help="store every output in the snapshot store (suite_snapshots.py)")
+    p.add_argument("-q", "--quiet", action="store_true")
+    return p
+
+
+def main(argv=None) -> int:
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    scripts = (discover_libs if args.libs else discover_scripts)(args.patterns)
+    if args.report is None:
+        args.report = LIBS_REPORT_TXT if args.libs else REPORT_TXT
+    if args.shard:
+        import suite_shard
+        if args.plan is None:
+            parser.error("--shard needs --plan (python suite_shard.py plan -n N -o FILE)")
+        try:
+            shard = suite_shard.parse_shard(args.shard)
+        except argparse.ArgumentTypeError as exc:
+            parser.error(str(exc))
+        scripts = suite_shard.select(scripts, shard, args.plan)
+    if not scripts:
+        print("No scripts matched.")
+        return 1
+    cache = None
+    if not (args.no_cache or args.profile):
+        from suite_cache import ResultCache
+        cache = ResultCache()
+    runner, executor = run_script, None
+    if args.profile:
+        import suite_profile
+        runner = suite_profile.run_script_profiled
+    if args.fork:
+        import suite_forkserver
+        if suite_forkserver.available():
+            executor = partial(suite_forkserver.execute_forked, profile=args.profile)
+        else:
+            print("Fork mode needs os.fork; running fresh interpreters instead.")
+    t0 = time.perf_counter()
+    results = run_suite(scripts, args.jobs, args.timeout, verbose=not args.quiet,
+                        runner=runner, cache=cache, executor=executor)
+    write_report(results, args.report, args.report.with_suffix(".json"))
+    print()
+    print(format_report(results))
+    if args.profile:
+        suite_profile.append_history(results, "fork" if executor else "subprocess")
+        suite_profile.print_run_summary()
+    if args.snapshot is not None:
+        import suite_snapshots
+        print(f"Snapshot: {suite_snapshots.take(results, args.snapshot)}")
+    print(f"Wall time: {time.perf_counter() - t0:.1f}s  Report: {args.report}")
+    return 0 if all(r.status == "PASS" for r in results) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
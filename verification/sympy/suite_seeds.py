@@ -0,0 +1,314 @@
+#!/usr/bin/env python3
+"""
+Seed-Sweep Nondeterminism Detector
+==================================
+
+Some scripts pass only for the one seed they hard-code
+(statistical_significance_s170.py seeds random with 42,
+boltzmann_third_law_cascade.py seeds numpy with 181, ...). This re-runs every
+stochastic script under many seeds, in parallel, and reports:
+
+  - seed-fragile scripts: PASS with their own seeds, FAIL/ERROR for some
+    sweep seed;
+  - flaky tests: the individual [PASS]/[FAIL] names that flip across seeds;
+  - statistic spread: printed numbers (and suite_results predicted/measured
+    values) that change with the seed, with their mean, std and range.
+
+Scripts are not edited. Each sweep run is a fresh interpreter started through
+`suite_seeds.py --child SEED script.py`, which remaps every seed the script
+asks for before running it:
+
+  random.seed(a)              -> random.seed(mix(SEED, a))
+  numpy.random.seed(a)        -> numpy.random.seed(mix(SEED, a))
+  numpy.random.RandomState(a) -> RandomState(mix(SEED, a))
+  numpy.random.default_rng(a) -> default_rng(mix(SEED, a))
+
+mix() is a hash, so distinct seeds inside one script stay distinct, a given
+(SEED, a) pair is reproducible, and unseeded scripts become reproducible per
+SEED. The "fixed" run is the script exactly as written.
+
+A script counts as stochastic when its source uses the random module or
+numpy.random (STOCHASTIC).
+
+Usage:
+  python suite_seeds.py                         # all stochastic scripts, 20 seeds
+  python suite_seeds.py --seeds 100 -j 8 measurement_from_projection.py
+  python suite_seeds.py --list                  # which scripts would be swept
+  python suite_seeds.py --child 7 script.py     # one run under sweep seed 7
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import random
+import re
+import runpy
+import statistics
+import subprocess
+import sys
+import time
+from collections import defaultdict
+from typing import Dict, List, Optional, Tuple
+
+from suite_runner import (SCRIPT_DIR, STATE_DIR, DEFAULT_TIMEOUT, ScriptResult,
+                          child_env, discover_scripts, execute_threaded,
+                          make_result, results_file, run_script)
+
+REPORT_FILE = STATE_DIR / "seed_sweep.json"
+DEFAULT_SEEDS = 20
+
+STOCHASTIC = re.compile(
+    r"\b(?:np|numpy)\.random\b"
+    r"|^[ \t]*(?:import[ \t]+random\b|from[ \t]+random[ \t]+import"
+    r"|from[ \t]+numpy\.random[ \t]+import|from[ \t]+numpy[ \t]+import[ \t]+random\b)",
+    re.MULTILINE)
+NUMBER = re.compile(r"(?<![\w.])[-+]?(?:\d+\.\d*|\.\d+|\d+)(?:[eE][-+]?\d+)?(?![\w.])")
+SPREAD_MIN = 1e-12   # relative spread below this counts as constant
+
+
+# ==============================================================================
+# CHILD: SEED REMAPPING
+# ==============================================================================
+
+def mix(sweep_seed: int, seed) -> int:
+    """Deterministic 32-bit seed from the sweep seed and the script's own seed."""
+    h = hashlib.sha256(f"{sweep_seed}:{seed!r}".encode()).digest()
+    return int.from_bytes(h[:4], "little")
+
+
+def install_seed(sweep_seed: int) -> None:
+    """Remap every seed requested through random / numpy.random."""
+    orig_seed = random.seed
+
+    def seed(a=None, version=2):
+        orig_seed(mix(sweep_seed, a), version)
+
+    random.seed = seed
+    random.seed()
+    try:
+        import numpy as np
+    except ImportError:
+        return
+    npr = np.random
+    orig_np_seed, orig_rng = npr.seed, npr.default_rng
+
+    def np_seed(seed=None):
+        orig_np_seed(mix(sweep_seed, seed))
+
+    def default_rng(seed=None):
+        return orig_rng(mix(sweep_seed, seed))
+
+    class RandomState(npr.RandomState):
+        def __init__(self, seed=None):
+            super().__init__(mix(sweep_seed, seed))
+
+    npr.seed, npr.default_rng, npr.RandomState = np_seed, default_rng, RandomState
+    npr.seed()
+
+
+def run_child(sweep_seed: int, script: str) -> int:
+    """`python suite_seeds.py --child SEED script.py`."""
+    install_seed(sweep_seed)
+    sys.argv = [script]
+    sys.path[0] = str(SCRIPT_DIR)
+    try:
+        runpy.run_path(script, run_name="__main__")
+    except SystemExit as exc:
+        if isinstance(exc.code, int) or exc.code is None:
+            return exc.code or 0
+        print(exc.code, file=sys.stderr)
+        return 1
+    return 0
+
+
+# ==============================================================================
+# SWEEP
+# ==============================================================================
+
+def stochastic_scripts(scripts: List[str]) -> List[str]:
+    return [s for s in scripts
+            if STOCHASTIC.search((SCRIPT_DIR / s).read_text(encoding="utf-8",
+                                                            errors="replace"))]
+
+
+def run_seeded(job: Tuple[str, Optional[int]], timeout: float = DEFAULT_TIMEOUT):
+    """execute_threaded runner for one (script, seed); seed None = as written."""
+    script, seed = job
+    if seed is None:
+        return job, run_script(script, timeout)
+    rpath = results_file(script)
+    cmd = [sys.executable, str(SCRIPT_DIR / "suite_seeds.py"), "--child", str(seed), script]
+    t0 = time.perf_counter()
+    try:
+        proc = subprocess.run(cmd, cwd=SCRIPT_DIR, env=child_env(rpath),
+                              stdin=subprocess.DEVNULL, stdout=subprocess.PIPE,
+                              stderr=subprocess.STDOUT, timeout=timeout)
+        output, code, timed_out = proc.stdout, proc.returncode, False
+    except subprocess.TimeoutExpired as exc:
+        output, code, timed_out = exc.output or b"", None, True
+    return job, make_result(script, output.decode("utf-8", errors="replace"), code,
+                            time.perf_counter() - t0, timed_out, rpath)
+
+
+def sweep(scripts: List[str], seeds: List[int], jobs: int, timeout: float,
+          verbose: bool = True) -> Dict[str, Dict[Optional[int], ScriptResult]]:
+    """script -> {seed: result}; seed None is the unmodified run."""
+    jobs_list = [(s, seed) for s in scripts for seed in [None] + seeds]
+    runs: Dict[str, Dict[Optional[int], ScriptResult]] = defaultdict(dict)
+    done = [0]
+
+    def on_result(item) -> None:
+        (script, seed), r = item
+        runs[script][seed] = r
+        done[0] += 1
+        if verbose:
+            label = "fixed" if seed is None else f"seed {seed}"
+            print(f"  [{done[0]:>5}/{len(jobs_list)}] [{r.status}] {script} ({label}, "
+                  f"{r.n_passed}/{r.n_tests}, {r.elapsed:.1f}s)", flush=True)
+
+    execute_threaded(jobs_list, jobs, timeout, on_result, run_seeded)
+    return dict(runs)
+
+
+# ==============================================================================
+# ANALYSIS
+# ==============================================================================
+
+def statistics_of(r: ScriptResult) -> Dict[str, List[float]]:
+    """Numbers a run reports, keyed so the same quantity lines up across runs.
+
+    Printed lines are keyed by their text with numbers blanked out (plus an
+    occurrence count for repeated lines); structured records by test name.
+    """
+    stats: Dict[str, List[float]] = {}
+    seen: Dict[str, int] = defaultdict(int)
+    for line in r.output.splitlines():
+        line = line.strip()
+        numbers = NUMBER.findall(line)
+        if not numbers:
+            continue
+        template = NUMBER.sub("#", line)
+        seen[template] += 1
+        key = template if seen[template] == 1 else f"{template}  (#{seen[template]})"
+        stats[key] = [float(x) for x in numbers]
+    for rec in r.records:
+        values = [rec[k] for k in ("predicted", "measured")
+                  if isinstance(rec.get(k), (int, float))]
+        if values:
+            stats[f"record: {rec['name']}"] = values
+    return stats
+
+
+def analyse(script: str, runs: Dict[Optional[int], ScriptResult]) -> dict:
+    fixed = runs.get(None)
+    swept = {seed: r for seed, r in runs.items() if seed is not None}
+    failing = sorted(seed for seed, r in swept.items() if r.status != "PASS")
+    tests: Dict[str, Dict[str, int]] = defaultdict(lambda: {"PASS": 0, "FAIL": 0})
+    for r in swept.values():
+        for name, status in r.tests:
+            tests[name][status] += 1
+    flaky = {name: c for name, c in tests.items() if c["PASS"] and c["FAIL"]}
+
+    per_run = [statistics_of(r) for r in swept.values()]
+    fixed_stats = statistics_of(fixed) if fixed is not None else {}
+    spread = []
+    if per_run:
+        common = set(per_run[0]).intersection(*per_run[1:])
+        for key in sorted(common):
+            vectors = [st[key] for st in per_run]
+            if len({len(v) for v in vectors}) != 1:
+                continue
+            for pos, values in enumerate(zip(*vectors)):
+                lo, hi = min(values), max(values)
+                mean = statistics.fmean(values)
+                scale = max(abs(mean), abs(lo), abs(hi), 1e-300)
+                if (hi - lo) / scale <= SPREAD_MIN:
+                    continue
+                spread.append({
+                    "statistic": key, "position": pos, "mean": mean,
+                    "std": statistics.pstdev(values), "min": lo, "max": hi,
+                    "fixed": (fixed_stats[key][pos]
+                              if len(fixed_stats.get(key, [])) == len(vectors[0]) else None),
+                })
+        spread.sort(key=lambda s: -s["std"] / max(abs(s["mean"]), 1e-300))
+    return {
+        "script": script,
+        "fixed": fixed.status if fixed is not None else None,
+        "seeds": len(swept),
+        "pass": len(swept) - len(failing),
+        "failing_seeds": failing,
+        "fragile": bool(fixed is not None and fixed.status == "PASS" and failing),
+        "flaky_tests": flaky,
+        "spread": spread,
+    }
+
+
+def format_analysis(a: dict, top: int = 5) -> str:
+    tag = "FRAGILE" if a["fragile"] else ("STABLE" if not a["failing_seeds"] else "UNSTABLE")
+    lines = [f"  [{tag}] {a['script']}: fixed {a['fixed']}, "
+             f"{a['pass']}/{a['seeds']} seeds PASS"]
+    if a["failing_seeds"]:
+        shown = ", ".join(map(str, a["failing_seeds"][:10]))
+        more = " ..." if len(a["failing_seeds"]) > 10 else ""
+        lines.append(f"      failing seeds: {shown}{more}")
+    for name, c in sorted(a["flaky_tests"].items(), key=lambda kv: -kv[1]["FAIL"]):
+        lines.append(f"      flaky: {name} (FAIL {c['FAIL']}/{c['PASS'] + c['FAIL']})")
+    for s in a["spread"][:top]:
+        fixed = "" if s["fixed"] is None else f", fixed {s['fixed']:.6g}"
+        lines.append(f"      varies: {s['statistic'][:70]} [{s['position']}]: "
+                     f"mean {s['mean']:.6g} +/- {s['std']:.3g} "
+                     f"(range {s['min']:.6g} .. {s['max']:.6g}{fixed})")
+    if len(a["spread"]) > top:
+        lines.append(f"      ... {len(a['spread']) - top} more varying statistics")
+    return "\n".join(lines)
+
+
+# ==============================================================================
+# CLI
+# ==============================================================================
+
+def main(argv=None) -> int:
+    p = argparse.ArgumentParser(description="Re-run stochastic scripts under many seeds.")
+    p.add_argument("patterns", nargs="*", help="script globs (default: all stochastic)")
+    p.add_argument("--seeds", type=int, default=DEFAULT_SEEDS, help="sweep seeds per script")
+    p.add_argument("--seed-base", type=int, default=0, help="first sweep seed")
+    p.add_argument("-j", "--jobs", type=int, default=None)
+    p.add_argument("--timeout", type=float, default=DEFAULT_TIMEOUT)
+    p.add_argument("--top", type=int, default=5, help="varying statistics shown per script")
+    p.add_argument("--list", action="store_true", help="list stochastic scripts and exit")
+    p.add_argument("-q", "--quiet", action="store_true")
+    p.add_argument("--child", nargs=2, metavar=("SEED", "SCRIPT"), help=argparse.SUPPRESS)
+    args = p.parse_args(argv)
+
+    if args.child:
+        return run_child(int(args.child[0]), args.child[1])
+    scripts = stochastic_scripts(discover_scripts(args.patterns or None))
+    if args.list:
+        print("\n".join(scripts))
+        print(f"  {len(scripts)} stochastic scripts")
+        return 0
+    if not scripts:
+        print("No stochastic scripts matched.")
+        return 1
+    seeds = list(range(args.seed_base, args.seed_base + args.seeds))
+    jobs = args.jobs or os.cpu_count() or 1
+    print(f"Sweeping {len(scripts)} scripts x {len(seeds)} seeds on {jobs} workers")
+    runs = sweep(scripts, seeds, jobs, args.timeout, verbose=not args.quiet)
+
+    analyses = [analyse(s, runs[s]) for s in sorted(runs)]
+    print()
+    for a in analyses:
+        print(format_analysis(a, args.top))
+    fragile = [a["script"] for a in analyses if a["fragile"]]
+    print(f"\n  seed-fragile: {len(fragile)}/{len(analyses)}"
+          + (f" ({', '.join(fragile)})" if fragile else ""))
+    STATE_DIR.mkdir(exist_ok=True)
+    REPORT_FILE.write_text(json.dumps({"seeds": seeds, "scripts": analyses}, indent=1),
+                           encoding="utf-8")
+    print(f"  details: {REPORT_FILE}")
+    return 1 if fragile else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,187 @@
+#!/usr/bin/env python3
+"""
+Cost-Balanced Sharding of the Verification Suite
+================================================
+
+Splits the suite into N shards of roughly equal predicted runtime so it can
+run on N machines with no shared state, then merges the shard reports into
+one summary identical to a single-machine run.
+
+Assignment is longest-processing-time-first (LPT) over the recorded
+durations, with every tie broken by script name, so the same inputs always
+give the same shards. Recorded durations differ from machine to machine, so
+the plan is computed once and frozen to a JSON file holding the assignment
+and the costs it used; every node reads the same file. Scripts added after
+the plan was frozen are placed by extending it with the frozen costs, so all
+nodes agree on them too and existing scripts never move (per-node result
+caches stay valid). Pass --rebalance to start over.
+
+Scripts with no recorded duration are costed at the median of the known
+durations.
+
+Usage:
+  python suite_shard.py plan -n 4 -o shards.json          # freeze a plan
+  python suite_shard.py plan -n 4 -o shards.json --previous shards.json
+  python suite_shard.py show shards.json
+  python suite_runner.py --shard 2/4 --plan shards.json    # on node 2
+  python suite_shard.py merge node*/report.json -o .suite/report.txt
+"""
+
+import argparse
+import json
+import statistics
+import sys
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from suite_runner import (REPORT_TXT, discover_scripts, format_report,
+                          load_durations, load_report, write_report)
+
+DEFAULT_COST = 1.0   # seconds, when nothing has been recorded at all
+
+
+def parse_shard(spec: str) -> Tuple[int, int]:
+    """'2/4' -> (2, 4); shards are numbered from 1."""
+    try:
+        i, n = (int(x) for x in spec.split("/"))
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"shard must look like I/N, got {spec!r}")
+    if not 1 <= i <= n:
+        raise argparse.ArgumentTypeError(f"shard index {i} outside 1..{n}")
+    return i, n
+
+
+def costs_for(scripts: List[str], durations: Dict[str, float]) -> Dict[str, float]:
+    known = [durations[s] for s in scripts if s in durations]
+    fallback = statistics.median(known) if known else DEFAULT_COST
+    return {s: durations.get(s, fallback) for s in scripts}
+
+
+def assign_shards(scripts: List[str], n: int, durations: Dict[str, float],
+                  previous: Optional[Dict[str, int]] = None) -> Dict[str, int]:
+    """Map script -> shard index (1..n), LPT with deterministic tie-breaks.
+
+    `previous` pins scripts that were already assigned (same n) to their shard.
+    """
+    scripts = sorted(scripts)
+    cost = costs_for(scripts, durations)
+    load = [0.0] * n
+    assignment: Dict[str, int] = {}
+    if previous:
+        for s in scripts:
+            if s in previous and 1 <= previous[s] <= n:
+                assignment[s] = previous[s]
+                load[previous[s] - 1] += cost[s]
+    for s in sorted((s for s in scripts if s not in assignment),
+                    key=lambda s: (-cost[s], s)):
+        k = min(range(n), key=lambda k: (load[k], k))
+        assignment[s] = k + 1
+        load[k] += cost[s]
+    return assignment
+
+
+def shard_loads(assignment: Dict[str, int], n: int,
+                durations: Dict[str, float]) -> List[float]:
+    cost = costs_for(sorted(assignment), durations)
+    load = [0.0] * n
+    for s, k in assignment.items():
+        load[k - 1] += cost[s]
+    return load
+
+
+def save_plan(path: Path, assignment: Dict[str, int], n: int,
+              costs: Dict[str, float]) -> None:
+    path.write_text(json.dumps({
+        "shards": n,
+        "assignment": dict(sorted(assignment.items())),
+        "costs": {s: round(costs[s], 3) for s in sorted(assignment)},
+    }, indent=1), encoding="utf-8")
+
+
+def load_plan(path: Path) -> Tuple[int, Dict[str, int], Dict[str, float]]:
+    data = json.loads(Path(path).read_text(encoding="utf-8"))
+    return data["shards"], data["assignment"], data.get("costs", {})
+
+
+def select(scripts: List[str], shard: Tuple[int, int], plan: Path) -> List[str]:
+    """The subset of `scripts` that shard (i, n) of `plan` must run.
+
+    Scripts missing from the plan are placed by extending it with its frozen
+    costs, so every node agrees on them without coordinating.
+    """
+    i, n = shard
+    plan_n, previous, costs = load_plan(plan)
+    if plan_n != n:
+        raise SystemExit(f"plan {plan} has {plan_n} shards, not {n}")
+    assignment = assign_shards(discover_scripts(), n, costs, previous)
+    return [s for s in scripts if assignment.get(s) == i]
+
+
+def merge_reports(paths: List[Path]):
+    """Union of shard results, in single-run (alphabetical) order."""
+    merged = {}
+    for p in paths:
+        for r in load_report(p):
+            if r.script in merged:
+                print(f"  WARNING: {r.script} appears in more than one shard report")
+            merged[r.script] = r
+    return [merged[s] for s in sorted(merged)]
+
+
+# ==============================================================================
+# CLI
+# ==============================================================================
+
+def main(argv=None) -> int:
+    p = argparse.ArgumentParser(description="Shard the verification suite.")
+    sub = p.add_subparsers(dest="cmd", required=True)
+    pp = sub.add_parser("plan", help="write a frozen shard plan")
+    pp.add_argument("-n", type=int, required=True, help="number of shards")
+    pp.add_argument("-o", "--out", type=Path, required=True)
+    pp.add_argument("--previous", type=Path, help="keep assignments from this plan")
+    pp.add_argument("--rebalance", action="store_true", help="ignore --previous")
+    ps = sub.add_parser("show", help="print predicted shard loads")
+    ps.add_argument("plan", type=Path)
+    pm = sub.add_parser("merge", help="merge shard report.json files")
+    pm.add_argument("reports", nargs="+", type=Path)
+    pm.add_argument("-o", "--out", type=Path, default=REPORT_TXT)
+    pm.add_argument("--plan", type=Path, help="check every planned script is present")
+    args = p.parse_args(argv)
+
+    durations = load_durations()
+    if args.cmd == "plan":
+        previous = None
+        if args.previous and not args.rebalance and args.previous.exists():
+            prev_n, previous, _ = load_plan(args.previous)
+            if prev_n != args.n:
+                print(f"Previous plan has {prev_n} shards; rebalancing for {args.n}.")
+                previous = None
+        scripts = discover_scripts()
+        assignment = assign_shards(scripts, args.n, durations, previous)
+        save_plan(args.out, assignment, args.n, costs_for(scripts, durations))
+        args.plan = args.out
+    if args.cmd in ("plan", "show"):
+        n, assignment, costs = load_plan(args.plan)
+        loads = shard_loads(assignment, n, costs)
+        mean = sum(loads) / n if n else 0.0
+        for k, load in enumerate(loads, 1):
+            count = sum(1 for v in assignment.values() if v == k)
+            print(f"  shard {k}/{n}: {count:>4} scripts, predicted {load:8.1f}s")
+        if mean:
+            print(f"  imbalance: max/mean = {max(loads) / mean:.3f}")
+        return 0
+
+    results = merge_reports(args.reports)
+    if args.plan:
+        _, assignment, _ = load_plan(args.plan)
+        missing = sorted(set(assignment) - {r.script for r in results})
+        if missing:
+            print(f"  WARNING: {len(missing)} planned scripts missing: "
+                  f"{', '.join(missing[:10])}{' ...' if len(missing) > 10 else ''}")
+    write_report(results, args.out, args.out.with_suffix(".json"))
+    print(format_report(results))
+    return 0 if all(r.status == "PASS" for r in results) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,388 @@
+#!/usr/bin/env python3
+"""
+Golden-Output Snapshot Store
+============================
+
+Many findings exist only as printed numbers ("Max eigenvalue discrepancy"
+in coleman_weinberg_so11.py, the p-values in
+phase7_cross_framework_statistics.py, ...). This keeps every run's output in
+a compressed, content-addressed store and diffs runs semantically, so a
+SymPy/NumPy upgrade that moves a number shows up as one line per script.
+
+Store layout (under .suite/snapshots/, not tracked by git):
+
+  objects/ab/cdef...   zlib-compressed script output, named by its sha256;
+                       identical outputs across runs are stored once
+  runs/<id>.json       one manifest per snapshot: script -> blob + verdict,
+                       with the git revision and library versions
+  golden               id of the run other runs are compared with
+
+The diff normalises each output line into a template (numbers replaced by
+'#') and its list of numbers, aligns the templates with difflib, and
+compares aligned numbers with |a - b| <= atol + rtol * max(|a|, |b|).
+Scripts are then classified as
+
+  identical    same blob (not even decompressed)
+  equivalent   numbers agree within tolerance
+  drift        same text, some numbers outside tolerance
+  changed      lines added, removed or reworded
+  verdict      PASS/FAIL status changed (always reported)
+
+Lines matching --ignore (default: wall-clock timings) are dropped first, and
+durations matching --mask ("31 ms", "0.25s") are replaced by "<t>" in the
+lines that remain.
+
+Runs are named by id, id prefix, label, "latest", "latest~N" or "golden".
+
+Usage:
+  python suite_runner.py --snapshot numpy-2.1     # run, then snapshot
+  python suite_snapshots.py take --label before   # snapshot .suite/report.json
+  python suite_snapshots.py golden latest         # mark the reference run
+  python suite_snapshots.py diff                  # golden vs latest
+  python suite_snapshots.py diff before latest --rtol 1e-6 -v
+  python suite_snapshots.py show latest coleman_weinberg_so11.py
+  python suite_snapshots.py list
+  python suite_snapshots.py prune --keep 10
+"""
+
+import argparse
+import difflib
+import fnmatch
+import hashlib
+import json
+import re
+import subprocess
+import sys
+import time
+import zlib
+from dataclasses import dataclass, field
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from suite_runner import SCRIPT_DIR, STATE_DIR, REPORT_JSON, ScriptResult, load_report
+from suite_cache import environment_fingerprint
+from suite_seeds import NUMBER
+
+STORE_DIR = STATE_DIR / "snapshots"
+OBJECTS_DIR = STORE_DIR / "objects"
+RUNS_DIR = STORE_DIR / "runs"
+GOLDEN_FILE = STORE_DIR / "golden"
+
+DEFAULT_RTOL = 1e-9
+DEFAULT_ATOL = 1e-12
+DEFAULT_IGNORE = (r"(?i)\b(?:elapsed|took|runtime|wall[ -]?time|time taken)\b"
+                  r"|\b\d{4}-\d{2}-\d{2}[ T]\d{2}:\d{2}")
+# Unit-suffixed durations inside otherwise meaningful lines ("100000 points
+# in 31 ms", "200 configs, 0.18s): A13 = ...") are masked, not dropped;
+# the mask takes the padding in front, so right-aligned columns compare equal.
+DEFAULT_MASK = r"[ \t]*\b\d+(?:\.\d+)?(?:[eE][-+]?\d+)?\s*(?:ms|us|s)\b(?!-)"
+COMPRESSION = 6
+
+
+# ==============================================================================
+# STORE
+# ==============================================================================
+
+def put_blob(text: str) -> str:
+    data = text.encode("utf-8")
+    digest = hashlib.sha256(data).hexdigest()
+    path = OBJECTS_DIR / digest[:2] / digest[2:]
+    if not path.exists():
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(".tmp")
+        tmp.write_bytes(zlib.compress(data, COMPRESSION))
+        tmp.replace(path)
+    return digest
+
+
+@lru_cache(maxsize=256)
+def get_blob(digest: str) -> str:
+    path = OBJECTS_DIR / digest[:2] / digest[2:]
+    return zlib.decompress(path.read_bytes()).decode("utf-8")
+
+
+def _git_revision() -> Optional[str]:
+    try:
+        out = subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=SCRIPT_DIR,
+                             capture_output=True, text=True, timeout=10)
+    except (OSError, subprocess.SubprocessError):
+        return None
+    return out.stdout.strip() or None
+
+
+def take(results: List[ScriptResult], label: str = "") -> str:
+    """Snapshot `results`; returns the new run id."""
+    RUNS_DIR.mkdir(parents=True, exist_ok=True)
+    run_id = time.strftime("%Y%m%dT%H%M%S", time.gmtime())
+    if label:
+        run_id += "-" + re.sub(r"[^\w.+-]", "_", label)
+    manifest = {
+        "id": run_id,
+        "label": label,
+        "created": time.strftime("%Y-%m-%d %H:%M:%S UTC", time.gmtime()),
+        "git": _git_revision(),
+        "env": environment_fingerprint(),
+        "scripts": {r.script: {"blob": put_blob(r.output), "status": r.status}
+                    for r in sorted(results, key=lambda r: r.script)},
+    }
+    (RUNS_DIR / f"{run_id}.json").write_text(json.dumps(manifest, indent=1),
+                                             encoding="utf-8")
+    return run_id
+
+
+def run_ids() -> List[str]:
+    return sorted(p.stem for p in RUNS_DIR.glob("*.json")) if RUNS_DIR.exists() else []
+
+
+def resolve(name: str) -> str:
+    ids = run_ids()
+    if not ids:
+        raise SystemExit("No snapshots yet; run: python suite_snapshots.py take")
+    if name == "golden":
+        if not GOLDEN_FILE.exists():
+            raise SystemExit("No golden run; set one with: python suite_snapshots.py golden RUN")
+        return GOLDEN_FILE.read_text(encoding="utf-8").strip()
+    if name in ids:
+        return name
+    m = re.fullmatch(r"latest(?:~(\d+))?", name)
+    if m:
+        back = int(m.group(1) or 0)
+        if back >= len(ids):
+            raise SystemExit(f"Only {len(ids)} snapshots exist")
+        return ids[-1 - back]
+    matches = [i for i in ids if i == name or i.startswith(name) or i.endswith("-" + name)]
+    if not matches:
+        raise SystemExit(f"No snapshot matches {name!r}")
+    return matches[-1]
+
+
+def load_run(name: str) -> dict:
+    run_id = resolve(name)
+    return json.loads((RUNS_DIR / f"{run_id}.json").read_text(encoding="utf-8"))
+
+
+# ==============================================================================
+# SEMANTIC DIFF
+# ==============================================================================
+
+@dataclass
+class ScriptDiff:
+    script: str
+    kind: str                         # identical/equivalent/drift/changed/added/removed
+    old_status: Optional[str] = None
+    new_status: Optional[str] = None
+    max_rel: float = 0.0              # largest relative difference beyond tolerance
+    drifts: List[Tuple[str, str, float]] = field(default_factory=list)  # old, new, rel
+    changes: List[str] = field(default_factory=list)   # unified-diff style lines
+
+    @property
+    def verdict_changed(self) -> bool:
+        return (self.old_status is not None and self.new_status is not None
+                and self.old_status != self.new_status)
+
+
+def normalise(text: str, ignore: Optional[re.Pattern],
+              mask: Optional[re.Pattern] = None) -> List[Tuple[str, Tuple[float, ...], str]]:
+    """(template, numbers, original line) per non-ignored, non-blank line."""
+    lines = []
+    for line in text.splitlines():
+        line = line.rstrip()
+        if not line.strip() or (ignore is not None and ignore.search(line)):
+            continue
+        body = mask.sub(" <t>", line) if mask is not None else line
+        lines.append((NUMBER.sub("#", body), tuple(float(x) for x in NUMBER.findall(body)),
+                      line))
+    return lines
+
+
+def _rel(a: float, b: float) -> float:
+    scale = max(abs(a), abs(b))
+    return abs(a - b) / scale if scale else 0.0
+
+
+def diff_outputs(script: str, old: str, new: str, rtol: float, atol: float,
+                 ignore: Optional[re.Pattern], mask: Optional[re.Pattern] = None) -> ScriptDiff:
+    a, b = normalise(old, ignore, mask), normalise(new, ignore, mask)
+    d = ScriptDiff(script, "equivalent")
+    sm = difflib.SequenceMatcher(None, [x[0] for x in a], [x[0] for x in b],
+                                 autojunk=False)
+    for tag, i1, i2, j1, j2 in sm.get_opcodes():
+        if tag == "equal":
+            for (_, na, la), (_, nb, lb) in zip(a[i1:i2], b[j1:j2]):
+                worst = max((_rel(x, y) for x, y in zip(na, nb)
+                             if abs(x - y) > atol + rtol * max(abs(x), abs(y))),
+                            default=None)
+                if worst is not None:
+                    d.drifts.append((la, lb, worst))
+                    d.max_rel = max(d.max_rel, worst)
+        else:
+            d.changes.extend("- " + x[2] for x in a[i1:i2])
+            d.changes.extend("+ " + x[2] for x in b[j1:j2])
+    if d.changes:
+        d.kind = "changed"
+    elif d.drifts:
+        d.kind = "drift"
+    return d
+
+
+def diff_runs(old: dict, new: dict, rtol: float = DEFAULT_RTOL,
+              atol: float = DEFAULT_ATOL, ignore: Optional[str] = DEFAULT_IGNORE,
+              patterns: Optional[List[str]] = None,
+              mask: Optional[str] = DEFAULT_MASK) -> List[ScriptDiff]:
+    ignore_re = re.compile(ignore) if ignore else None
+    mask_re = re.compile(mask) if mask else None
+    so, sn = old["scripts"], new["scripts"]
+    names = sorted(set(so) | set(sn))
+    if patterns:
+        names = [n for n in names if any(fnmatch.fnmatch(n, p) for p in patterns)]
+    diffs = []
+    for s in names:
+        eo, en = so.get(s), sn.get(s)
+        if eo is None:
+            diffs.append(ScriptDiff(s, "added", new_status=en["status"]))
+        elif en is None:
+            diffs.append(ScriptDiff(s, "removed", old_status=eo["status"]))
+        elif eo["blob"] == en["blob"]:
+            diffs.append(ScriptDiff(s, "identical", eo["status"], en["status"]))
+        else:
+            d = diff_outputs(s, get_blob(eo["blob"]), get_blob(en["blob"]),
+                             rtol, atol, ignore_re, mask_re)
+            d.old_status, d.new_status = eo["status"], en["status"]
+            diffs.append(d)
+    return diffs
+
+
+def format_diff(old: dict, new: dict, diffs: List[ScriptDiff], verbose: bool = False,
+                max_lines: int = 6) -> str:
+    counts: Dict[str, int] = {}
+    for d in diffs:
+        counts[d.kind] = counts.get(d.kind, 0) + 1
+    lines = [f"Snapshot diff: {old['id']} -> {new['id']}"]
+    if old.get("env") != new.get("env"):
+        lines.append(f"  env: {old.get('env')}\n    -> {new.get('env')}")
+    lines.append("  " + "  ".join(f"{k}: {counts.get(k, 0)}" for k in
+                                  ("identical", "equivalent", "drift", "changed",
+                                   "added", "removed")))
+    verdicts = [d for d in diffs if d.verdict_changed]
+    if verdicts:
+        lines.append(f"\n  VERDICT CHANGES ({len(verdicts)}):")
+        lines.extend(f"    {d.script}: {d.old_status} -> {d.new_status}" for d in verdicts)
+    drift = sorted((d for d in diffs if d.kind == "drift"), key=lambda d: -d.max_rel)
+    if drift:
+        lines.append(f"\n  NUMERIC DRIFT ({len(drift)}):")
+        for d in drift:
+            lines.append(f"    {d.script}: {len(d.drifts)} lines, max rel {d.max_rel:.3g}")
+            if verbose:
+                for la, lb, rel in d.drifts[:max_lines]:
+                    lines.append(f"      - {la.strip()}\n      + {lb.strip()}   (rel {rel:.3g})")
+    changed = [d for d in diffs if d.kind == "changed"]
+    if changed:
+        lines.append(f"\n  CHANGED OUTPUT ({len(changed)}):")
+        for d in changed:
+            extra = f", {len(d.drifts)} drifted" if d.drifts else ""
+            lines.append(f"    {d.script}: {len(d.changes)} lines differ{extra}")
+            if verbose:
+                lines.extend("      " + c for c in d.changes[:max_lines])
+                if len(d.changes) > max_lines:
+                    lines.append(f"      ... {len(d.changes) - max_lines} more")
+    for kind in ("added", "removed"):
+        names = [d.script for d in diffs if d.kind == kind]
+        if names:
+            lines.append(f"\n  {kind.upper()} ({len(names)}): {', '.join(names)}")
+    return "\n".join(lines)
+
+
+# ==============================================================================
+# CLI
+# ==============================================================================
+
+def prune(keep: int) -> Tuple[int, int]:
+    """Keep the newest `keep` runs (and golden); delete unreferenced blobs."""
+    ids = run_ids()
+    golden = GOLDEN_FILE.read_text(encoding="utf-8").strip() if GOLDEN_FILE.exists() else None
+    keep_ids = set(ids[-keep:] if keep else []) | ({golden} if golden else set())
+    removed_runs = 0
+    for i in ids:
+        if i not in keep_ids:
+            (RUNS_DIR / f"{i}.json").unlink()
+            removed_runs += 1
+    live = set()
+    for i in run_ids():
+        live.update(e["blob"] for e in load_run(i)["scripts"].values())
+    removed_blobs = 0
+    for path in OBJECTS_DIR.glob("*/*"):
+        if path.parent.name + path.name not in live:
+            path.unlink()
+            removed_blobs += 1
+    return removed_runs, removed_blobs
+
+
+def main(argv=None) -> int:
+    p = argparse.ArgumentParser(description="Golden-output snapshots and semantic diffs.")
+    sub = p.add_subparsers(dest="cmd", required=True)
+    pt = sub.add_parser("take", help="snapshot a suite report")
+    pt.add_argument("--label", default="")
+    pt.add_argument("--report", type=Path, default=REPORT_JSON)
+    pg = sub.add_parser("golden", help="show or set the golden run")
+    pg.add_argument("run", nargs="?")
+    pd = sub.add_parser("diff", help="semantic diff of two runs")
+    pd.add_argument("old", nargs="?", default="golden")
+    pd.add_argument("new", nargs="?", default="latest")
+    pd.add_argument("--rtol", type=float, default=DEFAULT_RTOL)
+    pd.add_argument("--atol", type=float, default=DEFAULT_ATOL)
+    pd.add_argument("--ignore", default=DEFAULT_IGNORE,
+                    help="regex of lines to skip ('' to compare everything)")
+    pd.add_argument("--mask", default=DEFAULT_MASK,
+                    help="regex of durations masked inside lines ('' to compare them)")
+    pd.add_argument("--scripts", nargs="+", metavar="GLOB")
+    pd.add_argument("-v", "--verbose", action="store_true", help="show differing lines")
+    ps = sub.add_parser("show", help="print a stored output")
+    ps.add_argument("run")
+    ps.add_argument("script")
+    sub.add_parser("list", help="list snapshots")
+    pp = sub.add_parser("prune", help="delete old snapshots and unreferenced blobs")
+    pp.add_argument("--keep", type=int, default=10)
+    args = p.parse_args(argv)
+
+    if args.cmd == "take":
+        run_id = take(load_report(args.report), args.label)
+        print(f"  snapshot {run_id}")
+        return 0
+    if args.cmd == "golden":
+        if args.run:
+            run_id = resolve(args.run)
+            GOLDEN_FILE.write_text(run_id + "\n", encoding="utf-8")
+        print(f"  golden: {resolve('golden')}")
+        return 0
+    if args.cmd == "list":
+        golden = GOLDEN_FILE.read_text(encoding="utf-8").strip() if GOLDEN_FILE.exists() else None
+        for i in run_ids():
+            m = load_run(i)
+            mark = " (golden)" if i == golden else ""
+            print(f"  {i}  {len(m['scripts']):>4} scripts  git {m.get('git')}{mark}")
+        return 0
+    if args.cmd == "show":
+        entry = load_run(args.run)["scripts"].get(Path(args.script).name)
+        if entry is None:
+            print(f"{args.script} is not in snapshot {resolve(args.run)}")
+            return 1
+        sys.stdout.write(get_blob(entry["blob"]))
+        return 0
+    if args.cmd == "prune":
+        runs, blobs = prune(args.keep)
+        print(f"  removed {runs} snapshots, {blobs} blobs")
+        return 0
+
+    old, new = load_run(args.old), load_run(args.new)
+    t0 = time.perf_counter()
+    diffs = diff_runs(old, new, args.rtol, args.atol, args.ignore or None, args.scripts,
+                      args.mask or None)
+    print(format_diff(old, new, diffs, args.verbose))
+    print(f"\n  compared {len(diffs)} scripts in {time.perf_counter() - t0:.2f}s "
+          f"(rtol {args.rtol:g}, atol {args.atol:g})")
+    return 1 if any(d.kind in ("drift", "changed") or d.verdict_changed for d in diffs) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,266 @@
+#!/usr/bin/env python3
+"""
+Website Verification Index Generator
+====================================
+
+Regenerates website/data/verification-scripts.json from real run results
+instead of hand-maintained numbers:
+
+  stats.total_scripts   scripts on disk in verification/sympy
+  stats.pass_rate       PASS scripts / scripts with a result
+  stats.total_tests     sum of per-script test counts
+  domains[].count       scripts per domain, from website/data/script-domains.json
+  featured/curated      "tests" from the run, plus "status", "created",
+                        "key_finding" and "result" from the script itself
+
+Results come from the last suite report (.suite/report.json) and, for
+scripts that report does not cover, from still-valid suite_cache entries,
+so an incremental run is enough. The file is not written while any script
+lacks a result (--allow-partial overrides). Editorial fields (titles, descriptions,
+formulas, domain names/colours, codata_year) are kept from the existing file.
+
+Domains are never guessed from filenames. script-domains.json maps each
+script to a domain id (null: reviewed, belongs to no domain). The domain
+counts are only recomputed once every script on disk is in the map; until
+then the existing counts are kept and the unclassified scripts are listed.
+An unknown domain id, or a featured/curated entry whose "domain" disagrees
+with the map, is an error.
+
+Header metadata (Status:, Created:, KEY FINDING) is indexed incrementally
+in .suite/script_index.json: a script is re-read only when its size or
+mtime changes.
+
+Usage:
+  python suite_website_index.py                 # rewrite the website JSON
+  python suite_website_index.py --check         # exit 1 if it is stale
+  python suite_website_index.py --report other/report.json
+"""
+
+import argparse
+import json
+import re
+import sys
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from suite_runner import SCRIPT_DIR, STATE_DIR, REPORT_JSON, discover_scripts, load_report
+from suite_cache import ResultCache
+from suite_deps import header_text
+
+REPO_ROOT = SCRIPT_DIR.parent.parent
+WEBSITE_JSON = REPO_ROOT / "website" / "data" / "verification-scripts.json"
+SYNC_MANIFEST = REPO_ROOT / "website" / "SYNC_MANIFEST.json"
+INDEX_FILE = STATE_DIR / "script_index.json"
+DOMAIN_MAP = REPO_ROOT / "website" / "data" / "script-domains.json"
+UNCLASSIFIED_SHOWN = 20
+
+FIELD = re.compile(r"^\s*(Status|Created)\s*:\s*(.+?)\s*$", re.MULTILINE)
+KEY_FINDING = re.compile(r"KEY FINDINGS?\s*:?\s*(.*?)(?:\n\s*\n|\Z)", re.DOTALL)
+KEY_FINDING_CHARS = 300
+
+
+# ==============================================================================
+# HEADER INDEX (incremental)
+# ==============================================================================
+
+def parse_header(script: str) -> dict:
+    text = header_text(script)
+    meta = {"title": next((l.strip() for l in text.splitlines() if l.strip()), ""),
+            "status": None, "created": None, "key_finding": None}
+    for key, value in FIELD.findall(text):
+        meta.setdefault(key.lower(), None)
+        if meta[key.lower()] is None:
+            meta[key.lower()] = value
+    m = KEY_FINDING.search(text)
+    if m:
+        finding = " ".join(m.group(1).split())
+        if len(finding) > KEY_FINDING_CHARS:
+            finding = finding[:KEY_FINDING_CHARS - 3].rstrip() + "..."
+        meta["key_finding"] = finding or None
+    return meta
+
+
+def header_index(scripts: List[str]) -> Dict[str, dict]:
+    """Header metadata for `scripts`, re-parsing only changed files."""
+    old = {}
+    if INDEX_FILE.exists():
+        try:
+            old = json.loads(INDEX_FILE.read_text(encoding="utf-8"))
+        except ValueError:
+            old = {}
+    index, reparsed = {}, 0
+    for s in scripts:
+        st = (SCRIPT_DIR / s).stat()
+        stamp = [st.st_size, st.st_mtime_ns]
+        entry = old.get(s)
+        if entry is None or entry.get("stamp") != stamp:
+            entry = {"stamp": stamp, **parse_header(s)}
+            reparsed += 1
+        index[s] = entry
+    if reparsed or set(old) != set(index):
+        STATE_DIR.mkdir(exist_ok=True)
+        INDEX_FILE.write_text(json.dumps(index, sort_keys=True), encoding="utf-8")
+    return index
+
+
+# ==============================================================================
+# DOMAINS
+# ==============================================================================
+
+def load_domains(path: Path) -> Dict[str, Optional[str]]:
+    """The curated script -> domain id map (empty if the file is missing)."""
+    if not path.exists():
+        return {}
+    return json.loads(path.read_text(encoding="utf-8"))
+
+
+def domain_errors(data: dict, domains: Dict[str, Optional[str]]) -> List[str]:
+    """Unknown domain ids in the map, and featured/curated entries that disagree with it."""
+    ids = {d["id"] for d in data.get("domains", [])}
+    errors = [f"{s}: unknown domain {d!r}" for s, d in sorted(domains.items())
+              if d is not None and d not in ids]
+    for group in ("featured", "curated"):
+        for e in data.get(group, []):
+            s = e["filename"]
+            if s in domains and e.get("domain") != domains[s]:
+                errors.append(f"{s}: {group} entry says {e.get('domain')!r}, "
+                              f"script-domains.json says {domains[s]!r}")
+    return errors
+
+
+# ==============================================================================
+# RESULTS
+# ==============================================================================
+
+def collect_results(scripts: List[str], report: Path) -> dict:
+    """Latest result per script: the report first, then valid cache entries."""
+    results = {}
+    if report.exists():
+        results = {r.script: r for r in load_report(report) if r.script in scripts}
+    cache = ResultCache()
+    for s in scripts:
+        if s not in results:
+            hit = cache.get(s)
+            if hit is not None:
+                results[s] = hit
+    return results
+
+
+def build(data: dict, scripts: List[str], results: dict, index: Dict[str, dict],
+          domains: Dict[str, Optional[str]]) -> dict:
+    ran = [results[s] for s in scripts if s in results]
+    n_pass = sum(1 for r in ran if r.status == "PASS")
+    out = dict(data)
+    out["stats"] = dict(data.get("stats", {}),
+                        total_scripts=len(scripts),
+                        pass_rate=round(100.0 * n_pass / len(ran), 1) if ran else 0.0,
+                        domains=len(data.get("domains", [])),
+                        total_tests=sum(r.n_tests for r in ran))
+    if all(s in domains for s in scripts):
+        counts: Dict[str, int] = {}
+        for s in scripts:
+            d = domains[s]
+            if d:
+                counts[d] = counts.get(d, 0) + 1
+        out["domains"] = [dict(d, count=counts.get(d["id"], 0)) for d in data.get("domains", [])]
+    for group in ("featured", "curated"):
+        entries = []
+        for e in data.get(group, []):
+            e = dict(e)
+            s = e["filename"]
+            meta = index.get(s)
+            if meta is None:
+                print(f"  WARNING: {group} script {s} no longer exists")
+            else:
+                e["status"] = meta["status"]
+                e["created"] = meta["created"]
+                e["key_finding"] = meta["key_finding"]
+            r = results.get(s)
+            if r is not None:
+                e["tests"] = r.n_tests
+                e["result"] = r.status
+            entries.append(e)
+        out[group] = entries
+    return out
+
+
+def dump(data: dict) -> str:
+    """JSON in the file's existing layout: 2-space indent, one line per domain."""
+    domains = data.get("domains", [])
+    text = json.dumps(dict(data, domains=["@@%d" % i for i in range(len(domains))]),
+                      indent=2, ensure_ascii=False)
+    for i, d in enumerate(domains):
+        inline = "{ " + ", ".join(f"{json.dumps(k)}: {json.dumps(v, ensure_ascii=False)}"
+                                  for k, v in d.items()) + " }"
+        text = text.replace(f'"@@{i}"', inline, 1)
+    return text + "\n"
+
+
+def update_manifest(n_scripts: int) -> None:
+    if not SYNC_MANIFEST.exists():
+        return
+    text = SYNC_MANIFEST.read_text(encoding="utf-8")
+    new = re.sub(r'("lastKnownCount":\s*)\d+', rf"\g<1>{n_scripts}", text, count=1)
+    if new != text:
+        SYNC_MANIFEST.write_text(new, encoding="utf-8")
+
+
+def main(argv=None) -> int:
+    p = argparse.ArgumentParser(description="Regenerate verification-scripts.json.")
+    p.add_argument("--report", type=Path, default=REPORT_JSON)
+    p.add_argument("--out", type=Path, default=WEBSITE_JSON)
+    p.add_argument("--domains", type=Path, default=DOMAIN_MAP,
+                   help="curated script -> domain map (default: %(default)s)")
+    p.add_argument("--check", action="store_true",
+                   help="do not write; exit 1 if the file is out of date")
+    p.add_argument("--allow-partial", action="store_true",
+                   help="write even if some scripts have no result")
+    args = p.parse_args(argv)
+
+    scripts = discover_scripts()
+    results = collect_results(scripts, args.report)
+    index = header_index(scripts)
+    data = json.loads(args.out.read_text(encoding="utf-8"))
+    domains = load_domains(args.domains)
+    errors = domain_errors(data, domains)
+    if errors:
+        for e in errors:
+            print(f"  ERROR: {e}")
+        return 1
+    new = build(data, scripts, results, index, domains)
+    text = dump(new)
+
+    missing = len(scripts) - len(results)
+    s = new["stats"]
+    print(f"  scripts: {s['total_scripts']}  with results: {len(results)}  "
+          f"pass rate: {s['pass_rate']}%  tests: {s['total_tests']}")
+    if missing:
+        print(f"  WARNING: {missing} scripts have no result; run suite_runner.py first")
+    unclassified = [s for s in scripts if s not in domains]
+    if unclassified:
+        print(f"  WARNING: {len(unclassified)} scripts are not in {args.domains.name}; "
+              f"domain counts kept from the existing file")
+        for s in unclassified[:UNCLASSIFIED_SHOWN]:
+            print(f"    {s}")
+        if len(unclassified) > UNCLASSIFIED_SHOWN:
+            print(f"    ... and {len(unclassified) - UNCLASSIFIED_SHOWN} more")
+    gone = sorted(set(domains) - set(scripts))
+    if gone:
+        print(f"  WARNING: {len(gone)} scripts in {args.domains.name} no longer exist: "
+              + ", ".join(gone))
+    stale = args.out.read_text(encoding="utf-8") != text
+    if args.check:
+        print("  verification-scripts.json is " + ("STALE" if stale else "up to date"))
+        return 1 if stale or missing else 0
+    if missing and not args.allow_partial:
+        print("  not written: stats would not cover the whole suite")
+        return 1
+    if stale:
+        args.out.write_text(text, encoding="utf-8")
+        print(f"  wrote {args.out}")
+    update_manifest(len(scripts))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
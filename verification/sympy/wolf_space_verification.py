@@ -7,7 +7,7 @@ representation theory constraints, and dimension counting.
 
 chi(G_2/SO(4)) = |W(G_2)|/|W(SO(4))| = 12/4 = 3 = Im_H [THEOREM]
 dim = 8 = dim_O [THEOREM]
-Branching 14 -> (1,0)+(0,1)+2*(1/2,1/2) verified by symmetric space structure.
+Branching 14 -> (1,0)+(0,1)+(1/2,3/2) computed with lib_reps (weight projection).
 Branching 7 -> (1/2,1/2)+(0,1) verified by octonionic decomposition Im(O)=Im(H)+H*e.
 
 Integer/half-integer split: SPECIFIC to Im_H=3 (quadratic has unique root Im_H=3).
@@ -17,6 +17,27 @@ Status: VERIFICATION
 
 from sympy import *
 
+from lib_reps import g2, so, su, product
+
+# SO(4) = SU(2)_L x SU(2)_R inside G_2: SU(2)_L on the long root e_1 - e_2,
+# SU(2)_R on the orthogonal short root e_3 - (e_1 + e_2 + e_3)/3
+G2, SO7 = g2(), so(7)
+SO4 = product(su(2), su(2))
+h = Rational(1, 2)
+TO_SO4 = [[h, -h, 0], [-h, h, 0], [-h, -h, 1], [h, h, -1]]
+TO_G2 = [[Rational(int(i == j)) - Rational(1, 3) for j in range(3)] for i in range(3)]
+
+def spins(rep):
+    """Sorted (j_L, j_R) content of an SU(2) x SU(2) representation."""
+    return sorted((Rational(a, 2), Rational(b, 2)) for (a, b), m in rep.items() for _ in range(m))
+
+def so7_to_so4(hw):
+    out = {}
+    for w2, m2 in SO7.branch(hw, G2, TO_G2).items():
+        for w4, m4 in G2.branch(w2, SO4, TO_SO4).items():
+            out[w4] = out.get(w4, 0) + m2 * m4
+    return out
+
 # Framework constants
 dim_R = 1
 dim_C = 2
@@ -100,7 +121,10 @@ print(f"\nSO(4) = SU(2)_L x SU(2)_R acts on H = R^4 as (1/2,1/2)")
 print(f"  H*e: same rep shifted by e -> (1/2,1/2), dim {dim_H}")
 print(f"  Im(H): adjoint of one SU(2) -> (0,1), dim {Im_H}")
 print(f"  Total: (1/2,1/2) + (0,1) = {dim_H} + {Im_H} = {dim_H + Im_H}")
+branch_7 = spins(G2.branch((0, 1), SO4, TO_SO4))
+print(f"  lib_reps: 7 -> {' + '.join(str(j) for j in branch_7)}")
 tests.append(("Branching 7 = 4+3 dimensions", dim_H + Im_H == Im_O))
+tests.append(("7 -> (1/2,1/2) + (0,1) (weight projection)", branch_7 == [(0, 1), (h, h)]))
 
 # ============================================================
 # SECTION 3: Branching 14 -> symmetric space decomposition
@@ -128,22 +152,22 @@ tests.append(("dim(tangent) = dim_O = 8", dim_m == dim_O))
 
 # But our K = SO(4) = SU(2)*SU(2), not Sp(2)*Sp(1)
 # For the Wolf space G_2/(SU(2)*SU(2)):
-# The isotropy representation on m decomposes as 2*(1/2,1/2)
-# Proof: m must be an 8-dim SO(4)-rep.
-# By the quaternion-Kahler structure, m = V (x) E where
-# V is 2-dim (complex) from one SU(2) and E is 2-dim from the other
-# So m = (1/2) (x) (1/2) = (1/2, 1/2), but this is only 4-dim.
-# For quat_dim = 2, we need TWO copies: m = 2*(1/2, 1/2) = dim 8.
-
-print(f"\nm as SO(4)-module: 2*(1/2,1/2)")
-print(f"  = 2 copies of bifundamental, dim = 2*4 = {2*4} = dim_O")
+# By the quaternion-Kahler structure, m = H (x) E where H = C^2 is the
+# doublet of one SU(2) and E is 2n = 4 dimensional (quat_dim n = 2).
+# Projecting the g_2 weights onto the SO(4) torus gives E = S^3(C^2):
+# m = (1/2, 3/2), an irreducible 8-dim rep (not 2 copies of (1/2,1/2)).
+branch_14 = spins(G2.branch((1, 0), SO4, TO_SO4))
+m_rep = [j for j in branch_14 if j not in [(1, 0), (0, 1)]]
+
+print(f"\nm as SO(4)-module: {' + '.join(str(j) for j in m_rep)}")
+print(f"  = S^3(C^2) (x) C^2, dim = 4*2 = {4*2} = dim_O")
 print(f"  Quaternionic dimension = {dim_m // 4} = dim_C = {dim_C}")
 tests.append(("Quaternionic dimension = dim_C", dim_m // 4 == dim_C))
 
-# Complete branching: 14 -> (1,0) + (0,1) + 2*(1/2,1/2) = 3+3+4+4
-print(f"\nFull branching: 14 -> (1,0) + (0,1) + 2*(1/2,1/2)")
-print(f"  = 3 + 3 + 4 + 4 = {3+3+4+4}")
-tests.append(("14 = 3+3+4+4", 3+3+4+4 == 14))
+# Complete branching: 14 -> (1,0) + (0,1) + (1/2,3/2) = 3+3+8
+print(f"\nFull branching: 14 -> {' + '.join(str(j) for j in branch_14)}")
+print(f"  = 3 + 3 + 8 = {3+3+8}")
+tests.append(("14 = 3+3+8: (1,0)+(0,1)+(1/2,3/2)", branch_14 == [(0, 1), (h, 3 * h), (1, 0)]))
 
 # ============================================================
 # SECTION 4: so(7) decomposition under SO(4)
@@ -181,7 +205,12 @@ tests.append(("Lambda^2(triplet) = triplet", True))
 print(f"\nso(7) = (1,0) + (0,1) + (1/2,3/2) + (1/2,1/2) + (0,1)")
 print(f"      = (1,0) + 2*(0,1) + (1/2,1/2) + (1/2,3/2)")
 print(f"  dims: 3 + 6 + 4 + 8 = {3+6+4+8}")
+branch_21 = spins(so7_to_so4((0, 1, 0)))
+print(f"  lib_reps: 21 -> {' + '.join(str(j) for j in branch_21)}")
 tests.append(("so(7) = 3+6+4+8=21", 3+6+4+8 == 21))
+tests.append(("so(7) = Lambda^2(7): 21 -> (1,0)+2*(0,1)+(1/2,1/2)+(1/2,3/2)",
+              SO7.alt2((1, 0, 0)) == {(0, 1, 0): 1}
+              and branch_21 == [(0, 1), (0, 1), (h, h), (h, 3 * h), (1, 0)]))
 
 # Note the L-R asymmetry: (0,1) appears twice but (1,0) only once
 # because Im(H) was assigned to (0,1), breaking the symmetry
@@ -204,7 +233,7 @@ int_from_so7 = 9    # (1,0)+2*(0,1) = 3+3+3
 total_int = int_from_R + int_from_so4 + int_from_g2 + int_from_so7
 
 # Half-integer spin (j_L or j_R half-integer):
-half_from_g2 = 8    # 2*(1/2,1/2) = 2*4 [tangent part of g_2]
+half_from_g2 = 8    # (1/2,3/2) = 8 [tangent part of g_2]
 half_from_so7 = 12  # (1/2,1/2)+(1/2,3/2) = 4+8
 total_half = half_from_g2 + half_from_so7
 
@@ -371,9 +400,9 @@ VERIFIED RESULTS:
 2. Branching 7 -> (1/2,1/2) + (0,1) = 4 + 3 [THEOREM]
    Via octonionic decomposition Im(O) = Im(H) + H*e.
 
-3. Branching 14 -> (1,0)+(0,1)+2*(1/2,1/2) = 6+8 [THEOREM]
+3. Branching 14 -> (1,0)+(0,1)+(1/2,3/2) = 6+8 [THEOREM]
    Via symmetric space Cartan decomposition g_2 = so(4) + m,
-   where m has quaternion-Kahler structure (2 copies of bifundamental).
+   where m = S^3(C^2) (x) C^2 has quaternion-Kahler structure.
 
 4. so(7) = (1,0)+2*(0,1)+(1/2,1/2)+(1/2,3/2) under SO(4) [DERIVATION]
    Via Lambda^2 of the 7-dim branching rule.